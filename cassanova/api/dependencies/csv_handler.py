@@ -2,44 +2,120 @@ from __future__ import annotations
 
 import json
 from collections.abc import Generator, Iterable, Iterator
+from contextlib import contextmanager
 from csv import DictReader, writer
 from io import StringIO
 from logging import getLogger
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from cassanova.core.query_registry import InFlightQuery
     from cassanova.models.auth_models import WebUser
 
 from cassandra.cluster import Session
 from cassandra.metadata import TableMetadata
 from cassandra.query import BatchStatement, BatchType, SimpleStatement
 
+from cassanova.consts.execution_profiles import ExecutionProfiles
+from cassanova.consts.workloads import Priorities, Workloads
 from cassanova.core.cql.converters import convert_value_for_cql
+from cassanova.core.cql.prepared_statements import bind_statement
 from cassanova.core.cql.query_builder import build_insert_query
+from cassanova.core.cql.statements import idempotent_statement
 
 logger = getLogger(__name__)
 
 _BATCH_SIZE = 50
 
 
-def generate_csv_stream(session: Session, query: str) -> Generator[str, None, None]:
-    rows = session.execute(query)
-    output, csv_writer = _init_csv_writer()
+def generate_csv_stream(
+    session: Session,
+    query: str,
+    fetch_size: int | None = None,
+    user: WebUser | None = None,
+    consistency_level: int | None = None,
+    cluster_name: str = "",
+    parameters: list[Any] | None = None,
+) -> Generator[str, None, None]:
+    with _bulk_read(
+        session, query, fetch_size, user, consistency_level, cluster_name, parameters
+    ) as (headers, rows):
+        output, csv_writer = _init_csv_writer()
 
-    headers = rows.column_names
-    yield _write_row(output, csv_writer, headers)
+        yield _write_row(output, csv_writer, headers)
 
-    for row in rows:
-        clean_values = _extract_clean_values(row, headers)
-        yield _write_row(output, csv_writer, clean_values)
+        for row in rows:
+            clean_values = _extract_clean_values(row, headers)
+            yield _write_row(output, csv_writer, clean_values)
 
 
-def generate_json_stream(session: Session, query: str) -> Generator[str, None, None]:
-    rows = session.execute(query)
-    headers = rows.column_names
-    for row in rows:
-        clean_values = _extract_clean_values(row, headers)
-        yield json.dumps(dict(zip(headers, clean_values, strict=True)), default=str) + "\n"
+def generate_json_stream(
+    session: Session,
+    query: str,
+    fetch_size: int | None = None,
+    user: WebUser | None = None,
+    consistency_level: int | None = None,
+    cluster_name: str = "",
+    parameters: list[Any] | None = None,
+) -> Generator[str, None, None]:
+    with _bulk_read(
+        session, query, fetch_size, user, consistency_level, cluster_name, parameters
+    ) as (headers, rows):
+        for row in rows:
+            clean_values = _extract_clean_values(row, headers)
+            yield json.dumps(dict(zip(headers, clean_values, strict=True)), default=str) + "\n"
+
+
+@contextmanager
+def _bulk_read(
+    session: Session,
+    query: str,
+    fetch_size: int | None,
+    user: WebUser | None,
+    consistency_level: int | None,
+    cluster_name: str,
+    parameters: list[Any] | None = None,
+) -> Iterator[tuple[list[str], Iterator[Any]]]:
+    """Run a bulk read, registered as in-flight until the caller is done with it.
+
+    With ``parameters`` the query is prepared (once per session) and bound.
+    """
+    from cassanova.core.query_registry import query_registry
+    from cassanova.core.scheduler import scheduled
+
+    if parameters is not None:
+        statement = bind_statement(
+            session, query, parameters, fetch_size=fetch_size, consistency_level=consistency_level
+        )
+    else:
+        statement = idempotent_statement(
+            query, fetch_size=fetch_size, consistency_level=consistency_level
+        )
+    with query_registry.track(cluster_name, user, query) as tracked:
+        with scheduled(session, user, Priorities.BACKGROUND), tracked.bound():
+            rows = session.execute(statement, execution_profile=ExecutionProfiles.BULK)
+        yield rows.column_names, _iter_pages(session, rows, user, tracked)
+
+
+def _iter_pages(
+    session: Session, rows: Any, user: WebUser | None, tracked: InFlightQuery
+) -> Iterator[Any]:
+    """Yield every row, taking a separate background turn for each page.
+
+    Scheduling per page instead of per export lets interactive requests
+    overtake a long-running export between pages. A cancelled query stops
+    before its next page is requested.
+    """
+    from cassanova.core.scheduler import scheduled
+
+    while True:
+        tracked.add_rows(len(rows.current_rows))
+        yield from rows.current_rows
+        if not rows.has_more_pages:
+            return
+        tracked.check_cancelled()
+        with scheduled(session, user, Priorities.BACKGROUND):
+            rows.fetch_next_page()
 
 
 def load_csv_data(
@@ -72,6 +148,26 @@ def load_json_data(
     )
 
 
+def _execute_batch(
+    session: Session,
+    batch: BatchStatement,
+    cluster_name: str,
+    user: WebUser | None,
+    timeout: float,
+) -> None:
+    from cassanova.core.cql._executor import execute_cql
+
+    execute_cql(
+        session,
+        batch,
+        cluster_name,
+        user,
+        timeout=timeout,
+        workload=Workloads.IMPORTS,
+        execution_profile=ExecutionProfiles.BULK,
+    )
+
+
 def _bulk_insert_rows(
     rows_iter: Iterable[dict[str, Any]],
     keyspace_name: str,
@@ -80,9 +176,26 @@ def _bulk_insert_rows(
     session: Session,
     cluster_name: str,
     user: WebUser | None,
+) -> dict[str, Any]:
+    from cassanova.core.admission import admission_controller
+
+    # One import slot covers the whole file; its batches reuse it.
+    with admission_controller.acquire(cluster_name, user, Workloads.IMPORTS):
+        return _insert_in_batches(
+            rows_iter, keyspace_name, table_name, table_metadata, session, cluster_name, user
+        )
+
+
+def _insert_in_batches(
+    rows_iter: Iterable[dict[str, Any]],
+    keyspace_name: str,
+    table_name: str,
+    table_metadata: TableMetadata,
+    session: Session,
+    cluster_name: str,
+    user: WebUser | None,
 ) -> dict[str, Any]:
     from cassanova.config.cassanova_config import get_clusters_config
-    from cassanova.core.cql._executor import execute_cql
 
     batch_timeout = get_clusters_config().timeouts.batch
     success_count = 0
@@ -102,7 +215,7 @@ def _bulk_insert_rows(
             batch_rows += 1
 
             if batch_rows >= _BATCH_SIZE:
-                execute_cql(session, batch, cluster_name, user, timeout=batch_timeout)
+                _execute_batch(session, batch, cluster_name, user, batch_timeout)
                 success_count += batch_rows
                 batch = BatchStatement(batch_type=BatchType.UNLOGGED)
                 batch_rows = 0
@@ -110,7 +223,7 @@ def _bulk_insert_rows(
         except Exception as e:
             if batch_rows > 0:
                 try:
-                    execute_cql(session, batch, cluster_name, user, timeout=batch_timeout)
+                    _execute_batch(session, batch, cluster_name, user, batch_timeout)
                     success_count += batch_rows
                 except Exception as batch_err:
                     errors.append(str(batch_err))
@@ -122,7 +235,7 @@ def _bulk_insert_rows(
 
     if batch_rows > 0:
         try:
-            execute_cql(session, batch, cluster_name, user, timeout=batch_timeout)
+            _execute_batch(session, batch, cluster_name, user, batch_timeout)
             success_count += batch_rows
         except Exception as e:
             errors.append(str(e))
@@ -1,7 +1,13 @@
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 
-from cassanova.exceptions.cql_exceptions import CQLPermissionDenied, ReadOnlyClusterError
+from cassanova.exceptions.cql_exceptions import (
+    AdmissionRejected,
+    CQLPermissionDenied,
+    QueryCancelled,
+    QueryCostExceeded,
+    ReadOnlyClusterError,
+)
 
 
 def add_cql_exception_handlers(app: FastAPI) -> None:
@@ -20,3 +26,28 @@ def add_cql_exception_handlers(app: FastAPI) -> None:
             status_code=403,
             content={"detail": str(exc)},
         )
+
+    @app.exception_handler(AdmissionRejected)
+    async def admission_rejected_handler(_request: Request, exc: AdmissionRejected) -> JSONResponse:
+        return JSONResponse(
+            status_code=429,
+            content={"detail": str(exc)},
+            headers={"Retry-After": str(exc.retry_after)},
+        )
+
+    @app.exception_handler(QueryCancelled)
+    async def query_cancelled_handler(_request: Request, exc: QueryCancelled) -> JSONResponse:
+        return JSONResponse(
+            status_code=409,
+            content={"detail": str(exc), "query_id": exc.query_id},
+        )
+
+    @app.exception_handler(QueryCostExceeded)
+    async def query_cost_exceeded_handler(
+        _request: Request, exc: QueryCostExceeded
+    ) -> JSONResponse:
+        # 428 tells the client it may resend the query with confirm_cost set.
+        return JSONResponse(
+            status_code=403 if exc.decision == "block" else 428,
+            content={"detail": str(exc), "decision": exc.decision, "cost": exc.cost},
+        )
@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Any, Literal
 
 from fastapi import APIRouter, Query
 from pydantic import BaseModel
@@ -6,6 +7,10 @@ from pydantic import BaseModel
 from cassanova.config.cassanova_config import get_clusters_config
 from cassanova.config.cluster_config import ClusterConnectionConfig
 from cassanova.config.cluster_metadata import ClusterMetadata
+from cassanova.core.admission import admission_controller
+from cassanova.core.metrics.query_stats import QueryStatsCollector
+from cassanova.core.scheduler import all_schedulers
+from cassanova.core.session_manager import session_manager
 
 admin_router = APIRouter(prefix="/admin", tags=["Admin"])
 
@@ -80,3 +85,42 @@ def list_all_clusters(
         )
         for name, cc in cfg.clusters.items()
     ]
+
+
+@admin_router.get("/scheduler")
+def get_scheduler_stats() -> dict[str, Any]:
+    return {
+        "schedulers": [scheduler.stats() for scheduler in all_schedulers()],
+        "admission": admission_controller.stats(),
+    }
+
+
+def _query_stats(cluster: str | None) -> list[QueryStatsCollector]:
+    if cluster is None:
+        return session_manager.all_query_stats()
+    stats = session_manager.get_query_stats(cluster)
+    return [stats] if stats else []
+
+
+@admin_router.get("/query-metrics")
+def get_query_metrics(
+    cluster: str | None = Query(default=None),
+    sort_by: Literal["count", "p99_ms", "max_ms", "errors", "slow"] = Query(default="count"),
+    limit: int = Query(default=50, ge=1, le=1000),
+) -> dict[str, Any]:
+    return {
+        "clusters": [
+            {"cluster": stats.cluster_name, "shapes": stats.shapes(limit, sort_by)}
+            for stats in _query_stats(cluster)
+        ]
+    }
+
+
+@admin_router.get("/slow-queries")
+def get_slow_queries(
+    cluster: str | None = Query(default=None),
+    limit: int = Query(default=100, ge=1, le=1000),
+) -> list[dict[str, Any]]:
+    entries = [entry for stats in _query_stats(cluster) for entry in stats.slow_queries()]
+    entries.sort(key=lambda entry: entry["timestamp"], reverse=True)
+    return entries[:limit]
@@ -1,32 +1,45 @@
+import json
+from asyncio import sleep
+from collections.abc import AsyncIterator
 from time import time
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
 
-from cassanova.api.dependencies.auth import require_permission
+from cassanova.api.dependencies.auth import get_current_user, require_permission
 from cassanova.api.dependencies.db_session import get_session
 from cassanova.config.cassanova_config import get_clusters_config
+from cassanova.consts.node_views import NodeViews
+from cassanova.consts.scan_jobs import ScanJobStatuses
+from cassanova.consts.workloads import Priorities
 from cassanova.core.constructors._schema_diff import compare_schemas
 from cassanova.core.constructors.cluster_info import generate_cluster_info
 from cassanova.core.constructors.keyspaces import generate_keyspaces_info
 from cassanova.core.constructors.nodes import generate_nodes_info, host_tokens_from_metadata
 from cassanova.core.constructors.tables import generate_tables_info
+from cassanova.core.cql.statements import execute_metadata_query
 from cassanova.core.cql.table_cleanup import drop_table_cql, truncate_table_cql
 from cassanova.core.cql.table_info import show_table_description_cql, show_table_schema_cql
+from cassanova.core.metrics.latency import get_latency_metrics
+from cassanova.core.node_views import node_view, settings_drift
+from cassanova.core.page_cache import page_cache
+from cassanova.core.query_registry import query_registry
+from cassanova.core.scan_jobs import scan_jobs
+from cassanova.core.scheduler import default_priority
+from cassanova.core.schema_cache import invalidate_schema_cache, schema_map_cache
+from cassanova.core.schema_loader import get_lazy_schema, keyspace_listing
+from cassanova.core.schema_refresh import SchemaTarget, schema_refresher
+from cassanova.core.session_manager import session_manager
+from cassanova.core.size_estimates import size_estimate_cache
 from cassanova.exceptions.system_views_unavailable import SystemViewsUnavailableException
 from cassanova.models.auth_models import WebUser
 
 cluster_router = APIRouter()
 clusters_config = get_clusters_config()
 
-_schema_map_cache: dict[str, tuple[float, dict[str, Any]]] = {}
-
-
-def _invalidate_schema_cache(cluster_name: str, session: Any = None) -> None:
-    _schema_map_cache.pop(cluster_name, None)
-    if session:
-        session.cluster.refresh_schema_metadata()
+_MIN_EVENT_INTERVAL = 0.2
 
 
 @cluster_router.get("/cluster-keys")
@@ -47,7 +60,9 @@ def compare_cluster_schemas(cluster_a: str, cluster_b: str) -> dict[str, Any]:
 
 @cluster_router.get("/clusters")
 def get_clusters() -> list[dict[str, Any]]:
-    return [get_cluster_safe(cluster_name) for cluster_name in clusters_config.clusters]
+    # Dashboard health polling should never hold up a user's queries.
+    with default_priority(Priorities.BACKGROUND):
+        return [get_cluster_safe(cluster_name) for cluster_name in clusters_config.clusters]
 
 
 def get_cluster_safe(cluster_name: str) -> dict[str, Any]:
@@ -76,8 +91,7 @@ def get_cluster(cluster_name: str) -> dict[str, Any]:
 @cluster_router.get("/cluster/{cluster_name}/keyspaces")
 def get_keyspaces(cluster_name: str) -> list[dict[str, Any]]:
     session = get_session(cluster_name)
-    cluster = session.cluster
-    keyspace_list = list(cluster.metadata.keyspaces.items())
+    keyspace_list = keyspace_listing(session)
     return [keyspace.model_dump() for keyspace in generate_keyspaces_info(keyspace_list)]
 
 
@@ -91,6 +105,21 @@ def get_keyspace(cluster_name: str, keyspace_name: str) -> dict[str, Any]:
     return generate_keyspaces_info([(keyspace_name, keyspace)])[0].model_dump()
 
 
+@cluster_router.get("/cluster/{cluster_name}/keyspace/{keyspace_name}/sizes")
+def get_keyspace_sizes(cluster_name: str, keyspace_name: str) -> dict[str, Any]:
+    """Estimated partitions, mean partition size and on-disk size of each table."""
+    session = get_session(cluster_name)
+    if keyspace_name not in session.cluster.metadata.keyspaces:
+        raise HTTPException(status_code=404, detail="Keyspace not found")
+
+    sizes = size_estimate_cache.keyspace_sizes(session, cluster_name, keyspace_name)
+    disk = [size.disk_bytes for size in sizes.values() if size.disk_bytes is not None]
+    return {
+        "tables": {name: sizes[name].to_dict() for name in sorted(sizes)},
+        "disk_bytes": sum(disk) if disk else None,
+    }
+
+
 @cluster_router.get("/cluster/{cluster_name}/keyspace/{keyspace_name}/cql")
 def get_keyspace_cql(cluster_name: str, keyspace_name: str) -> dict[str, str]:
     session = get_session(cluster_name)
@@ -166,7 +195,8 @@ def get_table_description(
 def test_cluster_connection(cluster_name: str) -> dict[str, str]:
     try:
         session = get_session(cluster_name)
-        session.execute(
+        execute_metadata_query(
+            session,
             "SELECT key FROM system.local LIMIT 1",
             timeout=clusters_config.timeouts.health_check,
         )
@@ -175,6 +205,96 @@ def test_cluster_connection(cluster_name: str) -> dict[str, str]:
         raise HTTPException(status_code=503, detail=str(e)) from e
 
 
+@cluster_router.get("/cluster/{cluster_name}/latency")
+def get_cluster_latency(cluster_name: str) -> dict[str, Any]:
+    session = get_session(cluster_name)
+    tracker = session_manager.get_latency_tracker(cluster_name)
+    if tracker is None:
+        raise HTTPException(status_code=404, detail="No latency data for cluster")
+    return {"profiles": get_latency_metrics(session, tracker)}
+
+
+@cluster_router.get("/cluster/{cluster_name}/queries")
+def list_running_queries(
+    cluster_name: str, mine: bool = False, _user: WebUser | None = Depends(get_current_user)
+) -> dict[str, list[dict[str, Any]]]:
+    """In-flight queries on the cluster: everyone's for admins, else the caller's own."""
+    return {"queries": query_registry.list_queries(_user, cluster_name, only_own=mine)}
+
+
+@cluster_router.delete("/cluster/{cluster_name}/queries/{query_id}")
+def cancel_running_query(
+    cluster_name: str, query_id: str, _user: WebUser | None = Depends(get_current_user)
+) -> dict[str, Any]:
+    query = query_registry.cancel(query_id, _user, cluster_name)
+    if query is None:
+        raise HTTPException(status_code=404, detail=f"No running query '{query_id}'")
+    return {"detail": f"Query {query_id} cancelled", "query": query.to_dict()}
+
+
+@cluster_router.get("/cluster/{cluster_name}/jobs")
+def list_scan_jobs(
+    cluster_name: str, _user: WebUser | None = Depends(get_current_user)
+) -> dict[str, list[dict[str, Any]]]:
+    """Background table scans on the cluster: everyone's for admins, else the caller's own."""
+    return {"jobs": scan_jobs.list_jobs(_user, cluster_name)}
+
+
+@cluster_router.get("/cluster/{cluster_name}/jobs/{job_id}")
+def get_scan_job(
+    cluster_name: str, job_id: str, _user: WebUser | None = Depends(get_current_user)
+) -> dict[str, Any]:
+    """A job's progress, and its result so far."""
+    job = scan_jobs.get(job_id, _user, cluster_name)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"No job '{job_id}'")
+    return jsonable_encoder(  # type: ignore[no-any-return]
+        {"job": job.to_dict()}, custom_encoder={bytes: lambda var: var.hex()}
+    )
+
+
+@cluster_router.get("/cluster/{cluster_name}/jobs/{job_id}/events")
+def stream_scan_job(
+    cluster_name: str,
+    job_id: str,
+    interval: float = 1.0,
+    _user: WebUser | None = Depends(get_current_user),
+) -> StreamingResponse:
+    """Stream one NDJSON snapshot of the job every ``interval`` seconds until it finishes."""
+    job = scan_jobs.get(job_id, _user, cluster_name)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"No job '{job_id}'")
+    interval = max(interval, _MIN_EVENT_INTERVAL)
+
+    # Async, so a long-running watcher waits on the event loop rather than
+    # holding a threadpool worker between snapshots.
+    async def _events() -> AsyncIterator[str]:
+        while True:
+            finished = job.status in ScanJobStatuses.FINISHED
+            snapshot = jsonable_encoder(
+                job.to_dict(), custom_encoder={bytes: lambda var: var.hex()}
+            )
+            yield json.dumps(snapshot) + "\n"
+            if finished:
+                return
+            await sleep(interval)
+
+    return StreamingResponse(_events(), media_type="application/x-ndjson")
+
+
+@cluster_router.delete("/cluster/{cluster_name}/jobs/{job_id}")
+def cancel_scan_job(
+    cluster_name: str, job_id: str, _user: WebUser | None = Depends(get_current_user)
+) -> dict[str, Any]:
+    job = scan_jobs.cancel(job_id, _user, cluster_name)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"No job '{job_id}'")
+    return jsonable_encoder(  # type: ignore[no-any-return]
+        {"detail": f"Job {job_id} cancelled", "job": job.to_dict()},
+        custom_encoder={bytes: lambda var: var.hex()},
+    )
+
+
 @cluster_router.get("/cluster/{cluster_name}/nodes")
 def get_nodes(cluster_name: str) -> Any:
     session = get_session(cluster_name)
@@ -188,7 +308,7 @@ def get_nodes(cluster_name: str) -> Any:
 def get_cluster_settings(cluster_name: str) -> dict[str, Any]:
     session = get_session(cluster_name)
     try:
-        rows = session.execute("SELECT * FROM system_views.settings")
+        rows = execute_metadata_query(session, "SELECT * FROM system_views.settings")
         settings_dict = {row.name: row.value for row in rows}
     except Exception as e:
         error_message = str(e)
@@ -202,15 +322,48 @@ def get_cluster_settings(cluster_name: str) -> dict[str, Any]:
     return settings_dict
 
 
+@cluster_router.get("/cluster/{cluster_name}/settings/drift")
+def get_settings_drift(cluster_name: str, refresh: bool = False) -> dict[str, Any]:
+    """Settings that differ between nodes, read from every node's ``system_views.settings``."""
+    session = get_session(cluster_name)
+    table = node_view(session, cluster_name, NodeViews.SETTINGS, refresh)
+    return jsonable_encoder(  # type: ignore[no-any-return]
+        {
+            "nodes": table.nodes,
+            "errors": table.errors,
+            "fetched_at": table.fetched_at.isoformat(),
+            "drift": settings_drift(table),
+        },
+        custom_encoder={bytes: lambda var: var.hex()},
+    )
+
+
+@cluster_router.get("/cluster/{cluster_name}/nodes/views/{view}")
+def get_node_view(cluster_name: str, view: str, refresh: bool = False) -> dict[str, Any]:
+    """Rows of one ``system_views`` table from every node, each tagged with its node."""
+    if view not in NodeViews.ALL:
+        raise HTTPException(status_code=404, detail=f"Unknown node view '{view}'")
+
+    session = get_session(cluster_name)
+    table = node_view(session, cluster_name, view, refresh)
+    return jsonable_encoder(  # type: ignore[no-any-return]
+        {"view": view, **table.to_dict()}, custom_encoder={bytes: lambda var: var.hex()}
+    )
+
+
 @cluster_router.get("/cluster/{cluster_name}/vnodes")
 def get_cluster_vnodes(cluster_name: str) -> dict[str, list[dict[str, Any]]]:
     session = get_session(cluster_name)
     try:
-        local_rows = list(session.execute("SELECT host_id, rpc_address, tokens FROM system.local"))
+        local_rows = list(
+            execute_metadata_query(session, "SELECT host_id, rpc_address, tokens FROM system.local")
+        )
         seen_ids = {str(r.host_id) for r in local_rows}
         peers_rows = [
             r
-            for r in session.execute("SELECT host_id, rpc_address, tokens FROM system.peers")
+            for r in execute_metadata_query(
+                session, "SELECT host_id, rpc_address, tokens FROM system.peers"
+            )
             if str(r.host_id) not in seen_ids
         ]
         nodes = [
@@ -252,7 +405,7 @@ def delete_table(
 ) -> JSONResponse:
     session = get_session(cluster_name)
     drop_table_cql(session, keyspace_name, table_name, cluster_name, _user)
-    _invalidate_schema_cache(cluster_name, session)
+    invalidate_schema_cache(cluster_name, session, SchemaTarget("table", keyspace_name, table_name))
     return JSONResponse({"detail": f"Table {keyspace_name}.{table_name} deleted successfully"})
 
 
@@ -267,6 +420,7 @@ def truncate_table(
 ) -> dict[str, str]:
     session = get_session(cluster_name)
     truncate_table_cql(session, keyspace_name, table_name, cluster_name, _user)
+    page_cache.invalidate(cluster_name, keyspace_name, table_name)
     return {"detail": f"Table {keyspace_name}.{table_name} truncated successfully"}
 
 
@@ -274,33 +428,42 @@ _SCHEMA_MAP_TTL_SECONDS = 60
 
 
 @cluster_router.post("/cluster/{cluster_name}/schema/refresh")
-def refresh_schema_cache(cluster_name: str) -> dict[str, str]:
+def refresh_schema_cache(cluster_name: str, keyspace: str | None = None) -> dict[str, str]:
     """Manually invalidate the schema cache and refresh driver metadata.
 
     Useful when DDL was applied outside Cassanova (e.g. via cqlsh) and
-    the in-memory cache hasn't expired yet.
+    the in-memory cache hasn't expired yet. ``keyspace`` narrows the
+    invalidation on clusters running with ``lazy_schema``.
     """
     try:
         session = get_session(cluster_name)
     except Exception:
         session = None
-    _invalidate_schema_cache(cluster_name, session)
+
+    if session and keyspace and get_lazy_schema(session) is not None:
+        invalidate_schema_cache(cluster_name, session, SchemaTarget("keyspace", keyspace))
+    else:
+        invalidate_schema_cache(cluster_name, session)
+        schema_refresher.flush(cluster_name)
     return {"detail": "Schema cache invalidated"}
 
 
 @cluster_router.get("/cluster/{cluster_name}/schema-map")
 def get_cluster_schema_map(cluster_name: str) -> dict[str, Any]:
     now = time()
-    cached = _schema_map_cache.get(cluster_name)
+    cached = schema_map_cache.get(cluster_name)
     if cached and (now - cached[0]) < _SCHEMA_MAP_TTL_SECONDS:
         return cached[1]
 
     session = get_session(cluster_name)
-    metadata = session.cluster.metadata
 
+    # Keyspaces of a lazy schema that are not loaded yet are listed without tables.
     schema_map = {}
-    for ks_name, ks_meta in metadata.keyspaces.items():
-        tables = {}
+    for ks_name, ks_meta in keyspace_listing(session):
+        tables: dict[str, list[str]] = {}
+        if ks_meta is None:
+            schema_map[ks_name] = tables
+            continue
         for table_name, table_meta in ks_meta.tables.items():
             tables[table_name] = [col.name for col in table_meta.columns.values()]
 
@@ -309,5 +472,5 @@ def get_cluster_schema_map(cluster_name: str) -> dict[str, Any]:
 
         schema_map[ks_name] = tables
 
-    _schema_map_cache[cluster_name] = (now, schema_map)
+    schema_map_cache[cluster_name] = (now, schema_map)
     return schema_map
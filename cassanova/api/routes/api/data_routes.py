@@ -1,13 +1,15 @@
 from binascii import hexlify, unhexlify
-from json import JSONDecodeError, loads
+from collections.abc import Iterator
+from contextlib import contextmanager
+from json import JSONDecodeError, dumps, loads
 from typing import Any
 
-from cassandra.query import SimpleStatement
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
+from cassandra.cluster import Session
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
 from fastapi.encoders import jsonable_encoder
 from fastapi.responses import StreamingResponse
 
-from cassanova.api.dependencies.auth import require_permission
+from cassanova.api.dependencies.auth import get_current_user, require_permission
 from cassanova.api.dependencies.csv_handler import (
     generate_csv_stream,
     generate_json_stream,
@@ -15,11 +17,32 @@ from cassanova.api.dependencies.csv_handler import (
     load_json_data,
 )
 from cassanova.api.dependencies.db_session import get_session
+from cassanova.config.cassanova_config import bulk_fetch_size, get_clusters_config
+from cassanova.consts.execution_profiles import ExecutionProfiles
+from cassanova.consts.scan_jobs import ScanJobKinds
+from cassanova.consts.workloads import Priorities, Workloads
+from cassanova.core.admission import admission_controller, hold_while_streaming
+from cassanova.core.column_profile import profile_table
 from cassanova.core.cql._executor import execute_cql
-from cassanova.core.cql.converters import convert_value_for_cql
-from cassanova.core.cql.query_builder import build_insert_query, build_where_clause
+from cassanova.core.cql.access_path import AccessPath, plan_access
+from cassanova.core.cql.converters import convert_value_for_cql, truncate_cell
+from cassanova.core.cql.partition_listing import list_partitions
+from cassanova.core.cql.partition_lookup import lookup_partitions
+from cassanova.core.cql.partition_slice import SliceOrder, next_after, slice_statement
+from cassanova.core.cql.prepared_statements import bind_statement
+from cassanova.core.cql.query_builder import WhereClause, build_insert_query, build_where
+from cassanova.core.cql.query_cost import check_query_cost
+from cassanova.core.cql.row_sampling import sample_rows
 from cassanova.core.cql.sanitize_input import sanitize_identifier
+from cassanova.core.cql.statements import idempotent_statement
+from cassanova.core.page_cache import Page, cursor_key, page_cache
+from cassanova.core.query_registry import query_registry
+from cassanova.core.row_count import count_rows, estimate_rows
+from cassanova.core.scan_jobs import ScanJob, scan_jobs
+from cassanova.core.scheduler import scheduled
+from cassanova.exceptions.cql_exceptions import AdmissionRejected, QueryCancelled
 from cassanova.models.auth_models import WebUser
+from cassanova.models.cql_query import PartitionLookup
 
 data_router = APIRouter()
 
@@ -33,59 +56,95 @@ def get_table_data(
     filter_json: str | None = None,
     allow_filtering: bool = False,
     paging_state: str | None = None,
+    confirm_cost: bool = False,
+    page: int | None = None,
+    cursor: str | None = None,
+    columns: str | None = None,
+    max_cell_bytes: int | None = None,
+    _user: WebUser | None = Depends(get_current_user),
 ) -> dict[str, Any]:
+    """Read one page of a table.
+
+    Pages are addressed by number within a server-side ``cursor`` (see
+    ``core/page_cache.py``); the response carries the cursor to pass back.
+    A client passing a raw ``paging_state`` instead pages forward uncached.
+
+    ``columns`` is a comma-separated projection; the primary key is always
+    included so rows stay editable. Large ``text`` and ``blob`` cells are
+    truncated to ``max_cell_bytes`` (default ``browse.max_cell_bytes``) and
+    read in full from the ``cell`` endpoint.
+    """
     session = get_session(cluster_name)
     keyspace_name = sanitize_identifier(keyspace_name)
     table_name = sanitize_identifier(table_name)
 
-    try:
-        where_clause = build_where_clause(filter_json)
-    except (ValueError, Exception) as e:
-        raise HTTPException(status_code=400, detail=f"Invalid filter: {e}") from e
+    table_metadata = _table_metadata(session, keyspace_name, table_name)
+    where, access_path = _plan_read(table_metadata, filter_json)
+    projection = _projection(table_metadata, columns, include_key=True)
+    max_cell_bytes = _cell_limit(max_cell_bytes)
 
-    query = f'SELECT * FROM "{keyspace_name}"."{table_name}"{where_clause}'
-    if allow_filtering:
-        query += " ALLOW FILTERING"
+    query = _select_query(keyspace_name, where, access_path, allow_filtering, projection)
+    check_query_cost(session, cluster_name, query, _user, confirm_cost, page_size=limit)
 
-    try:
-        statement = SimpleStatement(query, fetch_size=limit)
+    def fetch(state: bytes | None, priority: str) -> tuple[list[dict[str, Any]], bytes | None]:
+        rows, next_state = _read_page(
+            session, cluster_name, _user, query, where, limit, state, priority
+        )
+        return _truncate_rows(rows, max_cell_bytes), next_state
 
+    with _http_errors("fetch data"):
         actual_paging_state = None
         if paging_state and paging_state != "null":
             actual_paging_state = unhexlify(paging_state)
 
-        rows = session.execute(statement, paging_state=actual_paging_state)
-
-        next_paging_state = hexlify(rows.paging_state).decode() if rows.paging_state else None
-
-        result = {
-            "rows": [dict(row._asdict()) for row in rows.current_rows],
-            "next_paging_state": next_paging_state,
+        if actual_paging_state is not None or not get_clusters_config().page_cache.enabled:
+            rows, next_state = fetch(actual_paging_state, Priorities.INTERACTIVE)
+            result = Page(page or 0, rows, next_state is not None, next_state)
+            cursor = None
+        else:
+            key = cursor_key(
+                cluster_name,
+                _user.username if _user else "anonymous",
+                keyspace_name,
+                table_name,
+                query,
+                where.values,
+                limit,
+                max_cell_bytes,
+            )
+            page_cursor = page_cache.cursor(cursor, key)
+            result = page_cache.read(page_cursor, max(page or 0, 0), fetch)
+            cursor = page_cursor.id
+
+        response = {
+            "rows": result.rows,
+            "next_paging_state": (
+                hexlify(result.next_paging_state).decode() if result.next_paging_state else None
+            ),
+            "cursor": cursor,
+            "page": result.number,
+            "has_more": result.has_more,
+            "access_path": access_path.to_dict(),
         }
-        return jsonable_encoder(result, custom_encoder={bytes: lambda var: var.hex()})  # type: ignore[no-any-return]
-    except Exception as e:
-        error_msg = str(e)
-        if "ALLOW FILTERING" in error_msg:
-            raise HTTPException(
-                status_code=400,
-                detail=(
-                    "This query requires ALLOW FILTERING. Please enable it in the filter settings."
-                ),
-            ) from e
-        raise HTTPException(status_code=500, detail=f"Failed to fetch data: {error_msg}") from e
+    return _browse_response(response)
 
 
 @data_router.get(
     "/cluster/{cluster_name}/keyspace/{keyspace_name}/table/{table_name}/cell-metadata"
 )
 def get_cell_metadata(
-    cluster_name: str, keyspace_name: str, table_name: str, pk: str, column: str
+    cluster_name: str,
+    keyspace_name: str,
+    table_name: str,
+    pk: str,
+    column: str,
+    _user: WebUser | None = Depends(get_current_user),
 ) -> dict[str, Any]:
     session = get_session(cluster_name)
     keyspace_name = sanitize_identifier(keyspace_name)
     table_name = sanitize_identifier(table_name)
     column = sanitize_identifier(column)
-    try:
+    with _http_errors("fetch cell metadata"):
         pk_data = loads(pk)
         for col in pk_data:
             sanitize_identifier(col)
@@ -97,15 +156,374 @@ def get_cell_metadata(
             f' FROM "{keyspace_name}"."{table_name}"'
             f" WHERE {where_clause}"
         )
-        rows = list(session.execute(query, values))
+        with (
+            admission_controller.acquire(cluster_name, _user, Workloads.INTERACTIVE),
+            scheduled(session, _user, Priorities.INTERACTIVE),
+            query_registry.track(cluster_name, _user, query) as tracked,
+            tracked.bound(),
+        ):
+            rows = list(
+                session.execute(
+                    idempotent_statement(query),
+                    values,
+                    execution_profile=ExecutionProfiles.INTERACTIVE,
+                )
+            )
 
-        if not rows:
-            return {"ttl": None, "writetime": None}
+    if not rows:
+        return {"ttl": None, "writetime": None}
 
-        row = rows[0]
-        return {"ttl": row[0], "writetime": row[1]}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to fetch cell metadata: {e}") from e
+    row = rows[0]
+    return {"ttl": row[0], "writetime": row[1]}
+
+
+@data_router.get("/cluster/{cluster_name}/keyspace/{keyspace_name}/table/{table_name}/cell")
+def get_cell_value(
+    cluster_name: str,
+    keyspace_name: str,
+    table_name: str,
+    pk: str,
+    column: str,
+    _user: WebUser | None = Depends(get_current_user),
+) -> StreamingResponse:
+    """Stream one full cell value, e.g. one truncated in the table browser.
+
+    Blobs are sent as raw bytes and text as UTF-8; other types as JSON.
+    """
+    session = get_session(cluster_name)
+    keyspace_name = sanitize_identifier(keyspace_name)
+    table_name = sanitize_identifier(table_name)
+    column = sanitize_identifier(column)
+
+    table_metadata = _table_metadata(session, keyspace_name, table_name)
+    if column not in table_metadata.columns:
+        raise HTTPException(status_code=400, detail=f"Unknown column: {column}")
+    try:
+        pk_data = loads(pk)
+        values = []
+        for col, val in pk_data.items():
+            col_meta = table_metadata.columns.get(sanitize_identifier(col))
+            if not col_meta:
+                raise ValueError(f"Unknown PK column: {col}")
+            values.append(convert_value_for_cql(val, str(col_meta.cql_type)))
+    except (ValueError, AttributeError, JSONDecodeError) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid primary key: {e}") from e
+
+    where_clause = " AND ".join([f'"{col}" = ?' for col in pk_data])
+    query = f'SELECT "{column}" FROM "{keyspace_name}"."{table_name}" WHERE {where_clause}'
+    with (
+        _http_errors("fetch cell"),
+        admission_controller.acquire(cluster_name, _user, Workloads.INTERACTIVE),
+        scheduled(session, _user, Priorities.INTERACTIVE),
+        query_registry.track(cluster_name, _user, query) as tracked,
+        tracked.bound(),
+    ):
+        row = session.execute(
+            bind_statement(session, query, values),
+            execution_profile=ExecutionProfiles.INTERACTIVE,
+        ).one()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Row not found")
+
+    value = row[0]
+    if isinstance(value, bytes | bytearray):
+        content, media_type = bytes(value), "application/octet-stream"
+    elif isinstance(value, str):
+        content, media_type = value.encode(), "text/plain; charset=utf-8"
+    else:
+        content, media_type = dumps(jsonable_encoder(value)).encode(), "application/json"
+
+    chunk_size = get_clusters_config().browse.cell_chunk_size
+    return StreamingResponse(
+        (content[i : i + chunk_size] for i in range(0, len(content), chunk_size)),
+        media_type=media_type,
+        headers={
+            "Content-Length": str(len(content)),
+            "Content-Disposition": f"attachment; filename={table_name}_{column}",
+        },
+    )
+
+
+@data_router.post("/cluster/{cluster_name}/keyspace/{keyspace_name}/table/{table_name}/lookup")
+def lookup_table_partitions(
+    cluster_name: str,
+    keyspace_name: str,
+    table_name: str,
+    lookup: PartitionLookup,
+    _user: WebUser | None = Depends(get_current_user),
+) -> dict[str, Any]:
+    """Read partitions (or clustering slices of them) by key, routed to a replica.
+
+    Each key gives the partition key columns and optionally a clustering
+    prefix; results come back in the order of ``keys``, each with its own
+    rows or error.
+    """
+    session = get_session(cluster_name)
+    keyspace_name = sanitize_identifier(keyspace_name)
+    table_name = sanitize_identifier(table_name)
+
+    table_metadata = _table_metadata(session, keyspace_name, table_name)
+    columns = ",".join(lookup.columns) if lookup.columns else None
+    projection = _projection(table_metadata, columns, include_key=True)
+    max_cell_bytes = _cell_limit(lookup.max_cell_bytes)
+
+    with _http_errors("look up keys"):
+        results = lookup_partitions(
+            session,
+            cluster_name,
+            _user,
+            keyspace_name,
+            table_metadata,
+            lookup.keys,
+            projection,
+            lookup.limit,
+        )
+
+    for result in results:
+        result.rows = _truncate_rows(result.rows, max_cell_bytes)
+    return _browse_response({"results": [result.to_dict() for result in results]})
+
+
+@data_router.get("/cluster/{cluster_name}/keyspace/{keyspace_name}/table/{table_name}/partitions")
+def get_table_partitions(
+    cluster_name: str,
+    keyspace_name: str,
+    table_name: str,
+    after: str | None = None,
+    limit: int = 100,
+    segments: int = 1,
+    preview: int = 0,
+    columns: str | None = None,
+    max_cell_bytes: int | None = None,
+    _user: WebUser | None = Depends(get_current_user),
+) -> dict[str, Any]:
+    """List partition keys in token order.
+
+    ``after`` is the ``next_after`` token of the previous page. ``segments``
+    splits the rest of the ring into token ranges scanned concurrently, and
+    ``preview`` returns up to that many rows of each partition with it.
+    """
+    session = get_session(cluster_name)
+    keyspace_name = sanitize_identifier(keyspace_name)
+    table_name = sanitize_identifier(table_name)
+
+    table_metadata = _table_metadata(session, keyspace_name, table_name)
+    projection = _projection(table_metadata, columns, include_key=True)
+    max_cell_bytes = _cell_limit(max_cell_bytes)
+    if limit < 1 or segments < 1 or preview < 0:
+        raise HTTPException(status_code=400, detail="limit and segments must be positive")
+
+    with _http_errors("list partitions"):
+        page = list_partitions(
+            session,
+            cluster_name,
+            _user,
+            keyspace_name,
+            table_metadata,
+            int(after) if after else None,
+            limit,
+            segments,
+            preview,
+            projection,
+        )
+
+    for partition in page.partitions:
+        if partition.rows is not None:
+            partition.rows = _truncate_rows(partition.rows, max_cell_bytes)
+    return _browse_response(
+        {
+            "partitions": [partition.to_dict() for partition in page.partitions],
+            "next_after": str(page.next_after) if page.next_after is not None else None,
+        }
+    )
+
+
+@data_router.get("/cluster/{cluster_name}/keyspace/{keyspace_name}/table/{table_name}/sample")
+def get_table_sample(
+    cluster_name: str,
+    keyspace_name: str,
+    table_name: str,
+    points: int = 20,
+    rows_per_point: int = 5,
+    columns: str | None = None,
+    max_cell_bytes: int | None = None,
+    seed: int | None = None,
+    _user: WebUser | None = Depends(get_current_user),
+) -> dict[str, Any]:
+    """Rows read from ``points`` random tokens, ``rows_per_point`` rows each.
+
+    A ``seed`` makes the sample repeatable.
+    """
+    session = get_session(cluster_name)
+    keyspace_name = sanitize_identifier(keyspace_name)
+    table_name = sanitize_identifier(table_name)
+
+    table_metadata = _table_metadata(session, keyspace_name, table_name)
+    projection = _projection(table_metadata, columns, include_key=True)
+    max_cell_bytes = _cell_limit(max_cell_bytes)
+    if points < 1 or rows_per_point < 1:
+        raise HTTPException(status_code=400, detail="points and rows_per_point must be positive")
+
+    with _http_errors("sample table"):
+        rows = sample_rows(
+            session,
+            cluster_name,
+            _user,
+            keyspace_name,
+            table_metadata,
+            points,
+            rows_per_point,
+            projection,
+            seed,
+        )
+
+    return _browse_response({"rows": _truncate_rows(rows, max_cell_bytes)})
+
+
+@data_router.post("/cluster/{cluster_name}/keyspace/{keyspace_name}/table/{table_name}/profile")
+def start_table_profile(
+    cluster_name: str,
+    keyspace_name: str,
+    table_name: str,
+    columns: str | None = None,
+    sample_points: int | None = None,
+    rows_per_point: int = 5,
+    _user: WebUser | None = Depends(get_current_user),
+) -> dict[str, Any]:
+    """Start a background job computing per-column statistics.
+
+    The whole table is scanned over its token ranges, unless
+    ``sample_points`` asks for a random sample instead. Poll the job under
+    ``/cluster/{cluster_name}/jobs/{job_id}`` for progress and the result.
+    """
+    session = get_session(cluster_name)
+    keyspace_name = sanitize_identifier(keyspace_name)
+    table_name = sanitize_identifier(table_name)
+
+    table_metadata = _table_metadata(session, keyspace_name, table_name)
+    projection = _projection(table_metadata, columns, include_key=False)
+    if sample_points is not None:
+        max_points = get_clusters_config().browse.max_sample_points
+        if not 1 <= sample_points <= max_points or rows_per_point < 1:
+            raise HTTPException(
+                status_code=400, detail=f"sample_points must be between 1 and {max_points}"
+            )
+
+    job = ScanJob(
+        cluster_name=cluster_name,
+        username=_user.username if _user else "anonymous",
+        kind=ScanJobKinds.PROFILE,
+        keyspace=keyspace_name,
+        table=table_name,
+        parameters={
+            "columns": projection,
+            "sample_points": sample_points,
+            "rows_per_point": rows_per_point if sample_points else None,
+        },
+    )
+    scan_jobs.submit(
+        job,
+        _user,
+        lambda job: profile_table(
+            session, job, _user, table_metadata, projection, sample_points, rows_per_point
+        ),
+    )
+    return {"job": job.to_dict()}
+
+
+@data_router.post("/cluster/{cluster_name}/keyspace/{keyspace_name}/table/{table_name}/count")
+def start_table_count(
+    cluster_name: str,
+    keyspace_name: str,
+    table_name: str,
+    _user: WebUser | None = Depends(get_current_user),
+) -> dict[str, Any]:
+    """Start an exact row count, returning the size estimate as a first answer.
+
+    The running total is the job's ``result.count``; follow it under
+    ``/cluster/{cluster_name}/jobs/{job_id}/events``.
+    """
+    session = get_session(cluster_name)
+    keyspace_name = sanitize_identifier(keyspace_name)
+    table_name = sanitize_identifier(table_name)
+
+    table_metadata = _table_metadata(session, keyspace_name, table_name)
+    estimate = estimate_rows(session, cluster_name, keyspace_name, table_metadata)
+    job = ScanJob(
+        cluster_name=cluster_name,
+        username=_user.username if _user else "anonymous",
+        kind=ScanJobKinds.COUNT,
+        keyspace=keyspace_name,
+        table=table_name,
+    )
+    scan_jobs.submit(
+        job, _user, lambda job: count_rows(session, job, _user, table_metadata, estimate)
+    )
+    return {"estimate": estimate, "job": job.to_dict()}
+
+
+@data_router.get("/cluster/{cluster_name}/keyspace/{keyspace_name}/table/{table_name}/partition")
+def get_partition_slice(
+    cluster_name: str,
+    keyspace_name: str,
+    table_name: str,
+    key: str,
+    start: str | None = None,
+    end: str | None = None,
+    after: str | None = None,
+    order: SliceOrder = "asc",
+    limit: int = Query(default=100, ge=1, le=1000),
+    columns: str | None = None,
+    max_cell_bytes: int | None = None,
+    _user: WebUser | None = Depends(get_current_user),
+) -> dict[str, Any]:
+    """Page through one partition by clustering-key range.
+
+    ``key`` is a JSON object of the partition key values. ``start``
+    (inclusive) and ``end`` (exclusive) are JSON objects giving a clustering
+    prefix. Each response's ``next_after`` is passed back as ``after`` to
+    read the following page.
+    """
+    session = get_session(cluster_name)
+    keyspace_name = sanitize_identifier(keyspace_name)
+    table_name = sanitize_identifier(table_name)
+
+    table_metadata = _table_metadata(session, keyspace_name, table_name)
+    projection = _projection(table_metadata, columns, include_key=True)
+    max_cell_bytes = _cell_limit(max_cell_bytes)
+    try:
+        query, values = slice_statement(
+            keyspace_name,
+            table_metadata,
+            loads(key),
+            loads(start) if start else None,
+            loads(end) if end else None,
+            loads(after) if after else None,
+            order,
+            projection,
+            limit,
+        )
+    except (ValueError, AttributeError, JSONDecodeError) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid slice: {e}") from e
+
+    with _http_errors("read partition"):
+        rows, _ = _read_page(
+            session,
+            cluster_name,
+            _user,
+            query,
+            WhereClause(values=values),
+            limit,
+            None,
+            Priorities.INTERACTIVE,
+        )
+
+    return _browse_response(
+        {
+            "rows": _truncate_rows(rows, max_cell_bytes),
+            "next_after": next_after(table_metadata, rows, limit),
+        }
+    )
 
 
 @data_router.put("/cluster/{cluster_name}/keyspace/{keyspace_name}/table/{table_name}/row")
@@ -158,7 +576,10 @@ def update_table_row(
         query = f'UPDATE "{keyspace_name}"."{table_name}" SET {set_clause} WHERE {where_clause}'
 
         execute_cql(session, query, cluster_name, _user, parameters=converted_values)
+        page_cache.invalidate(cluster_name, keyspace_name, table_name)
         return {"detail": "Row updated successfully"}
+    except (AdmissionRejected, QueryCancelled):
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to update row: {e}") from e
 
@@ -202,7 +623,10 @@ def delete_table_row(
         query = f'DELETE FROM "{keyspace_name}"."{table_name}" WHERE {where_clause}'
 
         execute_cql(session, query, cluster_name, _user, parameters=converted_values)
+        page_cache.invalidate(cluster_name, keyspace_name, table_name)
         return {"detail": "Row deleted successfully"}
+    except (AdmissionRejected, QueryCancelled):
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to delete row: {e}") from e
 
@@ -250,7 +674,10 @@ def insert_table_row(
 
     try:
         execute_cql(session, query, cluster_name, _user, parameters=converted_values)
+        page_cache.invalidate(cluster_name, keyspace_name, table_name)
         return {"detail": "Row inserted successfully"}
+    except (AdmissionRejected, QueryCancelled):
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to insert row: {e}") from e
 
@@ -263,35 +690,166 @@ def export_table_data(
     filter_json: str | None = None,
     allow_filtering: bool = False,
     format: str = "csv",
+    columns: str | None = None,
+    _user: WebUser | None = Depends(get_current_user),
 ) -> StreamingResponse:
     session = get_session(cluster_name)
     keyspace_name = sanitize_identifier(keyspace_name)
     table_name = sanitize_identifier(table_name)
 
-    try:
-        where_clause = build_where_clause(filter_json)
-    except (ValueError, Exception) as e:
-        raise HTTPException(status_code=400, detail=f"Invalid filter: {e}") from e
-
-    query = f'SELECT * FROM "{keyspace_name}"."{table_name}"{where_clause}'
-
-    if allow_filtering:
-        query += " ALLOW FILTERING"
+    table_metadata = _table_metadata(session, keyspace_name, table_name)
+    where, access_path = _plan_read(table_metadata, filter_json)
+    projection = _projection(table_metadata, columns, include_key=False)
+    query = _select_query(keyspace_name, where, access_path, allow_filtering, projection)
 
+    fetch_size = bulk_fetch_size(cluster_name)
+    slot = admission_controller.acquire(cluster_name, _user, Workloads.EXPORTS)
     if format == "json":
+        stream = generate_json_stream(
+            session, query, fetch_size, _user, cluster_name=cluster_name, parameters=where.values
+        )
         return StreamingResponse(
-            generate_json_stream(session, query),
+            hold_while_streaming(stream, slot),
             media_type="application/x-ndjson",
             headers={"Content-Disposition": f"attachment; filename={table_name}_export.json"},
         )
 
+    stream = generate_csv_stream(
+        session, query, fetch_size, _user, cluster_name=cluster_name, parameters=where.values
+    )
     return StreamingResponse(
-        generate_csv_stream(session, query),
+        hold_while_streaming(stream, slot),
         media_type="text/csv",
         headers={"Content-Disposition": f"attachment; filename={table_name}_export.csv"},
     )
 
 
+@contextmanager
+def _http_errors(action: str) -> Iterator[None]:
+    """Map a failed read to an HTTP error.
+
+    Admission and cancellation errors have their own handlers. A
+    ``ValueError`` is a bad request; anything else is reported as a failure
+    to ``action``.
+    """
+    try:
+        yield
+    except (AdmissionRejected, QueryCancelled, HTTPException):
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except Exception as e:
+        error_msg = str(e)
+        if "ALLOW FILTERING" in error_msg:
+            raise HTTPException(
+                status_code=400,
+                detail=(
+                    "This query requires ALLOW FILTERING. Please enable it in the filter settings."
+                ),
+            ) from e
+        raise HTTPException(status_code=500, detail=f"Failed to {action}: {error_msg}") from e
+
+
+def _cell_limit(max_cell_bytes: int | None) -> int | None:
+    """The request's cell size cap, else the configured one; ``None`` or ``0`` is no cap."""
+    if max_cell_bytes is None:
+        return get_clusters_config().browse.max_cell_bytes
+    return max_cell_bytes
+
+
+def _truncate_rows(rows: list[dict[str, Any]], max_cell_bytes: int | None) -> list[dict[str, Any]]:
+    return [{k: truncate_cell(v, max_cell_bytes) for k, v in row.items()} for row in rows]
+
+
+def _browse_response(response: dict[str, Any]) -> dict[str, Any]:
+    return jsonable_encoder(response, custom_encoder={bytes: lambda var: var.hex()})  # type: ignore[no-any-return]
+
+
+def _table_metadata(session: Session, keyspace_name: str, table_name: str) -> Any:
+    """Metadata of a table or materialized view, or a 404."""
+    keyspace_metadata = session.cluster.metadata.keyspaces.get(keyspace_name)
+    table_metadata = None
+    if keyspace_metadata:
+        table_metadata = keyspace_metadata.tables.get(table_name) or keyspace_metadata.views.get(
+            table_name
+        )
+    if not table_metadata:
+        raise HTTPException(status_code=404, detail="Table not found")
+    return table_metadata
+
+
+def _plan_read(table_metadata: Any, filter_json: str | None) -> tuple[WhereClause, AccessPath]:
+    try:
+        where = build_where(filter_json, table_metadata)
+    except (ValueError, Exception) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid filter: {e}") from e
+    return where, plan_access(table_metadata, where.restrictions)
+
+
+def _projection(table_metadata: Any, columns: str | None, include_key: bool) -> list[str] | None:
+    if not columns:
+        return None
+    requested = [column.strip() for column in columns.split(",") if column.strip()]
+    for column in requested:
+        sanitize_identifier(column)
+        if column not in table_metadata.columns:
+            raise HTTPException(status_code=400, detail=f"Unknown column: {column}")
+    if include_key:
+        key = [
+            column.name
+            for column in (*table_metadata.partition_key, *table_metadata.clustering_key)
+        ]
+        requested = key + [column for column in requested if column not in key]
+    return list(dict.fromkeys(requested))
+
+
+def _select_query(
+    keyspace_name: str,
+    where: WhereClause,
+    access_path: AccessPath,
+    allow_filtering: bool,
+    columns: list[str] | None = None,
+) -> str:
+    """Read from the planned table or view.
+
+    ALLOW FILTERING is only added when the user enabled it and the access path
+    needs it. Without it, Cassandra still rejects reads the planner could not
+    place, and the user is asked to enable it.
+    """
+    selected = ", ".join(f'"{column}"' for column in columns) if columns else "*"
+    query = f'SELECT {selected} FROM "{keyspace_name}"."{access_path.table}"{where.clause}'
+    if allow_filtering and access_path.filtering:
+        query += " ALLOW FILTERING"
+    return query
+
+
+def _read_page(
+    session: Session,
+    cluster_name: str,
+    user: WebUser | None,
+    query: str,
+    where: WhereClause,
+    limit: int,
+    paging_state: bytes | None,
+    priority: str,
+) -> tuple[list[dict[str, Any]], bytes | None]:
+    statement = bind_statement(session, query, where.values, fetch_size=limit)
+    # Prefetches are speculative, so they must not take the user's interactive slots.
+    workload = Workloads.EXPORTS if priority == Priorities.BACKGROUND else Workloads.INTERACTIVE
+    with (
+        admission_controller.acquire(cluster_name, user, workload),
+        scheduled(session, user, priority),
+        query_registry.track(cluster_name, user, query) as tracked,
+        tracked.bound(),
+    ):
+        rows = session.execute(
+            statement,
+            paging_state=paging_state,
+            execution_profile=ExecutionProfiles.INTERACTIVE,
+        )
+    return [dict(row._asdict()) for row in rows.current_rows], rows.paging_state
+
+
 _MAX_IMPORT_SIZE = 50 * 1024 * 1024
 
 
@@ -321,6 +879,7 @@ def import_table_data(
     if len(content) > _MAX_IMPORT_SIZE:
         raise HTTPException(status_code=413, detail="File too large (max 50MB)")
 
+    page_cache.invalidate(cluster_name, keyspace_name, table_name)
     resolved_format = (format or _infer_import_format(file.filename)).lower()
     if resolved_format == "json":
         try:
@@ -330,9 +889,7 @@ def import_table_data(
         except (ValueError, JSONDecodeError) as e:
             raise HTTPException(status_code=400, detail=f"Invalid JSON: {e}") from e
     if resolved_format != "csv":
-        raise HTTPException(
-            status_code=400, detail=f"Unsupported import format: {resolved_format}"
-        )
+        raise HTTPException(status_code=400, detail=f"Unsupported import format: {resolved_format}")
     return load_csv_data(
         content, keyspace_name, table_name, table_metadata, session, cluster_name, _user
     )
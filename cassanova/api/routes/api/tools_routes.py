@@ -1,30 +1,49 @@
+import json
+from collections.abc import Iterator
 from http import HTTPStatus
+from itertools import chain
 from logging import getLogger
 from shutil import rmtree
 from typing import Any, Literal
+from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, Form, UploadFile
+from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
 from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 
 from cassanova.api.dependencies.auth import require_permission
+from cassanova.api.dependencies.csv_handler import generate_csv_stream, generate_json_stream
 from cassanova.api.dependencies.db_session import get_session
-from cassanova.api.routes.api.cluster_routes import _invalidate_schema_cache
+from cassanova.config.cassanova_config import bulk_fetch_size, get_clusters_config
 from cassanova.consts.cass_tools import CassTools
-from cassanova.core.cql.execute_query import execute_query_cql
+from cassanova.consts.workloads import Workloads
+from cassanova.core.admission import admission_controller, hold_while_streaming
+from cassanova.core.cql.execute_query import (
+    cqlsh_page_size,
+    decode_paging_state,
+    execute_query_cql,
+)
+from cassanova.core.cql.fan_out import check_fan_out_cost, fan_out_query, select_clusters
+from cassanova.core.cql.query_cost import analyze_query, check_query_cost, decide
+from cassanova.core.cql.query_trace import fetch_trace
+from cassanova.core.cql.script_runner import run_script
+from cassanova.core.cql.script_splitter import split_statements
+from cassanova.core.schema_cache import invalidate_schema_cache
+from cassanova.core.schema_refresh import parse_ddl_target
 from cassanova.core.tools.argument_handling import parse_args, resolve_args
 from cassanova.core.tools.execute_tool import execute_tool
 from cassanova.core.tools.tool_validation import get_tool_path, is_tool_allowed
 from cassanova.core.tools.user_workspace import get_namespace_dir, save_uploaded_files
+from cassanova.exceptions.cql_exceptions import AdmissionRejected, QueryCancelled
 from cassanova.models.auth_models import WebUser
-from cassanova.models.cql_query import CQLQuery
+from cassanova.models.cql_query import CQLQuery, CQLScript, FanOutQuery
 
 logger = getLogger(__name__)
 
 tools_router = APIRouter()
 
 
-_DDL_KEYWORDS = {"CREATE", "DROP", "ALTER", "TRUNCATE"}
+_DDL_KEYWORDS = {"CREATE", "DROP", "ALTER"}
 
 
 @tools_router.post("/cluster/{cluster_name}/operations/cqlsh")
@@ -33,16 +52,170 @@ def run_cqlsh(
     query: CQLQuery,
     _user: WebUser = Depends(require_permission("cluster:admin")),
 ) -> Any:
+    try:
+        decode_paging_state(query.paging_state)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
     session = get_session(cluster_name)
+    check_query_cost(
+        session,
+        cluster_name,
+        query.cql,
+        _user,
+        query.confirm_cost,
+        page_size=cqlsh_page_size(query),
+    )
     result = execute_query_cql(session, query, cluster_name, _user)
 
     first_word = query.cql.strip().split()[0].upper() if query.cql.strip() else ""
     if first_word in _DDL_KEYWORDS:
-        _invalidate_schema_cache(cluster_name, session)
+        invalidate_schema_cache(cluster_name, session, parse_ddl_target(query.cql))
 
     return jsonable_encoder(result, custom_encoder={bytes: lambda var: var.hex()})
 
 
+@tools_router.post("/cluster/{cluster_name}/operations/cqlsh/analyze")
+def analyze_cqlsh_query(
+    cluster_name: str,
+    query: CQLQuery,
+    _user: WebUser = Depends(require_permission("cluster:admin")),
+) -> dict[str, Any]:
+    """Classify a SELECT and estimate what it would read, without running it."""
+    session = get_session(cluster_name)
+    cost = analyze_query(session, cluster_name, query.cql, page_size=cqlsh_page_size(query))
+    return {**cost.to_dict(), "decision": decide(cost, _user)}
+
+
+@tools_router.get("/cluster/{cluster_name}/operations/cqlsh/trace/{trace_id}")
+def get_cqlsh_trace(
+    cluster_name: str,
+    trace_id: UUID,
+    _user: WebUser = Depends(require_permission("cluster:admin")),
+) -> Any:
+    """Fetch a trace by session id; answers 202 while Cassandra is still writing it."""
+    session = get_session(cluster_name)
+    trace = fetch_trace(session, cluster_name, trace_id, _user)
+    if trace is None:
+        return JSONResponse(
+            status_code=HTTPStatus.ACCEPTED,
+            content={"status": "pending", "trace_id": str(trace_id)},
+        )
+    return jsonable_encoder(trace, custom_encoder={bytes: lambda var: var.hex()})
+
+
+@tools_router.post("/cluster/{cluster_name}/operations/cqlsh/script")
+def run_cqlsh_script(
+    cluster_name: str,
+    script: CQLScript,
+    _user: WebUser = Depends(require_permission("cluster:admin")),
+) -> Any:
+    try:
+        statements = split_statements(script.script)
+        if not statements:
+            raise ValueError("Script contains no statements")
+        session = get_session(cluster_name)
+        # Every SELECT must pass the same cost check as a query run on its own.
+        page_size = get_clusters_config().cqlsh.default_page_size
+        for cql in statements:
+            if cql.split(maxsplit=1)[0].upper() == "SELECT":
+                check_query_cost(session, cluster_name, cql, _user, script.confirm_cost, page_size)
+        result = run_script(
+            session,
+            statements,
+            cluster_name,
+            _user,
+            script.cl,
+            stop_on_error=script.stop_on_error,
+            concurrency=script.concurrency,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    # One debounced refresh covers every DDL statement in the script.
+    for statement in result.statements:
+        if statement.kind == "ddl" and statement.status == "ok":
+            invalidate_schema_cache(cluster_name, session, parse_ddl_target(statement.statement))
+
+    return jsonable_encoder(result.to_dict(), custom_encoder={bytes: lambda var: var.hex()})
+
+
+@tools_router.post("/cluster/{cluster_name}/operations/cqlsh/export")
+def export_cqlsh_query(
+    cluster_name: str,
+    query: CQLQuery,
+    format: Literal["csv", "json"] = "csv",
+    _user: WebUser = Depends(require_permission("cluster:admin")),
+) -> StreamingResponse:
+    """Stream every page of a SELECT as CSV or NDJSON without buffering it."""
+    cql = _require_select(query.cql, "exported")
+    session = get_session(cluster_name)
+    generate_stream = generate_json_stream if format == "json" else generate_csv_stream
+    slot = admission_controller.acquire(cluster_name, _user, Workloads.EXPORTS)
+    try:
+        stream = _start_stream(
+            generate_stream(
+                session, cql, bulk_fetch_size(cluster_name), _user, query.cl, cluster_name
+            )
+        )
+    except (AdmissionRejected, QueryCancelled):
+        slot.release()
+        raise
+    except Exception as e:
+        slot.release()
+        raise HTTPException(status_code=400, detail=f"Export failed: {e}") from e
+
+    if format == "json":
+        return StreamingResponse(
+            hold_while_streaming(stream, slot),
+            media_type="application/x-ndjson",
+            headers={"Content-Disposition": "attachment; filename=query_export.json"},
+        )
+    return StreamingResponse(
+        hold_while_streaming(stream, slot),
+        media_type="text/csv",
+        headers={"Content-Disposition": "attachment; filename=query_export.csv"},
+    )
+
+
+@tools_router.post("/operations/fan-out")
+def run_fan_out_query(
+    query: FanOutQuery,
+    _user: WebUser = Depends(require_permission("cluster:admin")),
+) -> StreamingResponse:
+    """Run a SELECT on every selected cluster, streaming one NDJSON line per cluster."""
+    cql = _require_select(query.cql, "fanned out")
+    cluster_names = select_clusters(query.clusters, query.pattern)
+    if not cluster_names:
+        raise HTTPException(status_code=400, detail="No clusters match the selector")
+    check_fan_out_cost(cluster_names, cql, _user, query.confirm_cost)
+
+    results = fan_out_query(
+        cluster_names, cql, _user, query.cl, query.parallelism, query.deadline_seconds
+    )
+    return StreamingResponse(
+        (
+            json.dumps(jsonable_encoder(result, custom_encoder={bytes: lambda var: var.hex()}))
+            + "\n"
+            for result in results
+        ),
+        media_type="application/x-ndjson",
+    )
+
+
+def _require_select(cql: str, action: str) -> str:
+    cql = cql.strip().rstrip(";")
+    if not cql or cql.split()[0].upper() != "SELECT":
+        raise HTTPException(status_code=400, detail=f"Only SELECT statements can be {action}")
+    return cql
+
+
+def _start_stream(stream: Iterator[str]) -> Iterator[str]:
+    """Run the query up to its first chunk so errors surface before streaming."""
+    for first in stream:
+        return chain([first], stream)
+    return iter(())
+
+
 @tools_router.get("/tool/list")
 def get_available_tools() -> JSONResponse:
     return JSONResponse({"tools": CassTools.ALLOWED_TOOLS})
@@ -76,7 +249,8 @@ async def run_tool(
         stdout, stderr, ret_code = await execute_tool(tool_path, resolved_args, workdir)
 
         stderr = "\n".join(
-            line for line in stderr.splitlines()
+            line
+            for line in stderr.splitlines()
             if "--add-exports" not in line and "--add-opens" not in line
         ).strip()
 
@@ -0,0 +1,30 @@
+from pydantic import BaseModel, Field
+
+
+class WorkloadLimits(BaseModel):
+    """Maximum concurrent CQL requests per workload; ``None`` means unlimited."""
+
+    interactive: int | None = Field(default=None, ge=1)
+    mutations: int | None = Field(default=None, ge=1)
+    exports: int | None = Field(default=None, ge=1)
+    imports: int | None = Field(default=None, ge=1)
+
+
+class AdmissionConfig(BaseModel):
+    """Concurrency bulkheads around CQL execution.
+
+    Every cluster gets ``cluster_limits`` (or its entry in ``clusters``). A
+    user whose role appears in ``role_limits`` must also fit within that
+    role's limits, which are shared by everyone holding the role on the same
+    cluster. Requests over a limit wait up to ``queue_timeout_seconds`` in a
+    queue of at most ``max_queue_size`` before being rejected with 429.
+    """
+
+    enabled: bool = True
+    queue_timeout_seconds: float = Field(default=5.0, ge=0)
+    max_queue_size: int = Field(default=100, ge=0)
+    cluster_limits: WorkloadLimits = Field(
+        default_factory=lambda: WorkloadLimits(interactive=32, mutations=16, exports=4, imports=2)
+    )
+    clusters: dict[str, WorkloadLimits] = Field(default_factory=dict)
+    role_limits: dict[str, WorkloadLimits] = Field(default_factory=dict)
@@ -0,0 +1,26 @@
+from pydantic import BaseModel, Field
+
+
+class BrowseConfig(BaseModel):
+    """Size limits for table data returned by the data explorer.
+
+    ``text`` and ``blob`` cells larger than ``max_cell_bytes`` are replaced
+    by a preview of at most that size and a marker with the full size; the
+    full value is fetched on its own from the raw cell endpoint, which
+    streams it in ``cell_chunk_size`` byte chunks. Requests may pass their
+    own cap, and ``None`` or ``0`` turns truncation off.
+
+    Partition-key lookups take up to ``max_lookup_keys`` keys per request and
+    run up to ``lookup_concurrency`` of them at once. Partition listings may
+    split the token ring into at most ``max_listing_segments`` ranges.
+    Random samples read from up to ``max_sample_points`` tokens,
+    ``sample_concurrency`` at a time.
+    """
+
+    max_cell_bytes: int | None = Field(default=1024, ge=0)
+    cell_chunk_size: int = Field(default=64 * 1024, ge=1)
+    max_lookup_keys: int = Field(default=1000, ge=1)
+    lookup_concurrency: int = Field(default=32, ge=1)
+    max_listing_segments: int = Field(default=16, ge=1)
+    max_sample_points: int = Field(default=100, ge=1)
+    sample_concurrency: int = Field(default=16, ge=1)
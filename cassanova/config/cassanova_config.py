@@ -12,12 +12,23 @@ from pydantic_settings import (
     SettingsConfigDict,
 )
 
+from cassanova.config.admission_config import AdmissionConfig
 from cassanova.config.app_config import APPConfig
 from cassanova.config.auth_config import AuthConfig
+from cassanova.config.browse_config import BrowseConfig
 from cassanova.config.cluster_config import ClusterConnectionConfig
 from cassanova.config.cluster_metadata import ClusterMetadata
+from cassanova.config.cqlsh_config import CqlshConfig
+from cassanova.config.fan_out_config import FanOutConfig
 from cassanova.config.k8s_config import K8sConfig
 from cassanova.config.logging_config import LoggingConfig
+from cassanova.config.node_views_config import NodeViewsConfig
+from cassanova.config.page_cache_config import PageCacheConfig
+from cassanova.config.query_cost_config import QueryCostConfig
+from cassanova.config.query_metrics_config import QueryMetricsConfig
+from cassanova.config.scan_jobs_config import ScanJobsConfig
+from cassanova.config.scheduler_config import SchedulerConfig
+from cassanova.config.schema_refresh_config import SchemaRefreshConfig
 from cassanova.config.timeouts_config import TimeoutConfig
 
 logger = getLogger(__name__)
@@ -35,6 +46,17 @@ class CassanovaConfig(BaseSettings):
     logging: LoggingConfig = LoggingConfig()
     k8s: K8sConfig = K8sConfig()
     timeouts: TimeoutConfig = TimeoutConfig()
+    schema_refresh: SchemaRefreshConfig = SchemaRefreshConfig()
+    admission: AdmissionConfig = AdmissionConfig()
+    scheduler: SchedulerConfig = SchedulerConfig()
+    cqlsh: CqlshConfig = CqlshConfig()
+    fan_out: FanOutConfig = FanOutConfig()
+    query_metrics: QueryMetricsConfig = QueryMetricsConfig()
+    query_cost: QueryCostConfig = QueryCostConfig()
+    page_cache: PageCacheConfig = PageCacheConfig()
+    browse: BrowseConfig = BrowseConfig()
+    scan_jobs: ScanJobsConfig = ScanJobsConfig()
+    node_views: NodeViewsConfig = NodeViewsConfig()
 
     @classmethod
     def settings_customise_sources(
@@ -95,12 +117,16 @@ class CassanovaConfig(BaseSettings):
                 discovered_at=now,
                 last_seen=now,
             )
-        logger.info(
-            f"K8s Discovery added {len(discovered)} clusters: {list(discovered.keys())}"
-        )
+        logger.info(f"K8s Discovery added {len(discovered)} clusters: {list(discovered.keys())}")
 
 
 @cache
 def get_clusters_config(*args: Any, **kwargs: Any) -> CassanovaConfig:
     config = CassanovaConfig(*args, **kwargs)
     return config
+
+
+def bulk_fetch_size(cluster_name: str) -> int | None:
+    """The page size of the cluster's bulk execution profile, for full-table reads."""
+    cluster_config = get_clusters_config().clusters.get(cluster_name)
+    return cluster_config.execution_profiles.bulk.fetch_size if cluster_config else None
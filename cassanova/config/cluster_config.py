@@ -1,15 +1,29 @@
 from typing import Any
 
+from cassandra import ConsistencyLevel
 from cassandra.auth import PlainTextAuthProvider
-from cassandra.cluster import Cluster
+from cassandra.cluster import EXEC_PROFILE_DEFAULT, Cluster, ExecutionProfile, default_lbp_factory
 from cassandra.policies import (
     DCAwareRoundRobinPolicy,
+    LoadBalancingPolicy,
     RetryPolicy,
     TokenAwarePolicy,
 )
 from pydantic import BaseModel, Field
 
+from cassanova.config.execution_profiles_config import (
+    ExecutionProfilesConfig,
+    ExecutionProfileSettings,
+    SpeculativeExecutionConfig,
+)
 from cassanova.config.timeouts_config import TimeoutConfig
+from cassanova.consts.execution_profiles import ExecutionProfiles
+from cassanova.core.metrics.latency import LatencyTracker
+from cassanova.core.speculative_execution import (
+    ConstantSpeculativeExecution,
+    PercentileSpeculativeExecution,
+    ProfileSpeculativeExecutionPolicy,
+)
 
 
 class ClusterCredentials(BaseModel):
@@ -25,22 +39,35 @@ class ClusterConnectionConfig(BaseModel):
     local_dc: str | None = Field(default=None)
     protocol_version: int | None = Field(default=None)
     read_only: bool = Field(default=False)
+    lazy_schema: bool = Field(
+        default=False,
+        description=(
+            "Disable driver schema metadata and load keyspaces from system_schema on demand. "
+            "Intended for clusters with tens of thousands of tables."
+        ),
+    )
+    execution_profiles: ExecutionProfilesConfig = Field(default_factory=ExecutionProfilesConfig)
     additional_kwargs: dict[str, Any] | None = Field(default_factory=dict)
 
 
 def generate_cluster_connection(
     cluster_config: ClusterConnectionConfig,
     timeouts: TimeoutConfig | None = None,
+    latency_tracker: LatencyTracker | None = None,
 ) -> Cluster:
     kwargs = dict(cluster_config.additional_kwargs or {})
 
-    if cluster_config.local_dc:
-        kwargs.setdefault(
-            "load_balancing_policy",
-            TokenAwarePolicy(DCAwareRoundRobinPolicy(local_dc=cluster_config.local_dc)),
-        )
+    # The driver refuses legacy policy kwargs alongside execution profiles, so
+    # user-supplied ones are folded into every profile instead.
+    lbp = kwargs.pop("load_balancing_policy", None)
+    retry_policy = kwargs.pop("default_retry_policy", None) or RetryPolicy()
+    profiles = _build_execution_profiles(
+        cluster_config, timeouts or TimeoutConfig(), lbp, retry_policy, latency_tracker
+    )
+    kwargs["execution_profiles"] = {**profiles, **kwargs.get("execution_profiles", {})}
 
-    kwargs.setdefault("default_retry_policy", RetryPolicy())
+    if cluster_config.lazy_schema:
+        kwargs.setdefault("schema_metadata_enabled", False)
 
     if cluster_config.protocol_version:
         kwargs["protocol_version"] = cluster_config.protocol_version
@@ -56,6 +83,69 @@ def generate_cluster_connection(
     )
 
 
+def _build_execution_profiles(
+    cluster_config: ClusterConnectionConfig,
+    timeouts: TimeoutConfig,
+    lbp: LoadBalancingPolicy | None,
+    retry_policy: RetryPolicy,
+    latency_tracker: LatencyTracker | None,
+) -> dict[Any, ExecutionProfile]:
+    def _profile(
+        name: str, settings: ExecutionProfileSettings | None, timeout: float
+    ) -> ExecutionProfile:
+        settings = settings or ExecutionProfileSettings()
+        profile = ExecutionProfile(
+            load_balancing_policy=lbp or _default_lbp(cluster_config.local_dc),
+            retry_policy=retry_policy,
+            request_timeout=settings.request_timeout or timeout,
+            speculative_execution_policy=_speculative_policy(
+                name, settings.speculative_execution, latency_tracker
+            ),
+        )
+        if settings.consistency_level:
+            profile.consistency_level = ConsistencyLevel.name_to_value[settings.consistency_level]
+        return profile
+
+    profiles_config = cluster_config.execution_profiles
+    return {
+        EXEC_PROFILE_DEFAULT: _profile(ExecutionProfiles.DEFAULT, None, timeouts.default_query),
+        ExecutionProfiles.INTERACTIVE: _profile(
+            ExecutionProfiles.INTERACTIVE, profiles_config.interactive, timeouts.interactive
+        ),
+        ExecutionProfiles.BULK: _profile(
+            ExecutionProfiles.BULK, profiles_config.bulk, timeouts.batch
+        ),
+        ExecutionProfiles.METADATA: _profile(
+            ExecutionProfiles.METADATA, profiles_config.metadata, timeouts.metadata
+        ),
+    }
+
+
+def _speculative_policy(
+    profile: str,
+    config: SpeculativeExecutionConfig | None,
+    latency_tracker: LatencyTracker | None,
+) -> ProfileSpeculativeExecutionPolicy:
+    if config is None:
+        return ProfileSpeculativeExecutionPolicy(profile)
+    if config.policy == "percentile":
+        return PercentileSpeculativeExecution(
+            profile,
+            latency_tracker,
+            percentile=config.percentile,
+            fallback_delay=config.delay,
+            max_attempts=config.max_attempts,
+            min_samples=config.min_samples,
+        )
+    return ConstantSpeculativeExecution(profile, config.delay, config.max_attempts)
+
+
+def _default_lbp(local_dc: str | None) -> LoadBalancingPolicy:
+    if local_dc:
+        return TokenAwarePolicy(DCAwareRoundRobinPolicy(local_dc=local_dc))
+    return default_lbp_factory()
+
+
 def _get_auth_provider(
     credentials: ClusterCredentials | None = None,
 ) -> PlainTextAuthProvider | None:
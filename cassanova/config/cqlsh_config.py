@@ -0,0 +1,27 @@
+from pydantic import BaseModel, Field
+
+
+class CqlshConfig(BaseModel):
+    """Paging and script limits for statements run from the CQL shell.
+
+    The shell returns one page of ``default_page_size`` rows plus a paging
+    state for the next one. Clients may ask for bigger pages, up to
+    ``max_page_size`` rows; full result sets are only available through the
+    streaming download.
+
+    Scripts run up to ``script_concurrency`` consecutive DML statements at
+    once. DDL runs alone and waits up to ``schema_agreement_timeout`` seconds
+    for every node to agree on the new schema before the script continues.
+
+    Traced statements return only a trace id. Fetching the trace waits up to
+    ``trace_fetch_wait`` seconds for Cassandra to finish writing it, and the
+    last ``trace_cache_size`` formatted traces are kept for re-viewing.
+    """
+
+    default_page_size: int = Field(default=100, ge=1)
+    max_page_size: int = Field(default=1000, ge=1)
+    script_concurrency: int = Field(default=8, ge=1)
+    max_script_statements: int = Field(default=1000, ge=1)
+    schema_agreement_timeout: float = Field(default=30.0, gt=0)
+    trace_fetch_wait: float = Field(default=2.0, gt=0)
+    trace_cache_size: int = Field(default=200, ge=1)
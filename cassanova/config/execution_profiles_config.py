@@ -0,0 +1,62 @@
+from typing import Literal
+
+from cassandra import ConsistencyLevel
+from pydantic import BaseModel, Field, field_validator
+
+
+class SpeculativeExecutionConfig(BaseModel):
+    """When to send a duplicate request for an idempotent statement to another replica.
+
+    ``constant`` always waits ``delay`` seconds. ``percentile`` waits for the
+    observed ``percentile`` latency of the profile, using ``delay`` until
+    ``min_samples`` requests have been measured.
+    """
+
+    policy: Literal["constant", "percentile"] = "constant"
+    delay: float = Field(default=0.2, gt=0, description="Seconds before a speculative attempt")
+    max_attempts: int = Field(default=2, ge=1, description="Extra attempts per request")
+    percentile: float = Field(default=99.0, gt=0, lt=100)
+    min_samples: int = Field(default=100, ge=1)
+
+
+class ExecutionProfileSettings(BaseModel):
+    request_timeout: float | None = Field(
+        default=None, gt=0, description="Overrides the matching value from the global timeouts"
+    )
+    consistency_level: str | None = Field(
+        default=None, description="Consistency level name used when a statement sets none"
+    )
+    fetch_size: int | None = Field(default=None, gt=0)
+    speculative_execution: SpeculativeExecutionConfig | None = None
+
+    @field_validator("consistency_level", mode="before")
+    @classmethod
+    def validate_consistency_level(cls, v: str | None) -> str | None:
+        if v is None:
+            return v
+        name = v.upper()
+        if name not in ConsistencyLevel.name_to_value:
+            raise ValueError(f"Unknown consistency level: {v}")
+        return name
+
+
+class ExecutionProfilesConfig(BaseModel):
+    """Per-workload driver execution profiles.
+
+    Interactive UI reads, bulk exports/imports and metadata reads each get
+    their own timeout and consistency so long-running bulk work cannot
+    starve the clicks in the UI.
+    """
+
+    interactive: ExecutionProfileSettings = Field(
+        default_factory=lambda: ExecutionProfileSettings(
+            consistency_level="LOCAL_ONE",
+            speculative_execution=SpeculativeExecutionConfig(),
+        )
+    )
+    bulk: ExecutionProfileSettings = Field(
+        default_factory=lambda: ExecutionProfileSettings(fetch_size=5000)
+    )
+    metadata: ExecutionProfileSettings = Field(
+        default_factory=lambda: ExecutionProfileSettings(consistency_level="ONE")
+    )
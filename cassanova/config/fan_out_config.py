@@ -0,0 +1,14 @@
+from pydantic import BaseModel, Field
+
+
+class FanOutConfig(BaseModel):
+    """Limits for running one read across many clusters.
+
+    At most ``max_parallelism`` clusters are queried at once. A cluster that
+    has not answered ``cluster_deadline_seconds`` after its query started,
+    connecting included, is reported as timed out and the fan-out moves on.
+    """
+
+    max_parallelism: int = Field(default=8, ge=1)
+    cluster_deadline_seconds: float = Field(default=15.0, gt=0)
+    max_rows_per_cluster: int = Field(default=100, ge=1)
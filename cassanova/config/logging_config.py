@@ -27,6 +27,7 @@ class LoggingConfig(BaseModel):
     level: str = Field(default="INFO")
     app: LoggerConfig = LoggerConfig()
     audit: LoggerConfig = LoggerConfig()
+    slow_query: LoggerConfig = LoggerConfig()
 
 
 def _build_stdout_handler(fmt: logging.Formatter, _cfg: LoggerConfig) -> logging.Handler:
@@ -66,6 +67,14 @@ def configure_logging(config: LoggingConfig | None = None) -> None:
         "audit.log",
         propagate=False,
     )
+    _configure_logger(
+        "cassanova.slow_query",
+        logging.INFO,
+        config.slow_query,
+        logging.Formatter("%(message)s"),
+        "slow_query.log",
+        propagate=False,
+    )
 
 
 _HANDLER_FACTORIES: dict[str, Callable[..., logging.Handler]] = {
@@ -0,0 +1,12 @@
+from pydantic import BaseModel, Field
+
+
+class NodeViewsConfig(BaseModel):
+    """Per-node reads of the ``system_views`` virtual tables.
+
+    Every node is queried at once and the merged rows are kept for
+    ``cache_ttl_seconds``, so dashboards polling a view do not send a query
+    to each node on every refresh.
+    """
+
+    cache_ttl_seconds: float = Field(default=10.0, ge=0)
@@ -0,0 +1,23 @@
+from pydantic import BaseModel, Field
+
+
+class PageCacheConfig(BaseModel):
+    """Server-side page cursors for browsing table data.
+
+    Each browse query gets a cursor that remembers the paging state of every
+    page it has read, so going back or jumping to a page resumes from the
+    nearest known state instead of re-running the scan. With ``cache_rows``,
+    the rows of the ``max_cached_pages`` most recently read pages are kept as
+    well. At most ``max_cursors`` cursors are kept, and one unused for
+    ``ttl_seconds`` is dropped. With ``prefetch``, the page after the one
+    being shown is read in the background by up to ``prefetch_workers``
+    threads.
+    """
+
+    enabled: bool = True
+    max_cursors: int = Field(default=256, ge=1)
+    ttl_seconds: float = Field(default=600.0, gt=0)
+    cache_rows: bool = True
+    max_cached_pages: int = Field(default=10, ge=1)
+    prefetch: bool = True
+    prefetch_workers: int = Field(default=4, ge=1)
@@ -0,0 +1,35 @@
+from pydantic import BaseModel, Field
+
+_GIB = 1024**3
+
+
+class CostThresholds(BaseModel):
+    """When a query needs confirmation or is refused outright.
+
+    A query matches when its kind is listed, or when its estimated partitions
+    or bytes reach the given limit; ``None`` disables a limit.
+    """
+
+    confirm_kinds: list[str] = Field(default_factory=list)
+    block_kinds: list[str] = Field(default_factory=list)
+    confirm_partitions: int | None = Field(default=None, ge=1)
+    block_partitions: int | None = Field(default=None, ge=1)
+    confirm_bytes: int | None = Field(default=None, ge=1)
+    block_bytes: int | None = Field(default=None, ge=1)
+
+
+class QueryCostConfig(BaseModel):
+    """Pre-execution cost analysis of table browsing and CQL shell reads.
+
+    Queries are classified from table metadata and sized from
+    ``system.size_estimates`` (cached for ``size_estimates_ttl_seconds``),
+    then checked against ``default_thresholds``, which by default ask for
+    confirmation before reading an estimated 1 GiB or more. A user whose roles
+    appear in ``role_thresholds`` gets the most lenient outcome among those
+    roles instead.
+    """
+
+    enabled: bool = True
+    size_estimates_ttl_seconds: float = Field(default=300.0, ge=0)
+    default_thresholds: CostThresholds = CostThresholds(confirm_bytes=_GIB)
+    role_thresholds: dict[str, CostThresholds] = Field(default_factory=dict)
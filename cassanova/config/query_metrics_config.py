@@ -0,0 +1,18 @@
+from pydantic import BaseModel, Field
+
+
+class QueryMetricsConfig(BaseModel):
+    """Per-statement latency histograms and the slow-query log.
+
+    Every statement is timed from request to first page and recorded under
+    its normalized shape, up to ``max_shapes_per_cluster`` shapes per
+    cluster. Statements whose first page takes at least
+    ``slow_query_threshold_ms`` are written to the ``cassanova.slow_query``
+    logger, and the most recent ``slow_query_buffer_size`` of them are kept
+    in memory for the admin API.
+    """
+
+    enabled: bool = True
+    slow_query_threshold_ms: float = Field(default=500.0, ge=0)
+    slow_query_buffer_size: int = Field(default=200, ge=1)
+    max_shapes_per_cluster: int = Field(default=500, ge=1)
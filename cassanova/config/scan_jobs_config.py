@@ -0,0 +1,21 @@
+from pydantic import BaseModel, Field
+
+
+class ScanJobsConfig(BaseModel):
+    """Limits for background jobs that read a whole table, such as profiling.
+
+    At most ``max_running_jobs`` jobs run at once; more are queued. A job
+    splits the token ring into ``token_ranges`` ranges, reads
+    ``parallelism`` of them at a time in pages of ``fetch_size`` rows, and
+    holds a single ``exports`` admission slot while it runs. The last
+    ``max_finished_jobs`` finished jobs are kept so their results can be
+    read back. A row count retries a failed range up to ``count_retries``
+    times, split into halves each time.
+    """
+
+    max_running_jobs: int = Field(default=2, ge=1)
+    token_ranges: int = Field(default=64, ge=1)
+    parallelism: int = Field(default=4, ge=1)
+    fetch_size: int = Field(default=1000, ge=1)
+    max_finished_jobs: int = Field(default=50, ge=0)
+    count_retries: int = Field(default=2, ge=0)
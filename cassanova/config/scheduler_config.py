@@ -0,0 +1,18 @@
+from pydantic import BaseModel, Field
+
+
+class SchedulerConfig(BaseModel):
+    """Per-cluster work scheduler in front of the driver connection pool.
+
+    At most ``max_concurrent_requests`` CQL requests run per cluster. Beyond
+    that, requests are dispatched by weighted fair queuing: each priority
+    class gets capacity in proportion to its weight, shared fairly between
+    the users queued in it.
+    """
+
+    enabled: bool = True
+    max_concurrent_requests: int = Field(default=48, ge=1)
+    queue_timeout_seconds: float = Field(default=30.0, ge=0)
+    interactive_weight: float = Field(default=8.0, gt=0)
+    mutation_weight: float = Field(default=4.0, gt=0)
+    background_weight: float = Field(default=1.0, gt=0)
@@ -0,0 +1,15 @@
+from pydantic import BaseModel, Field
+
+
+class SchemaRefreshConfig(BaseModel):
+    """Debounce window for driver schema refreshes triggered by DDL.
+
+    DDL issued within ``debounce_seconds`` of each other on the same cluster is
+    coalesced into one background refresh, which is never postponed by more
+    than ``max_delay_seconds``. When more than ``max_targets`` distinct objects
+    change in one window a single full refresh replaces the targeted ones.
+    """
+
+    debounce_seconds: float = Field(default=0.5, ge=0)
+    max_delay_seconds: float = Field(default=5.0, gt=0)
+    max_targets: int = Field(default=20, ge=1)
@@ -6,7 +6,8 @@ class TimeoutConfig(BaseModel):
 
     Applied globally to every Cassandra session so that a single bad query
     cannot hang a request indefinitely. Per-call overrides (e.g. DDL, batch
-    imports) use the longer values defined here.
+    imports) use the longer values defined here. ``interactive`` and
+    ``metadata`` are the request timeouts of the matching execution profiles.
     """
 
     default_query: float = Field(default=30.0, gt=0)
@@ -14,3 +15,5 @@ class TimeoutConfig(BaseModel):
     ddl: float = Field(default=120.0, gt=0)
     batch: float = Field(default=120.0, gt=0)
     health_check: float = Field(default=5.0, gt=0)
+    interactive: float = Field(default=10.0, gt=0)
+    metadata: float = Field(default=10.0, gt=0)
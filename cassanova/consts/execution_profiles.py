@@ -0,0 +1,12 @@
+class ExecutionProfiles:
+    """Names of the driver execution profiles registered on every cluster.
+
+    ``DEFAULT`` labels the driver's default profile in metrics. ``INTERACTIVE``
+    serves UI-driven reads, ``BULK`` serves exports and imports, ``METADATA``
+    serves system table and ``DESCRIBE`` reads.
+    """
+
+    DEFAULT = "default"
+    INTERACTIVE = "interactive"
+    BULK = "bulk"
+    METADATA = "metadata"
@@ -0,0 +1,20 @@
+class NodeViews:
+    """``system_views`` tables that describe only the node serving the read."""
+
+    SETTINGS = "settings"
+    THREAD_POOLS = "thread_pools"
+    CLIENTS = "clients"
+    CACHES = "caches"
+    COORDINATOR_READ_LATENCY = "coordinator_read_latency"
+    COORDINATOR_WRITE_LATENCY = "coordinator_write_latency"
+    COORDINATOR_SCAN_LATENCY = "coordinator_scan_latency"
+
+    ALL = (
+        SETTINGS,
+        THREAD_POOLS,
+        CLIENTS,
+        CACHES,
+        COORDINATOR_READ_LATENCY,
+        COORDINATOR_WRITE_LATENCY,
+        COORDINATOR_SCAN_LATENCY,
+    )
@@ -0,0 +1,26 @@
+class QueryKinds:
+    """How much of a table a read touches, from cheapest to most expensive."""
+
+    SINGLE_PARTITION = "single_partition"
+    MULTI_PARTITION = "multi_partition"
+    INDEX_SCAN = "index_scan"
+    FULL_SCAN = "full_scan"
+    UNKNOWN = "unknown"
+
+
+class CostDecisions:
+    """Outcome of checking a query's cost against the configured thresholds."""
+
+    ALLOW = "allow"
+    CONFIRM = "confirm"
+    BLOCK = "block"
+
+
+class AccessPaths:
+    """How the data explorer serves a filtered read of a table."""
+
+    SCAN = "scan"
+    PRIMARY_KEY = "primary_key"
+    INDEX = "index"
+    VIEW = "view"
+    FILTERING = "filtering"
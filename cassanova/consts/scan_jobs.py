@@ -0,0 +1,17 @@
+class ScanJobKinds:
+    """Background jobs that read a whole table over its token ranges."""
+
+    PROFILE = "profile"
+    COUNT = "count"
+
+
+class ScanJobStatuses:
+    """Lifecycle of a background scan job."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    FINISHED = (COMPLETED, FAILED, CANCELLED)
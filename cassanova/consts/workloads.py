@@ -0,0 +1,22 @@
+class Workloads:
+    """Admission control classes; each has its own concurrency limit."""
+
+    INTERACTIVE = "interactive"
+    MUTATIONS = "mutations"
+    EXPORTS = "exports"
+    IMPORTS = "imports"
+
+
+class Priorities:
+    """Scheduler priority classes, from most to least latency sensitive."""
+
+    INTERACTIVE = "interactive"
+    MUTATION = "mutation"
+    BACKGROUND = "background"
+
+    FOR_WORKLOAD = {
+        Workloads.INTERACTIVE: INTERACTIVE,
+        Workloads.MUTATIONS: MUTATION,
+        Workloads.EXPORTS: BACKGROUND,
+        Workloads.IMPORTS: BACKGROUND,
+    }
@@ -0,0 +1,242 @@
+"""Per-cluster and per-role concurrency bulkheads for CQL execution.
+
+Each (cluster, workload) pair has a bulkhead limiting concurrent requests, and
+roles listed in ``admission.role_limits`` get an extra bulkhead shared by all
+users holding the role. A request over the limit queues until a slot frees up
+or ``queue_timeout_seconds`` passes, then fails with ``AdmissionRejected``.
+
+Admission is re-entrant per thread: a request that already holds a slot for
+a cluster and workload (e.g. an import job running its batches) is not
+queued again.
+"""
+
+import weakref
+from collections.abc import Iterator
+from logging import getLogger
+from math import ceil
+from threading import Condition, Lock, local
+from time import monotonic
+from typing import Any, TypeVar
+
+from cassanova.config.admission_config import AdmissionConfig, WorkloadLimits
+from cassanova.config.cassanova_config import get_clusters_config
+from cassanova.exceptions.cql_exceptions import AdmissionRejected
+from cassanova.models.auth_models import WebUser
+
+logger = getLogger(__name__)
+
+_CLUSTER_SCOPE = "*"
+
+_T = TypeVar("_T")
+
+_held_slots = local()
+
+
+class _Bulkhead:
+    def __init__(self, limit: int, max_queue: int) -> None:
+        self.limit = limit
+        self.max_queue = max_queue
+        self.active = 0
+        self.waiting = 0
+        self._condition = Condition()
+
+    def acquire(self, timeout: float) -> str | None:
+        """Take a slot, returning the rejection reason if none became free."""
+        with self._condition:
+            if self.active < self.limit and self.waiting == 0:
+                self.active += 1
+                return None
+            if self.waiting >= self.max_queue:
+                return "queue is full"
+
+            self.waiting += 1
+            try:
+                if not self._condition.wait_for(lambda: self.active < self.limit, timeout):
+                    return f"no slot freed up within {timeout:.1f}s"
+                self.active += 1
+                return None
+            finally:
+                self.waiting -= 1
+
+    def release(self) -> None:
+        with self._condition:
+            self.active -= 1
+            self._condition.notify()
+
+    def resize(self, limit: int, max_queue: int) -> None:
+        """Apply new limits; slots held over a lowered limit drain as they are released."""
+        with self._condition:
+            if limit == self.limit and max_queue == self.max_queue:
+                return
+            grew = limit > self.limit
+            self.limit = limit
+            self.max_queue = max_queue
+            if grew:
+                self._condition.notify_all()
+
+
+class AdmissionSlot:
+    """Held slots for one request; released on context exit or ``release()``."""
+
+    def __init__(
+        self,
+        bulkheads: list[_Bulkhead],
+        held: set[tuple[str, str]] | None = None,
+        key: tuple[str, str] | None = None,
+    ) -> None:
+        self._bulkheads = bulkheads
+        self._held = held
+        self._key = key
+        self._released = False
+        self._lock = Lock()
+
+    def release(self) -> None:
+        with self._lock:
+            if self._released:
+                return
+            self._released = True
+        self.detach()
+        for bulkhead in reversed(self._bulkheads):
+            bulkhead.release()
+
+    def detach(self) -> None:
+        """Stop treating the acquiring thread as the holder of this slot."""
+        if self._held is not None and self._key is not None:
+            self._held.discard(self._key)
+        self._held = None
+
+    def __enter__(self) -> "AdmissionSlot":
+        return self
+
+    def __exit__(self, *_exc: Any) -> None:
+        self.release()
+
+
+class AdmissionController:
+    def __init__(self) -> None:
+        self._bulkheads: dict[tuple[str, str, str], _Bulkhead] = {}
+        self._lock = Lock()
+
+    def acquire(self, cluster_name: str, user: WebUser | None, workload: str) -> AdmissionSlot:
+        config = get_clusters_config().admission
+        held = _thread_held_slots()
+        key = (cluster_name, workload)
+        if not config.enabled or key in held:
+            return AdmissionSlot([])
+
+        deadline = monotonic() + config.queue_timeout_seconds
+        acquired: list[_Bulkhead] = []
+        try:
+            for bulkhead in self._bulkheads_for(config, cluster_name, user, workload):
+                reason = bulkhead.acquire(max(0.0, deadline - monotonic()))
+                if reason is not None:
+                    logger.warning(
+                        f"Rejected {workload} request on '{cluster_name}' "
+                        f"for '{user.username if user else 'anonymous'}': {reason}"
+                    )
+                    raise AdmissionRejected(
+                        cluster_name,
+                        workload,
+                        reason,
+                        retry_after=max(1, ceil(config.queue_timeout_seconds)),
+                    )
+                acquired.append(bulkhead)
+        except BaseException:
+            for bulkhead in reversed(acquired):
+                bulkhead.release()
+            raise
+
+        held.add(key)
+        return AdmissionSlot(acquired, held, key)
+
+    def stats(self) -> list[dict[str, Any]]:
+        with self._lock:
+            items = list(self._bulkheads.items())
+        return [
+            {
+                "cluster": cluster_name,
+                "scope": "cluster" if scope == _CLUSTER_SCOPE else f"role:{scope}",
+                "workload": workload,
+                "limit": bulkhead.limit,
+                "active": bulkhead.active,
+                "waiting": bulkhead.waiting,
+            }
+            for (cluster_name, scope, workload), bulkhead in items
+        ]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._bulkheads.clear()
+
+    def _bulkheads_for(
+        self, config: AdmissionConfig, cluster_name: str, user: WebUser | None, workload: str
+    ) -> Iterator[_Bulkhead]:
+        role, role_limit = _role_limit(config, user, workload)
+        if role is not None and role_limit is not None:
+            yield self._bulkhead(config, cluster_name, role, workload, role_limit)
+
+        cluster_limits = config.clusters.get(cluster_name, config.cluster_limits)
+        cluster_limit = getattr(cluster_limits, workload)
+        if cluster_limit is not None:
+            yield self._bulkhead(config, cluster_name, _CLUSTER_SCOPE, workload, cluster_limit)
+
+    def _bulkhead(
+        self, config: AdmissionConfig, cluster_name: str, scope: str, workload: str, limit: int
+    ) -> _Bulkhead:
+        key = (cluster_name, scope, workload)
+        with self._lock:
+            bulkhead = self._bulkheads.get(key)
+            if bulkhead is None:
+                bulkhead = _Bulkhead(limit, config.max_queue_size)
+                self._bulkheads[key] = bulkhead
+        # The config may have been reloaded since the bulkhead was created.
+        bulkhead.resize(limit, config.max_queue_size)
+        return bulkhead
+
+
+def hold_while_streaming(stream: Iterator[_T], slot: AdmissionSlot) -> Iterator[_T]:
+    """Keep ``slot`` until ``stream`` is exhausted, closed or garbage collected."""
+    # The stream is consumed from other threads, so the acquiring thread must
+    # not keep skipping admission for new requests in the meantime.
+    slot.detach()
+
+    def _stream() -> Iterator[_T]:
+        try:
+            yield from stream
+        finally:
+            slot.release()
+
+    wrapped = _stream()
+    # A generator that is never started does not run its finally block.
+    weakref.finalize(wrapped, slot.release)
+    return wrapped
+
+
+def _thread_held_slots() -> set[tuple[str, str]]:
+    held = getattr(_held_slots, "keys", None)
+    if held is None:
+        held = _held_slots.keys = set()
+    return held
+
+
+def _role_limit(
+    config: AdmissionConfig, user: WebUser | None, workload: str
+) -> tuple[str | None, int | None]:
+    """Pick the most generous limit among the user's limited roles."""
+    if user is None:
+        return None, None
+
+    best: tuple[str | None, int | None] = (None, None)
+    for role in user.roles:
+        limits: WorkloadLimits | None = config.role_limits.get(role)
+        if limits is None:
+            continue
+        limit = getattr(limits, workload)
+        if limit is None:
+            return None, None
+        if best[1] is None or limit > best[1]:
+            best = (role, limit)
+    return best
+
+
+admission_controller = AdmissionController()
@@ -0,0 +1,196 @@
+"""Per-column statistics of a table: nulls, min/max, cardinality, top values.
+
+Rows are profiled a page at a time: each page is transposed into columns
+once, and every column's statistics are updated from its whole batch of
+values. Each token range builds its own ``TableProfile``; profiles are
+mergeable, so ranges are combined as they finish and the job reports the
+profile of the ranges read so far.
+
+Text, blob and collection columns get a histogram of value lengths, numeric
+columns a histogram of the values themselves. Distinct counts are
+HyperLogLog estimates and top values come from a space-saving summary.
+"""
+
+from collections.abc import Sequence
+from threading import Lock
+from typing import Any
+
+from cassandra.cluster import Session
+from cassandra.metadata import TableMetadata
+
+from cassanova.config.cassanova_config import get_clusters_config
+from cassanova.consts.workloads import Priorities
+from cassanova.core.cql.converters import truncate_cell
+from cassanova.core.cql.row_sampling import sample_rows
+from cassanova.core.scan_jobs import ScanJob, scan_token_ranges
+from cassanova.core.sketches import HyperLogLog, LogHistogram, SpaceSaving
+from cassanova.models.auth_models import WebUser
+
+_NUMERIC_TYPES = {
+    "tinyint",
+    "smallint",
+    "int",
+    "bigint",
+    "varint",
+    "counter",
+    "float",
+    "double",
+    "decimal",
+}
+_SIZED_TYPES = {"text", "varchar", "ascii", "blob"}
+_COLLECTIONS = ("list<", "set<", "map<", "frozen<list", "frozen<set", "frozen<map")
+
+
+class ColumnProfile:
+    def __init__(self, name: str, cql_type: str) -> None:
+        self.name = name
+        self.cql_type = cql_type
+        self.count = 0
+        self.nulls = 0
+        self.min: Any = None
+        self.max: Any = None
+        self.ordered = True
+        self.distinct = HyperLogLog()
+        self.top = SpaceSaving()
+        self.histogram = LogHistogram()
+        if cql_type in _NUMERIC_TYPES:
+            self.histogram_of: str | None = "value"
+        elif cql_type in _SIZED_TYPES or cql_type.startswith(_COLLECTIONS):
+            self.histogram_of = "length"
+        else:
+            self.histogram_of = None
+
+    def update(self, values: Sequence[Any]) -> None:
+        self.count += len(values)
+        present = [value for value in values if value is not None]
+        self.nulls += len(values) - len(present)
+        if not present:
+            return
+
+        self.distinct.add_many(present)
+        self.top.add_many(present)
+        if self.histogram_of == "value":
+            self.histogram.add_many(present)
+        elif self.histogram_of == "length":
+            self.histogram.add_many(map(len, present))
+        if self.ordered:
+            # NaN compares false to everything and would make min/max arbitrary.
+            self._bound([value for value in present if value == value])
+
+    def merge(self, other: "ColumnProfile") -> None:
+        self.count += other.count
+        self.nulls += other.nulls
+        self.distinct.merge(other.distinct)
+        self.top.merge(other.top)
+        self.histogram.merge(other.histogram)
+        self.ordered = self.ordered and other.ordered
+        if self.ordered and other.min is not None:
+            self._bound([other.min, other.max])
+
+    def to_dict(self, max_cell_bytes: int | None = None) -> dict[str, Any]:
+        top = self.top.top()
+        for entry in top:
+            entry["value"] = truncate_cell(entry["value"], max_cell_bytes)
+        return {
+            "column": self.name,
+            "type": self.cql_type,
+            "count": self.count,
+            "nulls": self.nulls,
+            "null_ratio": round(self.nulls / self.count, 4) if self.count else None,
+            "min": truncate_cell(self.min, max_cell_bytes) if self.ordered else None,
+            "max": truncate_cell(self.max, max_cell_bytes) if self.ordered else None,
+            "distinct": self.distinct.estimate() if self.count > self.nulls else 0,
+            "top": top,
+            "histogram_of": self.histogram_of,
+            "histogram": self.histogram.to_list() if self.histogram_of else None,
+        }
+
+    def _bound(self, values: list[Any]) -> None:
+        if not values:
+            return
+        try:
+            low, high = min(values), max(values)
+            if self.min is None or low < self.min:
+                self.min = low
+            if self.max is None or high > self.max:
+                self.max = high
+        except TypeError:
+            self.ordered = False
+            self.min = self.max = None
+
+
+class TableProfile:
+    def __init__(self, table: TableMetadata, columns: list[str]) -> None:
+        self.columns = {
+            name: ColumnProfile(name, str(table.columns[name].cql_type)) for name in columns
+        }
+        self.rows = 0
+
+    def update(self, batch: dict[str, Sequence[Any]], rows: int) -> None:
+        self.rows += rows
+        for name, profile in self.columns.items():
+            profile.update(batch.get(name) or [None] * rows)
+
+    def update_rows(self, rows: Sequence[Any]) -> None:
+        """Profile a page of driver rows, transposed into columns."""
+        if not rows:
+            return
+        batch = dict(zip(rows[0]._fields, zip(*rows, strict=True), strict=True))
+        self.update(batch, len(rows))
+
+    def merge(self, other: "TableProfile") -> None:
+        self.rows += other.rows
+        for name, profile in self.columns.items():
+            profile.merge(other.columns[name])
+
+    def to_dict(self, max_cell_bytes: int | None = None) -> dict[str, Any]:
+        return {
+            "rows": self.rows,
+            "columns": [profile.to_dict(max_cell_bytes) for profile in self.columns.values()],
+        }
+
+
+def profile_table(
+    session: Session,
+    job: ScanJob,
+    user: WebUser | None,
+    table: TableMetadata,
+    columns: list[str] | None = None,
+    sample_points: int | None = None,
+    rows_per_point: int = 5,
+) -> dict[str, Any]:
+    """Profile a whole table, or a random sample of it when ``sample_points`` is set."""
+    columns = columns or list(table.columns)
+    max_cell_bytes = get_clusters_config().browse.max_cell_bytes
+    profile = TableProfile(table, columns)
+
+    if sample_points:
+        job.ranges_total = 1
+        rows = sample_rows(
+            session,
+            job.cluster_name,
+            user,
+            job.keyspace,
+            table,
+            sample_points,
+            rows_per_point,
+            columns,
+            priority=Priorities.BACKGROUND,
+        )
+        profile.update({c: [row.get(c) for row in rows] for c in columns}, len(rows))
+        job.add_rows(len(rows))
+        job.finish_range()
+        return profile.to_dict(max_cell_bytes) | {"sampled": True}
+
+    lock = Lock()
+
+    def _consume(pages: Any) -> None:
+        partial = TableProfile(table, columns)
+        for page in pages:
+            partial.update_rows(page)
+        with lock:
+            profile.merge(partial)
+            job.result = profile.to_dict(max_cell_bytes) | {"sampled": False}
+
+    scan_token_ranges(session, job, user, table, columns, _consume)
+    return profile.to_dict(max_cell_bytes) | {"sampled": False}
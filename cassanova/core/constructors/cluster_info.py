@@ -6,6 +6,7 @@ from cassanova.core.metrics.get_dc_rack_distribution import get_dc_rack_distribu
 from cassanova.core.metrics.get_description import get_cluster_description, get_cluster_version
 from cassanova.core.metrics.get_health import get_cluster_health
 from cassanova.core.metrics.get_technology_type import detect_database_technology
+from cassanova.core.schema_loader import keyspace_listing
 from cassanova.models.cluster import ClusterInfo
 from cassanova.models.cluster_metrics import ClusterMetrics
 
@@ -14,7 +15,7 @@ def generate_cluster_info(cluster: Cluster, session: Session) -> ClusterInfo:
     return ClusterInfo(
         metrics=generate_cluster_metrics(cluster, session),
         nodes=generate_nodes_info(session),
-        keyspaces=generate_keyspaces_info(list(cluster.metadata.keyspaces.items())),
+        keyspaces=generate_keyspaces_info(keyspace_listing(session)),
     )
 
 
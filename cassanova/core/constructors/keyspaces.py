@@ -5,9 +5,14 @@ from cassanova.core.constructors.tables import generate_tables_info
 from cassanova.models.keyspace import KeyspaceInfo
 
 
-def generate_keyspaces_info(keyspaces: list[tuple[str, KeyspaceMetadata]]) -> list[KeyspaceInfo]:
+def generate_keyspaces_info(
+    keyspaces: list[tuple[str, KeyspaceMetadata | None]],
+) -> list[KeyspaceInfo]:
+    """Keyspace summaries; a keyspace without metadata (not loaded yet) is listed by name only."""
     return [
-        KeyspaceInfo(
+        KeyspaceInfo(name=name, tables=[], indexes=[], loaded=False)
+        if keyspace_metadata is None
+        else KeyspaceInfo(
             name=name,
             replication=keyspace_metadata.replication_strategy.export_for_schema()
             if keyspace_metadata.replication_strategy
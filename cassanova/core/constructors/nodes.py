@@ -1,5 +1,6 @@
 from cassandra.cluster import Session
 
+from cassanova.core.cql.statements import execute_metadata_query
 from cassanova.models.node import NodeInfo
 
 
@@ -31,11 +32,11 @@ def generate_nodes_info(session: Session) -> list[NodeInfo]:
     The back-fill loop below handles the inverse case: a node absent from
     both CQL results gets appended from driver metadata.
     """
-    local_rows = list(session.execute("SELECT * FROM system.local"))
+    local_rows = list(execute_metadata_query(session, "SELECT * FROM system.local"))
     seen_ids = {str(row.host_id) for row in local_rows}
     peers_rows = [
         r
-        for r in session.execute("SELECT * FROM system.peers_v2")
+        for r in execute_metadata_query(session, "SELECT * FROM system.peers_v2")
         if str(r.host_id) not in seen_ids
     ]
     nodes = [NodeInfo(**row._asdict()) for row in local_rows + peers_rows]
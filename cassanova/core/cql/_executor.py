@@ -1,8 +1,9 @@
 """Central CQL execution function for all user-initiated mutations.
 
 All mutation code paths route through ``execute_cql`` which enforces
-read-only mode, RBAC permissions, and emits structured audit log lines.
-Internal read-only system queries bypass this and use session.execute directly.
+read-only mode, RBAC permissions, admission control and priority
+scheduling, and emits structured audit log lines. Internal read-only
+system queries bypass this and use session.execute directly.
 """
 
 import json
@@ -15,15 +16,29 @@ from cassandra.query import BatchStatement, SimpleStatement
 
 from cassanova.api.dependencies.auth import check_permission
 from cassanova.config.cassanova_config import get_clusters_config
+from cassanova.consts.workloads import Priorities, Workloads
+from cassanova.core.admission import admission_controller
+from cassanova.core.query_registry import query_registry
+from cassanova.core.scheduler import scheduled
 from cassanova.exceptions.cql_exceptions import CQLPermissionDenied, ReadOnlyClusterError
 from cassanova.models.auth_models import WebUser
 
 _audit_logger = logging.getLogger("cassanova.audit")
 
-_MUTATION_PREFIXES = frozenset({
-    "INSERT", "UPDATE", "DELETE", "DROP", "TRUNCATE",
-    "ALTER", "CREATE", "GRANT", "REVOKE", "BATCH",
-})
+_MUTATION_PREFIXES = frozenset(
+    {
+        "INSERT",
+        "UPDATE",
+        "DELETE",
+        "DROP",
+        "TRUNCATE",
+        "ALTER",
+        "CREATE",
+        "GRANT",
+        "REVOKE",
+        "BATCH",
+    }
+)
 
 _ADMIN_KEYWORDS = frozenset({"DROP", "TRUNCATE", "ALTER", "CREATE", "GRANT", "REVOKE"})
 _WRITE_KEYWORDS = frozenset({"INSERT", "UPDATE", "DELETE", "BATCH"})
@@ -39,11 +54,19 @@ def execute_cql(
     cluster_name: str,
     user: WebUser | None,
     parameters: tuple | list | None = None,
+    workload: str | None = None,
     **execute_kwargs: Any,
 ) -> Any:
     action = _detect_action(statement)
     if action not in _MUTATION_PREFIXES:
-        return session.execute(statement, parameters, **execute_kwargs)
+        workload = workload or Workloads.INTERACTIVE
+        with (
+            admission_controller.acquire(cluster_name, user, workload),
+            scheduled(session, user, Priorities.FOR_WORKLOAD[workload]),
+            query_registry.track(cluster_name, user, _query_text(statement)) as query,
+            query.bound(),
+        ):
+            return session.execute(statement, parameters, **execute_kwargs)
 
     config = get_clusters_config()
     cluster_config = config.clusters.get(cluster_name)
@@ -57,7 +80,14 @@ def execute_cql(
 
     _audit_log(user, cluster_name, statement, action, parameters is not None)
 
-    return session.execute(statement, parameters, **execute_kwargs)
+    workload = workload or Workloads.MUTATIONS
+    with (
+        admission_controller.acquire(cluster_name, user, workload),
+        scheduled(session, user, Priorities.FOR_WORKLOAD[workload]),
+        query_registry.track(cluster_name, user, _query_text(statement)) as query,
+        query.bound(),
+    ):
+        return session.execute(statement, parameters, **execute_kwargs)
 
 
 def _detect_action(statement: SimpleStatement | BatchStatement | str) -> str:
@@ -68,21 +98,25 @@ def _detect_action(statement: SimpleStatement | BatchStatement | str) -> str:
     return first_word
 
 
+def _query_text(statement: Any) -> str:
+    if isinstance(statement, BatchStatement):
+        return "<BatchStatement>"
+    return statement.query_string if isinstance(statement, SimpleStatement) else str(statement)
+
+
 def _audit_log(
     user: WebUser | None, cluster_name: str, statement: Any, action: str, has_params: bool
 ) -> None:
-    query_str = (
-        "<BatchStatement>"
-        if isinstance(statement, BatchStatement)
-        else (statement.query_string if isinstance(statement, SimpleStatement) else str(statement))
-    )
+    query_str = _query_text(statement)
     _audit_logger.info(
-        json.dumps({
-            "timestamp": datetime.now(UTC).isoformat(),
-            "user": user.username if user else "anonymous",
-            "cluster": cluster_name,
-            "action": action,
-            "query": query_str[:2000],
-            "has_params": has_params,
-        })
+        json.dumps(
+            {
+                "timestamp": datetime.now(UTC).isoformat(),
+                "user": user.username if user else "anonymous",
+                "cluster": cluster_name,
+                "action": action,
+                "query": query_str[:2000],
+                "has_params": has_params,
+            }
+        )
     )
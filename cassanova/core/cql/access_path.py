@@ -0,0 +1,202 @@
+"""Choose how the data explorer serves a filtered read.
+
+Filters on columns outside the primary key need ALLOW FILTERING unless an
+index or a materialized view can serve them. Paths are tried from cheapest
+to most expensive:
+
+* ``scan`` - no filters;
+* ``primary_key`` - the base table serves the filters directly: partition key
+  restricted by ``=`` / ``IN`` and clustering columns as a prefix;
+* ``index`` - every filter is served by a secondary index or SAI;
+* ``view`` - a view with every base column and no restriction beyond
+  ``IS NOT NULL`` serves the filters through its own primary key, and is
+  queried instead of the table; a key column the table's key lacks must be
+  filtered on, as rows where it is null are not in the view; views are only
+  eventually consistent with their base table;
+* ``index`` with filtering - one index narrows the read, other filters are
+  applied on the replicas;
+* ``filtering`` - nothing helps; the read needs ALLOW FILTERING.
+
+Only cases Cassandra is known to accept without ALLOW FILTERING are
+reported as unfiltered, so a plan never drops a clause the query needs.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Any
+
+from cassandra.metadata import IndexMetadata, TableMetadata
+
+from cassanova.consts.query_kinds import AccessPaths
+
+_INDEX_TARGET = re.compile(r"^(?P<kind>values|keys|entries|full)\((?P<column>.*)\)$", re.IGNORECASE)
+
+_EQUALITY_OPS = {"=", "IN"}
+_RANGE_OPS = {"<", ">", "<=", ">="}
+_SAI_OPS = {"=", *_RANGE_OPS}
+_TARGET_OPS = {"values": {"CONTAINS"}, "keys": {"CONTAINS KEY"}, "entries": set(), "full": {"="}}
+_NOT_NULL_TERM = re.compile(r'^(?:"(?:[^"]|"")+"|\w+)\s+IS\s+NOT\s+NULL$', re.IGNORECASE)
+
+
+@dataclass
+class ColumnIndex:
+    name: str
+    is_sai: bool
+    target: str | None = None
+
+    def serves(self, op: str) -> bool:
+        if self.target is not None:
+            return op in _TARGET_OPS[self.target]
+        return op in (_SAI_OPS if self.is_sai else {"="})
+
+
+@dataclass
+class AccessPath:
+    kind: str
+    table: str
+    index: str | None = None
+    filtering: bool = False
+    description: str = ""
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "table": self.table,
+            "index": self.index,
+            "filtering": self.filtering,
+            "description": self.description,
+        }
+
+
+def plan_access(table: TableMetadata, restrictions: list[tuple[str, str]]) -> AccessPath:
+    """Pick the cheapest way to read ``table`` under the given filters."""
+    if not restrictions:
+        return AccessPath(AccessPaths.SCAN, table.name, description="Full table scan")
+
+    if _served_by_primary_key(table, restrictions):
+        return AccessPath(
+            AccessPaths.PRIMARY_KEY, table.name, description="Served by the table's primary key"
+        )
+
+    indexes = column_indexes(table)
+    used: dict[str, ColumnIndex] = {}
+    for column, op in restrictions:
+        index = indexes.get(column)
+        if index is not None and index.serves(op):
+            used.setdefault(column, index)
+
+    if used and len(used) == len({column for column, _ in restrictions}):
+        served = list(used.values())
+        if len(served) == 1 or all(index.is_sai for index in served):
+            names = ", ".join(dict.fromkeys(index.name for index in served))
+            return AccessPath(
+                AccessPaths.INDEX, table.name, served[0].name, description=f"Served by {names}"
+            )
+
+    # Views have no views (or indexes) of their own.
+    restricted = {column for column, _ in restrictions}
+    for view in sorted(getattr(table, "views", {}).values(), key=lambda v: v.name):
+        if (
+            set(table.columns) <= set(view.columns)
+            and _has_every_row(table, view, restricted)
+            and _served_by_primary_key(view, restrictions)
+        ):
+            return AccessPath(
+                AccessPaths.VIEW,
+                view.name,
+                description=f"Served by materialized view {view.name} "
+                "(eventually consistent with the table)",
+            )
+
+    if used:
+        narrowing = next(iter(used.values()))
+        return AccessPath(
+            AccessPaths.INDEX,
+            table.name,
+            narrowing.name,
+            filtering=True,
+            description=f"Narrowed by {narrowing.name}; remaining filters need ALLOW FILTERING",
+        )
+
+    return AccessPath(
+        AccessPaths.FILTERING,
+        table.name,
+        filtering=True,
+        description="No key, index or view covers these filters; needs ALLOW FILTERING",
+    )
+
+
+def column_indexes(table: TableMetadata) -> dict[str, ColumnIndex]:
+    """Indexes of ``table`` by the column they are built on."""
+    columns = {}
+    for index in getattr(table, "indexes", {}).values():
+        column_index = _column_index(index)
+        if column_index is not None:
+            columns[column_index[0]] = column_index[1]
+    return columns
+
+
+def _column_index(index: IndexMetadata) -> tuple[str, ColumnIndex] | None:
+    options = index.index_options or {}
+    target = options.get("target")
+    if not target:
+        return None
+    wrapped = _INDEX_TARGET.match(target)
+    column = _unquote(wrapped.group("column") if wrapped else target)
+    kind = wrapped.group("kind").lower() if wrapped else None
+    class_name = options.get("class_name", "")
+    is_sai = "StorageAttachedIndex" in class_name or class_name.lower() == "sai"
+    return column, ColumnIndex(index.name, is_sai, kind)
+
+
+def _served_by_primary_key(table: TableMetadata, restrictions: list[tuple[str, str]]) -> bool:
+    ops: dict[str, set[str]] = {}
+    for column, op in restrictions:
+        ops.setdefault(column, set()).add(op)
+
+    partition_key = [column.name for column in table.partition_key]
+    if not all(ops.get(column, set()) & _EQUALITY_OPS for column in partition_key):
+        return False
+    if any(ops.get(column, set()) - _EQUALITY_OPS for column in partition_key):
+        return False
+
+    remaining = {column: ops[column] for column in ops if column not in partition_key}
+    for column in (column.name for column in table.clustering_key):
+        column_ops = remaining.pop(column, None)
+        if not column_ops:
+            break
+        if column_ops <= _EQUALITY_OPS and len(column_ops) == 1:
+            continue
+        if column_ops <= _RANGE_OPS:
+            break
+        return False
+    return not remaining
+
+
+def _has_every_row(table: TableMetadata, view: Any, restricted: set[str]) -> bool:
+    """Whether the view holds every row of the table that the filters select.
+
+    A view keyed on a column outside the table's primary key has no row where
+    that column is null, so the filters must restrict it. The view's WHERE
+    clause may only require its key columns to be set; any other restriction,
+    such as ``status = 'active'``, makes the view hold a subset of the rows.
+    """
+    table_key = {column.name for column in table.primary_key}
+    if any(
+        column.name not in table_key and column.name not in restricted
+        for column in view.primary_key
+    ):
+        return False
+
+    where_clause = (view.where_clause or "").strip()
+    if not where_clause:
+        return True
+    terms = re.split(r"\s+AND\s+", where_clause, flags=re.IGNORECASE)
+    return all(_NOT_NULL_TERM.match(term.strip()) for term in terms)
+
+
+def _unquote(identifier: str) -> str:
+    identifier = identifier.strip()
+    if identifier.startswith('"') and identifier.endswith('"'):
+        return identifier[1:-1].replace('""', '"')
+    return identifier
@@ -9,6 +9,8 @@ _FLOAT_TYPES = frozenset({"float", "double", "decimal"})
 _BOOLEAN_TYPES = frozenset({"boolean", "bool"})
 _UUID_TYPES = frozenset({"uuid", "timeuuid"})
 
+TRUNCATED_MARKER = "$truncated"
+
 
 def convert_value_for_cql(value: Any, cql_type: str) -> Any:
     cql_type = cql_type.lower()
@@ -55,6 +57,29 @@ def convert_value_for_cql(value: Any, cql_type: str) -> Any:
         raise ValueError(str(e)) from e
 
 
+def truncate_cell(value: Any, max_bytes: int | None) -> Any:
+    """Replace a ``text`` or ``blob`` value over ``max_bytes`` with a preview.
+
+    The marker keeps the value's full size in bytes. Other values are
+    returned unchanged.
+    """
+    if not max_bytes:
+        return value
+    if isinstance(value, bytes | bytearray):
+        # Blobs are sent hex-encoded, at two characters per byte.
+        if len(value) * 2 <= max_bytes:
+            return value
+        preview = bytes(value[: max_bytes // 2]).hex()
+        return {TRUNCATED_MARKER: True, "preview": preview, "size": len(value)}
+    if isinstance(value, str):
+        encoded = value.encode()
+        if len(encoded) <= max_bytes:
+            return value
+        preview = encoded[:max_bytes].decode(errors="ignore")
+        return {TRUNCATED_MARKER: True, "preview": preview, "size": len(encoded)}
+    return value
+
+
 def _is_collection_type(cql_type: str) -> bool:
     return (
         cql_type.startswith("list<")
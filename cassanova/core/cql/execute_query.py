@@ -1,12 +1,18 @@
 import re
+from binascii import hexlify, unhexlify
 from typing import Any
 
 from cassandra import InvalidRequest
-from cassandra.cluster import NoHostAvailable, ResultSet, Session
+from cassandra.cluster import NoHostAvailable, Session
 from cassandra.protocol import SyntaxException
 from cassandra.query import SimpleStatement
 
+from cassanova.config.cassanova_config import get_clusters_config
+from cassanova.consts.execution_profiles import ExecutionProfiles
 from cassanova.core.cql._executor import execute_cql
+from cassanova.core.cql.query_trace import get_trace_id
+from cassanova.core.schema_loader import keyspace_listing
+from cassanova.exceptions.cql_exceptions import AdmissionRejected, QueryCancelled
 from cassanova.models.auth_models import WebUser
 from cassanova.models.cql_query import CQLQuery
 
@@ -20,15 +26,32 @@ def execute_query_cql(
 def _execute_with_retry(
     session: Session, query: CQLQuery, cluster_name: str, user: WebUser | None, attempt: int
 ) -> list[dict[str, Any]] | str:
-    statement = SimpleStatement(query_string=query.cql, consistency_level=query.cl)
+    statement = SimpleStatement(
+        query_string=query.cql, consistency_level=query.cl, fetch_size=cqlsh_page_size(query)
+    )
     try:
         result_set = execute_cql(
-            session, statement, cluster_name, user, trace=query.enable_tracing
+            session,
+            statement,
+            cluster_name,
+            user,
+            trace=query.enable_tracing,
+            paging_state=decode_paging_state(query.paging_state),
+            execution_profile=ExecutionProfiles.INTERACTIVE,
         )
-        result = [row._asdict() for row in result_set]
+        # Only the first page is materialised; later pages are fetched by
+        # sending next_paging_state back.
+        result = [row._asdict() for row in result_set.current_rows]
         if query.enable_tracing:
-            result = {"result": result, "trace": get_trace_info(result_set)}  # type: ignore[assignment]
-        return {"result": result}  # type: ignore[return-value]
+            # The trace is still being written; it is fetched separately by id.
+            trace_id = get_trace_id(result_set)
+            result = {"result": result, "trace_id": trace_id}  # type: ignore[assignment]
+        next_paging_state = (
+            hexlify(result_set.paging_state).decode() if result_set.paging_state else None
+        )
+        return {"result": result, "next_paging_state": next_paging_state}  # type: ignore[return-value]
+    except (AdmissionRejected, QueryCancelled):
+        raise
     except InvalidRequest as e:
         msg = str(e).lower()
         match = re.search(r"table ([a-z0-9_]+) does not exist", msg) or re.search(
@@ -37,10 +60,12 @@ def _execute_with_retry(
 
         if match and attempt == 1:
             missing_table = match.group(1)
-            metadata = session.cluster.metadata
             found_real_name = None
 
-            for ks_meta in metadata.keyspaces.values():
+            # Only keyspaces already loaded are searched on a lazy schema.
+            for _, ks_meta in keyspace_listing(session):
+                if ks_meta is None:
+                    continue
                 for table_name in ks_meta.tables:
                     if table_name.lower() == missing_table and table_name != missing_table:
                         found_real_name = table_name
@@ -53,9 +78,7 @@ def _execute_with_retry(
                     f"\\b{missing_table}\\b", f'"{found_real_name}"', query.cql, flags=re.IGNORECASE
                 )
                 if new_cql != query.cql:
-                    new_query = CQLQuery(
-                        cql=new_cql, cl=query.cl, enable_tracing=query.enable_tracing
-                    )
+                    new_query = query.model_copy(update={"cql": new_cql})
                     return _execute_with_retry(session, new_query, cluster_name, user, attempt=2)
 
         return str(e)
@@ -65,28 +88,16 @@ def _execute_with_retry(
         return str(e)
 
 
-def get_trace_info(result_set: ResultSet) -> dict[str, Any]:
-    trace = result_set.get_query_trace()
-
-    if isinstance(trace.duration, int):
-        duration_ms = trace.duration / 1000.0
-    elif trace.duration:
-        duration_ms = trace.duration.total_seconds() * 1000.0
-    else:
-        duration_ms = 0.0
+def cqlsh_page_size(query: CQLQuery) -> int:
+    cqlsh_config = get_clusters_config().cqlsh
+    return min(query.page_size or cqlsh_config.default_page_size, cqlsh_config.max_page_size)
 
-    events = []
-    for e in trace.events:
-        ms = e.source_elapsed.total_seconds() * 1000.0
-        events.append({"description": e.description, "source": e.source, "elapsed_ms": ms})
 
-    if duration_ms == 0 and events:
-        duration_ms = max(e["elapsed_ms"] for e in events)
-
-    return {
-        "request_type": trace.request_type,
-        "duration_ms": duration_ms,
-        "coordinator": trace.coordinator,
-        "parameters": trace.parameters,
-        "events": events,
-    }
+def decode_paging_state(paging_state: str | None) -> bytes | None:
+    """Decode a paging state sent back by the client; ``ValueError`` if not hex."""
+    if not paging_state:
+        return None
+    try:
+        return unhexlify(paging_state)
+    except ValueError as e:
+        raise ValueError("paging_state must be the hex string returned with a page") from e
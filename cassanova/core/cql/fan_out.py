@@ -0,0 +1,170 @@
+"""Run one read-only statement across many clusters.
+
+Clusters are queried on a bounded thread pool and results are yielded as
+each cluster finishes, so a caller can stream them. Every cluster gets its
+own deadline, at most ``fan_out.cluster_deadline_seconds``, counted from when
+its worker starts (connecting included);
+a cluster that misses it is reported as timed out while the others carry on.
+Errors are reported per cluster and never abort the fan-out.
+
+Before anything runs, the statement goes through the same cost check as a
+single query on every selected cluster, so a scan that one cluster would
+refuse cannot be sent to all of them instead.
+"""
+
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from fnmatch import fnmatchcase
+from logging import getLogger
+from time import monotonic
+from typing import Any
+
+from cassandra.query import SimpleStatement
+
+from cassanova.config.cassanova_config import get_clusters_config
+from cassanova.consts.execution_profiles import ExecutionProfiles
+from cassanova.core.cql._executor import execute_cql
+from cassanova.core.cql.query_cost import check_query_cost
+from cassanova.core.session_manager import session_manager
+from cassanova.exceptions.cql_exceptions import QueryCostExceeded
+from cassanova.models.auth_models import WebUser
+
+logger = getLogger(__name__)
+
+_POLL_INTERVAL = 0.25
+
+
+def select_clusters(names: list[str], pattern: str | None) -> list[str]:
+    """Resolve an explicit list and/or glob pattern into cluster names.
+
+    Unknown names from the explicit list are kept so they are reported back
+    as errors rather than silently dropped.
+    """
+    known = get_clusters_config().clusters
+    selected = list(dict.fromkeys(names))
+    if pattern:
+        selected += [n for n in sorted(known) if fnmatchcase(n, pattern) and n not in selected]
+    return selected
+
+
+def check_fan_out_cost(
+    cluster_names: list[str], cql: str, user: WebUser | None, confirmed: bool = False
+) -> None:
+    """Run ``check_query_cost`` for ``cql`` on every selected cluster.
+
+    Raises the ``QueryCostExceeded`` of the first cluster, in selection order,
+    where the query may not run as is. Clusters that are unknown or cannot be
+    reached are skipped here and left to the fan-out to report.
+    """
+    config = get_clusters_config()
+
+    def _check(cluster_name: str) -> QueryCostExceeded | None:
+        cluster_config = config.clusters.get(cluster_name)
+        if cluster_config is None:
+            return None
+        try:
+            session = session_manager.get_session(cluster_name, cluster_config)
+        except Exception as e:
+            logger.info(f"Skipping the cost check on '{cluster_name}': {e}")
+            return None
+        try:
+            check_query_cost(
+                session, cluster_name, cql, user, confirmed, config.fan_out.max_rows_per_cluster
+            )
+        except QueryCostExceeded as e:
+            return e
+        return None
+
+    workers = min(len(cluster_names), config.fan_out.max_parallelism) or 1
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="cql-fan-out") as pool:
+        exceeded = list(pool.map(_check, cluster_names))
+    for error in exceeded:
+        if error is not None:
+            raise error
+
+
+def fan_out_query(
+    cluster_names: list[str],
+    cql: str,
+    user: WebUser | None,
+    consistency_level: int,
+    parallelism: int | None = None,
+    deadline_seconds: float | None = None,
+) -> Iterator[dict[str, Any]]:
+    config = get_clusters_config().fan_out
+    parallelism = min(parallelism or config.max_parallelism, config.max_parallelism)
+    deadline = min(
+        deadline_seconds or config.cluster_deadline_seconds, config.cluster_deadline_seconds
+    )
+    started: dict[str, float] = {}
+
+    def _run(cluster_name: str) -> dict[str, Any]:
+        started[cluster_name] = monotonic()
+        return _query_cluster(
+            cluster_name, cql, user, consistency_level, deadline, config.max_rows_per_cluster
+        )
+
+    pool = ThreadPoolExecutor(max_workers=parallelism, thread_name_prefix="cql-fan-out")
+    try:
+        pending: dict[Future, str] = {pool.submit(_run, name): name for name in cluster_names}
+        while pending:
+            done, _ = wait(pending, timeout=_POLL_INTERVAL, return_when=FIRST_COMPLETED)
+            for future in done:
+                pending.pop(future)
+                yield future.result()
+
+            now = monotonic()
+            for future, name in list(pending.items()):
+                if name in started and now - started[name] > deadline:
+                    # The worker is abandoned; the driver timeout ends it later.
+                    pending.pop(future)
+                    yield _result(name, "timeout", started[name], error=f"No answer in {deadline}s")
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _query_cluster(
+    cluster_name: str,
+    cql: str,
+    user: WebUser | None,
+    consistency_level: int,
+    deadline: float,
+    max_rows: int,
+) -> dict[str, Any]:
+    started = monotonic()
+    cluster_config = get_clusters_config().clusters.get(cluster_name)
+    if cluster_config is None:
+        return _result(cluster_name, "error", started, error="Cluster not found")
+
+    try:
+        session = session_manager.get_session(cluster_name, cluster_config)
+        statement = SimpleStatement(
+            cql, consistency_level=consistency_level, fetch_size=max_rows, is_idempotent=True
+        )
+        rows = execute_cql(
+            session,
+            statement,
+            cluster_name,
+            user,
+            timeout=max(0.1, deadline - (monotonic() - started)),
+            execution_profile=ExecutionProfiles.INTERACTIVE,
+        )
+        return _result(
+            cluster_name,
+            "ok",
+            started,
+            rows=[row._asdict() for row in rows.current_rows],
+            truncated=bool(rows.has_more_pages),
+        )
+    except Exception as e:
+        logger.info(f"Fan-out query failed on '{cluster_name}': {e}")
+        return _result(cluster_name, "error", started, error=str(e))
+
+
+def _result(cluster_name: str, status: str, started: float, **extra: Any) -> dict[str, Any]:
+    return {
+        "cluster": cluster_name,
+        "status": status,
+        "elapsed_ms": round((monotonic() - started) * 1000, 3),
+        **extra,
+    }
@@ -0,0 +1,132 @@
+"""Running one system query on every node of a cluster.
+
+Node-local tables such as ``system.size_estimates`` and the ``system_views``
+virtual tables only describe the node serving the read, so a query through
+the load balancer sees a single node. Here the statement is sent to each
+live host directly, all at once, and every node's rows or error come back
+separately; a node that fails or is down does not fail the others.
+
+Results can also be merged into one table with a ``node`` column and cached
+for ``node_views.cache_ttl_seconds``.
+"""
+
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from threading import Lock
+from time import monotonic
+from typing import Any
+
+from cassandra.cluster import Session
+from cassandra.pool import Host
+
+from cassanova.config.cassanova_config import get_clusters_config
+from cassanova.consts.execution_profiles import ExecutionProfiles
+from cassanova.core.cql.statements import idempotent_statement
+from cassanova.core.scheduler import scheduled
+
+
+@dataclass
+class NodeResult:
+    host: Host
+    rows: list[Any] = field(default_factory=list)
+    error: str | None = None
+
+    @property
+    def address(self) -> str:
+        return str(self.host.address)
+
+
+@dataclass
+class NodeTable:
+    """Every node's rows of one query, each row tagged with its node.
+
+    ``nodes`` lists every node that answered, including those with no rows.
+    """
+
+    rows: list[dict[str, Any]]
+    errors: dict[str, str]
+    nodes: list[str] = field(default_factory=list)
+    fetched_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "rows": self.rows,
+            "errors": self.errors,
+            "nodes": self.nodes,
+            "fetched_at": self.fetched_at.isoformat(),
+        }
+
+
+def query_nodes(
+    session: Session, query: str, parameters: list[Any] | None = None
+) -> list[NodeResult]:
+    hosts = sorted(session.cluster.metadata.all_hosts(), key=lambda host: str(host.address))
+    statement = idempotent_statement(query)
+    results = [NodeResult(host) for host in hosts]
+    with scheduled(session):
+        futures = [
+            session.execute_async(
+                statement, parameters, execution_profile=ExecutionProfiles.METADATA, host=host
+            )
+            if host.is_up
+            else None
+            for host in hosts
+        ]
+
+    for result, future in zip(results, futures, strict=True):
+        if future is None:
+            result.error = "Node is down"
+            continue
+        try:
+            result.rows = list(future.result())
+        except Exception as e:
+            result.error = str(e)
+    return results
+
+
+def merge_node_rows(results: list[NodeResult]) -> NodeTable:
+    rows: list[dict[str, Any]] = []
+    errors: dict[str, str] = {}
+    nodes: list[str] = []
+    for result in results:
+        if result.error is not None:
+            errors[result.address] = result.error
+            continue
+        nodes.append(result.address)
+        rows.extend({"node": result.address, **row._asdict()} for row in result.rows)
+    return NodeTable(rows, errors, nodes)
+
+
+class NodeQueryCache:
+    def __init__(self) -> None:
+        self._entries: dict[tuple[str, str, tuple[Any, ...]], tuple[float, NodeTable]] = {}
+        self._lock = Lock()
+
+    def get(
+        self,
+        session: Session,
+        cluster_name: str,
+        query: str,
+        parameters: list[Any] | None = None,
+        refresh: bool = False,
+    ) -> NodeTable:
+        """The merged rows of ``query`` on every node, read again once the TTL passes."""
+        key = (cluster_name, query, tuple(parameters or ()))
+        ttl = get_clusters_config().node_views.cache_ttl_seconds
+        with self._lock:
+            cached = self._entries.get(key)
+        if not refresh and cached is not None and monotonic() - cached[0] < ttl:
+            return cached[1]
+
+        table = merge_node_rows(query_nodes(session, query, parameters))
+        with self._lock:
+            self._entries[key] = (monotonic(), table)
+        return table
+
+    def invalidate(self, cluster_name: str) -> None:
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == cluster_name]:
+                del self._entries[key]
+
+
+node_query_cache = NodeQueryCache()
@@ -0,0 +1,163 @@
+"""Listing a table's partitions in token order.
+
+Partition keys are read with ``SELECT DISTINCT`` in token order, so a page
+costs one row per partition however wide the partitions are. With a
+preview, the first rows of each partition are read instead, capped with
+``PER PARTITION LIMIT``. Pages are keyset-based: the next page starts after
+the token of the last partition listed.
+
+The rest of the ring can be split into even token ranges scanned
+concurrently, which helps when partitions are sparse. Every range reads up
+to a full page, and ranges are merged in ring order up to the first one that
+was not read to its end, so the result is the same as a single scan.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from cassandra.cluster import Session
+from cassandra.metadata import TableMetadata
+
+from cassanova.config.cassanova_config import get_clusters_config
+from cassanova.consts.execution_profiles import ExecutionProfiles
+from cassanova.consts.workloads import Priorities, Workloads
+from cassanova.core.admission import admission_controller
+from cassanova.core.cql.prepared_statements import bind_statement
+from cassanova.core.cql.token_ranges import (
+    TokenRange,
+    split_ring,
+    token_conditions,
+    token_function,
+)
+from cassanova.core.query_registry import execute_concurrent_tracked, query_registry
+from cassanova.core.scheduler import scheduled
+from cassanova.models.auth_models import WebUser
+
+
+@dataclass
+class Partition:
+    token: int
+    key: dict[str, Any]
+    rows: list[dict[str, Any]] | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        # Tokens are 64 bit or wider, more than a JSON number holds exactly.
+        return {"token": str(self.token), "key": self.key, "rows": self.rows}
+
+
+@dataclass
+class PartitionPage:
+    partitions: list[Partition] = field(default_factory=list)
+    next_after: int | None = None
+
+
+def listing_statement(
+    keyspace: str,
+    table: TableMetadata,
+    token_range: TokenRange,
+    limit: int,
+    preview: int = 0,
+    columns: list[str] | None = None,
+) -> tuple[str, list[int]]:
+    """A preparable SELECT for the partitions of one token range, token last."""
+    if preview:
+        selected = columns or list(table.columns)
+    else:
+        selected = [column.name for column in table.partition_key]
+    conditions, values = token_conditions(table, token_range)
+
+    distinct = "" if preview else "DISTINCT "
+    projection = ", ".join([*(f'"{column}"' for column in selected), token_function(table)])
+    query = f'SELECT {distinct}{projection} FROM "{keyspace}"."{table.name}"'
+    if conditions:
+        query += f" WHERE {' AND '.join(conditions)}"
+    if preview:
+        query += " PER PARTITION LIMIT ?"
+        values.append(preview)
+    query += " LIMIT ?"
+    values.append(_fetch_limit(limit, preview))
+    return query, values
+
+
+def list_partitions(
+    session: Session,
+    cluster_name: str,
+    user: WebUser | None,
+    keyspace: str,
+    table: TableMetadata,
+    after: int | None = None,
+    limit: int = 100,
+    segments: int = 1,
+    preview: int = 0,
+    columns: list[str] | None = None,
+) -> PartitionPage:
+    config = get_clusters_config().browse
+    if segments > config.max_listing_segments:
+        raise ValueError(f"At most {config.max_listing_segments} segments can be scanned")
+    partitioner = session.cluster.metadata.partitioner
+    ranges = split_ring(partitioner, after, segments) if segments > 1 else [(after, None)]
+
+    fetch_limit = _fetch_limit(limit, preview)
+    statements = []
+    for token_range in ranges:
+        query, values = listing_statement(keyspace, table, token_range, limit, preview, columns)
+        statements.append(bind_statement(session, query, values, fetch_size=fetch_limit))
+
+    with (
+        admission_controller.acquire(cluster_name, user, Workloads.INTERACTIVE),
+        scheduled(session, user, Priorities.INTERACTIVE),
+        query_registry.track(
+            cluster_name, user, statements[0].prepared_statement.query_string
+        ) as tracked,
+    ):
+        outcomes = execute_concurrent_tracked(
+            session,
+            statements,
+            tracked,
+            concurrency=len(statements),
+            execution_profile=ExecutionProfiles.INTERACTIVE,
+        )
+
+    page = PartitionPage()
+    more = False
+    for _, outcome in outcomes:
+        rows = list(outcome.current_rows)
+        partitions, complete = _group(table, rows, fetch_limit, preview)
+        page.partitions.extend(partitions)
+        if not complete:
+            # Partitions past this range's last row come before later ranges.
+            more = True
+            break
+    if len(page.partitions) > limit:
+        page.partitions = page.partitions[:limit]
+        more = True
+    if more and page.partitions:
+        page.next_after = page.partitions[-1].token
+    return page
+
+
+def _group(
+    table: TableMetadata, rows: list[Any], fetch_limit: int, preview: int
+) -> tuple[list[Partition], bool]:
+    """Partitions of one range's rows, and whether the range was read to its end."""
+    key_columns = [column.name for column in table.partition_key]
+    partitions: list[Partition] = []
+    for row in rows:
+        token = row[-1]
+        values = row._asdict()
+        values.pop(row._fields[-1])
+        key = {column: values[column] for column in key_columns}
+        if not partitions or (partitions[-1].token, partitions[-1].key) != (token, key):
+            partitions.append(Partition(token, key, [] if preview else None))
+        if preview:
+            partitions[-1].rows.append(values)  # type: ignore[union-attr]
+
+    complete = len(rows) < fetch_limit
+    if not complete and preview and len(partitions[-1].rows or []) < preview:
+        # The row limit cut into the last partition; it is listed on the next page.
+        partitions.pop()
+    return partitions, complete
+
+
+def _fetch_limit(limit: int, preview: int) -> int:
+    return limit * preview if preview else limit
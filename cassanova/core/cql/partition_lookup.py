@@ -0,0 +1,124 @@
+"""Token-aware lookups of partitions by key.
+
+Each key's partition key values (plus an optional clustering prefix) are
+converted with the column types and bound to a cached prepared statement.
+With the whole partition key bound, the driver derives the statement's
+routing key, so ``TokenAwarePolicy`` sends it straight to a replica instead
+of a round-robin coordinator. A batch of keys runs concurrently through the
+registry's ``execute_concurrent_tracked`` under a single admission slot, so
+cancelling the lookup stops every key, and a key that fails does not fail the
+others.
+"""
+
+from dataclasses import dataclass, field
+from logging import getLogger
+from typing import Any
+
+from cassandra.cluster import Session
+from cassandra.metadata import TableMetadata
+from cassandra.query import BoundStatement
+
+from cassanova.config.cassanova_config import get_clusters_config
+from cassanova.consts.execution_profiles import ExecutionProfiles
+from cassanova.consts.workloads import Priorities, Workloads
+from cassanova.core.admission import admission_controller
+from cassanova.core.cql.converters import convert_value_for_cql
+from cassanova.core.cql.prepared_statements import bind_statement
+from cassanova.core.query_registry import execute_concurrent_tracked, query_registry
+from cassanova.core.scheduler import scheduled
+from cassanova.models.auth_models import WebUser
+
+logger = getLogger(__name__)
+
+
+@dataclass
+class LookupResult:
+    key: dict[str, Any]
+    rows: list[dict[str, Any]] = field(default_factory=list)
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"key": self.key, "rows": self.rows, "error": self.error}
+
+
+def lookup_statement(
+    keyspace: str,
+    table: TableMetadata,
+    key: dict[str, Any],
+    columns: list[str] | None = None,
+    limit: int = 100,
+) -> tuple[str, list[Any]]:
+    """A preparable SELECT for one key and the typed values to bind to it."""
+    partition_key = [column.name for column in table.partition_key]
+    missing = [column for column in partition_key if column not in key]
+    if missing:
+        raise ValueError(f"Missing partition key column(s): {', '.join(missing)}")
+
+    clustering = [column.name for column in table.clustering_key]
+    prefix = 0
+    while prefix < len(clustering) and clustering[prefix] in key:
+        prefix += 1
+    restricted = partition_key + clustering[:prefix]
+    extra = [column for column in key if column not in restricted]
+    if extra:
+        raise ValueError(
+            f"Column(s) {', '.join(extra)} are not part of the partition key or a clustering prefix"
+        )
+
+    values = [convert_value_for_cql(key[c], str(table.columns[c].cql_type)) for c in restricted]
+    selected = ", ".join(f'"{column}"' for column in columns) if columns else "*"
+    where = " AND ".join(f'"{column}" = ?' for column in restricted)
+    query = f'SELECT {selected} FROM "{keyspace}"."{table.name}" WHERE {where} LIMIT ?'
+    return query, [*values, limit]
+
+
+def lookup_partitions(
+    session: Session,
+    cluster_name: str,
+    user: WebUser | None,
+    keyspace: str,
+    table: TableMetadata,
+    keys: list[dict[str, Any]],
+    columns: list[str] | None = None,
+    limit: int = 100,
+) -> list[LookupResult]:
+    config = get_clusters_config().browse
+    if len(keys) > config.max_lookup_keys:
+        raise ValueError(f"At most {config.max_lookup_keys} keys can be looked up at once")
+
+    results = [LookupResult(key) for key in keys]
+    pending: list[tuple[LookupResult, BoundStatement]] = []
+    for result in results:
+        try:
+            query, values = lookup_statement(keyspace, table, result.key, columns, limit)
+            pending.append((result, bind_statement(session, query, values, fetch_size=limit)))
+        except ValueError as e:
+            result.error = str(e)
+    if not pending:
+        return results
+
+    with (
+        admission_controller.acquire(cluster_name, user, Workloads.INTERACTIVE),
+        scheduled(session, user, Priorities.INTERACTIVE),
+        query_registry.track(
+            cluster_name, user, pending[0][1].prepared_statement.query_string
+        ) as tracked,
+    ):
+        outcomes = execute_concurrent_tracked(
+            session,
+            [statement for _, statement in pending],
+            tracked,
+            concurrency=config.lookup_concurrency,
+            raise_on_first_error=False,
+            execution_profile=ExecutionProfiles.INTERACTIVE,
+        )
+
+    for (result, _), (success, outcome) in zip(pending, outcomes, strict=True):
+        if success:
+            result.rows = [dict(row._asdict()) for row in outcome.current_rows]
+        else:
+            result.error = str(outcome)
+    failed = sum(1 for result in results if result.error)
+    if failed:
+        logger.info(f"{failed} of {len(keys)} lookups on {keyspace}.{table.name} failed")
+    return results
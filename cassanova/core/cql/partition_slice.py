@@ -0,0 +1,99 @@
+"""Clustering-range slices of a single partition.
+
+Rows of a wide partition are read in clustering order, bounded by an
+inclusive ``start`` and exclusive ``end`` clustering prefix, in ascending or
+descending order. Pages are keyset-based: the next page starts strictly
+after the full clustering key of the last row read, so any point of the
+partition, such as a recent time window, is one round trip away and a page
+can be bookmarked without server-side state.
+
+Bounds are multi-column relations, e.g. ``("day", "seq") >= (?, ?)``, which
+Cassandra applies on the clustering index. Reading in one order across
+clustering columns declared with mixed ``ASC``/``DESC`` directions is not
+expressible as a single slice, so such tables are rejected.
+"""
+
+from typing import Any, Literal
+
+from cassandra.metadata import TableMetadata
+
+from cassanova.core.cql.converters import convert_value_for_cql
+
+SliceOrder = Literal["asc", "desc"]
+
+
+def slice_statement(
+    keyspace: str,
+    table: TableMetadata,
+    key: dict[str, Any],
+    start: dict[str, Any] | None = None,
+    end: dict[str, Any] | None = None,
+    after: dict[str, Any] | None = None,
+    order: SliceOrder = "asc",
+    columns: list[str] | None = None,
+    limit: int = 100,
+) -> tuple[str, list[Any]]:
+    """A preparable SELECT for one slice page and the typed values to bind."""
+    clustering = [column.name for column in table.clustering_key]
+    if not clustering:
+        raise ValueError(f"Table {table.name} has no clustering columns to slice by")
+    if len({column.is_reversed for column in table.clustering_key}) > 1:
+        raise ValueError("Tables with mixed clustering orders cannot be sliced")
+
+    partition_key = [column.name for column in table.partition_key]
+    missing = [column for column in partition_key if column not in key]
+    if missing:
+        raise ValueError(f"Missing partition key column(s): {', '.join(missing)}")
+    if after is not None and set(after) != set(clustering):
+        raise ValueError("'after' must give every clustering column")
+
+    conditions = [f'"{column}" = ?' for column in partition_key]
+    values = [_typed(table, column, key[column]) for column in partition_key]
+
+    # Resuming after a row replaces the bound on the side the slice moves from.
+    lower = (">", after) if after is not None and order == "asc" else (">=", start)
+    upper = ("<", after) if after is not None and order == "desc" else ("<", end)
+    for op, bound in (lower, upper):
+        if not bound:
+            continue
+        prefix = _prefix(clustering, bound)
+        markers = ", ".join(["?"] * len(prefix))
+        conditions.append(f"({_quoted(prefix)}) {op} ({markers})")
+        values.extend(_typed(table, column, bound[column]) for column in prefix)
+
+    direction = order.upper()
+    ordering = ", ".join(f'"{column}" {direction}' for column in clustering)
+    selected = _quoted(columns) if columns else "*"
+    where = " AND ".join(conditions)
+    query = (
+        f'SELECT {selected} FROM "{keyspace}"."{table.name}" WHERE {where}'
+        f" ORDER BY {ordering} LIMIT ?"
+    )
+    return query, [*values, limit]
+
+
+def next_after(
+    table: TableMetadata, rows: list[dict[str, Any]], limit: int
+) -> dict[str, Any] | None:
+    """The ``after`` bound of the page following ``rows``, if there may be one."""
+    if len(rows) < limit:
+        return None
+    return {column.name: rows[-1][column.name] for column in table.clustering_key}
+
+
+def _prefix(clustering: list[str], bound: dict[str, Any]) -> list[str]:
+    prefix = clustering[: len(bound)]
+    if set(prefix) != set(bound):
+        raise ValueError(
+            f"Slice bounds must be a clustering prefix of ({', '.join(clustering)}), "
+            f"got ({', '.join(bound)})"
+        )
+    return prefix
+
+
+def _quoted(columns: list[str]) -> str:
+    return ", ".join(f'"{column}"' for column in columns)
+
+
+def _typed(table: TableMetadata, column: str, value: Any) -> Any:
+    return convert_value_for_cql(value, str(table.columns[column].cql_type))
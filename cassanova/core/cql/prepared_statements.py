@@ -0,0 +1,62 @@
+"""Per-session cache of prepared statements.
+
+``session.prepare`` sends a PREPARE round trip to every host each time it is
+called, even for a statement the driver has seen before. Generated queries
+whose values are bound rather than inlined are prepared once per session here
+and reused. The cache is bounded, and is cleared after DDL so that
+``SELECT *`` statements pick up added or dropped columns.
+"""
+
+from collections import OrderedDict
+from logging import getLogger
+from threading import Lock
+from typing import Any
+from weakref import WeakKeyDictionary
+
+from cassandra.cluster import Session
+from cassandra.query import BoundStatement, PreparedStatement
+
+logger = getLogger(__name__)
+
+_MAX_STATEMENTS_PER_SESSION = 512
+
+
+class PreparedStatementCache:
+    def __init__(self, max_size: int = _MAX_STATEMENTS_PER_SESSION) -> None:
+        self._max_size = max_size
+        self._statements: WeakKeyDictionary[Session, OrderedDict[str, PreparedStatement]] = (
+            WeakKeyDictionary()
+        )
+        self._lock = Lock()
+
+    def get(self, session: Session, query: str) -> PreparedStatement:
+        with self._lock:
+            statements = self._statements.setdefault(session, OrderedDict())
+            prepared = statements.get(query)
+            if prepared is not None:
+                statements.move_to_end(query)
+                return prepared
+
+        prepared = session.prepare(query)
+        with self._lock:
+            statements = self._statements.setdefault(session, OrderedDict())
+            statements[query] = prepared
+            while len(statements) > self._max_size:
+                statements.popitem(last=False)
+        return prepared
+
+    def invalidate(self, session: Session) -> None:
+        with self._lock:
+            self._statements.pop(session, None)
+
+
+prepared_statements = PreparedStatementCache()
+
+
+def bind_statement(
+    session: Session, query: str, values: list[Any], **kwargs: Any
+) -> BoundStatement:
+    """Bind values to a cached prepared read the driver may retry or speculate."""
+    statement = BoundStatement(prepared_statements.get(session, query), **kwargs)
+    statement.is_idempotent = True
+    return statement.bind(values)
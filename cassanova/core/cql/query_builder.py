@@ -1,7 +1,11 @@
+from dataclasses import dataclass, field
 from json import loads
 from logging import getLogger
 from typing import Any
 
+from cassandra.metadata import TableMetadata
+
+from cassanova.core.cql.converters import convert_value_for_cql
 from cassanova.core.cql.sanitize_input import sanitize_identifier
 
 logger = getLogger(__name__)
@@ -22,6 +26,88 @@ _ALLOWED_OPERATORS = frozenset(
 )
 
 
+@dataclass
+class WhereClause:
+    """A WHERE clause with ``?`` bind markers and the values to bind to them.
+
+    ``restrictions`` lists each filter's ``(column, operator)`` for planning.
+    """
+
+    clause: str = ""
+    values: list[Any] = field(default_factory=list)
+    restrictions: list[tuple[str, str]] = field(default_factory=list)
+
+
+def build_where(filter_json: str | None, table: TableMetadata) -> WhereClause:
+    """Build a preparable WHERE clause from the explorer's filter list.
+
+    Values are converted with the column's CQL type and bound rather than
+    inlined, so one filter shape always yields the same statement text. An
+    IN filter gets one marker per item.
+    """
+    if not filter_json:
+        return WhereClause()
+
+    conditions = []
+    values: list[Any] = []
+    restrictions = []
+    for f in loads(filter_json):
+        col = f.get("col")
+        op = f.get("op", "=").upper()
+        val = f.get("val", "")
+
+        sanitize_identifier(col)
+        _validate_operator(op)
+        column = table.columns.get(col)
+        if column is None:
+            raise ValueError(f"Unknown column: {col}")
+
+        if op == "IN":
+            items = [_bind_value(item.strip(), column.cql_type, op) for item in str(val).split(",")]
+            conditions.append(f'"{col}" IN ({", ".join(["?"] * len(items))})')
+            values.extend(items)
+        else:
+            conditions.append(f'"{col}" {op} ?')
+            values.append(_bind_value(val, column.cql_type, op))
+        restrictions.append((col, op))
+
+    clause = " WHERE " + " AND ".join(conditions) if conditions else ""
+    return WhereClause(clause, values, restrictions)
+
+
+def _bind_value(val: Any, cql_type: str, op: str) -> Any:
+    if op == "LIKE":
+        return val if "%" in str(val) else f"%{val}%"
+    if op == "CONTAINS":
+        return convert_value_for_cql(val, _element_type(cql_type, key=False))
+    if op == "CONTAINS KEY":
+        return convert_value_for_cql(val, _element_type(cql_type, key=True))
+    return convert_value_for_cql(val, cql_type)
+
+
+def _element_type(cql_type: str, key: bool) -> str:
+    """The type of a collection's elements, or of a map's keys/values."""
+    cql_type = cql_type.strip()
+    while cql_type.lower().startswith("frozen<"):
+        cql_type = cql_type[len("frozen<") : -1].strip()
+    outer, _, inner = cql_type.partition("<")
+    if not inner:
+        raise ValueError(f"CONTAINS needs a collection column, not {cql_type}")
+    inner = inner[:-1]
+    if outer.lower() != "map":
+        return inner.strip()
+
+    depth = 0
+    for i, char in enumerate(inner):
+        if char == "<":
+            depth += 1
+        elif char == ">":
+            depth -= 1
+        elif char == "," and depth == 0:
+            return (inner[:i] if key else inner[i + 1 :]).strip()
+    raise ValueError(f"Malformed map type: {cql_type}")
+
+
 def build_where_clause(filter_json: str | None = None) -> str:
     if not filter_json:
         return ""
@@ -0,0 +1,279 @@
+"""Pre-execution cost analysis for SELECT statements.
+
+A query is classified from the table's metadata before it runs:
+
+* ``single_partition`` / ``multi_partition`` - every partition key column is
+  restricted by ``=`` or ``IN``;
+* ``index_scan`` - a restricted column is served by a secondary index or SAI;
+* ``full_scan`` - anything else, including token ranges and ALLOW FILTERING.
+
+Partitions and bytes touched are estimated from ``system.size_estimates``.
+A full scan without ALLOW FILTERING stops once it has a page (or LIMIT) of
+rows, so its estimate is capped there. The outcome is then checked against
+the thresholds for the user's roles, which may ask for confirmation or
+refuse the query.
+"""
+
+import re
+from dataclasses import dataclass, field
+from logging import getLogger
+from math import prod
+from typing import Any
+
+from cassandra.cluster import Session
+from cassandra.metadata import TableMetadata
+
+from cassanova.config.cassanova_config import get_clusters_config
+from cassanova.config.query_cost_config import CostThresholds
+from cassanova.consts.query_kinds import CostDecisions, QueryKinds
+from cassanova.core.cql.access_path import column_indexes
+from cassanova.core.size_estimates import size_estimate_cache
+from cassanova.exceptions.cql_exceptions import QueryCostExceeded
+from cassanova.models.auth_models import WebUser
+
+logger = getLogger(__name__)
+
+_IDENTIFIER = r'(?:"(?:[^"]|"")+"|\w+)'
+_SELECT = re.compile(
+    rf"^\s*SELECT\s.*?\bFROM\s+(?P<first>{_IDENTIFIER})(?:\s*\.\s*(?P<second>{_IDENTIFIER}))?"
+    r"(?P<rest>.*)$",
+    re.IGNORECASE | re.DOTALL,
+)
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'|\$\$.*?\$\$", re.DOTALL)
+_WHERE = re.compile(
+    r"\bWHERE\b(?P<conditions>.*?)"
+    r"(?=\b(?:ORDER\s+BY|GROUP\s+BY|PER\s+PARTITION\s+LIMIT|LIMIT|ALLOW\s+FILTERING)\b|$)",
+    re.IGNORECASE | re.DOTALL,
+)
+_LIMIT = re.compile(r"(?<!PARTITION\s)\bLIMIT\s+(\d+)", re.IGNORECASE)
+_ALLOW_FILTERING = re.compile(r"\bALLOW\s+FILTERING\b", re.IGNORECASE)
+_AND = re.compile(r"\bAND\b", re.IGNORECASE)
+_CONDITION = re.compile(
+    rf"^\s*(?P<lhs>token\s*\(.*?\)|\(.*?\)|{_IDENTIFIER})\s*"
+    r"(?P<op><=|>=|!=|=|<|>|\bIN\b|\bCONTAINS\s+KEY\b|\bCONTAINS\b|\bLIKE\b)\s*(?P<rhs>.*)$",
+    re.IGNORECASE | re.DOTALL,
+)
+
+_EQUALITY_OPS = {"=", "IN"}
+_SEVERITY = {CostDecisions.ALLOW: 0, CostDecisions.CONFIRM: 1, CostDecisions.BLOCK: 2}
+
+
+@dataclass
+class QueryCost:
+    kind: str
+    keyspace: str | None = None
+    table: str | None = None
+    estimated_partitions: int | None = None
+    estimated_bytes: int | None = None
+    filtering: bool = False
+    index: str | None = None
+    reasons: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "keyspace": self.keyspace,
+            "table": self.table,
+            "estimated_partitions": self.estimated_partitions,
+            "estimated_bytes": self.estimated_bytes,
+            "filtering": self.filtering,
+            "index": self.index,
+            "reasons": self.reasons,
+        }
+
+
+@dataclass
+class _Restriction:
+    column: str
+    op: str
+    values: int | None
+
+
+def analyze_query(
+    session: Session, cluster_name: str, cql: str, page_size: int | None = None
+) -> QueryCost:
+    match = _SELECT.match(_STRING_LITERAL.sub("?", cql))
+    if match is None:
+        return QueryCost(QueryKinds.UNKNOWN, reasons=["Only SELECT statements are analyzed"])
+
+    if match.group("second"):
+        keyspace, table = _name(match.group("first")), _name(match.group("second"))
+    else:
+        keyspace, table = session.keyspace, _name(match.group("first"))
+    if not keyspace:
+        return QueryCost(QueryKinds.UNKNOWN, table=table, reasons=["No keyspace given"])
+
+    keyspace_meta = session.cluster.metadata.keyspaces.get(keyspace)
+    table_meta = None
+    if keyspace_meta is not None:
+        table_meta = keyspace_meta.tables.get(table) or keyspace_meta.views.get(table)
+    if table_meta is None:
+        return QueryCost(
+            QueryKinds.UNKNOWN, keyspace, table, reasons=[f"Table {keyspace}.{table} not found"]
+        )
+
+    rest = match.group("rest")
+    cost = _classify(table_meta, _restrictions(rest), bool(_ALLOW_FILTERING.search(rest)))
+    cost.keyspace, cost.table = keyspace, table
+
+    limit_match = _LIMIT.search(rest)
+    limit = int(limit_match.group(1)) if limit_match else None
+    bound = min(v for v in (limit, page_size) if v) if (limit or page_size) else None
+    _estimate(cost, session, cluster_name, bound)
+    return cost
+
+
+def check_query_cost(
+    session: Session,
+    cluster_name: str,
+    cql: str,
+    user: WebUser | None,
+    confirmed: bool = False,
+    page_size: int | None = None,
+) -> QueryCost | None:
+    """Analyze a query and raise ``QueryCostExceeded`` if it may not run as is."""
+    config = get_clusters_config().query_cost
+    if not config.enabled:
+        return None
+
+    cost = analyze_query(session, cluster_name, cql, page_size)
+    decision = decide(cost, user)
+    if decision == CostDecisions.BLOCK or (decision == CostDecisions.CONFIRM and not confirmed):
+        raise QueryCostExceeded(cluster_name, decision, cost.to_dict())
+    return cost
+
+
+def decide(cost: QueryCost, user: WebUser | None) -> str:
+    """Check a cost against the thresholds of the user's roles.
+
+    Users with several configured roles get the most lenient outcome.
+    """
+    config = get_clusters_config().query_cost
+    roles = [role for role in (user.roles if user else []) if role in config.role_thresholds]
+    if not roles:
+        return _decide(cost, config.default_thresholds)
+    decisions = [_decide(cost, config.role_thresholds[role]) for role in roles]
+    return min(decisions, key=_SEVERITY.__getitem__)
+
+
+def _decide(cost: QueryCost, thresholds: CostThresholds) -> str:
+    if (
+        cost.kind in thresholds.block_kinds
+        or _reaches(cost.estimated_partitions, thresholds.block_partitions)
+        or _reaches(cost.estimated_bytes, thresholds.block_bytes)
+    ):
+        return CostDecisions.BLOCK
+    if (
+        cost.kind in thresholds.confirm_kinds
+        or _reaches(cost.estimated_partitions, thresholds.confirm_partitions)
+        or _reaches(cost.estimated_bytes, thresholds.confirm_bytes)
+    ):
+        return CostDecisions.CONFIRM
+    return CostDecisions.ALLOW
+
+
+def _reaches(estimate: int | None, limit: int | None) -> bool:
+    return estimate is not None and limit is not None and estimate >= limit
+
+
+def _classify(table: TableMetadata, restrictions: list[_Restriction], filtering: bool) -> QueryCost:
+    partition_key = [column.name for column in table.partition_key]
+    equalities = {r.column: r for r in restrictions if r.op in _EQUALITY_OPS}
+
+    if all(column in equalities for column in partition_key):
+        counts = [equalities[column].values for column in partition_key]
+        partitions = prod(counts) if None not in counts else None  # type: ignore[arg-type]
+        kind = QueryKinds.SINGLE_PARTITION if partitions == 1 else QueryKinds.MULTI_PARTITION
+        cost = QueryCost(kind, estimated_partitions=partitions, filtering=filtering)
+        cost.reasons.append(f"Partition key ({', '.join(partition_key)}) fully restricted")
+        return cost
+
+    indexes = column_indexes(table)
+    for restriction in restrictions:
+        index = indexes.get(restriction.column)
+        if index is not None and index.serves(restriction.op):
+            cost = QueryCost(QueryKinds.INDEX_SCAN, filtering=filtering, index=index.name)
+            kind = "SAI" if index.is_sai else "secondary index"
+            cost.reasons.append(f"Column {restriction.column} is served by {kind} {index.name}")
+            return cost
+
+    cost = QueryCost(QueryKinds.FULL_SCAN, filtering=filtering)
+    missing = [column for column in partition_key if column not in equalities]
+    if any(r.column == "token" for r in restrictions):
+        cost.reasons.append("Token range restriction scans part of the ring")
+    else:
+        cost.reasons.append(f"Partition key column(s) {', '.join(missing)} not restricted")
+    if filtering:
+        cost.reasons.append("ALLOW FILTERING reads and discards rows on the replicas")
+    return cost
+
+
+def _estimate(cost: QueryCost, session: Session, cluster_name: str, bound: int | None) -> None:
+    if cost.kind == QueryKinds.INDEX_SCAN:
+        cost.reasons.append("Index selectivity is unknown; no size estimate")
+        return
+
+    estimate = None
+    if cost.keyspace is not None and cost.table is not None:
+        estimate = size_estimate_cache.get(session, cluster_name, cost.keyspace, cost.table)
+    if estimate is None:
+        cost.reasons.append("No size estimates available for this table")
+        return
+
+    if cost.kind == QueryKinds.FULL_SCAN:
+        partitions = estimate.partitions
+        if bound is not None and not cost.filtering:
+            partitions = min(partitions, bound)
+            cost.reasons.append(f"Scan stops after {bound} rows")
+        cost.estimated_partitions = partitions
+    if cost.estimated_partitions is not None:
+        cost.estimated_bytes = cost.estimated_partitions * estimate.mean_partition_size
+
+
+def _restrictions(rest: str) -> list[_Restriction]:
+    where = _WHERE.search(rest)
+    if where is None:
+        return []
+
+    restrictions = []
+    for condition in _AND.split(where.group("conditions")):
+        match = _CONDITION.match(condition)
+        if match is None:
+            continue
+        lhs = match.group("lhs")
+        op = " ".join(match.group("op").upper().split())
+        if lhs.lower().startswith("token"):
+            restrictions.append(_Restriction("token", op, None))
+        elif lhs.startswith("("):
+            # Multi-column restrictions only apply to clustering columns.
+            continue
+        else:
+            values = _count_values(match.group("rhs")) if op == "IN" else 1
+            restrictions.append(_Restriction(_name(lhs), op, values))
+    return restrictions
+
+
+def _count_values(rhs: str) -> int | None:
+    rhs = rhs.strip()
+    if not rhs.startswith("("):
+        # A single bind marker stands for a list of unknown size.
+        return None
+    depth = 0
+    count = 1
+    for char in rhs:
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+            if depth == 0:
+                break
+        elif char == "," and depth == 1:
+            count += 1
+    return count if rhs.strip("() ") else 0
+
+
+def _name(identifier: str) -> str:
+    identifier = identifier.strip()
+    if identifier.startswith('"') and identifier.endswith('"'):
+        return identifier[1:-1].replace('""', '"')
+    return identifier.lower()
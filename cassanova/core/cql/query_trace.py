@@ -0,0 +1,166 @@
+"""Lazy retrieval and formatting of query traces.
+
+Cassandra writes trace events to ``system_traces`` asynchronously, so a traced
+statement only returns its trace session id. The trace itself is fetched on
+request with a short wait; while it is still being written the caller is told
+to come back later. Complete traces are formatted once, with events grouped
+into per-replica stage timelines, and kept in a small LRU cache.
+"""
+
+import re
+from collections import OrderedDict
+from logging import getLogger
+from threading import Lock
+from typing import Any
+from uuid import UUID
+
+from cassandra import ConsistencyLevel
+from cassandra.cluster import ResultSet, Session
+from cassandra.query import QueryTrace, TraceUnavailable
+
+from cassanova.config.cassanova_config import get_clusters_config
+from cassanova.core.scheduler import scheduled
+from cassanova.models.auth_models import WebUser
+
+logger = getLogger(__name__)
+
+_THREAD_SUFFIX = re.compile(r"[-:]\d+$")
+
+
+class TraceCache:
+    def __init__(self) -> None:
+        self._traces: OrderedDict[tuple[str, UUID], dict[str, Any]] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, cluster_name: str, trace_id: UUID) -> dict[str, Any] | None:
+        with self._lock:
+            trace = self._traces.get((cluster_name, trace_id))
+            if trace is not None:
+                self._traces.move_to_end((cluster_name, trace_id))
+            return trace
+
+    def put(self, cluster_name: str, trace_id: UUID, trace: dict[str, Any]) -> None:
+        max_size = get_clusters_config().cqlsh.trace_cache_size
+        with self._lock:
+            self._traces[(cluster_name, trace_id)] = trace
+            self._traces.move_to_end((cluster_name, trace_id))
+            while len(self._traces) > max_size:
+                self._traces.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._traces.clear()
+
+
+trace_cache = TraceCache()
+
+
+def get_trace_id(result_set: ResultSet) -> str | None:
+    """The trace session id of a traced statement, without fetching the trace."""
+    trace_ids = result_set.response_future.get_query_trace_ids()
+    return str(trace_ids[-1]) if trace_ids else None
+
+
+def fetch_trace(
+    session: Session, cluster_name: str, trace_id: UUID, user: WebUser | None = None
+) -> dict[str, Any] | None:
+    """Return the formatted trace, or ``None`` while Cassandra is still writing it."""
+    cached = trace_cache.get(cluster_name, trace_id)
+    if cached is not None:
+        return cached
+
+    trace = QueryTrace(trace_id, session)
+    try:
+        with scheduled(session, user):
+            trace.populate(
+                max_wait=get_clusters_config().cqlsh.trace_fetch_wait,
+                query_cl=ConsistencyLevel.LOCAL_ONE,
+            )
+    except TraceUnavailable:
+        logger.debug(f"Trace {trace_id} on '{cluster_name}' is not complete yet")
+        return None
+
+    formatted = format_trace(trace)
+    trace_cache.put(cluster_name, trace_id, formatted)
+    return formatted
+
+
+def format_trace(trace: QueryTrace) -> dict[str, Any]:
+    if isinstance(trace.duration, int):
+        duration_ms = trace.duration / 1000.0
+    elif trace.duration:
+        duration_ms = trace.duration.total_seconds() * 1000.0
+    else:
+        duration_ms = 0.0
+
+    events = []
+    for e in trace.events:
+        ms = e.source_elapsed.total_seconds() * 1000.0 if e.source_elapsed else 0.0
+        events.append(
+            {
+                "description": e.description,
+                "source": str(e.source),
+                "stage": _stage(e.thread_name),
+                "elapsed_ms": ms,
+            }
+        )
+
+    if duration_ms == 0 and events:
+        duration_ms = max(e["elapsed_ms"] for e in events)
+
+    return {
+        "trace_id": str(trace.trace_id),
+        "request_type": trace.request_type,
+        "duration_ms": duration_ms,
+        "coordinator": str(trace.coordinator),
+        "parameters": trace.parameters,
+        "started_at": trace.started_at.isoformat() if trace.started_at else None,
+        "events": events,
+        "replicas": _replica_timelines(events),
+    }
+
+
+def _stage(thread_name: str | None) -> str:
+    return _THREAD_SUFFIX.sub("", thread_name) if thread_name else "unknown"
+
+
+def _replica_timelines(events: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Group each replica's events into consecutive runs on the same stage.
+
+    ``source_elapsed`` is measured from when the replica started work on the
+    request, so a stage runs from its first event until the next stage begins.
+    """
+    by_source: dict[str, list[dict[str, Any]]] = {}
+    for event in sorted(events, key=lambda e: e["elapsed_ms"]):
+        by_source.setdefault(event["source"], []).append(event)
+
+    replicas = []
+    for source, source_events in by_source.items():
+        stages: list[dict[str, Any]] = []
+        for event in source_events:
+            if stages and stages[-1]["stage"] == event["stage"]:
+                stages[-1]["end_ms"] = event["elapsed_ms"]
+                stages[-1]["events"] += 1
+                continue
+            if stages:
+                stages[-1]["end_ms"] = event["elapsed_ms"]
+            stages.append(
+                {
+                    "stage": event["stage"],
+                    "start_ms": event["elapsed_ms"],
+                    "end_ms": event["elapsed_ms"],
+                    "events": 1,
+                }
+            )
+        for stage in stages:
+            stage["duration_ms"] = stage["end_ms"] - stage["start_ms"]
+
+        replicas.append(
+            {
+                "source": source,
+                "events": len(source_events),
+                "span_ms": source_events[-1]["elapsed_ms"] - source_events[0]["elapsed_ms"],
+                "stages": stages,
+            }
+        )
+    return replicas
@@ -0,0 +1,93 @@
+"""Random samples of a table's rows from across the token ring.
+
+A table read from its start only ever shows the partitions with the lowest
+tokens, all owned by the same replicas. A sample instead draws random
+tokens, uniformly over the partitioner's ring, and reads a few rows from
+each point onwards concurrently, so rows come from partitions spread over
+the whole ring and every replica set. Overlapping reads are deduplicated
+and the sample is returned in token order.
+"""
+
+from random import Random
+from typing import Any
+
+from cassandra.cluster import Session
+from cassandra.metadata import TableMetadata
+
+from cassanova.config.cassanova_config import get_clusters_config
+from cassanova.consts.execution_profiles import ExecutionProfiles
+from cassanova.consts.workloads import Priorities, Workloads
+from cassanova.core.admission import admission_controller
+from cassanova.core.cql.prepared_statements import bind_statement
+from cassanova.core.cql.token_ranges import token_conditions, token_function, token_ring
+from cassanova.core.query_registry import execute_concurrent_tracked, query_registry
+from cassanova.core.scheduler import scheduled
+from cassanova.models.auth_models import WebUser
+
+
+def sample_statement(
+    keyspace: str,
+    table: TableMetadata,
+    start: int,
+    rows_per_point: int,
+    columns: list[str] | None = None,
+) -> tuple[str, list[int]]:
+    """A preparable SELECT of the rows following token ``start``, token last."""
+    selected = columns or list(table.columns)
+    conditions, values = token_conditions(table, (start, None))
+    projection = ", ".join([*(f'"{column}"' for column in selected), token_function(table)])
+    query = (
+        f'SELECT {projection} FROM "{keyspace}"."{table.name}"'
+        f" WHERE {' AND '.join(conditions)} LIMIT ?"
+    )
+    return query, [*values, rows_per_point]
+
+
+def sample_rows(
+    session: Session,
+    cluster_name: str,
+    user: WebUser | None,
+    keyspace: str,
+    table: TableMetadata,
+    points: int = 20,
+    rows_per_point: int = 5,
+    columns: list[str] | None = None,
+    seed: int | None = None,
+    priority: str = Priorities.INTERACTIVE,
+) -> list[dict[str, Any]]:
+    config = get_clusters_config().browse
+    if points > config.max_sample_points:
+        raise ValueError(f"At most {config.max_sample_points} sample points can be read")
+
+    lowest, highest = token_ring(session.cluster.metadata.partitioner)
+    random = Random(seed)
+    starts = sorted({random.randint(lowest, highest) for _ in range(points)})
+    statements = []
+    for start in starts:
+        query, values = sample_statement(keyspace, table, start, rows_per_point, columns)
+        statements.append(bind_statement(session, query, values, fetch_size=rows_per_point))
+
+    with (
+        admission_controller.acquire(cluster_name, user, Workloads.INTERACTIVE),
+        scheduled(session, user, priority),
+        query_registry.track(
+            cluster_name, user, statements[0].prepared_statement.query_string
+        ) as tracked,
+    ):
+        outcomes = execute_concurrent_tracked(
+            session,
+            statements,
+            tracked,
+            concurrency=config.sample_concurrency,
+            execution_profile=ExecutionProfiles.INTERACTIVE,
+        )
+
+    primary_key = [column.name for column in (*table.partition_key, *table.clustering_key)]
+    sampled: dict[tuple[Any, ...], tuple[int, dict[str, Any]]] = {}
+    for _, outcome in outcomes:
+        for row in outcome.current_rows:
+            cells = row._asdict()
+            cells.pop(row._fields[-1])
+            key = (row[-1], *(repr(cells.get(column)) for column in primary_key))
+            sampled.setdefault(key, (row[-1], cells))
+    return [cells for _, cells in sorted(sampled.values(), key=lambda sample: sample[0])]
@@ -0,0 +1,235 @@
+"""Run a multi-statement CQL script in one request.
+
+Consecutive writes to different tables form a window that runs concurrently
+on a small thread pool, each statement going through ``execute_cql`` like any
+other user query. A write to a table already written in the current window
+starts a new window, so statements on the same table keep script order and
+their client timestamps follow it. SELECTs, and statements whose tables cannot
+be parsed, run on their own, after everything before them. DDL (and other
+schema or permission changes) is a barrier too, and the script waits for
+schema agreement after it so later statements see the new schema.
+"""
+
+import re
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from logging import getLogger
+from time import perf_counter
+from typing import Any
+
+from cassandra.cluster import Session
+from cassandra.query import SimpleStatement
+
+from cassanova.config.cassanova_config import get_clusters_config
+from cassanova.core.cql._executor import execute_cql
+from cassanova.models.auth_models import WebUser
+
+logger = getLogger(__name__)
+
+_BARRIER_KEYWORDS = frozenset({"CREATE", "ALTER", "DROP", "TRUNCATE", "GRANT", "REVOKE"})
+_DDL_KEYWORDS = frozenset({"CREATE", "ALTER", "DROP"})
+_UNSUPPORTED_KEYWORDS = frozenset({"USE"})
+
+_NAME = r'(?:"(?:[^"]|"")+"|\w+)'
+_TABLE = rf"({_NAME}(?:\s*\.\s*{_NAME})?)"
+_WRITE_TARGETS = re.compile(
+    rf"\b(?:INSERT\s+INTO|UPDATE|DELETE\b.*?\bFROM)\s+{_TABLE}", re.IGNORECASE | re.DOTALL
+)
+
+
+@dataclass
+class StatementResult:
+    index: int
+    statement: str
+    kind: str
+    status: str = "skipped"
+    elapsed_ms: float | None = None
+    rows: list[dict[str, Any]] | None = None
+    schema_agreed: bool | None = None
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {key: value for key, value in self.__dict__.items() if value is not None}
+
+
+@dataclass
+class ScriptResult:
+    statements: list[StatementResult] = field(default_factory=list)
+    elapsed_ms: float = 0.0
+
+    @property
+    def succeeded(self) -> int:
+        return sum(1 for s in self.statements if s.status == "ok")
+
+    @property
+    def failed(self) -> int:
+        return sum(1 for s in self.statements if s.status == "error")
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "skipped": len(self.statements) - self.succeeded - self.failed,
+            "elapsed_ms": self.elapsed_ms,
+            "results": [s.to_dict() for s in self.statements],
+        }
+
+
+def run_script(
+    session: Session,
+    statements: list[str],
+    cluster_name: str,
+    user: WebUser | None,
+    consistency_level: int,
+    stop_on_error: bool = True,
+    concurrency: int | None = None,
+) -> ScriptResult:
+    config = get_clusters_config()
+    cqlsh_config = config.cqlsh
+    if len(statements) > cqlsh_config.max_script_statements:
+        raise ValueError(
+            f"Script has {len(statements)} statements; "
+            f"the limit is {cqlsh_config.max_script_statements}"
+        )
+
+    window = min(concurrency or cqlsh_config.script_concurrency, cqlsh_config.script_concurrency)
+    results = [
+        StatementResult(index=i, statement=cql, kind=_statement_kind(cql))
+        for i, cql in enumerate(statements)
+    ]
+    started = perf_counter()
+
+    def _run(result: StatementResult) -> StatementResult:
+        return _run_statement(session, result, cluster_name, user, consistency_level)
+
+    with ThreadPoolExecutor(max_workers=window, thread_name_prefix="cql-script") as pool:
+        for group in _groups(results):
+            if len(group) == 1:
+                _run(group[0])
+            else:
+                _run_concurrently(pool, group, _run, stop_on_error)
+            if stop_on_error and any(r.status == "error" for r in group):
+                break
+
+    script_result = ScriptResult(results, round((perf_counter() - started) * 1000, 3))
+    logger.info(
+        f"Script on '{cluster_name}' by '{user.username if user else 'anonymous'}': "
+        f"{script_result.succeeded}/{len(results)} statements succeeded "
+        f"in {script_result.elapsed_ms:.0f}ms"
+    )
+    return script_result
+
+
+def _groups(results: list[StatementResult]) -> list[list[StatementResult]]:
+    """Batch consecutive writes to disjoint tables into windows; everything else stands alone."""
+    groups: list[list[StatementResult]] = []
+    current: list[StatementResult] = []
+    written: set[str] = set()
+    for result in results:
+        tables = _written_tables(result) if result.kind == "dml" else None
+        if tables is not None and not tables & written:
+            current.append(result)
+            written |= tables
+            continue
+        if current:
+            groups.append(current)
+            current, written = [], set()
+        if tables is None:
+            groups.append([result])
+        else:
+            current, written = [result], set(tables)
+    if current:
+        groups.append(current)
+    return groups
+
+
+def _written_tables(result: StatementResult) -> set[str] | None:
+    """Tables an INSERT, UPDATE, DELETE or BATCH writes, or ``None`` if it is not a known write."""
+    words = result.statement.split(maxsplit=1)
+    if not words or words[0].upper() not in {"INSERT", "UPDATE", "DELETE", "BEGIN"}:
+        return None
+    tables = {_table_name(match) for match in _WRITE_TARGETS.findall(result.statement)}
+    return tables or None
+
+
+def _table_name(name: str) -> str:
+    parts = re.findall(_NAME, name)
+    return ".".join(
+        part[1:-1].replace('""', '"') if part.startswith('"') else part.lower() for part in parts
+    )
+
+
+def _run_concurrently(
+    pool: ThreadPoolExecutor,
+    group: list[StatementResult],
+    run: Callable[[StatementResult], StatementResult],
+    stop_on_error: bool,
+) -> None:
+    futures: list[Future] = [pool.submit(run, result) for result in group]
+    for future in futures:
+        if future.cancelled():
+            continue
+        future.result()
+        if stop_on_error and any(r.status == "error" for r in group):
+            # Statements not yet started are skipped; running ones finish.
+            for pending in futures:
+                pending.cancel()
+
+
+def _run_statement(
+    session: Session,
+    result: StatementResult,
+    cluster_name: str,
+    user: WebUser | None,
+    consistency_level: int,
+) -> StatementResult:
+    if result.kind == "unsupported":
+        result.status = "error"
+        result.error = "USE is not supported in scripts; qualify table names with a keyspace"
+        return result
+
+    config = get_clusters_config()
+    statement = SimpleStatement(
+        result.statement,
+        consistency_level=consistency_level,
+        fetch_size=config.cqlsh.default_page_size,
+    )
+    started = perf_counter()
+    try:
+        if result.kind == "ddl":
+            rows = execute_cql(session, statement, cluster_name, user, timeout=config.timeouts.ddl)
+            result.schema_agreed = _wait_for_schema_agreement(session, rows)
+        else:
+            rows = execute_cql(session, statement, cluster_name, user)
+        if rows is not None and rows.column_names:
+            result.rows = [row._asdict() for row in rows.current_rows]
+        result.status = "ok"
+    except Exception as e:
+        result.status = "error"
+        result.error = str(e)
+    finally:
+        result.elapsed_ms = round((perf_counter() - started) * 1000, 3)
+    return result
+
+
+def _wait_for_schema_agreement(session: Session, rows: Any) -> bool:
+    """Block until all live nodes report the same schema version, or time out."""
+    if rows is not None and rows.response_future.is_schema_agreed:
+        return True
+    wait_time = get_clusters_config().cqlsh.schema_agreement_timeout
+    agreed = bool(session.cluster.control_connection.wait_for_schema_agreement(wait_time=wait_time))
+    if not agreed:
+        logger.warning(f"Schema agreement not reached within {wait_time}s")
+    return agreed
+
+
+def _statement_kind(cql: str) -> str:
+    first_word = cql.split(maxsplit=1)[0].upper() if cql.strip() else ""
+    if first_word in _UNSUPPORTED_KEYWORDS:
+        return "unsupported"
+    if first_word in _DDL_KEYWORDS:
+        return "ddl"
+    if first_word in _BARRIER_KEYWORDS:
+        return "barrier"
+    return "dml"
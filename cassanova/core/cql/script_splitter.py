@@ -0,0 +1,90 @@
+"""Split a CQL script into individual statements.
+
+Semicolons only end a statement outside string literals, quoted identifiers,
+``$$`` blocks and comments, and inside ``BEGIN BATCH ... APPLY BATCH`` only
+the one after ``APPLY BATCH`` does. Comments are dropped from the output.
+"""
+
+import re
+
+_BATCH_START = re.compile(r"^\s*BEGIN\b", re.IGNORECASE)
+_BATCH_END = re.compile(r"\bAPPLY\s+BATCH\s*$", re.IGNORECASE)
+
+
+def split_statements(script: str) -> list[str]:
+    statements: list[str] = []
+    text: list[str] = []
+    # The statement with literals blanked out, used to spot BEGIN/APPLY BATCH.
+    code: list[str] = []
+    i = 0
+    length = len(script)
+
+    while i < length:
+        char = script[i]
+        pair = script[i : i + 2]
+
+        if pair in ("--", "//"):
+            end = script.find("\n", i)
+            i = length if end == -1 else end
+            continue
+
+        if pair == "/*":
+            end = script.find("*/", i + 2)
+            if end == -1:
+                raise ValueError("Unterminated block comment")
+            text.append(" ")
+            code.append(" ")
+            i = end + 2
+            continue
+
+        if char in ("'", '"') or pair == "$$":
+            end = _literal_end(script, i)
+            text.append(script[i:end])
+            code.append(" ")
+            i = end
+            continue
+
+        if char == ";":
+            code_so_far = "".join(code)
+            if _BATCH_START.match(code_so_far) and not _BATCH_END.search(code_so_far):
+                text.append(char)
+                code.append(char)
+            else:
+                _append_statement(statements, text)
+                text, code = [], []
+            i += 1
+            continue
+
+        text.append(char)
+        code.append(char)
+        i += 1
+
+    _append_statement(statements, text)
+    return statements
+
+
+def _literal_end(script: str, start: int) -> int:
+    """Index just past the literal opening at ``start``."""
+    if script.startswith("$$", start):
+        end = script.find("$$", start + 2)
+        if end == -1:
+            raise ValueError("Unterminated $$ string")
+        return end + 2
+
+    quote = script[start]
+    i = start + 1
+    while i < len(script):
+        if script[i] == quote:
+            # A doubled quote is an escaped quote, not the end of the literal.
+            if script[i + 1 : i + 2] == quote:
+                i += 2
+                continue
+            return i + 1
+        i += 1
+    raise ValueError(f"Unterminated {quote} literal")
+
+
+def _append_statement(statements: list[str], text: list[str]) -> None:
+    statement = "".join(text).strip()
+    if statement:
+        statements.append(statement)
@@ -0,0 +1,32 @@
+from typing import Any
+
+from cassandra.cluster import ResultSet, Session
+from cassandra.query import SimpleStatement
+
+from cassanova.consts.execution_profiles import ExecutionProfiles
+from cassanova.core.scheduler import scheduled
+
+
+def idempotent_statement(query: str, **kwargs: Any) -> SimpleStatement:
+    """Build a read statement the driver may retry or speculatively execute.
+
+    The driver only applies speculative execution, and retries after request
+    errors, to statements marked idempotent; plain query strings never are.
+    """
+    return SimpleStatement(query, is_idempotent=True, **kwargs)
+
+
+def execute_metadata_query(
+    session: Session, query: str, parameters: list | tuple | None = None, **kwargs: Any
+) -> ResultSet:
+    """Run an idempotent system/schema read on the metadata execution profile.
+
+    The read takes a scheduler turn at the caller's default priority.
+    """
+    with scheduled(session):
+        return session.execute(
+            idempotent_statement(query),
+            parameters,
+            execution_profile=ExecutionProfiles.METADATA,
+            **kwargs,
+        )
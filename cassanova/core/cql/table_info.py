@@ -3,37 +3,46 @@ from typing import Any
 
 from cassandra import ConsistencyLevel
 from cassandra.cluster import Session
-from cassandra.query import SimpleStatement
 
+from cassanova.consts.execution_profiles import ExecutionProfiles
 from cassanova.core.cql.sanitize_input import sanitize_identifier
+from cassanova.core.cql.statements import idempotent_statement
 
 logger = getLogger(__name__)
 
 
 def show_table_schema_cql(
-    session: Session, keyspace: str, table: str, cl: ConsistencyLevel = ConsistencyLevel.QUORUM
+    session: Session, keyspace: str, table: str, cl: ConsistencyLevel | None = None
 ) -> list[dict[str, Any]]:
     keyspace = sanitize_identifier(keyspace)
     table = sanitize_identifier(table)
 
-    statement = SimpleStatement(
+    statement = idempotent_statement(
         "SELECT * FROM system_schema.columns WHERE keyspace_name = %s AND table_name = %s",
         consistency_level=cl,
     )
-    return [row._asdict() for row in session.execute(statement, [keyspace, table])]
+    return [
+        row._asdict()
+        for row in session.execute(
+            statement, [keyspace, table], execution_profile=ExecutionProfiles.METADATA
+        )
+    ]
 
 
 def show_table_description_cql(
-    session: Session, keyspace: str, table: str, cl: ConsistencyLevel = ConsistencyLevel.QUORUM
+    session: Session, keyspace: str, table: str, cl: ConsistencyLevel | None = None
 ) -> list[dict[str, Any]]:
     keyspace = sanitize_identifier(keyspace)
     table = sanitize_identifier(table)
 
     try:
-        statement = SimpleStatement(
+        statement = idempotent_statement(
             f'DESCRIBE TABLE "{keyspace}"."{table}";', consistency_level=cl, keyspace=keyspace
         )
-        result = [row._asdict() for row in session.execute(statement)]
+        result = [
+            row._asdict()
+            for row in session.execute(statement, execution_profile=ExecutionProfiles.METADATA)
+        ]
 
         if result:
             return result
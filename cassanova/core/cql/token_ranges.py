@@ -0,0 +1,93 @@
+"""Token ring arithmetic for scans that walk a table in token order.
+
+Only the hashing partitioners have an integer ring that can be split into
+even ranges; tables on an order-preserving partitioner cannot be paged or
+split by token here.
+"""
+
+from cassandra.cluster import Session
+from cassandra.metadata import TableMetadata
+from cassandra.pool import Host
+
+_RINGS = {
+    "org.apache.cassandra.dht.Murmur3Partitioner": (-(2**63), 2**63 - 1),
+    "org.apache.cassandra.dht.RandomPartitioner": (0, 2**127),
+}
+
+# A range of the ring, exclusive of its start and inclusive of its end; None
+# leaves that side open.
+TokenRange = tuple[int | None, int | None]
+
+
+def token_ring(partitioner: str | None) -> tuple[int, int]:
+    """The lowest and highest token of a partitioner's ring."""
+    ring = _RINGS.get(partitioner or "")
+    if ring is None:
+        raise ValueError(f"Token ranges are not supported for partitioner {partitioner}")
+    return ring
+
+
+def split_ring(partitioner: str | None, after: int | None, parts: int) -> list[TokenRange]:
+    """Split the ring after ``after`` (or all of it) into ``parts`` even ranges, in order."""
+    return split_range(partitioner, (after, None), parts)
+
+
+def split_range(partitioner: str | None, token_range: TokenRange, parts: int) -> list[TokenRange]:
+    """Split one range into ``parts`` even ranges, in order; open ends stay open."""
+    lowest, highest = token_ring(partitioner)
+    start, end = token_range
+    low = lowest if start is None else start
+    high = highest if end is None else end
+    width = (high - low) // max(parts, 1)
+    if width < 1:
+        return [token_range]
+
+    bounds = [low + width * i for i in range(1, parts)]
+    return list(zip([start, *bounds], [*bounds, end], strict=True))
+
+
+def replica_ranges(
+    session: Session, keyspace: str, parts: int
+) -> list[tuple[TokenRange, list[Host]]]:
+    """About ``parts`` ranges covering the ring, each owned by one set of replicas.
+
+    The ring is cut at every node token first, so no range spans two
+    vnodes, and each vnode is then split evenly. Without token metadata the
+    ring is split evenly and no replicas are known.
+    """
+    partitioner = session.cluster.metadata.partitioner
+    token_map = session.cluster.metadata.token_map
+    if not token_map or not token_map.ring:
+        return [(token_range, []) for token_range in split_ring(partitioner, None, parts)]
+
+    ring = sorted({token.value for token in token_map.ring})
+    vnodes = list(zip([None, *ring], [*ring, None], strict=True))
+    per_vnode = max(1, -(-parts // len(vnodes)))
+    ranges = []
+    for start, end in vnodes:
+        # The range past the last token wraps around to the first token's owners.
+        owner = token_map.token_class(ring[0] if end is None else end)
+        replicas = list(token_map.get_replicas(keyspace, owner))
+        ranges += [(part, replicas) for part in split_range(partitioner, (start, end), per_vnode)]
+    return ranges
+
+
+def token_function(table: TableMetadata) -> str:
+    """``token(...)`` over the table's partition key columns."""
+    columns = ", ".join(f'"{column.name}"' for column in table.partition_key)
+    return f"token({columns})"
+
+
+def token_conditions(table: TableMetadata, token_range: TokenRange) -> tuple[list[str], list[int]]:
+    """WHERE conditions restricting a read to one token range, and their values."""
+    token = token_function(table)
+    conditions: list[str] = []
+    values: list[int] = []
+    start, end = token_range
+    if start is not None:
+        conditions.append(f"{token} > ?")
+        values.append(start)
+    if end is not None:
+        conditions.append(f"{token} <= ?")
+        values.append(end)
+    return conditions, values
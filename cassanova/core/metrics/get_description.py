@@ -1,15 +1,18 @@
 from cassandra import ConsistencyLevel
-from cassandra.cluster import Cluster, Session, SimpleStatement
+from cassandra.cluster import Cluster, Session
 from packaging.version import parse as parse_version
 
+from cassanova.consts.execution_profiles import ExecutionProfiles
+from cassanova.core.cql.statements import idempotent_statement
+
 
 def get_cluster_description(
-    cluster_session: Session, cl: ConsistencyLevel = ConsistencyLevel.QUORUM
+    cluster_session: Session, cl: ConsistencyLevel | None = None
 ) -> dict[str, str]:
-    statement = SimpleStatement(query_string="DESCRIBE CLUSTER;", consistency_level=cl)
+    statement = idempotent_statement("DESCRIBE CLUSTER;", consistency_level=cl)
     return {
         key: value
-        for row in cluster_session.execute(statement)
+        for row in cluster_session.execute(statement, execution_profile=ExecutionProfiles.METADATA)
         for key, value in row._asdict().items()
     }
 
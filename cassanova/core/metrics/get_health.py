@@ -1,5 +1,7 @@
 from cassandra.cluster import Cluster, Session
 
+from cassanova.core.cql.statements import execute_metadata_query
+
 
 def get_cluster_health(cluster: Cluster, session: Session) -> dict[str, int | str]:
     """Derive node health from nodetool-equivalent gossip info via the driver.
@@ -23,9 +25,9 @@ def get_cluster_health(cluster: Cluster, session: Session) -> dict[str, int | st
     # host list fills that gap.
     peer_ids = set()
     try:
-        for row in session.execute("SELECT host_id FROM system.local"):
+        for row in execute_metadata_query(session, "SELECT host_id FROM system.local"):
             peer_ids.add(str(row.host_id))
-        for row in session.execute("SELECT host_id FROM system.peers_v2"):
+        for row in execute_metadata_query(session, "SELECT host_id FROM system.peers_v2"):
             peer_ids.add(str(row.host_id))
     except Exception:
         pass
@@ -44,7 +46,7 @@ def get_cluster_health(cluster: Cluster, session: Session) -> dict[str, int | st
     # — make sure it's counted as up even if the driver disagrees
     local_id = None
     try:
-        row = session.execute("SELECT host_id FROM system.local").one()
+        row = execute_metadata_query(session, "SELECT host_id FROM system.local").one()
         if row:
             local_id = str(row.host_id)
     except Exception:
@@ -1,5 +1,7 @@
 from cassandra.cluster import Session
 
+from cassanova.core.cql.statements import execute_metadata_query
+
 _technology_cache: dict[str, str] = {}
 
 
@@ -16,13 +18,13 @@ def detect_database_technology(session: Session) -> str:
 
 def _detect_technology(session: Session) -> str:
     try:
-        session.execute("SELECT * FROM system.scylla_local LIMIT 1")
+        execute_metadata_query(session, "SELECT * FROM system.scylla_local LIMIT 1")
         return "scylla"
     except Exception:
         pass
 
     try:
-        row = session.execute("SELECT dse_version FROM system.local").one()
+        row = execute_metadata_query(session, "SELECT dse_version FROM system.local").one()
         if row and getattr(row, "dse_version", None):
             return "dse"
     except Exception:
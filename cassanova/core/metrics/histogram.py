@@ -0,0 +1,83 @@
+"""Fixed-memory latency histogram with HDR-style log-linear buckets.
+
+Values are bucketed by their power of two and then split linearly into
+``_SUB_BUCKETS`` slots, so every recorded value is reported within about 6%
+of its true value regardless of magnitude, while a histogram is only a few
+hundred integers. Latencies are stored in microseconds.
+"""
+
+from threading import Lock
+from typing import Any
+
+_SUB_BUCKET_BITS = 4
+_SUB_BUCKETS = 1 << _SUB_BUCKET_BITS
+# Up to 2**37 µs (~38 hours); anything longer lands in the last bucket.
+_MAX_MAGNITUDE = 37
+_BUCKET_COUNT = (_MAX_MAGNITUDE - _SUB_BUCKET_BITS + 2) * _SUB_BUCKETS
+
+_REPORTED_PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+
+class LatencyHistogram:
+    def __init__(self) -> None:
+        self._counts = [0] * _BUCKET_COUNT
+        self.count = 0
+        self.total_us = 0
+        self.min_us: int | None = None
+        self.max_us = 0
+        self._lock = Lock()
+
+    def record(self, seconds: float) -> None:
+        value = max(0, int(seconds * 1_000_000))
+        with self._lock:
+            self._counts[_bucket_index(value)] += 1
+            self.count += 1
+            self.total_us += value
+            self.max_us = max(self.max_us, value)
+            self.min_us = value if self.min_us is None else min(self.min_us, value)
+
+    def percentile(self, percentile: float) -> float | None:
+        """Return the ``percentile`` latency in milliseconds."""
+        with self._lock:
+            if self.count == 0:
+                return None
+            rank = max(1, round(self.count * percentile / 100))
+            seen = 0
+            for index, bucket_count in enumerate(self._counts):
+                seen += bucket_count
+                if seen >= rank:
+                    if index == _BUCKET_COUNT - 1:
+                        return self.max_us / 1000
+                    return min(_bucket_upper_bound(index), self.max_us) / 1000
+        return self.max_us / 1000
+
+    def snapshot(self) -> dict[str, Any]:
+        result: dict[str, Any] = {
+            "count": self.count,
+            "min_ms": self.min_us / 1000 if self.min_us is not None else None,
+            "max_ms": self.max_us / 1000 if self.count else None,
+            "mean_ms": round(self.total_us / self.count / 1000, 3) if self.count else None,
+        }
+        for percentile in _REPORTED_PERCENTILES:
+            result[f"p{percentile:g}_ms"] = self.percentile(percentile)
+        return result
+
+
+def _bucket_index(value: int) -> int:
+    if value < _SUB_BUCKETS:
+        return value
+    magnitude = value.bit_length() - 1
+    if magnitude > _MAX_MAGNITUDE:
+        return _BUCKET_COUNT - 1
+    shift = magnitude - _SUB_BUCKET_BITS
+    sub_bucket = (value >> shift) - _SUB_BUCKETS
+    return (magnitude - _SUB_BUCKET_BITS + 1) * _SUB_BUCKETS + sub_bucket
+
+
+def _bucket_upper_bound(index: int) -> int:
+    if index < _SUB_BUCKETS:
+        return index
+    magnitude = index // _SUB_BUCKETS + _SUB_BUCKET_BITS - 1
+    sub_bucket = index % _SUB_BUCKETS
+    shift = magnitude - _SUB_BUCKET_BITS
+    return ((_SUB_BUCKETS + sub_bucket + 1) << shift) - 1
@@ -0,0 +1,88 @@
+"""Client-side request latency per execution profile.
+
+Latency is measured from request creation to the first page of the response,
+including any retries and speculative attempts. Requests that needed more than
+one host attempt are tracked separately so their p99 can be compared with
+requests answered by the first replica. The samples are recorded by the
+session's ``QueryStatsCollector``, which already times every request.
+"""
+
+from collections import deque
+from logging import getLogger
+from math import ceil
+from threading import Lock
+from typing import Any
+
+from cassandra.cluster import Session
+
+logger = getLogger(__name__)
+
+_WINDOW_SIZE = 2048
+
+
+class LatencyTracker:
+    def __init__(self, window_size: int = _WINDOW_SIZE) -> None:
+        self._window_size = window_size
+        self._samples: dict[str, deque[tuple[float, bool]]] = {}
+        self._lock = Lock()
+
+    def record(self, profile: str, seconds: float, multi_attempt: bool = False) -> None:
+        with self._lock:
+            samples = self._samples.get(profile)
+            if samples is None:
+                samples = self._samples[profile] = deque(maxlen=self._window_size)
+            samples.append((seconds, multi_attempt))
+
+    def sample_count(self, profile: str) -> int:
+        with self._lock:
+            return len(self._samples.get(profile, ()))
+
+    def percentile(
+        self, profile: str, percentile: float, multi_attempt: bool | None = None
+    ) -> float | None:
+        with self._lock:
+            samples = list(self._samples.get(profile, ()))
+        latencies = [s for s, multi in samples if multi_attempt is None or multi == multi_attempt]
+        return _percentile(latencies, percentile)
+
+    def summary(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            profiles = {name: list(samples) for name, samples in self._samples.items()}
+
+        result = {}
+        for name, samples in profiles.items():
+            all_latencies = [s for s, _ in samples]
+            first = [s for s, multi in samples if not multi]
+            multi = [s for s, multi in samples if multi]
+            result[name] = {
+                "count": len(samples),
+                "multi_attempt_count": len(multi),
+                "p50_ms": _to_ms(_percentile(all_latencies, 50)),
+                "p99_ms": _to_ms(_percentile(all_latencies, 99)),
+                "first_attempt_p99_ms": _to_ms(_percentile(first, 99)),
+                "multi_attempt_p99_ms": _to_ms(_percentile(multi, 99)),
+            }
+        return result
+
+
+def get_latency_metrics(session: Session, tracker: LatencyTracker) -> dict[str, Any]:
+    profiles = session.cluster.profile_manager.profiles
+    summary = tracker.summary()
+    for name, profile in profiles.items():
+        policy = profile.speculative_execution_policy
+        delay = policy.current_delay() if hasattr(policy, "current_delay") else None
+        profile_name = getattr(policy, "profile", str(name))
+        summary.setdefault(profile_name, {"count": 0})["speculative_delay_ms"] = _to_ms(delay)
+    return summary
+
+
+def _percentile(latencies: list[float], percentile: float) -> float | None:
+    if not latencies:
+        return None
+    ordered = sorted(latencies)
+    index = max(0, ceil(len(ordered) * percentile / 100) - 1)
+    return ordered[index]
+
+
+def _to_ms(seconds: float | None) -> float | None:
+    return round(seconds * 1000, 3) if seconds is not None else None
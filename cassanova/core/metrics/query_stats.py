@@ -0,0 +1,233 @@
+"""Per-statement latency histograms and the slow-query log.
+
+A request-init listener times every statement the session sends, whether it
+comes from a data route, the CQL shell or an internal system query. The
+time to the first page goes into a histogram keyed by the statement's
+normalized shape (literals replaced by ``?``). Rows and pages are counted
+until the last page arrives, or until the result is dropped if the caller
+stops paging early. Statements whose first page is slower than the configured
+threshold are then written to the slow-query log.
+
+The same listener records the first-page latency of statements planned by an
+execution profile into the cluster's ``LatencyTracker``, so the session only
+times each request once. With query metrics disabled, only that is kept.
+"""
+
+import json
+import logging
+import re
+import weakref
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from threading import Lock
+from time import monotonic
+from typing import Any
+
+from cassandra.cluster import ResponseFuture, Session
+from cassandra.query import BatchStatement
+
+from cassanova.config.query_metrics_config import QueryMetricsConfig
+from cassanova.core.metrics.histogram import LatencyHistogram
+from cassanova.core.metrics.latency import LatencyTracker
+from cassanova.core.query_registry import current_query
+from cassanova.core.speculative_execution import planned_profile
+
+logger = logging.getLogger(__name__)
+_slow_query_logger = logging.getLogger("cassanova.slow_query")
+
+_OVERFLOW_SHAPE = "<other>"
+_MAX_SHAPE_LENGTH = 1000
+
+_LITERAL = re.compile(
+    r"""
+    (?P<identifier>"(?:[^"]|"")*")
+    | '(?:[^']|'')*'
+    | \$\$.*?\$\$
+    | \b0x[0-9a-f]+\b
+    | \b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b
+    | (?<![\w.])-?\d+(?:\.\d+)?(?:e[+-]?\d+)?\b
+    """,
+    re.IGNORECASE | re.VERBOSE | re.DOTALL,
+)
+_IN_LIST = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_query(query: str) -> str:
+    """Reduce a statement to its shape by replacing literal values with ``?``."""
+    shape = _LITERAL.sub(lambda m: m.group("identifier") or "?", query)
+    shape = _IN_LIST.sub("IN (?)", shape)
+    shape = _WHITESPACE.sub(" ", shape).strip().rstrip(";").strip()
+    return shape[:_MAX_SHAPE_LENGTH]
+
+
+@dataclass
+class _ShapeStats:
+    histogram: LatencyHistogram = field(default_factory=LatencyHistogram)
+    errors: int = 0
+    slow: int = 0
+    rows: int = 0
+
+
+@dataclass
+class _StatementTiming:
+    shape: str
+    started: float
+    user: str | None
+    profile: str | None = None
+    multi_attempt: bool = False
+    pages: int = 0
+    rows: int = 0
+    first_page: float | None = None
+    last_page: float | None = None
+    coordinator: str | None = None
+    error: str | None = None
+    finished: bool = False
+
+
+class QueryStatsCollector:
+    def __init__(
+        self,
+        cluster_name: str,
+        config: QueryMetricsConfig,
+        latency_tracker: LatencyTracker | None = None,
+    ) -> None:
+        self.cluster_name = cluster_name
+        self._config = config
+        self._latency_tracker = latency_tracker
+        self._shapes: dict[str, _ShapeStats] = {}
+        self._slow_queries: deque[dict[str, Any]] = deque(maxlen=config.slow_query_buffer_size)
+        self._lock = Lock()
+
+    def install(self, session: Session) -> None:
+        session.add_request_init_listener(self._on_request)
+
+    def shapes(self, limit: int | None = None, sort_by: str = "count") -> list[dict[str, Any]]:
+        with self._lock:
+            items = list(self._shapes.items())
+        result: list[dict[str, Any]] = [
+            {"shape": shape, "errors": s.errors, "slow": s.slow, "rows": s.rows}
+            | s.histogram.snapshot()
+            for shape, s in items
+        ]
+        # Latencies are None for shapes with no completed request.
+        result.sort(key=lambda r: float(r.get(sort_by) or 0), reverse=True)
+        return result[:limit] if limit else result
+
+    def slow_queries(self, limit: int | None = None) -> list[dict[str, Any]]:
+        with self._lock:
+            entries = list(reversed(self._slow_queries))
+        return entries[:limit] if limit else entries
+
+    def reset(self) -> None:
+        with self._lock:
+            self._shapes.clear()
+            self._slow_queries.clear()
+
+    def _on_request(self, future: ResponseFuture) -> None:
+        tracked = current_query()
+        timing = _StatementTiming(
+            shape=normalize_query(_statement_text(future.query)) if self._config.enabled else "",
+            started=monotonic(),
+            user=tracked.username if tracked else None,
+            profile=planned_profile(future.query),
+        )
+        # Callbacks must not hold the future itself, or the finalizer that
+        # reports abandoned paged reads would wait for the cycle collector.
+        future_ref = weakref.ref(future)
+
+        def _on_page(rows: Any) -> None:
+            now = monotonic()
+            if timing.first_page is None:
+                timing.first_page = now - timing.started
+                response_future = future_ref()
+                host = response_future.coordinator_host if response_future else None
+                timing.coordinator = str(host) if host else None
+                timing.multi_attempt = bool(
+                    response_future and len(response_future.attempted_hosts) > 1
+                )
+            timing.pages += 1
+            timing.rows += len(rows) if isinstance(rows, list) else 0
+            timing.last_page = now
+
+            response_future = future_ref()
+            if response_future is None or not response_future.has_more_pages:
+                self._finish(timing)
+
+        def _on_error(exc: BaseException) -> None:
+            timing.error = str(exc)
+            timing.last_page = monotonic()
+            self._finish(timing)
+
+        future.add_callbacks(_on_page, _on_error)
+        weakref.finalize(future, self._finish, timing)
+
+    def _finish(self, timing: _StatementTiming) -> None:
+        with self._lock:
+            if timing.finished:
+                return
+            timing.finished = True
+            if (
+                self._latency_tracker is not None
+                and timing.profile is not None
+                and timing.first_page is not None
+            ):
+                self._latency_tracker.record(
+                    timing.profile, timing.first_page, timing.multi_attempt
+                )
+            if not self._config.enabled:
+                return
+            stats = self._shape_stats(timing.shape)
+
+            if timing.error is not None:
+                stats.errors += 1
+            elif timing.first_page is not None:
+                stats.histogram.record(timing.first_page)
+                stats.rows += timing.rows
+
+            latency = timing.first_page
+            if latency is None and timing.last_page is not None:
+                latency = timing.last_page - timing.started
+            if latency is None or latency * 1000 < self._config.slow_query_threshold_ms:
+                return
+            stats.slow += 1
+            entry = self._slow_entry(timing, latency)
+            self._slow_queries.append(entry)
+
+        _slow_query_logger.info(json.dumps(entry))
+
+    def _shape_stats(self, shape: str) -> _ShapeStats:
+        stats = self._shapes.get(shape)
+        if stats is None:
+            if len(self._shapes) >= self._config.max_shapes_per_cluster:
+                shape = _OVERFLOW_SHAPE
+                stats = self._shapes.get(shape)
+            if stats is None:
+                stats = self._shapes[shape] = _ShapeStats()
+        return stats
+
+    def _slow_entry(self, timing: _StatementTiming, latency: float) -> dict[str, Any]:
+        total = (timing.last_page or timing.started) - timing.started
+        return {
+            "timestamp": datetime.now(UTC).isoformat(),
+            "cluster": self.cluster_name,
+            "user": timing.user,
+            "query": timing.shape,
+            "latency_ms": round(latency * 1000, 3),
+            "total_ms": round(total * 1000, 3),
+            "rows": timing.rows,
+            "pages": timing.pages,
+            "coordinator": timing.coordinator,
+            "error": timing.error,
+        }
+
+
+def _statement_text(statement: Any) -> str:
+    if isinstance(statement, BatchStatement):
+        return "<BatchStatement>"
+    prepared = getattr(statement, "prepared_statement", None)
+    if prepared is not None:
+        return str(prepared.query_string)
+    query_string = getattr(statement, "query_string", None)
+    return str(query_string if query_string is not None else statement)
@@ -0,0 +1,54 @@
+"""Per-node views of the ``system_views`` virtual tables.
+
+Virtual tables such as ``settings`` or ``thread_pools`` only describe the
+node serving the read. A view reads one of them from every node and merges
+the rows with a ``node`` column. Settings are also compared across nodes, so
+a node configured differently from the rest stands out.
+"""
+
+from typing import Any
+
+from cassandra.cluster import Session
+
+from cassanova.consts.node_views import NodeViews
+from cassanova.core.cql.node_queries import NodeTable, node_query_cache
+from cassanova.exceptions.system_views_unavailable import SystemViewsUnavailableException
+
+_MISSING_KEYSPACE = "Keyspace system_views does not exist"
+
+
+def node_view(session: Session, cluster_name: str, view: str, refresh: bool = False) -> NodeTable:
+    """The rows of ``system_views.<view>`` on every node.
+
+    Nodes that failed are listed in the table's errors; only a cluster where
+    no node has the ``system_views`` keyspace is an error.
+    """
+    if view not in NodeViews.ALL:
+        raise ValueError(f"Unknown node view '{view}'")
+
+    table = node_query_cache.get(
+        session, cluster_name, f"SELECT * FROM system_views.{view}", refresh=refresh
+    )
+    errors = list(table.errors.values())
+    if not table.rows and errors and all(_MISSING_KEYSPACE in error for error in errors):
+        raise SystemViewsUnavailableException(errors[0])
+    return table
+
+
+def settings_drift(table: NodeTable) -> dict[str, dict[str, Any]]:
+    """Settings whose value is not the same on every node, with each node's value.
+
+    A setting that a node does not report at all, as happens across versions
+    during an upgrade, is ``None`` for that node.
+    """
+    nodes = table.nodes
+    values: dict[str, dict[str, Any]] = {}
+    for row in table.rows:
+        values.setdefault(row["name"], {})[row["node"]] = row["value"]
+
+    drift = {}
+    for name in sorted(values):
+        by_node = {node: values[name].get(node) for node in nodes}
+        if len(set(by_node.values())) > 1:
+            drift[name] = by_node
+    return drift
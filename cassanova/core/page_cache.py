@@ -0,0 +1,191 @@
+"""Server-side page cursors for browsing table data.
+
+Cassandra only pages forward, from an opaque paging state. A cursor records
+the paging state of every page read for one user's query, so a previous
+page or a page already passed is fetched directly, and a page further on is
+reached by paging forward from the last known state. Recently read pages
+are also kept whole, and the page after the one just served is prefetched
+in the background, at background priority, so that "next" usually needs
+no round trip.
+
+A cursor is bound to the cluster, user, statement, bound values, page size
+and cell size cap it was created for; a request that does not match gets a
+new cursor.
+"""
+
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from logging import getLogger
+from threading import Lock
+from time import monotonic
+from typing import Any
+from uuid import uuid4
+
+from cassanova.config.cassanova_config import get_clusters_config
+from cassanova.consts.workloads import Priorities
+
+logger = getLogger(__name__)
+
+Rows = list[dict[str, Any]]
+# Reads one page from a paging state at the given priority, returning its rows
+# and the paging state of the following page (None after the last page).
+PageFetcher = Callable[[bytes | None, str], tuple[Rows, bytes | None]]
+CursorKey = tuple[str, str, str, str, str, str, int, int | None]
+
+
+@dataclass
+class Page:
+    number: int
+    rows: Rows
+    has_more: bool
+    next_paging_state: bytes | None = None
+
+
+class PageCursor:
+    def __init__(self, cursor_id: str, key: CursorKey) -> None:
+        self.id = cursor_id
+        self.key = key
+        self.touched = monotonic()
+        # _states[i] is the paging state that page i is read from.
+        self._states: list[bytes | None] = [None]
+        self._last_page: int | None = None
+        self._rows: OrderedDict[int, Rows] = OrderedDict()
+        self._lock = Lock()
+
+    def read(self, number: int, fetch: PageFetcher, cached_pages: int) -> Page:
+        """Page ``number``, paging forward from the nearest known state if needed.
+
+        The cursor stays locked until the page is read, so a jump far past the
+        last known page holds back other reads and the prefetch of the same
+        cursor for one fetch per page skipped. Only the user who owns the
+        cursor waits, and each fetch goes through admission as usual.
+        """
+        with self._lock:
+            if self._last_page is not None and number > self._last_page:
+                return Page(number, [], False)
+
+            rows = self._rows.get(number)
+            if rows is not None:
+                self._rows.move_to_end(number)
+                return self._page(number, rows)
+
+            page = min(number, len(self._states) - 1)
+            while True:
+                rows = self._load(page, fetch, Priorities.INTERACTIVE, cached_pages)
+                if page == number or page == self._last_page:
+                    break
+                page += 1
+            if page != number:
+                return Page(number, [], False)
+            return self._page(number, rows)
+
+    def prefetch(self, number: int, fetch: PageFetcher, cached_pages: int) -> None:
+        with self._lock:
+            if number in self._rows or number >= len(self._states):
+                return
+            if self._last_page is not None and number > self._last_page:
+                return
+            self._load(number, fetch, Priorities.BACKGROUND, cached_pages)
+
+    def _load(self, number: int, fetch: PageFetcher, priority: str, cached_pages: int) -> Rows:
+        rows, next_state = fetch(self._states[number], priority)
+        if next_state is None:
+            self._last_page = number
+        elif number + 1 == len(self._states):
+            self._states.append(next_state)
+
+        if cached_pages > 0:
+            self._rows[number] = rows
+            self._rows.move_to_end(number)
+            while len(self._rows) > cached_pages:
+                self._rows.popitem(last=False)
+        return rows
+
+    def _page(self, number: int, rows: Rows) -> Page:
+        has_more = self._last_page is None or number < self._last_page
+        next_state = self._states[number + 1] if number + 1 < len(self._states) else None
+        return Page(number, rows, has_more, next_state)
+
+
+class PageCache:
+    def __init__(self) -> None:
+        self._cursors: OrderedDict[str, PageCursor] = OrderedDict()
+        self._lock = Lock()
+        self._pool: ThreadPoolExecutor | None = None
+
+    def cursor(self, cursor_id: str | None, key: CursorKey) -> PageCursor:
+        """The cursor ``cursor_id`` if it was created for ``key``, else a new one."""
+        config = get_clusters_config().page_cache
+        now = monotonic()
+        with self._lock:
+            for stale_id in [
+                i for i, c in self._cursors.items() if now - c.touched >= config.ttl_seconds
+            ]:
+                del self._cursors[stale_id]
+
+            cursor = self._cursors.get(cursor_id) if cursor_id else None
+            if cursor is None or cursor.key != key:
+                cursor = PageCursor(uuid4().hex, key)
+                self._cursors[cursor.id] = cursor
+                while len(self._cursors) > config.max_cursors:
+                    self._cursors.popitem(last=False)
+            self._cursors.move_to_end(cursor.id)
+            cursor.touched = now
+        return cursor
+
+    def read(self, cursor: PageCursor, number: int, fetch: PageFetcher) -> Page:
+        config = get_clusters_config().page_cache
+        cached_pages = config.max_cached_pages if config.cache_rows else 0
+        page = cursor.read(number, fetch, cached_pages)
+        if config.prefetch and config.cache_rows and page.has_more:
+            self._prefetch(cursor, number + 1, fetch, cached_pages)
+        return page
+
+    def invalidate(
+        self, cluster_name: str, keyspace: str | None = None, table: str | None = None
+    ) -> None:
+        """Drop the cursors of a cluster, or of one of its keyspaces or tables."""
+        with self._lock:
+            for cursor_id in [
+                i
+                for i, c in self._cursors.items()
+                if c.key[0] == cluster_name
+                and keyspace in (None, c.key[2])
+                and table in (None, c.key[3])
+            ]:
+                del self._cursors[cursor_id]
+
+    def _prefetch(
+        self, cursor: PageCursor, number: int, fetch: PageFetcher, cached_pages: int
+    ) -> None:
+        with self._lock:
+            if self._pool is None:
+                workers = get_clusters_config().page_cache.prefetch_workers
+                self._pool = ThreadPoolExecutor(workers, thread_name_prefix="page-prefetch")
+            pool = self._pool
+        pool.submit(_prefetch, cursor, number, fetch, cached_pages)
+
+
+def _prefetch(cursor: PageCursor, number: int, fetch: PageFetcher, cached_pages: int) -> None:
+    try:
+        cursor.prefetch(number, fetch, cached_pages)
+    except Exception as e:
+        logger.debug(f"Prefetch of page {number} for cursor {cursor.id} failed: {e}")
+
+
+page_cache = PageCache()
+
+
+def cursor_key(
+    cluster_name: str,
+    username: str,
+    keyspace: str,
+    table: str,
+    query: str,
+    values: list[Any],
+    page_size: int,
+    max_cell_bytes: int | None = None,
+) -> CursorKey:
+    return (cluster_name, username, keyspace, table, query, repr(values), page_size, max_cell_bytes)
@@ -0,0 +1,228 @@
+"""Registry of in-flight user queries, used to list and cancel them.
+
+Every user-initiated query is registered for as long as it runs, together
+with the driver ``ResponseFuture`` that carries it. The future is captured
+through a request-init listener while the entry is bound to the executing
+thread, so call sites keep using ``session.execute``.
+
+Cancelling fails the entry's pending futures with ``QueryCancelled``, which
+wakes the waiting request immediately, and makes paged readers stop before
+fetching their next page. Cassandra has no way to abort a read on the
+replicas, so the page already requested still completes server-side.
+
+The driver's ``execute_concurrent`` sends most of its requests from its own
+callback threads, where no entry is bound, so batches of statements go
+through ``execute_concurrent_tracked`` instead.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from logging import getLogger
+from threading import BoundedSemaphore, Lock
+from time import monotonic
+from typing import Any
+from uuid import uuid4
+
+from cassandra.cluster import ResponseFuture, Session
+
+from cassanova.api.dependencies.auth import check_permission
+from cassanova.exceptions.cql_exceptions import QueryCancelled
+from cassanova.models.auth_models import WebUser
+
+logger = getLogger(__name__)
+
+_MAX_QUERY_LENGTH = 2000
+
+_current_query: ContextVar["InFlightQuery | None"] = ContextVar(
+    "cassanova_current_query", default=None
+)
+
+
+@dataclass
+class InFlightQuery:
+    cluster_name: str
+    username: str
+    query: str
+    query_id: str = field(default_factory=lambda: uuid4().hex)
+    started_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    rows_fetched: int = 0
+    cancelled: bool = False
+    futures: list[ResponseFuture] = field(default_factory=list, repr=False)
+    _started: float = field(default_factory=monotonic, repr=False)
+    _lock: Lock = field(default_factory=Lock, repr=False)
+
+    @contextmanager
+    def bound(self) -> Iterator["InFlightQuery"]:
+        """Attach requests sent by this thread inside the block to this entry."""
+        token = _current_query.set(self)
+        try:
+            yield self
+        finally:
+            _current_query.reset(token)
+
+    def attach(self, future: ResponseFuture) -> None:
+        with self._lock:
+            self.futures.append(future)
+            cancelled = self.cancelled
+        if cancelled:
+            _fail_future(future, self.query_id)
+
+    def add_rows(self, count: int) -> None:
+        self.rows_fetched += count
+
+    def check_cancelled(self) -> None:
+        if self.cancelled:
+            raise QueryCancelled(self.query_id)
+
+    def cancel(self) -> None:
+        with self._lock:
+            self.cancelled = True
+            futures = list(self.futures)
+        for future in futures:
+            _fail_future(future, self.query_id)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "query_id": self.query_id,
+            "cluster": self.cluster_name,
+            "user": self.username,
+            "query": self.query,
+            "started_at": self.started_at.isoformat(),
+            "elapsed_ms": round((monotonic() - self._started) * 1000, 1),
+            "rows_fetched": self.rows_fetched,
+            "cancelled": self.cancelled,
+        }
+
+
+class QueryRegistry:
+    def __init__(self) -> None:
+        self._queries: dict[str, InFlightQuery] = {}
+        self._lock = Lock()
+
+    def install(self, session: Session) -> None:
+        session.add_request_init_listener(_on_request)
+
+    @contextmanager
+    def track(self, cluster_name: str, user: WebUser | None, query: str) -> Iterator[InFlightQuery]:
+        entry = InFlightQuery(
+            cluster_name=cluster_name,
+            username=user.username if user else "anonymous",
+            query=query[:_MAX_QUERY_LENGTH],
+        )
+        with self._lock:
+            self._queries[entry.query_id] = entry
+        try:
+            yield entry
+        finally:
+            with self._lock:
+                self._queries.pop(entry.query_id, None)
+
+    def list_queries(
+        self, user: WebUser | None, cluster_name: str | None = None, only_own: bool = False
+    ) -> list[dict[str, Any]]:
+        """Queries visible to ``user``: all of them for admins, else their own."""
+        with self._lock:
+            entries = list(self._queries.values())
+        return [
+            entry.to_dict()
+            for entry in sorted(entries, key=lambda e: e.started_at)
+            if (cluster_name is None or entry.cluster_name == cluster_name)
+            and (_is_owner(user, entry) if only_own else _can_manage(user, entry))
+        ]
+
+    def cancel(
+        self, query_id: str, user: WebUser | None, cluster_name: str | None = None
+    ) -> InFlightQuery | None:
+        """Cancel a query, returning ``None`` if it is unknown or not the user's."""
+        with self._lock:
+            entry = self._queries.get(query_id)
+        if entry is None or not _can_manage(user, entry):
+            return None
+        if cluster_name is not None and entry.cluster_name != cluster_name:
+            return None
+
+        logger.info(
+            f"Cancelling query {query_id} on '{entry.cluster_name}' started by '{entry.username}'"
+        )
+        entry.cancel()
+        return entry
+
+
+def execute_concurrent_tracked(
+    session: Session,
+    statements: list[Any],
+    tracked: InFlightQuery,
+    concurrency: int,
+    raise_on_first_error: bool = True,
+    **execute_kwargs: Any,
+) -> list[tuple[bool, Any]]:
+    """Run ``statements`` with at most ``concurrency`` in flight, like the driver's helper.
+
+    Every request is sent from the calling thread while ``tracked`` is bound,
+    so a cancel fails all of them. Statements not sent yet when the query is
+    cancelled are skipped and fail with ``QueryCancelled``.
+    """
+    window = BoundedSemaphore(max(1, concurrency))
+    futures: list[ResponseFuture] = []
+    with tracked.bound():
+        for statement in statements:
+            window.acquire()
+            if tracked.cancelled:
+                break
+            future = session.execute_async(statement, **execute_kwargs)
+            # A cancel fails futures that may have completed already; free each slot once.
+            freed = Lock()
+
+            def _free(_result: Any, freed: Lock = freed) -> None:
+                if freed.acquire(blocking=False):
+                    window.release()
+
+            future.add_callbacks(_free, _free)
+            futures.append(future)
+
+    outcomes: list[tuple[bool, Any]] = []
+    for future in futures:
+        try:
+            outcomes.append((True, future.result()))
+        except Exception as e:
+            if raise_on_first_error:
+                raise
+            outcomes.append((False, e))
+    if len(futures) < len(statements):
+        if raise_on_first_error:
+            raise QueryCancelled(tracked.query_id)
+        skipped = len(statements) - len(futures)
+        outcomes.extend((False, QueryCancelled(tracked.query_id)) for _ in range(skipped))
+    return outcomes
+
+
+def current_query() -> InFlightQuery | None:
+    """The registered query bound to the calling thread, if any."""
+    return _current_query.get()
+
+
+def _can_manage(user: WebUser | None, entry: InFlightQuery) -> bool:
+    return check_permission(user, "cluster:admin") or _is_owner(user, entry)
+
+
+def _is_owner(user: WebUser | None, entry: InFlightQuery) -> bool:
+    return user is not None and user.username == entry.username
+
+
+def _on_request(future: ResponseFuture) -> None:
+    entry = _current_query.get()
+    if entry is not None:
+        entry.attach(future)
+
+
+def _fail_future(future: ResponseFuture, query_id: str) -> None:
+    try:
+        future._set_final_exception(QueryCancelled(query_id))
+    except Exception as e:
+        logger.warning(f"Could not cancel request for query {query_id}: {e}")
+
+
+query_registry = QueryRegistry()
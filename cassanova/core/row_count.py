@@ -0,0 +1,123 @@
+"""Exact row counts of large tables, counted range by range on replicas.
+
+A single ``SELECT COUNT(*)`` makes one coordinator scan the whole table and
+times out on any table of real size. A count job instead cuts the ring at
+every node token, splits each vnode further, and sends each range's count
+straight to one of the replicas owning it, ``scan_jobs.parallelism`` ranges
+at a time. A range that fails is split in two and each half retried on a
+replica picked again, up to ``scan_jobs.count_retries`` times, so a range
+that timed out gets smaller work on its next attempt.
+
+The running total is published on the job as ranges finish. An estimate
+from ``system.size_estimates`` is available immediately, before any range
+has been counted.
+"""
+
+from logging import getLogger
+from random import choice
+from threading import Lock
+from typing import Any
+
+from cassandra.cluster import Session
+from cassandra.metadata import TableMetadata
+from cassandra.pool import Host
+
+from cassanova.config.cassanova_config import get_clusters_config
+from cassanova.consts.execution_profiles import ExecutionProfiles
+from cassanova.consts.workloads import Priorities
+from cassanova.core.cql.prepared_statements import bind_statement
+from cassanova.core.cql.token_ranges import (
+    TokenRange,
+    replica_ranges,
+    split_range,
+    token_conditions,
+)
+from cassanova.core.query_registry import query_registry
+from cassanova.core.scan_jobs import ScanJob, run_ranges
+from cassanova.core.scheduler import scheduled
+from cassanova.core.size_estimates import size_estimate_cache
+from cassanova.exceptions.cql_exceptions import QueryCancelled
+from cassanova.models.auth_models import WebUser
+
+logger = getLogger(__name__)
+
+
+def count_statement(
+    keyspace: str, table: TableMetadata, token_range: TokenRange
+) -> tuple[str, list[int]]:
+    """A preparable COUNT of the rows in one token range."""
+    conditions, values = token_conditions(table, token_range)
+    query = f'SELECT COUNT(*) FROM "{keyspace}"."{table.name}"'
+    if conditions:
+        query += f" WHERE {' AND '.join(conditions)}"
+    return query, values
+
+
+def estimate_rows(
+    session: Session, cluster_name: str, keyspace: str, table: TableMetadata
+) -> dict[str, Any] | None:
+    """Size estimates of a table; rows are only known for tables without clustering columns."""
+    estimate = size_estimate_cache.get(session, cluster_name, keyspace, table.name)
+    if estimate is None:
+        return None
+    return {
+        "partitions": estimate.partitions,
+        "rows": estimate.partitions if not table.clustering_key else None,
+        "bytes": estimate.total_bytes,
+    }
+
+
+def count_rows(
+    session: Session,
+    job: ScanJob,
+    user: WebUser | None,
+    table: TableMetadata,
+    estimate: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    config = get_clusters_config().scan_jobs
+    partitioner = session.cluster.metadata.partitioner
+    ranges = replica_ranges(session, job.keyspace, config.token_ranges)
+    job.ranges_total = len(ranges)
+
+    lock = Lock()
+    totals = {"count": 0, "retries": 0}
+
+    def _publish() -> dict[str, Any]:
+        return {"count": totals["count"], "retries": totals["retries"], "estimate": estimate}
+
+    def _count(token_range: TokenRange, replicas: list[Host], attempt: int = 0) -> None:
+        job.check_cancelled()
+        query, values = count_statement(job.keyspace, table, token_range)
+        statement = bind_statement(session, query, values)
+        up = [host for host in replicas if host.is_up]
+        try:
+            with (
+                query_registry.track(job.cluster_name, user, query) as tracked,
+                scheduled(session, user, Priorities.BACKGROUND),
+                tracked.bound(),
+            ):
+                count = session.execute(
+                    statement,
+                    execution_profile=ExecutionProfiles.BULK,
+                    host=choice(up) if up else None,
+                ).one()[0]
+        except QueryCancelled:
+            raise
+        except Exception as e:
+            if attempt >= config.count_retries:
+                raise
+            logger.info(f"Retrying count of {token_range} in {job.keyspace}.{table.name}: {e}")
+            with lock:
+                totals["retries"] += 1
+            for half in split_range(partitioner, token_range, 2):
+                _count(half, replicas, attempt + 1)
+            return
+
+        job.add_rows(count)
+        with lock:
+            totals["count"] += count
+            job.result = _publish()
+
+    job.result = _publish()
+    run_ranges(job, ranges, lambda item: _count(*item))
+    return _publish()
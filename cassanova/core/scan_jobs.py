@@ -0,0 +1,272 @@
+"""Background jobs that read a whole table, split into token ranges.
+
+A job runs on a small pool of job threads, holding one ``exports``
+admission slot for its whole run. It splits the token ring into
+``scan_jobs.token_ranges`` ranges and reads ``scan_jobs.parallelism`` of them
+at a time, each page on its own background scheduler turn, so a full-table
+scan yields to interactive requests between pages. Progress is counted in
+ranges and rows and can be polled while the job runs. Cancelling a job stops
+every range before its next page.
+"""
+
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from logging import getLogger
+from threading import Lock
+from time import monotonic
+from typing import Any, TypeVar
+from uuid import uuid4
+
+from cassandra.cluster import Session
+from cassandra.metadata import TableMetadata
+
+from cassanova.api.dependencies.auth import check_permission
+from cassanova.config.cassanova_config import get_clusters_config
+from cassanova.consts.execution_profiles import ExecutionProfiles
+from cassanova.consts.scan_jobs import ScanJobStatuses
+from cassanova.consts.workloads import Priorities, Workloads
+from cassanova.core.admission import admission_controller
+from cassanova.core.cql.prepared_statements import bind_statement
+from cassanova.core.cql.token_ranges import TokenRange, split_ring, token_conditions
+from cassanova.core.query_registry import query_registry
+from cassanova.core.scheduler import scheduled
+from cassanova.exceptions.cql_exceptions import QueryCancelled
+from cassanova.models.auth_models import WebUser
+
+logger = getLogger(__name__)
+
+_T = TypeVar("_T")
+
+# Reads every page of one token range; runs on a scan worker thread.
+RangeConsumer = Callable[[Iterator[list[Any]]], None]
+ScanWork = Callable[["ScanJob"], dict[str, Any] | None]
+
+
+@dataclass
+class ScanJob:
+    cluster_name: str
+    username: str
+    kind: str
+    keyspace: str
+    table: str
+    parameters: dict[str, Any] = field(default_factory=dict)
+    job_id: str = field(default_factory=lambda: uuid4().hex)
+    status: str = ScanJobStatuses.QUEUED
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    ranges_total: int = 0
+    ranges_done: int = 0
+    rows_scanned: int = 0
+    # Updated as ranges finish, so a running job reports a partial result.
+    result: dict[str, Any] | None = None
+    error: str | None = None
+    cancelled: bool = False
+    _started: float | None = field(default=None, repr=False)
+    _finished: float | None = field(default=None, repr=False)
+    _lock: Lock = field(default_factory=Lock, repr=False)
+
+    def add_rows(self, count: int) -> None:
+        with self._lock:
+            self.rows_scanned += count
+
+    def finish_range(self) -> None:
+        with self._lock:
+            self.ranges_done += 1
+
+    def check_cancelled(self) -> None:
+        if self.cancelled:
+            raise QueryCancelled(self.job_id)
+
+    def to_dict(self) -> dict[str, Any]:
+        elapsed = None
+        if self._started is not None:
+            elapsed = round(((self._finished or monotonic()) - self._started) * 1000, 1)
+        progress = self.ranges_done / self.ranges_total if self.ranges_total else 0.0
+        return {
+            "job_id": self.job_id,
+            "kind": self.kind,
+            "cluster": self.cluster_name,
+            "keyspace": self.keyspace,
+            "table": self.table,
+            "user": self.username,
+            "parameters": self.parameters,
+            "status": self.status,
+            "created_at": self.created_at.isoformat(),
+            "elapsed_ms": elapsed,
+            "ranges_total": self.ranges_total,
+            "ranges_done": self.ranges_done,
+            "rows_scanned": self.rows_scanned,
+            "progress": round(progress, 4),
+            "result": self.result,
+            "error": self.error,
+        }
+
+
+class ScanJobRegistry:
+    def __init__(self) -> None:
+        self._jobs: OrderedDict[str, ScanJob] = OrderedDict()
+        self._lock = Lock()
+        self._pool: ThreadPoolExecutor | None = None
+
+    def submit(self, job: ScanJob, user: WebUser | None, work: ScanWork) -> ScanJob:
+        with self._lock:
+            if self._pool is None:
+                workers = get_clusters_config().scan_jobs.max_running_jobs
+                self._pool = ThreadPoolExecutor(workers, thread_name_prefix="scan-job")
+            self._jobs[job.job_id] = job
+            pool = self._pool
+        pool.submit(self._run, job, user, work)
+        return job
+
+    def get(
+        self, job_id: str, user: WebUser | None, cluster_name: str | None = None
+    ) -> ScanJob | None:
+        """A job visible to ``user``, or ``None`` if it is unknown or someone else's."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None or not _can_manage(user, job):
+            return None
+        if cluster_name is not None and job.cluster_name != cluster_name:
+            return None
+        return job
+
+    def list_jobs(
+        self, user: WebUser | None, cluster_name: str | None = None
+    ) -> list[dict[str, Any]]:
+        """Jobs visible to ``user``, without their results."""
+        with self._lock:
+            jobs = list(self._jobs.values())
+        return [
+            job.to_dict() | {"result": None}
+            for job in jobs
+            if (cluster_name is None or job.cluster_name == cluster_name) and _can_manage(user, job)
+        ]
+
+    def cancel(
+        self, job_id: str, user: WebUser | None, cluster_name: str | None = None
+    ) -> ScanJob | None:
+        job = self.get(job_id, user, cluster_name)
+        if job is None or job.status in ScanJobStatuses.FINISHED:
+            return job
+        logger.info(f"Cancelling {job.kind} job {job_id} on '{job.cluster_name}'")
+        job.cancelled = True
+        return job
+
+    def _run(self, job: ScanJob, user: WebUser | None, work: ScanWork) -> None:
+        job._started = monotonic()
+        try:
+            job.check_cancelled()
+            job.status = ScanJobStatuses.RUNNING
+            with admission_controller.acquire(job.cluster_name, user, Workloads.EXPORTS):
+                result = work(job)
+        except QueryCancelled:
+            job.status = ScanJobStatuses.CANCELLED
+        except Exception as e:
+            logger.warning(f"{job.kind} job {job.job_id} on {job.keyspace}.{job.table} failed: {e}")
+            job.error = str(e)
+            job.status = ScanJobStatuses.FAILED
+        else:
+            if result is not None:
+                job.result = result
+            job.status = ScanJobStatuses.COMPLETED
+        finally:
+            job._finished = monotonic()
+            self._prune()
+
+    def _prune(self) -> None:
+        keep = get_clusters_config().scan_jobs.max_finished_jobs
+        with self._lock:
+            finished = [i for i, j in self._jobs.items() if j.status in ScanJobStatuses.FINISHED]
+            for job_id in finished[: max(0, len(finished) - keep)]:
+                del self._jobs[job_id]
+
+
+scan_jobs = ScanJobRegistry()
+
+
+def range_statement(
+    keyspace: str, table: TableMetadata, token_range: TokenRange, columns: list[str]
+) -> tuple[str, list[int]]:
+    """A preparable SELECT of every row in one token range."""
+    conditions, values = token_conditions(table, token_range)
+    selected = ", ".join(f'"{column}"' for column in columns)
+    query = f'SELECT {selected} FROM "{keyspace}"."{table.name}"'
+    if conditions:
+        query += f" WHERE {' AND '.join(conditions)}"
+    return query, values
+
+
+def scan_token_ranges(
+    session: Session,
+    job: ScanJob,
+    user: WebUser | None,
+    table: TableMetadata,
+    columns: list[str],
+    consume: RangeConsumer,
+) -> None:
+    """Read the whole table range by range, handing each range's pages to ``consume``."""
+    config = get_clusters_config().scan_jobs
+    ranges = split_ring(session.cluster.metadata.partitioner, None, config.token_ranges)
+    job.ranges_total = len(ranges)
+
+    def _scan(token_range: TokenRange) -> None:
+        query, values = range_statement(job.keyspace, table, token_range, columns)
+        consume(_pages(session, job, user, query, values, config.fetch_size))
+
+    run_ranges(job, ranges, _scan)
+
+
+def run_ranges(job: ScanJob, items: list[_T], work: Callable[[_T], None]) -> None:
+    """Run ``work`` for every range on ``scan_jobs.parallelism`` threads.
+
+    The first failure stops the ranges still running at their next
+    cancellation check and is raised once they have stopped.
+    """
+    parallelism = get_clusters_config().scan_jobs.parallelism
+
+    def _run(item: _T) -> None:
+        job.check_cancelled()
+        work(item)
+        job.finish_range()
+
+    pool = ThreadPoolExecutor(parallelism, thread_name_prefix=f"scan-{job.job_id[:8]}")
+    try:
+        for future in [pool.submit(_run, item) for item in items]:
+            future.result()
+    except BaseException:
+        job.cancelled = True
+        raise
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _pages(
+    session: Session,
+    job: ScanJob,
+    user: WebUser | None,
+    query: str,
+    values: list[int],
+    fetch_size: int,
+) -> Iterator[list[Any]]:
+    statement = bind_statement(session, query, values, fetch_size=fetch_size)
+    with query_registry.track(job.cluster_name, user, query) as tracked:
+        with scheduled(session, user, Priorities.BACKGROUND), tracked.bound():
+            rows = session.execute(statement, execution_profile=ExecutionProfiles.BULK)
+        while True:
+            tracked.add_rows(len(rows.current_rows))
+            job.add_rows(len(rows.current_rows))
+            yield rows.current_rows
+            if not rows.has_more_pages:
+                return
+            tracked.check_cancelled()
+            job.check_cancelled()
+            with scheduled(session, user, Priorities.BACKGROUND), tracked.bound():
+                rows.fetch_next_page()
+
+
+def _can_manage(user: WebUser | None, job: ScanJob) -> bool:
+    if check_permission(user, "cluster:admin"):
+        return True
+    return user is not None and user.username == job.username
@@ -0,0 +1,224 @@
+"""Per-cluster priority scheduler for CQL requests.
+
+Each session gets a ``WorkScheduler`` that caps concurrent requests on the
+cluster. Once the cap is reached, waiting requests are dispatched by
+start-time fair queuing: every (priority class, user) pair is a flow whose
+requests advance by ``1 / weight`` of virtual time, and the request with the
+lowest finish tag runs next. Interactive clicks therefore overtake queued
+export pages, and one user's burst cannot starve other users of the same
+class.
+
+Exports take a turn per page rather than per export, which is what lets a
+running export give up capacity between pages.
+"""
+
+import heapq
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from itertools import count
+from logging import getLogger
+from math import ceil
+from threading import Event, Lock
+from time import monotonic
+from typing import Any
+from weakref import WeakKeyDictionary
+
+from cassandra.cluster import Session
+
+from cassanova.config.cassanova_config import get_clusters_config
+from cassanova.config.scheduler_config import SchedulerConfig
+from cassanova.consts.workloads import Priorities
+from cassanova.exceptions.cql_exceptions import AdmissionRejected
+from cassanova.models.auth_models import WebUser
+
+logger = getLogger(__name__)
+
+_SYSTEM_USER = "system"
+_WAIT_EWMA_ALPHA = 0.2
+
+_default_priority: ContextVar[str] = ContextVar(
+    "cassanova_default_priority", default=Priorities.INTERACTIVE
+)
+
+
+@dataclass
+class _ClassStats:
+    active: int = 0
+    queued: int = 0
+    dispatched: int = 0
+    rejected: int = 0
+    max_wait: float = 0.0
+    avg_wait: float = 0.0
+
+    def record_wait(self, seconds: float) -> None:
+        self.dispatched += 1
+        self.max_wait = max(self.max_wait, seconds)
+        self.avg_wait += _WAIT_EWMA_ALPHA * (seconds - self.avg_wait)
+
+
+@dataclass(order=True)
+class _Waiter:
+    finish: float
+    seq: int
+    start: float = field(compare=False)
+    priority: str = field(compare=False)
+    enqueued_at: float = field(compare=False)
+    event: Event = field(compare=False, default_factory=Event)
+    granted: bool = field(compare=False, default=False)
+    abandoned: bool = field(compare=False, default=False)
+
+
+class WorkScheduler:
+    def __init__(self, cluster_name: str, config: SchedulerConfig) -> None:
+        self.cluster_name = cluster_name
+        self.capacity = config.max_concurrent_requests
+        self.queue_timeout = config.queue_timeout_seconds
+        self.weights = {
+            Priorities.INTERACTIVE: config.interactive_weight,
+            Priorities.MUTATION: config.mutation_weight,
+            Priorities.BACKGROUND: config.background_weight,
+        }
+        self._active = 0
+        self._virtual_time = 0.0
+        self._last_finish: dict[tuple[str, str], float] = {}
+        self._queue: list[_Waiter] = []
+        self._seq = count()
+        self._stats = {priority: _ClassStats() for priority in self.weights}
+        self._lock = Lock()
+
+    @contextmanager
+    def turn(self, user: WebUser | None, priority: str) -> Iterator[None]:
+        """Wait for this request's turn, run the body, then hand the slot on."""
+        self.acquire(user, priority)
+        try:
+            yield
+        finally:
+            self.release(priority)
+
+    def acquire(self, user: WebUser | None, priority: str) -> None:
+        flow = (priority, user.username if user else _SYSTEM_USER)
+        stats = self._stats[priority]
+        with self._lock:
+            start = max(self._virtual_time, self._last_finish.get(flow, 0.0))
+            finish = start + 1 / self.weights[priority]
+            self._last_finish[flow] = finish
+
+            if self._active < self.capacity and not self._queue:
+                self._active += 1
+                self._virtual_time = start
+                stats.active += 1
+                stats.record_wait(0.0)
+                return
+
+            waiter = _Waiter(finish, next(self._seq), start, priority, monotonic())
+            heapq.heappush(self._queue, waiter)
+            stats.queued += 1
+
+        if waiter.event.wait(self.queue_timeout):
+            return
+
+        with self._lock:
+            if waiter.granted:
+                return
+            waiter.abandoned = True
+            stats.queued -= 1
+            stats.rejected += 1
+
+        raise AdmissionRejected(
+            self.cluster_name,
+            priority,
+            f"waited {self.queue_timeout:.1f}s for a scheduler slot",
+            retry_after=max(1, ceil(self.queue_timeout)),
+        )
+
+    def release(self, priority: str) -> None:
+        with self._lock:
+            self._stats[priority].active -= 1
+            while self._queue:
+                waiter = heapq.heappop(self._queue)
+                if waiter.abandoned:
+                    continue
+                # The slot passes straight to the waiter; _active is unchanged.
+                waiter.granted = True
+                self._virtual_time = waiter.start
+                waiter_stats = self._stats[waiter.priority]
+                waiter_stats.queued -= 1
+                waiter_stats.active += 1
+                waiter_stats.record_wait(monotonic() - waiter.enqueued_at)
+                waiter.event.set()
+                return
+
+            self._active -= 1
+            if self._active == 0:
+                self._last_finish.clear()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "cluster": self.cluster_name,
+                "capacity": self.capacity,
+                "active": self._active,
+                "classes": {
+                    priority: {
+                        "weight": self.weights[priority],
+                        "active": s.active,
+                        "queue_depth": s.queued,
+                        "dispatched": s.dispatched,
+                        "rejected": s.rejected,
+                        "avg_wait_ms": round(s.avg_wait * 1000, 3),
+                        "max_wait_ms": round(s.max_wait * 1000, 3),
+                    }
+                    for priority, s in self._stats.items()
+                },
+            }
+
+
+_schedulers: "WeakKeyDictionary[Session, WorkScheduler]" = WeakKeyDictionary()
+
+
+def install_scheduler(session: Session, cluster_name: str) -> WorkScheduler | None:
+    config = get_clusters_config().scheduler
+    if not config.enabled:
+        return None
+    scheduler = WorkScheduler(cluster_name, config)
+    _schedulers[session] = scheduler
+    return scheduler
+
+
+def get_scheduler(session: Session) -> WorkScheduler | None:
+    try:
+        return _schedulers.get(session)
+    except TypeError:
+        return None
+
+
+def all_schedulers() -> list[WorkScheduler]:
+    return list(_schedulers.values())
+
+
+@contextmanager
+def scheduled(
+    session: Session, user: WebUser | None = None, priority: str | None = None
+) -> Iterator[None]:
+    """Run the body as one scheduled request on the session's cluster.
+
+    Without an explicit ``priority`` the caller's default applies, which is
+    interactive unless overridden with ``default_priority``.
+    """
+    scheduler = get_scheduler(session)
+    if scheduler is None:
+        yield
+        return
+    with scheduler.turn(user, priority or _default_priority.get()):
+        yield
+
+
+@contextmanager
+def default_priority(priority: str) -> Iterator[None]:
+    token = _default_priority.set(priority)
+    try:
+        yield
+    finally:
+        _default_priority.reset(token)
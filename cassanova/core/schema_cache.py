@@ -0,0 +1,39 @@
+"""Caches derived from a cluster's schema, and their invalidation after DDL.
+
+The cluster page's schema map, cached result pages and prepared statements
+all go stale when the schema changes. ``invalidate_schema_cache`` drops them
+and reloads the affected part of the driver's schema: a lazy schema just
+forgets the keyspace, otherwise a debounced refresh is scheduled.
+"""
+
+from typing import Any
+
+from cassanova.core.cql.prepared_statements import prepared_statements
+from cassanova.core.page_cache import page_cache
+from cassanova.core.schema_loader import get_lazy_schema
+from cassanova.core.schema_refresh import SchemaTarget, schema_refresher
+
+schema_map_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+
+
+def invalidate_schema_cache(
+    cluster_name: str, session: Any = None, target: SchemaTarget | None = None
+) -> None:
+    schema_map_cache.pop(cluster_name, None)
+    page_cache.invalidate(cluster_name)
+    if not session:
+        return
+
+    prepared_statements.invalidate(session)
+    lazy_schema = get_lazy_schema(session)
+    if lazy_schema is not None:
+        lazy_schema.invalidate(target.keyspace if target else None)
+    else:
+        schema_refresher.schedule(cluster_name, session, target)
+
+
+def _drop_schema_map(cluster_name: str) -> None:
+    schema_map_cache.pop(cluster_name, None)
+
+
+schema_refresher.add_listener(_drop_schema_map)
@@ -0,0 +1,203 @@
+"""On-demand keyspace metadata for clusters with very large schemas.
+
+When ``lazy_schema`` is enabled for a cluster the driver runs with schema
+metadata disabled, and ``cluster.metadata.keyspaces`` is replaced with a
+``LazyKeyspaceMetadata`` mapping. Keyspaces are read from ``system_schema``
+one partition at a time the first time they are looked up, parsed with the
+driver's own schema parser, and cached until invalidated after DDL.
+"""
+
+from collections.abc import Iterator, MutableMapping
+from contextlib import suppress
+from dataclasses import dataclass
+from logging import getLogger
+from threading import RLock
+from typing import Any
+
+from cassandra import ConsistencyLevel, InvalidRequest
+from cassandra.cluster import Session
+from cassandra.metadata import KeyspaceMetadata, get_schema_parser
+from cassandra.query import SimpleStatement
+
+from cassanova.consts.execution_profiles import ExecutionProfiles
+from cassanova.core.cql.statements import idempotent_statement
+
+logger = getLogger(__name__)
+
+_SELECT_KEYSPACE_NAMES = "SELECT keyspace_name FROM system_schema.keyspaces"
+_SELECT_VIRTUAL_KEYSPACE_NAMES = "SELECT keyspace_name FROM system_virtual_schema.keyspaces"
+
+_FALLBACK_SERVER_VERSION = "4.0.0"
+
+
+class LazyKeyspaceMetadata(MutableMapping[str, KeyspaceMetadata]):
+    """Drop-in replacement for the driver's ``Metadata.keyspaces`` dict.
+
+    Lookups (``get``, ``[]``, ``in``) load a single keyspace on a miss.
+    Iteration lists keyspace names from ``system_schema.keyspaces`` and
+    only loads the keyspaces actually visited.
+    """
+
+    def __init__(self, session: Session, timeout: float) -> None:
+        self._session = session
+        self._timeout = timeout
+        self._keyspaces: dict[str, KeyspaceMetadata] = {}
+        self._names: list[str] | None = None
+        self._lock = RLock()
+
+    def __getitem__(self, name: str) -> KeyspaceMetadata:
+        with self._lock:
+            if name not in self._keyspaces:
+                keyspace_meta = self._load_keyspace(name)
+                if keyspace_meta is None:
+                    raise KeyError(name)
+                self._keyspaces[name] = keyspace_meta
+            return self._keyspaces[name]
+
+    def __setitem__(self, name: str, keyspace_meta: KeyspaceMetadata) -> None:
+        with self._lock:
+            self._keyspaces[name] = keyspace_meta
+
+    def __delitem__(self, name: str) -> None:
+        with self._lock:
+            del self._keyspaces[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keyspace_names())
+
+    def __len__(self) -> int:
+        return len(self.keyspace_names())
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and name in self.keyspace_names()
+
+    def keyspace_names(self) -> list[str]:
+        with self._lock:
+            if self._names is None:
+                self._names = self._load_keyspace_names()
+            return list(self._names)
+
+    def loaded_keyspaces(self) -> list[str]:
+        with self._lock:
+            return list(self._keyspaces)
+
+    def loaded_items(self) -> dict[str, KeyspaceMetadata]:
+        """Keyspaces loaded so far, without loading any."""
+        with self._lock:
+            return dict(self._keyspaces)
+
+    def invalidate(self, keyspace: str | None = None) -> None:
+        """Forget cached metadata so the next lookup re-reads ``system_schema``.
+
+        With a keyspace only that keyspace is dropped; the name list is always
+        reset since DDL may have created or dropped a keyspace.
+        """
+        with self._lock:
+            self._names = None
+            if keyspace is None:
+                self._keyspaces.clear()
+            else:
+                self._keyspaces.pop(keyspace, None)
+
+    def _load_keyspace_names(self) -> list[str]:
+        names = {row.keyspace_name for row in self._execute(_SELECT_KEYSPACE_NAMES)}
+        with suppress(InvalidRequest):
+            names.update(row.keyspace_name for row in self._execute(_SELECT_VIRTUAL_KEYSPACE_NAMES))
+        return sorted(names)
+
+    def _load_keyspace(self, name: str) -> KeyspaceMetadata | None:
+        parser = self._build_parser(_KeyspaceConnection(self._session, name, self._timeout))
+        keyspace_meta = next(iter(parser.get_all_keyspaces()), None)
+        if keyspace_meta is not None:
+            logger.debug(f"Lazily loaded keyspace '{name}' with {len(keyspace_meta.tables)} tables")
+        return keyspace_meta
+
+    def _build_parser(self, connection: "_KeyspaceConnection") -> Any:
+        hosts = self._session.cluster.metadata.all_hosts()
+        server_version = next(
+            (h.release_version for h in hosts if h.release_version), _FALLBACK_SERVER_VERSION
+        )
+        dse_version = next((h.dse_version for h in hosts if getattr(h, "dse_version", None)), None)
+        return get_schema_parser(connection, server_version, dse_version, self._timeout)
+
+    def _execute(self, query: str) -> Any:
+        statement = idempotent_statement(query, consistency_level=ConsistencyLevel.ONE)
+        return self._session.execute(
+            statement, timeout=self._timeout, execution_profile=ExecutionProfiles.METADATA
+        )
+
+
+def install_lazy_schema(session: Session, timeout: float) -> LazyKeyspaceMetadata:
+    keyspaces = LazyKeyspaceMetadata(session, timeout)
+    session.cluster.metadata.keyspaces = keyspaces
+    return keyspaces
+
+
+def get_lazy_schema(session: Session) -> LazyKeyspaceMetadata | None:
+    keyspaces = session.cluster.metadata.keyspaces
+    return keyspaces if isinstance(keyspaces, LazyKeyspaceMetadata) else None
+
+
+def keyspace_listing(session: Session) -> list[tuple[str, KeyspaceMetadata | None]]:
+    """Every keyspace name with its metadata, without loading any keyspace.
+
+    With a lazily loaded schema, keyspaces that have not been loaded yet come
+    with ``None`` instead of their metadata.
+    """
+    lazy_schema = get_lazy_schema(session)
+    if lazy_schema is None:
+        return list(session.cluster.metadata.keyspaces.items())
+    loaded = lazy_schema.loaded_items()
+    return [(name, loaded.get(name)) for name in lazy_schema.keyspace_names()]
+
+
+class _KeyspaceConnection:
+    """Serves the driver's schema parser the ``system_schema`` rows of one keyspace.
+
+    The parser sends its queries through ``wait_for_responses`` on the
+    connection it was built with. Here each query is restricted to the
+    keyspace's partition and run through the session, all concurrently.
+    """
+
+    def __init__(self, session: Session, keyspace: str, timeout: float) -> None:
+        self._session = session
+        self._keyspace = keyspace
+        self._timeout = timeout
+
+    def wait_for_responses(
+        self, *messages: Any, timeout: float | None = None, fail_on_error: bool = True
+    ) -> list[tuple[bool, Any]]:
+        futures = [
+            self._session.execute_async(
+                _keyspace_statement(message.query),
+                [self._keyspace],
+                timeout=timeout or self._timeout,
+                execution_profile=ExecutionProfiles.METADATA,
+            )
+            for message in messages
+        ]
+        responses: list[tuple[bool, Any]] = []
+        for future in futures:
+            try:
+                rows = future.result()
+            except Exception as e:
+                if fail_on_error:
+                    raise
+                responses.append((False, e))
+            else:
+                responses.append((True, _Rows(rows.column_names, list(rows))))
+        return responses
+
+
+@dataclass
+class _Rows:
+    """The two fields of a driver result message that the schema parser reads."""
+
+    column_names: list[str]
+    parsed_rows: list[tuple[Any, ...]]
+
+
+def _keyspace_statement(query: str) -> SimpleStatement:
+    return idempotent_statement(
+        f"{query} WHERE keyspace_name = %s", consistency_level=ConsistencyLevel.ONE
+    )
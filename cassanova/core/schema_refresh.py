@@ -0,0 +1,190 @@
+"""Debounced, targeted driver schema refreshes after DDL.
+
+The driver already waits for schema agreement before a DDL statement returns,
+so the follow-up metadata refresh does not need to block the request. DDL for
+the same cluster is collected for a short window and applied in one background
+pass using ``refresh_table_metadata``/``refresh_keyspace_metadata`` where the
+statement target could be parsed, falling back to a full refresh otherwise.
+"""
+
+import re
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from logging import getLogger
+from threading import Lock, Timer
+from time import monotonic
+from typing import Literal
+
+from cassandra.cluster import Cluster, Session
+
+from cassanova.config.cassanova_config import get_clusters_config
+
+logger = getLogger(__name__)
+
+_IDENTIFIER = r'(?:"(?:[^"]|"")+"|\w+)'
+_QUALIFIED_NAME = rf"({_IDENTIFIER})(?:\s*\.\s*({_IDENTIFIER}))?"
+
+_DDL_PATTERN = re.compile(
+    r"^\s*(CREATE|ALTER|DROP)\s+(?:OR\s+REPLACE\s+)?"
+    r"(KEYSPACE|SCHEMA|TABLE|COLUMNFAMILY|MATERIALIZED\s+VIEW|TYPE)\s+"
+    r"(?:IF\s+(?:NOT\s+)?EXISTS\s+)?" + _QUALIFIED_NAME,
+    re.IGNORECASE,
+)
+_CREATE_INDEX_PATTERN = re.compile(
+    r"^\s*CREATE\s+(?:CUSTOM\s+)?INDEX\b.*?\bON\s+" + _QUALIFIED_NAME,
+    re.IGNORECASE | re.DOTALL,
+)
+
+_OBJECT_KINDS: dict[str, Literal["keyspace", "table", "view", "type"]] = {
+    "KEYSPACE": "keyspace",
+    "SCHEMA": "keyspace",
+    "TABLE": "table",
+    "COLUMNFAMILY": "table",
+    "MATERIALIZED VIEW": "view",
+    "TYPE": "type",
+}
+
+
+@dataclass(frozen=True)
+class SchemaTarget:
+    kind: Literal["keyspace", "table", "view", "type"]
+    keyspace: str
+    name: str | None = None
+
+
+def parse_ddl_target(cql: str) -> SchemaTarget | None:
+    """Return the schema object a DDL statement changes, if it is unambiguous.
+
+    Statements whose keyspace is implicit (no ``ks.`` qualifier) or whose
+    effect is not scoped to a single object return ``None``.
+    """
+    if index_match := _CREATE_INDEX_PATTERN.match(cql):
+        keyspace, table = index_match.groups()
+        if table is None:
+            return None
+        return SchemaTarget("table", _unquote(keyspace), _unquote(table))
+
+    ddl_match = _DDL_PATTERN.match(cql)
+    if not ddl_match:
+        return None
+
+    _action, object_type, first, second = ddl_match.groups()
+    kind = _OBJECT_KINDS[" ".join(object_type.upper().split())]
+    if kind == "keyspace":
+        return SchemaTarget("keyspace", _unquote(first))
+    if second is None:
+        return None
+    return SchemaTarget(kind, _unquote(first), _unquote(second))
+
+
+def _unquote(identifier: str) -> str:
+    if identifier.startswith('"'):
+        return identifier[1:-1].replace('""', '"')
+    return identifier.lower()
+
+
+@dataclass
+class _PendingRefresh:
+    session: Session
+    first_requested: float
+    targets: set[SchemaTarget] = field(default_factory=set)
+    full: bool = False
+    timer: Timer | None = None
+
+
+class SchemaRefreshScheduler:
+    def __init__(self) -> None:
+        self._pending: dict[str, _PendingRefresh] = {}
+        self._listeners: list[Callable[[str], None]] = []
+        self._lock = Lock()
+
+    def add_listener(self, listener: Callable[[str], None]) -> None:
+        """Register a callback invoked with the cluster name after each refresh."""
+        self._listeners.append(listener)
+
+    def schedule(self, cluster_name: str, session: Session, target: SchemaTarget | None) -> None:
+        config = get_clusters_config().schema_refresh
+        with self._lock:
+            pending = self._pending.get(cluster_name)
+            if pending is None:
+                pending = _PendingRefresh(session=session, first_requested=monotonic())
+                self._pending[cluster_name] = pending
+
+            pending.session = session
+            if target is None:
+                pending.full = True
+            else:
+                pending.targets.add(target)
+
+            if pending.timer is not None:
+                pending.timer.cancel()
+
+            remaining = pending.first_requested + config.max_delay_seconds - monotonic()
+            delay = max(0.0, min(config.debounce_seconds, remaining))
+            pending.timer = Timer(delay, self._run, args=(cluster_name,))
+            pending.timer.daemon = True
+            pending.timer.start()
+
+    def flush(self, cluster_name: str) -> None:
+        """Apply any pending refresh for ``cluster_name`` synchronously."""
+        self._run(cluster_name)
+
+    def cancel(self, cluster_name: str) -> None:
+        with self._lock:
+            pending = self._pending.pop(cluster_name, None)
+        if pending and pending.timer:
+            pending.timer.cancel()
+
+    def cancel_all(self) -> None:
+        with self._lock:
+            pending_refreshes = list(self._pending.values())
+            self._pending.clear()
+        for pending in pending_refreshes:
+            if pending.timer:
+                pending.timer.cancel()
+
+    def _run(self, cluster_name: str) -> None:
+        with self._lock:
+            pending = self._pending.pop(cluster_name, None)
+        if pending is None:
+            return
+
+        if pending.timer:
+            pending.timer.cancel()
+
+        try:
+            self._refresh(pending)
+        except Exception as e:
+            logger.warning(f"Schema refresh for '{cluster_name}' failed: {e}")
+
+        for listener in self._listeners:
+            listener(cluster_name)
+
+    def _refresh(self, pending: _PendingRefresh) -> None:
+        cluster = pending.session.cluster
+        max_targets = get_clusters_config().schema_refresh.max_targets
+        if pending.full or len(pending.targets) > max_targets:
+            cluster.refresh_schema_metadata()
+            return
+
+        for target in pending.targets:
+            try:
+                _refresh_target(cluster, target)
+            except Exception as e:
+                logger.debug(f"Targeted refresh of {target} failed, refreshing all: {e}")
+                cluster.refresh_schema_metadata()
+                return
+
+
+def _refresh_target(cluster: Cluster, target: SchemaTarget) -> None:
+    if target.kind == "keyspace":
+        cluster.refresh_keyspace_metadata(target.keyspace)
+    elif target.kind == "table":
+        cluster.refresh_table_metadata(target.keyspace, target.name)
+    elif target.kind == "view":
+        cluster.refresh_materialized_view_metadata(target.keyspace, target.name)
+    else:
+        cluster.refresh_user_type_metadata(target.keyspace, target.name)
+
+
+schema_refresher = SchemaRefreshScheduler()
@@ -5,6 +5,13 @@ from cassandra.cluster import Cluster, Session
 
 from cassanova.config.cassanova_config import get_clusters_config
 from cassanova.config.cluster_config import ClusterConnectionConfig, generate_cluster_connection
+from cassanova.core.cql.node_queries import node_query_cache
+from cassanova.core.metrics.latency import LatencyTracker
+from cassanova.core.metrics.query_stats import QueryStatsCollector
+from cassanova.core.query_registry import query_registry
+from cassanova.core.scheduler import install_scheduler
+from cassanova.core.schema_loader import install_lazy_schema
+from cassanova.core.schema_refresh import schema_refresher
 
 logger = getLogger(__name__)
 
@@ -12,26 +19,74 @@ logger = getLogger(__name__)
 class SessionManager:
     _instances: dict[str, Cluster] = {}
     _sessions: dict[str, Session] = {}
+    _latency_trackers: dict[str, LatencyTracker] = {}
+    _query_stats: dict[str, QueryStatsCollector] = {}
     _lock = Lock()
+    # Held while a cluster connects, so a slow cluster only blocks its own callers.
+    _connect_locks: dict[str, Lock] = {}
 
     @classmethod
     def get_session(cls, cluster_name: str, cluster_config: ClusterConnectionConfig) -> Session:
         with cls._lock:
-            if cluster_name not in cls._sessions:
-                timeouts = get_clusters_config().timeouts
-                cluster = generate_cluster_connection(cluster_config, timeouts)
-                session = cluster.connect()
-                session.default_timeout = timeouts.default_query
-                cls._instances[cluster_name] = cluster
-                cls._sessions[cluster_name] = session
+            session = cls._sessions.get(cluster_name)
+            if session is not None:
+                return session
+            connect_lock = cls._connect_locks.setdefault(cluster_name, Lock())
 
-            return cls._sessions[cluster_name]
+        with connect_lock:
+            with cls._lock:
+                session = cls._sessions.get(cluster_name)
+            if session is None:
+                session = cls._connect(cluster_name, cluster_config)
+            return session
+
+    @classmethod
+    def _connect(cls, cluster_name: str, cluster_config: ClusterConnectionConfig) -> Session:
+        config = get_clusters_config()
+        timeouts = config.timeouts
+        latency_tracker = LatencyTracker()
+        cluster = generate_cluster_connection(cluster_config, timeouts, latency_tracker)
+        session = cluster.connect()
+        install_scheduler(session, cluster_name)
+        query_registry.install(session)
+        # One listener times every request, for both the query metrics and the
+        # per-profile latencies; it is only exposed when query metrics are on.
+        query_stats = QueryStatsCollector(cluster_name, config.query_metrics, latency_tracker)
+        query_stats.install(session)
+        if cluster_config.lazy_schema:
+            install_lazy_schema(session, timeouts.default_query)
+
+        with cls._lock:
+            if config.query_metrics.enabled:
+                cls._query_stats[cluster_name] = query_stats
+            cls._instances[cluster_name] = cluster
+            cls._sessions[cluster_name] = session
+            cls._latency_trackers[cluster_name] = latency_tracker
+        return session
+
+    @classmethod
+    def get_latency_tracker(cls, cluster_name: str) -> LatencyTracker | None:
+        return cls._latency_trackers.get(cluster_name)
+
+    @classmethod
+    def get_query_stats(cls, cluster_name: str) -> QueryStatsCollector | None:
+        return cls._query_stats.get(cluster_name)
+
+    @classmethod
+    def all_query_stats(cls) -> list[QueryStatsCollector]:
+        with cls._lock:
+            return list(cls._query_stats.values())
 
     @classmethod
     def shutdown(cls, name: str) -> None:
+        schema_refresher.cancel(name)
+        # A reconnect may reach different nodes, or differently configured ones.
+        node_query_cache.invalidate(name)
         with cls._lock:
             session = cls._sessions.pop(name, None)
             cluster = cls._instances.pop(name, None)
+            cls._latency_trackers.pop(name, None)
+            cls._query_stats.pop(name, None)
 
         if session:
             try:
@@ -46,6 +101,7 @@ class SessionManager:
 
     @classmethod
     def shutdown_all(cls) -> None:
+        schema_refresher.cancel_all()
         with cls._lock:
             for name, session in cls._sessions.items():
                 try:
@@ -59,6 +115,8 @@ class SessionManager:
                     logger.warning(f"Error shutting down cluster '{name}': {e}")
             cls._sessions.clear()
             cls._instances.clear()
+            cls._latency_trackers.clear()
+            cls._query_stats.clear()
 
 
 session_manager = SessionManager()
@@ -0,0 +1,185 @@
+"""Table size estimates from ``system.size_estimates``.
+
+Each node only records estimates for the token ranges it is primary for, so
+the coordinator's rows are scaled up by the fraction of the ring they cover.
+Estimates are refreshed by Cassandra every few minutes and cached here for
+``query_cost.size_estimates_ttl_seconds``.
+
+Keyspace listings read every node instead: the nodes' primary ranges
+together cover the ring, and on-disk sizes and the largest partitions come
+from the ``system_views.disk_usage`` and ``max_partition_size`` virtual
+tables where the cluster has them (Cassandra 4.1+). On-disk sizes are summed
+over all nodes, so they include every replica.
+"""
+
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass
+from logging import getLogger
+from threading import Lock
+from time import monotonic
+from typing import Any
+
+from cassandra.cluster import Session
+
+from cassanova.config.cassanova_config import get_clusters_config
+from cassanova.core.cql.node_queries import query_nodes
+from cassanova.core.cql.statements import execute_metadata_query
+
+logger = getLogger(__name__)
+
+_RING_SIZE = 2**64
+
+_SELECT_SIZE_ESTIMATES = (
+    "SELECT range_start, range_end, partitions_count, mean_partition_size "
+    "FROM system.size_estimates WHERE keyspace_name = %s AND table_name = %s"
+)
+_SELECT_KEYSPACE_ESTIMATES = (
+    "SELECT table_name, range_start, range_end, partitions_count, mean_partition_size "
+    "FROM system.size_estimates WHERE keyspace_name = %s"
+)
+_SELECT_DISK_USAGE = (
+    "SELECT table_name, mebibytes FROM system_views.disk_usage WHERE keyspace_name = %s"
+)
+_SELECT_MAX_PARTITION_SIZE = (
+    "SELECT table_name, mebibytes FROM system_views.max_partition_size WHERE keyspace_name = %s"
+)
+_MIB = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class TableSizeEstimate:
+    partitions: int
+    mean_partition_size: int
+
+    @property
+    def total_bytes(self) -> int:
+        return self.partitions * self.mean_partition_size
+
+
+@dataclass(frozen=True)
+class TableSizes:
+    partitions: int | None = None
+    mean_partition_size: int | None = None
+    disk_bytes: int | None = None
+    max_partition_size: int | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+class SizeEstimateCache:
+    def __init__(self) -> None:
+        self._entries: dict[tuple[str, str, str], tuple[float, TableSizeEstimate | None]] = {}
+        self._keyspaces: dict[tuple[str, str], tuple[float, dict[str, TableSizes]]] = {}
+        self._lock = Lock()
+
+    def get(
+        self, session: Session, cluster_name: str, keyspace: str, table: str
+    ) -> TableSizeEstimate | None:
+        key = (cluster_name, keyspace, table)
+        ttl = get_clusters_config().query_cost.size_estimates_ttl_seconds
+        with self._lock:
+            cached = self._entries.get(key)
+        if cached is not None and monotonic() - cached[0] < ttl:
+            return cached[1]
+
+        estimate = load_size_estimate(session, keyspace, table)
+        with self._lock:
+            self._entries[key] = (monotonic(), estimate)
+        return estimate
+
+    def keyspace_sizes(
+        self, session: Session, cluster_name: str, keyspace: str
+    ) -> dict[str, TableSizes]:
+        key = (cluster_name, keyspace)
+        ttl = get_clusters_config().query_cost.size_estimates_ttl_seconds
+        with self._lock:
+            cached = self._keyspaces.get(key)
+        if cached is not None and monotonic() - cached[0] < ttl:
+            return cached[1]
+
+        sizes = load_keyspace_sizes(session, keyspace)
+        with self._lock:
+            self._keyspaces[key] = (monotonic(), sizes)
+        return sizes
+
+    def invalidate(self, cluster_name: str) -> None:
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == cluster_name]:
+                del self._entries[key]
+            for keyspace_key in [k for k in self._keyspaces if k[0] == cluster_name]:
+                del self._keyspaces[keyspace_key]
+
+
+size_estimate_cache = SizeEstimateCache()
+
+
+def load_size_estimate(session: Session, keyspace: str, table: str) -> TableSizeEstimate | None:
+    try:
+        rows = list(execute_metadata_query(session, _SELECT_SIZE_ESTIMATES, [keyspace, table]))
+    except Exception as e:
+        logger.debug(f"Could not read size estimates for {keyspace}.{table}: {e}")
+        return None
+    return _estimate(rows)
+
+
+def load_keyspace_sizes(session: Session, keyspace: str) -> dict[str, TableSizes]:
+    """Sizes of every table of a keyspace, read from all nodes."""
+    ranges: dict[str, dict[tuple[str, str], Any]] = {}
+    for node in query_nodes(session, _SELECT_KEYSPACE_ESTIMATES, [keyspace]):
+        if node.error:
+            logger.debug(f"No size estimates from {node.address}: {node.error}")
+        for row in node.rows:
+            # Replicas may report the same range; it is only counted once.
+            ranges.setdefault(row.table_name, {})[(row.range_start, row.range_end)] = row
+
+    disk_bytes: dict[str, int] = {}
+    for node in query_nodes(session, _SELECT_DISK_USAGE, [keyspace]):
+        for row in node.rows:
+            disk_bytes[row.table_name] = disk_bytes.get(row.table_name, 0) + row.mebibytes * _MIB
+
+    max_partition: dict[str, int] = {}
+    for node in query_nodes(session, _SELECT_MAX_PARTITION_SIZE, [keyspace]):
+        for row in node.rows:
+            size = row.mebibytes * _MIB
+            max_partition[row.table_name] = max(max_partition.get(row.table_name, 0), size)
+
+    sizes = {}
+    for table in ranges.keys() | disk_bytes.keys() | max_partition.keys():
+        estimate = _estimate(ranges.get(table, {}).values())
+        sizes[table] = TableSizes(
+            partitions=estimate.partitions if estimate else None,
+            mean_partition_size=estimate.mean_partition_size if estimate else None,
+            disk_bytes=disk_bytes.get(table),
+            max_partition_size=max_partition.get(table),
+        )
+    return sizes
+
+
+def _estimate(rows: Iterable[Any]) -> TableSizeEstimate | None:
+    rows = list(rows)
+    if not rows:
+        return None
+
+    partitions = 0
+    weighted_size = 0
+    covered = 0
+    for row in rows:
+        partitions += row.partitions_count
+        weighted_size += row.partitions_count * row.mean_partition_size
+        covered += _range_width(row.range_start, row.range_end)
+
+    mean_size = weighted_size // partitions if partitions else 0
+    if 0 < covered < _RING_SIZE:
+        partitions = round(partitions * _RING_SIZE / covered)
+    return TableSizeEstimate(partitions=partitions, mean_partition_size=mean_size)
+
+
+def _range_width(range_start: str, range_end: str) -> int:
+    """Width of a Murmur3 token range; other partitioners are left unscaled."""
+    try:
+        start, end = int(range_start), int(range_end)
+    except ValueError:
+        return 0
+    # A range ending at or before its start wraps around the ring.
+    return end - start if end > start else _RING_SIZE - start + end
@@ -0,0 +1,117 @@
+"""Speculative execution policies that know which execution profile they serve.
+
+Every profile gets one of these policies, even when speculation is disabled,
+so that each planned request can be attributed to its profile. The driver
+plans a request while creating it and then runs the request-init listeners on
+the same thread, so the policy hands the profile name to the listener through
+``planned_profile``. The percentile policy reads the latencies recorded that
+way back to pick its delay.
+"""
+
+from threading import Lock, local
+from time import monotonic
+from typing import Any
+
+from cassandra.policies import SpeculativeExecutionPlan, SpeculativeExecutionPolicy
+
+from cassanova.core.metrics.latency import LatencyTracker
+
+_DELAY_REFRESH_SECONDS = 1.0
+
+
+class _LastPlan(local):
+    # The statement last planned on this thread, and its profile.
+    planned: tuple[Any, str] | None = None
+
+
+_last_plan = _LastPlan()
+
+
+def planned_profile(statement: Any) -> str | None:
+    """The profile whose policy just planned ``statement`` on this thread.
+
+    The driver only plans idempotent statements, so other statements have no
+    profile. The handoff is consumed by the first call.
+    """
+    planned = _last_plan.planned
+    _last_plan.planned = None
+    if planned is None or planned[0] is not statement:
+        return None
+    return planned[1]
+
+
+class ProfileSpeculativeExecutionPlan(SpeculativeExecutionPlan):
+    def __init__(self, delay: float | None, max_attempts: int) -> None:
+        self.delay = delay
+        self.remaining = max_attempts
+
+    def next_execution(self, host: Any) -> float:
+        if self.delay is None or self.remaining <= 0:
+            return -1
+        self.remaining -= 1
+        return self.delay
+
+
+class ProfileSpeculativeExecutionPolicy(SpeculativeExecutionPolicy):
+    """Never speculates; only reports the profile name of the plans it makes."""
+
+    def __init__(self, profile: str, max_attempts: int = 0) -> None:
+        self.profile = profile
+        self.max_attempts = max_attempts
+
+    def current_delay(self) -> float | None:
+        return None
+
+    def new_plan(self, keyspace: str | None, statement: Any) -> ProfileSpeculativeExecutionPlan:
+        _last_plan.planned = (statement, self.profile)
+        return ProfileSpeculativeExecutionPlan(self.current_delay(), self.max_attempts)
+
+
+class ConstantSpeculativeExecution(ProfileSpeculativeExecutionPolicy):
+    def __init__(self, profile: str, delay: float, max_attempts: int) -> None:
+        super().__init__(profile, max_attempts)
+        self.delay = delay
+
+    def current_delay(self) -> float | None:
+        return self.delay
+
+
+class PercentileSpeculativeExecution(ProfileSpeculativeExecutionPolicy):
+    """Speculates after the profile's observed latency percentile.
+
+    The percentile is recomputed at most once a second, not per request.
+    """
+
+    def __init__(
+        self,
+        profile: str,
+        tracker: LatencyTracker | None,
+        percentile: float,
+        fallback_delay: float,
+        max_attempts: int,
+        min_samples: int,
+    ) -> None:
+        super().__init__(profile, max_attempts)
+        self.tracker = tracker
+        self.percentile = percentile
+        self.fallback_delay = fallback_delay
+        self.min_samples = min_samples
+        self._delay = fallback_delay
+        self._computed_at: float | None = None
+        self._lock = Lock()
+
+    def current_delay(self) -> float | None:
+        if self.tracker is None:
+            return self.fallback_delay
+        now = monotonic()
+        with self._lock:
+            if self._computed_at is None or now - self._computed_at >= _DELAY_REFRESH_SECONDS:
+                self._delay = self._compute_delay()
+                self._computed_at = now
+            return self._delay
+
+    def _compute_delay(self) -> float:
+        if self.tracker is None or self.tracker.sample_count(self.profile) < self.min_samples:
+            return self.fallback_delay
+        observed = self.tracker.percentile(self.profile, self.percentile)
+        return observed if observed is not None else self.fallback_delay
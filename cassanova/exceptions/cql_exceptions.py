@@ -1,9 +1,35 @@
+from typing import Any
+
+
 class ReadOnlyClusterError(Exception):
     def __init__(self, cluster_name: str) -> None:
         self.cluster_name = cluster_name
         super().__init__(f"Cluster '{cluster_name}' is in read-only mode")
 
 
+class AdmissionRejected(Exception):
+    def __init__(self, cluster_name: str, workload: str, reason: str, retry_after: int) -> None:
+        self.cluster_name = cluster_name
+        self.workload = workload
+        self.retry_after = retry_after
+        super().__init__(f"Too many {workload} requests on cluster '{cluster_name}': {reason}")
+
+
+class QueryCancelled(Exception):
+    def __init__(self, query_id: str) -> None:
+        self.query_id = query_id
+        super().__init__(f"Query '{query_id}' was cancelled")
+
+
+class QueryCostExceeded(Exception):
+    def __init__(self, cluster_name: str, decision: str, cost: dict[str, Any]) -> None:
+        self.cluster_name = cluster_name
+        self.decision = decision
+        self.cost = cost
+        action = "is not allowed" if decision == "block" else "needs confirmation"
+        super().__init__(f"This {cost['kind'].replace('_', ' ')} on '{cluster_name}' {action}")
+
+
 class CQLPermissionDenied(Exception):
     def __init__(self, username: str, cluster_name: str, required_permission: str) -> None:
         self.username = username
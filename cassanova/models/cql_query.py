@@ -1,3 +1,5 @@
+from typing import Any
+
 from cassandra import ConsistencyLevel
 from pydantic import BaseModel, Field
 
@@ -6,3 +8,31 @@ class CQLQuery(BaseModel):
     cql: str
     cl: int = Field(default=ConsistencyLevel.QUORUM)
     enable_tracing: bool = False
+    page_size: int | None = Field(default=None, gt=0)
+    paging_state: str | None = None
+    confirm_cost: bool = False
+
+
+class CQLScript(BaseModel):
+    script: str
+    cl: int = Field(default=ConsistencyLevel.QUORUM)
+    stop_on_error: bool = True
+    concurrency: int | None = Field(default=None, gt=0)
+    confirm_cost: bool = False
+
+
+class FanOutQuery(BaseModel):
+    cql: str
+    cl: int = Field(default=ConsistencyLevel.LOCAL_ONE)
+    clusters: list[str] = Field(default_factory=list)
+    pattern: str | None = None
+    parallelism: int | None = Field(default=None, gt=0)
+    deadline_seconds: float | None = Field(default=None, gt=0)
+    confirm_cost: bool = False
+
+
+class PartitionLookup(BaseModel):
+    keys: list[dict[str, Any]] = Field(min_length=1)
+    columns: list[str] | None = None
+    limit: int = Field(default=100, gt=0)
+    max_cell_bytes: int | None = Field(default=None, ge=0)
@@ -24,8 +24,10 @@ class KeyspaceInfo(BaseModel):
     aggregates: dict[str, Any] = Field(default_factory=dict)
     views: dict[str, Any] | None = Field(default_factory=dict)
     graph_engine: Any | None = None
+    # False for a keyspace of a lazily loaded schema that has not been read yet.
+    loaded: bool = True
 
     @computed_field  # type: ignore[prop-decorator]
     @property
-    def table_count(self) -> int:
-        return len(self.tables)
+    def table_count(self) -> int | None:
+        return len(self.tables) if self.loaded else None
@@ -120,6 +120,43 @@
         });
     }
 
+    function nodeValues(byNode) {
+        return Object.entries(byNode)
+            .map(([node, value]) => `${node}: ${isNull(value) ? 'unset' : value}`)
+            .join(' | ');
+    }
+
+    async function loadDrift() {
+        let drift;
+        try {
+            const response = await fetch(
+                `/api/v1/cluster/${encodeURIComponent(clusterConfigName)}/settings/drift`
+            );
+            if (!response.ok) return;
+            drift = (await response.json()).drift;
+        } catch (e) {
+            return;
+        }
+        if (Object.keys(drift).length === 0) return;
+
+        document.querySelectorAll('.cs-setting-item').forEach(item => {
+            const key = item.querySelector('.cs-key').textContent;
+            if (key in drift) {
+                item.classList.add('drift');
+                item.title = `Differs between nodes: ${nodeValues(drift[key])}`;
+            }
+        });
+
+        const section = createGroupSection(
+            `Differs between nodes (${Object.keys(drift).length})`,
+            Object.fromEntries(Object.entries(drift).map(([k, byNode]) => [k, nodeValues(byNode)]))
+        );
+        section.classList.add('cs-drift-group');
+        section.querySelectorAll('.cs-setting-item').forEach(item => item.classList.add('drift'));
+        const container = document.getElementById('cs-groupsContainer');
+        container.insertBefore(section, container.firstChild);
+    }
+
     function setupSearch() {
         document.getElementById('cs-searchInput').addEventListener('input', e => {
             const filter = e.target.value.toLowerCase();
@@ -139,4 +176,5 @@
 
     render(settingsData);
     setupSearch();
+    loadDrift();
 })();
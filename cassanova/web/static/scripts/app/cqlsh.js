@@ -213,6 +213,7 @@ const container = document.getElementById('container');
 const editor = document.getElementById('editor');
 const resizer = document.getElementById('resizer');
 const runBtn = document.getElementById('run-btn');
+const cancelBtn = document.getElementById('cancel-btn');
 const resultEl = document.getElementById('query-result');
 const consistencySelect = document.getElementById('consistency-level');
 const consistencyMap = {
@@ -230,6 +231,7 @@ const consistencyMap = {
 };
 const historyList = document.getElementById('history-list');
 let queryHistory = [];
+let lastSelect = null;
 
 let isResizing = false;
 
@@ -356,7 +358,51 @@ function renderTrace(trace) {
             ${sources.map(s => `<div class="trace-legend-item"><span class="trace-event-dot" style="background:${nodeColor(s)}"></span>${escapeHtml(s)}</div>`).join('')}
         </div>` : '';
 
-    traceEl.innerHTML = summaryHtml + `<div class="trace-waterfall">${rowsHtml}</div>` + legendHtml;
+    const replicas = trace.replicas || [];
+    const timelinesHtml = replicas.length ? `
+        <div class="trace-timelines">
+            ${replicas.map(replica => `
+                <div class="trace-timeline">
+                    <div class="trace-timeline-header">
+                        <span class="trace-event-dot" style="background:${nodeColor(replica.source)}"></span>
+                        <span class="trace-event-source">${escapeHtml(replica.source)}</span>
+                        <span class="trace-event-time">${replica.span_ms.toFixed(3)} ms</span>
+                    </div>
+                    <div class="trace-timeline-track">
+                        ${replica.stages.map(stage => {
+                            const left = (stage.start_ms / totalMs) * 100;
+                            const width = Math.max((stage.duration_ms / totalMs) * 100, 1);
+                            const title = `${stage.stage}: ${stage.duration_ms.toFixed(3)} ms, ${stage.events} events`;
+                            return `<div class="trace-timeline-stage" title="${escapeHtml(title)}" style="left:${left.toFixed(1)}%;width:${width.toFixed(1)}%">${escapeHtml(stage.stage)}</div>`;
+                        }).join('')}
+                    </div>
+                </div>`).join('')}
+        </div>` : '';
+
+    traceEl.innerHTML = summaryHtml + timelinesHtml
+        + `<div class="trace-waterfall">${rowsHtml}</div>` + legendHtml;
+}
+
+// Traces are written by Cassandra after the query returns, so poll until
+// the server has the complete trace.
+async function loadTrace(traceId) {
+    const traceEl = document.getElementById('trace-result');
+    traceEl.innerHTML = '<span class="loading">Fetching trace...</span>';
+    const url = `/api/v1/cluster/${encodeURIComponent(clusterName)}/operations/cqlsh/trace/${encodeURIComponent(traceId)}`;
+    try {
+        for (let attempt = 0; attempt < 10; attempt++) {
+            const res = await fetch(url);
+            if (res.status === 200) {
+                renderTrace(await res.json());
+                return;
+            }
+            if (res.status !== 202) throw new Error(await res.text() || res.statusText);
+            await new Promise(resolve => setTimeout(resolve, 1000));
+        }
+        traceEl.innerHTML = `<em>Trace ${escapeHtml(traceId)} is not complete yet.</em>`;
+    } catch (err) {
+        traceEl.innerHTML = `<span class="error">Error: ${escapeHtml(err.toString())}</span>`;
+    }
 }
 
 function getStatementAtCursor() {
@@ -376,12 +422,53 @@ function getStatementAtCursor() {
     return text.trim();
 }
 
-async function executeStatement(cql, consistency, tracing) {
+function describeCost(cost) {
+    const parts = [cost.kind.replace(/_/g, ' ')];
+    if (cost.estimated_partitions != null) parts.push(`~${cost.estimated_partitions.toLocaleString()} partitions`);
+    if (cost.estimated_bytes != null) parts.push(`~${(cost.estimated_bytes / 1048576).toFixed(1)} MiB`);
+    return `${parts.join(', ')}\n\n${(cost.reasons || []).join('\n')}`;
+}
+
+async function executeStatement(cql, consistency, tracing, confirmCost = false) {
     const res = await fetch(`/api/v1/cluster/${encodeURIComponent(clusterName)}/operations/cqlsh`, {
         method: 'POST',
         headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify({ cql, cl: consistency, enable_tracing: tracing }),
+        body: JSON.stringify({ cql, cl: consistency, enable_tracing: tracing, confirm_cost: confirmCost }),
     });
+    if (res.status === 428) {
+        const { cost } = await res.json();
+        if (!confirm(`This query looks expensive:\n${describeCost(cost)}\n\nRun it anyway?`)) {
+            throw new Error('Query not run: cost confirmation declined');
+        }
+        return executeStatement(cql, consistency, tracing, true);
+    }
+    if (!res.ok) {
+        let errorText = await res.text();
+        try {
+            const errorJson = JSON.parse(errorText);
+            errorText = errorJson.detail || JSON.stringify(errorJson);
+        } catch { }
+        throw new Error(errorText || res.statusText);
+    }
+    return res.json();
+}
+
+async function executeScript(script, consistency, confirmCost = false) {
+    const res = await fetch(
+        `/api/v1/cluster/${encodeURIComponent(clusterName)}/operations/cqlsh/script`,
+        {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ script, cl: consistency, confirm_cost: confirmCost }),
+        },
+    );
+    if (res.status === 428) {
+        const { cost } = await res.json();
+        if (!confirm(`A query in this script looks expensive:\n${describeCost(cost)}\n\nRun the script anyway?`)) {
+            throw new Error('Script not run: cost confirmation declined');
+        }
+        return executeScript(script, consistency, true);
+    }
     if (!res.ok) {
         let errorText = await res.text();
         try {
@@ -414,33 +501,50 @@ window.runQuery = async function runQuery() {
     const tracing = tracingCheckbox ? tracingCheckbox.checked : false;
 
     runBtn.disabled = true;
+    if (cancelBtn) cancelBtn.disabled = false;
     resultEl.innerHTML = '<span class="loading">Running...</span>';
     document.getElementById('trace-result').innerHTML = '';
     tabBtns[0].click();
 
     const allResults = [];
-    let lastTrace = null;
+    let lastTraceId = null;
+    let truncated = false;
+    lastSelect = statements.length === 1 && /^select\b/i.test(statements[0])
+        ? { cql: statements[0], cl: consistency }
+        : null;
 
     try {
-        for (const stmt of statements) {
-            const data = await executeStatement(stmt, consistency, tracing);
-
-            if (!queryHistory.includes(stmt)) {
-                queryHistory.unshift(stmt);
+        // Multi-statement scripts run server-side in one request; tracing
+        // still needs one request per statement.
+        if (statements.length > 1 && !tracing) {
+            const data = await executeScript(rawCql, consistency);
+            if (!queryHistory.includes(rawCql)) {
+                queryHistory.unshift(rawCql);
                 if (queryHistory.length > 30) queryHistory.pop();
             }
+            allResults.push(...data.results);
+        } else {
+            for (const stmt of statements) {
+                const data = await executeStatement(stmt, consistency, tracing);
 
-            const actualData = data.result || data;
-            allResults.push(actualData.result || actualData);
+                if (!queryHistory.includes(stmt)) {
+                    queryHistory.unshift(stmt);
+                    if (queryHistory.length > 30) queryHistory.pop();
+                }
+
+                const actualData = data.result || data;
+                allResults.push(actualData.result || actualData);
 
-            const traceData = data.trace || (actualData && actualData.trace);
-            if (traceData) lastTrace = traceData;
+                const traceId = data.trace_id || (actualData && actualData.trace_id);
+                if (traceId) lastTraceId = traceId;
+                if (data.next_paging_state) truncated = true;
+            }
         }
 
         localStorage.setItem('cqlshHistory', JSON.stringify(queryHistory));
         updateHistoryUI();
 
-        const combined = statements.length === 1 ? allResults[0] : allResults;
+        const combined = allResults.length === 1 ? allResults[0] : allResults;
         try {
             if (window.syntaxHighlight) {
                 resultEl.innerHTML = window.syntaxHighlight(combined);
@@ -450,9 +554,17 @@ window.runQuery = async function runQuery() {
         } catch (e) {
             resultEl.textContent = JSON.stringify(combined, null, 2);
         }
+        if (truncated) {
+            const note = document.createElement('div');
+            note.className = 'loading';
+            note.textContent = lastSelect
+                ? 'Showing the first page only. Use Export to download every row.'
+                : 'Showing the first page of each result only.';
+            resultEl.prepend(note);
+        }
 
-        if (lastTrace) {
-            renderTrace(lastTrace);
+        if (lastTraceId) {
+            loadTrace(lastTraceId);
         } else {
             document.getElementById('trace-result').innerHTML = '<em>Tracing was not enabled.</em>';
         }
@@ -460,11 +572,31 @@ window.runQuery = async function runQuery() {
         resultEl.innerHTML = `<span class="error">Error: ${escapeHtml(err.toString())}</span>`;
     } finally {
         runBtn.disabled = false;
+        if (cancelBtn) cancelBtn.disabled = true;
     }
 };
 
 runBtn.addEventListener('click', window.runQuery);
 
+async function cancelRunningQueries() {
+    const base = `/api/v1/cluster/${encodeURIComponent(clusterName)}/queries`;
+    const res = await fetch(`${base}?mine=true`);
+    if (!res.ok) return;
+    const { queries } = await res.json();
+    await Promise.all(queries.map(q => fetch(`${base}/${q.query_id}`, { method: 'DELETE' })));
+}
+
+if (cancelBtn) {
+    cancelBtn.addEventListener('click', async () => {
+        cancelBtn.disabled = true;
+        try {
+            await cancelRunningQueries();
+        } catch (err) {
+            console.error('Failed to cancel queries', err);
+        }
+    });
+}
+
 function updateHistoryUI() {
     historyList.innerHTML = '';
     queryHistory.forEach((cql, idx) => {
@@ -478,16 +610,41 @@ function updateHistoryUI() {
     });
 }
 
-document.getElementById('export-btn').addEventListener('click', () => {
-    const content = resultEl.textContent;
-    if (!content) return;
+async function fetchFullExport(select) {
+    const res = await fetch(
+        `/api/v1/cluster/${encodeURIComponent(clusterName)}/operations/cqlsh/export?format=json`,
+        {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify(select),
+        },
+    );
+    if (!res.ok) throw new Error(await res.text() || res.statusText);
+    return res.blob();
+}
+
+document.getElementById('export-btn').addEventListener('click', async () => {
+    let blob;
+    let extension = 'json';
+    if (lastSelect) {
+        try {
+            blob = await fetchFullExport(lastSelect);
+            extension = 'ndjson';
+        } catch (err) {
+            resultEl.innerHTML = `<span class="error">Export failed: ${escapeHtml(err.toString())}</span>`;
+            return;
+        }
+    } else {
+        const content = resultEl.textContent;
+        if (!content) return;
+        blob = new Blob([content], { type: "application/json" });
+    }
 
-    const blob = new Blob([content], { type: "application/json" });
     const url = URL.createObjectURL(blob);
 
     const link = document.createElement("a");
     link.href = url;
-    link.download = `cql_result_${Date.now()}.json`;
+    link.download = `cql_result_${Date.now()}.${extension}`;
     link.click();
 
     URL.revokeObjectURL(url);
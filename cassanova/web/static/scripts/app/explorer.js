@@ -10,8 +10,10 @@ document.addEventListener('DOMContentLoaded', () => {
     const tableBody = document.getElementById('table-body');
     const loadingOverlay = document.getElementById('loading-overlay');
     const rowCountLabel = document.getElementById('row-count');
+    const accessPathLabel = document.getElementById('access-path');
     const prevPageBtn = document.getElementById('prev-page');
     const nextPageBtn = document.getElementById('next-page');
+    const pageJumpInput = document.getElementById('page-jump');
 
     const addFilterBtn = document.getElementById('add-filter-btn');
     const filterPopover = document.getElementById('filter-popover');
@@ -32,8 +34,9 @@ document.addEventListener('DOMContentLoaded', () => {
     const deleteRowDetails = document.getElementById('delete-row-details');
 
     let currentData = [];
-    let pagingStack = [null];
-    let nextPagingState = null;
+    let cursorId = null; // Server-side page cursor for the current query
+    let currentPage = 0;
+    let hasMore = false;
     let activeFilters = []; // Array of objects { col, op, val }
     let explicitAllowFiltering = false;
     let tableSchema = null;
@@ -41,23 +44,11 @@ document.addEventListener('DOMContentLoaded', () => {
     let isFetching = false;
     let editingFilterIndex = -1;
 
-    async function fetchData(dir = 'next') {
-        if (isFetching && dir === 'next' && !nextPagingState) return;
+    async function fetchData(page = 0) {
+        if (isFetching) return;
         isFetching = true;
 
         loadingOverlay.classList.remove('hidden');
-        if (dir !== 'next' || !nextPagingState) {
-            // New query or refresh, clear previous data
-            tableBody.innerHTML = '';
-        }
-
-        let stateToUse = null;
-        if (dir === 'next') {
-            stateToUse = nextPagingState;
-        } else if (dir === 'prev') {
-            pagingStack.pop();
-            stateToUse = pagingStack[pagingStack.length - 1];
-        }
 
         const url = new URL(`/api/v1/cluster/${cluster}/keyspace/${keyspace}/table/${table}/data`, window.location.origin);
         if (activeFilters.length > 0) {
@@ -66,40 +57,53 @@ document.addEventListener('DOMContentLoaded', () => {
         if (explicitAllowFiltering) {
             url.searchParams.set('allow_filtering', 'true');
         }
-        if (stateToUse) url.searchParams.set('paging_state', stateToUse);
+        // Pages already visited are served or resumed from the server-side cursor.
+        url.searchParams.set('page', page);
+        if (cursorId) url.searchParams.set('cursor', cursorId);
 
         try {
-            const response = await fetch(url);
-            const data = await response.json();
-
+            let response = await fetch(url);
+            let data = await response.json();
+
+            // The server asks before running queries it estimates as expensive.
+            if (response.status === 428) {
+                const cost = data.cost || {};
+                const size = cost.estimated_bytes != null
+                    ? ` (~${(cost.estimated_bytes / 1048576).toFixed(1)} MiB)` : '';
+                if (!confirm(`${data.detail}${size}. Run it anyway?`)) {
+                    throw new Error('Query not run: cost confirmation declined');
+                }
+                url.searchParams.set('confirm_cost', 'true');
+                response = await fetch(url);
+                data = await response.json();
+            }
             if (!response.ok) {
                 throw new Error(data.detail || `Server error: ${response.status}`);
             }
 
+            renderAccessPath(data.access_path);
+            cursorId = data.cursor;
+
             if (data.rows && data.rows.length > 0) {
                 currentData = data.rows;
-                nextPagingState = data.next_paging_state;
-                if (dir === 'next' && stateToUse) {
-                    pagingStack.push(stateToUse);
-                }
+                currentPage = data.page;
+                hasMore = data.has_more;
                 renderTable(data.rows);
 
-                // Only show expensive query warning if ALLOW FILTERING is explicitly enabled
-                if (explicitAllowFiltering) {
+                // Only warn when ALLOW FILTERING is enabled and the chosen access path needs it
+                if (explicitAllowFiltering && data.access_path && data.access_path.filtering) {
                     showExpensiveQueryWarning();
                 } else {
                     hideExpensiveQueryWarning();
                 }
+            } else if (page > 0) {
+                // Past the last page; stay on the current one
+                Toast.info("No more results available.");
+                if (page === currentPage + 1) hasMore = false;
             } else {
-                // No rows returned
-                if (dir === 'next' && pagingStack.length > 1 && stateToUse) {
-                    // We shouldn't have advanced to this empty page
-                    Toast.info("No more results available.");
-                    nextPagingState = null; // Kill the dead-end state
-                } else {
-                    renderTable([]); // Show "No data found"
-                    nextPagingState = null;
-                }
+                currentPage = 0;
+                hasMore = false;
+                renderTable([]); // Show "No data found"
             }
 
             updatePaginationUI();
@@ -175,8 +179,7 @@ document.addEventListener('DOMContentLoaded', () => {
 
     function refreshAndFetch() {
         renderChips();
-        pagingStack = [null];
-        nextPagingState = null;
+        cursorId = null;
         fetchData();
     }
 
@@ -240,14 +243,26 @@ document.addEventListener('DOMContentLoaded', () => {
     });
 
     function updatePaginationUI() {
-        prevPageBtn.disabled = pagingStack.length <= 1;
-        nextPageBtn.disabled = !nextPagingState;
+        prevPageBtn.disabled = currentPage === 0;
+        nextPageBtn.disabled = !hasMore;
 
-        const pageNum = pagingStack.length;
         const pageInfo = document.getElementById('page-info');
         if (pageInfo) {
-            pageInfo.textContent = `Page ${pageNum} ${nextPagingState ? '(more results available)' : '(end of data)'}`;
+            pageInfo.textContent = `Page ${currentPage + 1} ${hasMore ? '(more results available)' : '(end of data)'}`;
         }
+        pageJumpInput.value = '';
+    }
+
+    function renderAccessPath(accessPath) {
+        if (!accessPath) {
+            accessPathLabel.classList.add('hidden');
+            return;
+        }
+        // Filters may be served by an index or a materialized view instead of the table.
+        const viaView = accessPath.table !== table ? ` (reading ${accessPath.table})` : '';
+        accessPathLabel.textContent = `${accessPath.description}${viaView}`;
+        accessPathLabel.classList.toggle('filtering', accessPath.filtering);
+        accessPathLabel.classList.remove('hidden');
     }
 
     function showExpensiveQueryWarning() {
@@ -282,7 +297,7 @@ document.addEventListener('DOMContentLoaded', () => {
             const isPK = pkCols.includes(col);
             return `
                     <td data-col="${col}" class="${isPK ? 'pk-col read-only' : 'editable-cell'}" title="${isPK ? 'Primary Key (Read-only)' : escapeHtml(row[col])}">
-                        ${formatCell(row[col])}
+                        ${formatCell(row[col], row, col)}
                         ${!isPK ? '<span class="edit-hint">✎</span>' : ''}
                     </td>
                 `}).join('')}
@@ -300,12 +315,32 @@ document.addEventListener('DOMContentLoaded', () => {
         attachCellEvents();
     }
 
-    function formatCell(val) {
+    function formatCell(val, row, col) {
         if (val === null) return '<span class="syntax-null">null</span>';
+        if (isTruncated(val)) {
+            // Large text/blob cells arrive as a preview; the full value is downloaded on demand.
+            return `${escapeHtml(val.preview)}… <a class="cell-download" href="${cellUrl(row, col)}" download>(${formatBytes(val.size)})</a>`;
+        }
         if (typeof val === 'object') return escapeHtml(JSON.stringify(val));
         return escapeHtml(String(val));
     }
 
+    function isTruncated(val) {
+        return val !== null && typeof val === 'object' && val['$truncated'] === true;
+    }
+
+    function cellUrl(row, col) {
+        const pk = {};
+        pkCols.forEach(p => pk[p] = row[p]);
+        return `/api/v1/cluster/${cluster}/keyspace/${keyspace}/table/${table}/cell?pk=${encodeURIComponent(JSON.stringify(pk))}&column=${encodeURIComponent(col)}`;
+    }
+
+    function formatBytes(size) {
+        if (size < 1024) return `${size} B`;
+        if (size < 1048576) return `${(size / 1024).toFixed(1)} KiB`;
+        return `${(size / 1048576).toFixed(1)} MiB`;
+    }
+
     function attachCellEvents() {
         const cells = tableBody.querySelectorAll('td');
         cells.forEach(cell => {
@@ -382,6 +417,10 @@ document.addEventListener('DOMContentLoaded', () => {
         const rowIndex = activeCell.parentElement.dataset.index;
         const rowData = currentData[rowIndex];
         const val = rowData[col];
+        if (isTruncated(val)) {
+            Toast.info('This value is truncated; download it to copy it in full.');
+            return;
+        }
 
         const pk = {};
         pkCols.forEach(p => pk[p] = rowData[p]);
@@ -408,6 +447,10 @@ document.addEventListener('DOMContentLoaded', () => {
         const col = cell.dataset.col;
         const rowIndex = cell.parentElement.dataset.index;
         const originalValue = currentData[rowIndex][col];
+        if (isTruncated(originalValue)) {
+            Toast.info('This value is truncated; download it to see it in full.');
+            return;
+        }
 
         const input = document.createElement('input');
         input.className = 'cell-editor';
@@ -487,8 +530,7 @@ document.addEventListener('DOMContentLoaded', () => {
 
     // Event listeners
     document.getElementById('refresh-data').addEventListener('click', async () => {
-        pagingStack = [null];
-        nextPagingState = null;
+        cursorId = null;
         try {
             await fetch(`/api/v1/cluster/${encodeURIComponent(cluster)}/schema/refresh`, {
                 method: 'POST',
@@ -673,8 +715,12 @@ document.addEventListener('DOMContentLoaded', () => {
         }
     });
 
-    nextPageBtn.addEventListener('click', () => fetchData('next'));
-    prevPageBtn.addEventListener('click', () => fetchData('prev'));
+    nextPageBtn.addEventListener('click', () => fetchData(currentPage + 1));
+    prevPageBtn.addEventListener('click', () => fetchData(currentPage - 1));
+    pageJumpInput.addEventListener('keydown', (e) => {
+        const page = parseInt(pageJumpInput.value, 10);
+        if (e.key === 'Enter' && page >= 1) fetchData(page - 1);
+    });
 
     // Register for auto-refresh widget
     window.cassanovaRefresh = () => refreshAndFetch();
@@ -69,18 +69,117 @@ function showKeyspaceDetail(item) {
         <div class="detail-grid">
             <div class="detail-card">
                 <span class="label">Replication Strategy</span>
-                <span class="value code">${replication}</span>
+                <span class="value code" id="keyspace-replication">${replication}</span>
             </div>
             <div class="detail-card">
                 <span class="label">Tables</span>
-                <span class="value accent">${tables}</span>
+                <span class="value accent" id="keyspace-table-count">${tables || '…'}</span>
             </div>
             <div class="detail-card">
                 <span class="label">Durable Writes</span>
-                <span class="value">${durable === 'True' ? 'Enabled' : 'Disabled'}</span>
+                <span class="value" id="keyspace-durable">${durable === 'True' ? 'Enabled' : 'Disabled'}</span>
+            </div>
+            <div class="detail-card">
+                <span class="label">Size on Disk</span>
+                <span class="value" id="keyspace-disk-size">…</span>
             </div>
         </div>
+        <div id="keyspace-sizes"></div>
     `;
+
+    if (item.dataset.loaded === 'False') {
+        loadKeyspaceSummary(item);
+    }
+    if (isVirtual !== 'True') {
+        loadKeyspaceSizes(name);
+    } else {
+        document.getElementById('keyspace-disk-size').textContent = 'N/A';
+    }
+}
+
+// Keyspaces of a lazily loaded schema are listed by name only until one is shown.
+async function loadKeyspaceSummary(item) {
+    try {
+        const response = await fetch(
+            `/api/v1/cluster/${encodeURIComponent(clusterConfigName)}/keyspace/${encodeURIComponent(item.dataset.name)}`
+        );
+        if (!response.ok) return;
+        const keyspace = await response.json();
+        item.dataset.loaded = 'True';
+        item.dataset.tablecount = keyspace.table_count;
+        item.dataset.replication = keyspace.replication;
+        item.dataset.durable = keyspace.durable_writes ? 'True' : 'False';
+        item.querySelector('.keyspace-meta').textContent = `Tables: ${keyspace.table_count}`;
+
+        if (!item.classList.contains('active')) return;
+        document.getElementById('keyspace-table-count').textContent = keyspace.table_count;
+        document.getElementById('keyspace-replication').textContent = formatReplication(item.dataset.replication);
+        document.getElementById('keyspace-durable').textContent = keyspace.durable_writes ? 'Enabled' : 'Disabled';
+    } catch (e) {
+        // The detail view keeps its placeholders.
+    }
+}
+
+function formatSize(bytes) {
+    if (bytes === null || bytes === undefined) return '—';
+    const units = ['B', 'KiB', 'MiB', 'GiB', 'TiB'];
+    let value = bytes;
+    let unit = 0;
+    while (value >= 1024 && unit < units.length - 1) {
+        value /= 1024;
+        unit++;
+    }
+    return unit === 0 ? `${value} B` : `${value.toFixed(1)} ${units[unit]}`;
+}
+
+function formatCount(count) {
+    return count === null || count === undefined ? '—' : `~${count.toLocaleString()}`;
+}
+
+async function loadKeyspaceSizes(name) {
+    const diskSize = document.getElementById('keyspace-disk-size');
+    const container = document.getElementById('keyspace-sizes');
+    try {
+        const response = await fetch(
+            `/api/v1/cluster/${encodeURIComponent(clusterConfigName)}/keyspace/${encodeURIComponent(name)}/sizes`
+        );
+        if (!response.ok) throw new Error(response.statusText);
+        const sizes = await response.json();
+        // The user may have picked another keyspace while this was loading.
+        if (!container.isConnected) return;
+
+        diskSize.textContent = formatSize(sizes.disk_bytes);
+        const tables = Object.entries(sizes.tables);
+        if (tables.length === 0) return;
+        container.innerHTML = `
+            <div class="table-frame">
+                <table class="glass-table">
+                    <thead>
+                        <tr>
+                            <th>Table</th>
+                            <th>Partitions</th>
+                            <th>Mean Partition</th>
+                            <th>Largest Partition</th>
+                            <th>On Disk</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+                        ${tables.map(([table, size]) => `
+                            <tr>
+                                <td>${escapeHtml(table)}</td>
+                                <td>${formatCount(size.partitions)}</td>
+                                <td>${formatSize(size.mean_partition_size)}</td>
+                                <td>${formatSize(size.max_partition_size)}</td>
+                                <td>${formatSize(size.disk_bytes)}</td>
+                            </tr>
+                        `).join('')}
+                    </tbody>
+                </table>
+            </div>
+        `;
+    } catch (e) {
+        if (diskSize.isConnected) diskSize.textContent = '—';
+    }
 }
 
 document.addEventListener('DOMContentLoaded', () => {
@@ -12,19 +12,58 @@ def mock_session():
     return session
 
 
+def _column(name, cql_type="text", is_reversed=False):
+    column = MagicMock()
+    column.name = name
+    column.cql_type = cql_type
+    column.is_reversed = is_reversed
+    return column
+
+
+@pytest.fixture
+def make_table():
+    """Factory for table (or view) metadata.
+
+    Columns are names, typed ``text``, or ``(name, cql_type)`` pairs.
+    Clustering columns listed in ``descending`` are in reversed order.
+    """
+
+    def _make(
+        name="test_table",
+        partition_key=("id",),
+        clustering_key=(),
+        regular=(),
+        indexes=(),
+        views=(),
+        where_clause=None,
+        descending=(),
+    ):
+        def _columns(specs):
+            columns = []
+            for spec in specs:
+                column_name, cql_type = (spec, "text") if isinstance(spec, str) else spec
+                columns.append(_column(column_name, cql_type, column_name in descending))
+            return columns
+
+        table = MagicMock()
+        table.name = name
+        table.where_clause = where_clause
+        table.partition_key = _columns(partition_key)
+        table.clustering_key = _columns(clustering_key)
+        table.primary_key = [*table.partition_key, *table.clustering_key]
+        table.columns = {c.name: c for c in [*table.primary_key, *_columns(regular)]}
+        table.indexes = {index.name: index for index in indexes}
+        table.views = {view.name: view for view in views}
+        return table
+
+    return _make
+
+
 @pytest.fixture
-def mock_table_metadata():
-    meta = MagicMock()
-    columns = {}
-    for name, cql_type in [("id", "int"), ("name", "text"), ("age", "int"), ("email", "text")]:
-        col = MagicMock()
-        col.cql_type = cql_type
-        columns[name] = col
-    meta.columns = columns
-    meta.primary_key = [columns["id"]]
-    meta.partition_key = [columns["id"]]
-    meta.clustering_key = []
-    return meta
+def mock_table_metadata(make_table):
+    return make_table(
+        partition_key=[("id", "int")], regular=[("name", "text"), ("age", "int"), "email"]
+    )
 
 
 @pytest.fixture
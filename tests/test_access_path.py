@@ -0,0 +1,196 @@
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from cassandra.metadata import IndexMetadata
+
+from cassanova.api.routes.api.data_routes import get_table_data
+from cassanova.consts.query_kinds import AccessPaths
+from cassanova.core.cql.access_path import column_indexes, plan_access
+
+
+def _index(name, target, sai=False):
+    options = {"target": target}
+    if sai:
+        options["class_name"] = "org.apache.cassandra.index.sai.StorageAttachedIndex"
+    return IndexMetadata("ks", "events", name, "CUSTOM" if sai else "COMPOSITES", options)
+
+
+@pytest.fixture
+def events(make_table):
+    return make_table(
+        "events",
+        ["tenant"],
+        ["day", "seq"],
+        ["email", "source", "kind", "tags", "score", "note"],
+        indexes=[
+            _index("events_kind", "kind"),
+            _index("events_tags", "values(tags)"),
+            _index("events_score", "score", sai=True),
+            _index("events_note", "note", sai=True),
+        ],
+        views=[
+            make_table(
+                "events_by_email",
+                ["email"],
+                ["tenant", "day", "seq"],
+                ["source", "kind", "tags", "score", "note"],
+                where_clause='email IS NOT NULL AND tenant IS NOT NULL AND "day" IS NOT NULL '
+                "AND seq IS NOT NULL",
+            ),
+            # Only holds some of the table's rows.
+            make_table(
+                "events_by_kind",
+                ["kind"],
+                ["tenant", "day", "seq"],
+                ["email", "source", "tags", "score", "note"],
+                where_clause="kind IS NOT NULL AND tenant IS NOT NULL AND day IS NOT NULL "
+                "AND seq IS NOT NULL AND source = 'web'",
+            ),
+            # Leaves out most base columns, so it cannot stand in for the table.
+            make_table("events_by_source", ["source"], ["tenant", "day", "seq"]),
+        ],
+    )
+
+
+class TestPlanAccess:
+    def test_no_filters_scans(self, events):
+        path = plan_access(events, [])
+
+        assert path.kind == AccessPaths.SCAN
+        assert path.filtering is False
+
+    @pytest.mark.parametrize(
+        "restrictions",
+        [
+            [("tenant", "=")],
+            [("tenant", "IN"), ("day", "=")],
+            [("tenant", "="), ("day", "="), ("seq", ">"), ("seq", "<=")],
+        ],
+    )
+    def test_primary_key(self, events, restrictions):
+        path = plan_access(events, restrictions)
+
+        assert path.kind == AccessPaths.PRIMARY_KEY
+        assert path.table == "events"
+
+    @pytest.mark.parametrize(
+        "restrictions",
+        [[("tenant", "="), ("seq", "=")], [("tenant", "="), ("day", ">"), ("seq", "=")]],
+    )
+    def test_clustering_gaps_are_not_served_by_the_key(self, events, restrictions):
+        path = plan_access(events, restrictions)
+
+        assert path.kind == AccessPaths.FILTERING
+        assert path.filtering is True
+
+    @pytest.mark.parametrize(
+        ("restrictions", "index"),
+        [
+            ([("kind", "=")], "events_kind"),
+            ([("tags", "CONTAINS")], "events_tags"),
+            ([("score", ">"), ("note", "=")], "events_score"),
+        ],
+    )
+    def test_index(self, events, restrictions, index):
+        path = plan_access(events, restrictions)
+
+        assert path.kind == AccessPaths.INDEX
+        assert path.index == index
+        assert path.filtering is False
+
+    def test_view_replaces_the_table(self, events):
+        path = plan_access(events, [("email", "="), ("tenant", "=")])
+
+        assert path.kind == AccessPaths.VIEW
+        assert path.table == "events_by_email"
+        assert path.filtering is False
+        assert "eventually consistent" in path.description
+
+    def test_restricted_view_is_not_used(self, events):
+        # events_by_kind would serve "kind" but drops rows; the index is used instead.
+        path = plan_access(events, [("kind", "="), ("tenant", "=")])
+
+        assert path.kind == AccessPaths.INDEX
+        assert path.table == "events"
+
+    def test_view_keyed_on_an_unfiltered_column_is_not_used(self, events, make_table):
+        # Rows whose "kind" is null are missing from the view.
+        view = make_table(
+            "events_by_seq",
+            ["tenant"],
+            ["seq", "kind", "day"],
+            ["email", "source", "tags", "score", "note"],
+            where_clause="tenant IS NOT NULL AND seq IS NOT NULL AND kind IS NOT NULL "
+            "AND day IS NOT NULL",
+        )
+        events.views = {view.name: view}
+
+        assert plan_access(events, [("tenant", "="), ("seq", "=")]).kind == AccessPaths.FILTERING
+        path = plan_access(events, [("tenant", "="), ("seq", "="), ("kind", "=")])
+        assert path.kind == AccessPaths.VIEW
+        assert path.table == "events_by_seq"
+
+    def test_view_must_have_every_column(self, events):
+        assert plan_access(events, [("source", "=")]).kind == AccessPaths.FILTERING
+
+    def test_index_with_remaining_filters(self, events):
+        path = plan_access(events, [("kind", "="), ("tags", "CONTAINS")])
+
+        assert path.kind == AccessPaths.INDEX
+        assert path.filtering is True
+
+    @pytest.mark.parametrize("restrictions", [[("kind", ">")], [("tags", "CONTAINS KEY")]])
+    def test_unsupported_index_operators_fall_back_to_filtering(self, events, restrictions):
+        assert plan_access(events, restrictions).kind == AccessPaths.FILTERING
+
+    def test_column_indexes_unwrap_targets(self, events):
+        indexes = column_indexes(events)
+
+        assert indexes["tags"].target == "values"
+        assert indexes["score"].is_sai is True
+        assert indexes["kind"].serves("=") and not indexes["kind"].serves(">")
+
+
+class TestTableDataAccessPath:
+    @pytest.fixture
+    def session(self, mock_session, events):
+        keyspace = MagicMock()
+        keyspace.tables = {"events": events}
+        keyspace.views = dict(events.views)
+        mock_session.cluster.metadata.keyspaces = {"ks": keyspace}
+        rows = MagicMock(current_rows=[], paging_state=None)
+        mock_session.execute.return_value = rows
+        return mock_session
+
+    def _read(self, session, filters, allow_filtering=True):
+        with (
+            patch("cassanova.api.routes.api.data_routes.get_session", return_value=session),
+            patch("cassanova.api.routes.api.data_routes.check_query_cost"),
+            patch("cassanova.api.routes.api.data_routes.bind_statement") as bind,
+        ):
+            result = get_table_data(
+                "c1",
+                "ks",
+                "events",
+                filter_json=json.dumps(filters),
+                allow_filtering=allow_filtering,
+                _user=None,
+            )
+        return result, bind.call_args.args[1]
+
+    def test_view_is_queried_and_reported(self, session):
+        result, query = self._read(
+            session, [{"col": "email", "op": "=", "val": "a@b"}, {"col": "tenant", "val": "t"}]
+        )
+
+        assert query.startswith('SELECT * FROM "ks"."events_by_email" WHERE')
+        assert "ALLOW FILTERING" not in query
+        assert result["access_path"]["kind"] == AccessPaths.VIEW
+
+    def test_allow_filtering_only_when_needed(self, session):
+        _, indexed = self._read(session, [{"col": "kind", "val": "click"}])
+        _, filtered = self._read(session, [{"col": "kind", "op": ">", "val": "a"}])
+
+        assert "ALLOW FILTERING" not in indexed
+        assert filtered.endswith("ALLOW FILTERING")
@@ -0,0 +1,197 @@
+import asyncio
+import gc
+from threading import Thread
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import FastAPI
+
+from cassanova.api.exception_handlers.cql_handler import add_cql_exception_handlers
+from cassanova.config.admission_config import AdmissionConfig, WorkloadLimits
+from cassanova.consts.workloads import Workloads
+from cassanova.core.admission import AdmissionController, hold_while_streaming
+from cassanova.exceptions.cql_exceptions import AdmissionRejected
+from cassanova.models.auth_models import WebUser
+
+
+def _user(*roles: str) -> WebUser:
+    return WebUser(username="u", password="x", roles=list(roles))
+
+
+@pytest.fixture
+def admission_config():
+    config = MagicMock()
+    config.admission = AdmissionConfig(
+        queue_timeout_seconds=0,
+        cluster_limits=WorkloadLimits(interactive=2, mutations=1, exports=1, imports=1),
+    )
+    with patch("cassanova.core.admission.get_clusters_config", return_value=config):
+        yield config
+
+
+class TestAdmissionController:
+    def test_rejects_over_cluster_limit(self, admission_config):
+        controller = AdmissionController()
+        controller.acquire("c1", None, Workloads.INTERACTIVE).detach()
+        controller.acquire("c1", None, Workloads.INTERACTIVE).detach()
+
+        with pytest.raises(AdmissionRejected) as exc_info:
+            controller.acquire("c1", None, Workloads.INTERACTIVE)
+        assert exc_info.value.retry_after == 1
+
+    def test_workloads_and_clusters_are_isolated(self, admission_config):
+        controller = AdmissionController()
+        controller.acquire("c1", None, Workloads.MUTATIONS).detach()
+
+        controller.acquire("c1", None, Workloads.INTERACTIVE).detach()
+        controller.acquire("c2", None, Workloads.MUTATIONS).detach()
+
+    def test_release_frees_slot(self, admission_config):
+        controller = AdmissionController()
+        with controller.acquire("c1", None, Workloads.MUTATIONS):
+            pass
+
+        controller.acquire("c1", None, Workloads.MUTATIONS).release()
+
+    def test_queued_request_is_admitted_when_slot_frees(self, admission_config):
+        admission_config.admission.queue_timeout_seconds = 5
+        controller = AdmissionController()
+        slot = controller.acquire("c1", None, Workloads.MUTATIONS)
+        slot.detach()
+        admitted = []
+
+        waiter = Thread(
+            target=lambda: admitted.append(controller.acquire("c1", None, Workloads.MUTATIONS))
+        )
+        waiter.start()
+        while not any(s["waiting"] for s in controller.stats()):
+            pass
+        slot.release()
+        waiter.join(timeout=5)
+
+        assert len(admitted) == 1
+
+    def test_full_queue_rejects_immediately(self, admission_config):
+        admission_config.admission.queue_timeout_seconds = 5
+        admission_config.admission.max_queue_size = 0
+        controller = AdmissionController()
+        controller.acquire("c1", None, Workloads.MUTATIONS).detach()
+
+        with pytest.raises(AdmissionRejected, match="queue is full"):
+            controller.acquire("c1", None, Workloads.MUTATIONS)
+
+    def test_role_limit_is_shared_by_role_members(self, admission_config):
+        admission_config.admission.role_limits = {"viewer": WorkloadLimits(interactive=1)}
+        controller = AdmissionController()
+        controller.acquire("c1", _user("viewer"), Workloads.INTERACTIVE).detach()
+
+        with pytest.raises(AdmissionRejected):
+            controller.acquire(
+                "c1",
+                WebUser(username="other", password="x", roles=["viewer"]),
+                Workloads.INTERACTIVE,
+            )
+        controller.acquire("c1", _user("admin"), Workloads.INTERACTIVE).detach()
+
+    def test_most_generous_role_wins(self, admission_config):
+        admission_config.admission.role_limits = {
+            "viewer": WorkloadLimits(interactive=1),
+            "analyst": WorkloadLimits(interactive=None),
+        }
+        controller = AdmissionController()
+        controller.acquire("c1", _user("viewer", "analyst"), Workloads.INTERACTIVE).detach()
+        controller.acquire("c1", _user("viewer", "analyst"), Workloads.INTERACTIVE).detach()
+
+        scopes = {s["scope"] for s in controller.stats()}
+        assert scopes == {"cluster"}
+
+    def test_cluster_override(self, admission_config):
+        admission_config.admission.clusters = {"big": WorkloadLimits(mutations=None)}
+        controller = AdmissionController()
+        for _ in range(5):
+            controller.acquire("big", None, Workloads.MUTATIONS).detach()
+
+    def test_reloaded_limits_resize_existing_bulkheads(self, admission_config):
+        controller = AdmissionController()
+        first = controller.acquire("c1", None, Workloads.MUTATIONS)
+        first.detach()
+
+        admission_config.admission.cluster_limits = WorkloadLimits(mutations=2)
+        controller.acquire("c1", None, Workloads.MUTATIONS).detach()
+        assert controller.stats()[0]["limit"] == 2
+
+        admission_config.admission.cluster_limits = WorkloadLimits(mutations=1)
+        first.release()
+        # Still one slot held, which is the whole lowered limit.
+        with pytest.raises(AdmissionRejected):
+            controller.acquire("c1", None, Workloads.MUTATIONS)
+
+    def test_nested_acquire_on_same_thread_is_reentrant(self, admission_config):
+        controller = AdmissionController()
+        with controller.acquire("c1", None, Workloads.IMPORTS):
+            with controller.acquire("c1", None, Workloads.IMPORTS):
+                pass
+            with controller.acquire("c1", None, Workloads.IMPORTS):
+                pass
+
+    def test_disabled(self, admission_config):
+        admission_config.admission.enabled = False
+        controller = AdmissionController()
+        for _ in range(5):
+            controller.acquire("c1", None, Workloads.MUTATIONS)
+
+
+class TestHoldWhileStreaming:
+    def test_releases_when_exhausted(self, admission_config):
+        controller = AdmissionController()
+        stream = hold_while_streaming(
+            iter(["a", "b"]), controller.acquire("c1", None, Workloads.EXPORTS)
+        )
+
+        with pytest.raises(AdmissionRejected):
+            controller.acquire("c1", None, Workloads.EXPORTS)
+        assert list(stream) == ["a", "b"]
+        controller.acquire("c1", None, Workloads.EXPORTS).release()
+
+    def test_releases_when_never_started(self, admission_config):
+        controller = AdmissionController()
+        stream = hold_while_streaming(
+            iter(["a"]), controller.acquire("c1", None, Workloads.EXPORTS)
+        )
+
+        del stream
+        gc.collect()
+
+        controller.acquire("c1", None, Workloads.EXPORTS).release()
+
+
+class TestExecuteCqlAdmission:
+    @patch("cassanova.core.cql._executor.get_clusters_config")
+    @patch("cassanova.core.cql._executor.check_permission", return_value=True)
+    def test_mutation_rejected_when_limit_reached(self, _perm, mock_config, admission_config):
+        from cassanova.core.cql import _executor
+
+        mock_config.return_value.clusters = {}
+        controller = AdmissionController()
+        controller.acquire("c1", None, Workloads.MUTATIONS).detach()
+        session = MagicMock()
+
+        with patch.object(_executor, "admission_controller", controller):
+            with pytest.raises(AdmissionRejected):
+                _executor.execute_cql(session, "DELETE FROM t WHERE id = 1", "c1", None)
+            _executor.execute_cql(session, "SELECT * FROM t", "c1", None)
+
+        session.execute.assert_called_once()
+
+
+def test_rejection_maps_to_429():
+    app = FastAPI()
+    add_cql_exception_handlers(app)
+    handler = app.exception_handlers[AdmissionRejected]
+
+    response = asyncio.get_event_loop().run_until_complete(
+        handler(MagicMock(), AdmissionRejected("c1", Workloads.EXPORTS, "queue is full", 3))
+    )
+
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "3"
@@ -0,0 +1,128 @@
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+
+from cassanova.api.routes.api.data_routes import get_cell_value, get_table_data
+from cassanova.core.cql.converters import TRUNCATED_MARKER
+
+
+@pytest.fixture
+def session(mock_session, make_table):
+    keyspace = MagicMock()
+    keyspace.tables = {
+        "files": make_table("files", [("id", "int")], [("part", "int")], ["name", ("body", "blob")])
+    }
+    mock_session.cluster.metadata.keyspaces = {"ks": keyspace}
+    return mock_session
+
+
+def _patches(session):
+    return (
+        patch("cassanova.api.routes.api.data_routes.get_session", return_value=session),
+        patch("cassanova.api.routes.api.data_routes.check_query_cost"),
+        patch("cassanova.api.routes.api.data_routes.bind_statement"),
+    )
+
+
+class TestTableDataProjection:
+    def test_projection_keeps_the_primary_key_and_truncates_cells(self, session):
+        row = MagicMock()
+        row._asdict.return_value = {"id": 1, "part": 0, "body": b"\x00" * 4096}
+        session.execute.return_value = MagicMock(current_rows=[row], paging_state=None)
+        get_session, check_cost, bind = _patches(session)
+
+        with get_session, check_cost, bind as bind_statement:
+            result = get_table_data(
+                "c1", "ks", "files", columns="body,id", max_cell_bytes=16, _user=None
+            )
+
+        assert bind_statement.call_args.args[1] == ('SELECT "id", "part", "body" FROM "ks"."files"')
+        body = result["rows"][0]["body"]
+        assert body == {TRUNCATED_MARKER: True, "preview": "00" * 8, "size": 4096}
+
+    def test_truncation_can_be_turned_off_in_the_config(self, session):
+        row = MagicMock()
+        row._asdict.return_value = {"id": 1, "part": 0, "body": b"\x00" * 4096}
+        session.execute.return_value = MagicMock(current_rows=[row], paging_state=None)
+        get_session, check_cost, bind = _patches(session)
+
+        with (
+            get_session,
+            check_cost,
+            bind,
+            patch("cassanova.api.routes.api.data_routes.get_clusters_config") as config,
+        ):
+            config.return_value.browse.max_cell_bytes = None
+            config.return_value.page_cache.enabled = False
+            result = get_table_data("c1", "ks", "files", _user=None)
+
+        assert result["rows"][0]["body"] == "00" * 4096
+
+    def test_unknown_column(self, session):
+        get_session, check_cost, bind = _patches(session)
+
+        with get_session, check_cost, bind, pytest.raises(HTTPException) as exc:
+            get_table_data("c1", "ks", "files", columns="nope", _user=None)
+
+        assert exc.value.status_code == 400
+
+    @pytest.mark.parametrize(
+        ("error", "status_code"),
+        [
+            (RuntimeError("Cannot execute this query ... use ALLOW FILTERING"), 400),
+            (RuntimeError("timed out"), 500),
+        ],
+    )
+    def test_read_errors(self, session, error, status_code):
+        session.execute.side_effect = error
+        get_session, check_cost, bind = _patches(session)
+
+        with get_session, check_cost, bind, pytest.raises(HTTPException) as exc:
+            get_table_data("c1", "ks", "files", _user=None)
+
+        assert exc.value.status_code == status_code
+
+    def test_bad_paging_state(self, session):
+        get_session, check_cost, bind = _patches(session)
+
+        with get_session, check_cost, bind, pytest.raises(HTTPException) as exc:
+            get_table_data("c1", "ks", "files", paging_state="not-hex", _user=None)
+
+        assert exc.value.status_code == 400
+
+
+class TestGetCellValue:
+    def _stream(self, response):
+        async def collect():
+            return b"".join([chunk async for chunk in response.body_iterator])
+
+        return asyncio.get_event_loop().run_until_complete(collect())
+
+    def test_blob_is_streamed_raw(self, session):
+        value = bytes(range(256)) * 1000
+        session.execute.return_value = MagicMock(**{"one.return_value": (value,)})
+        get_session, _, bind = _patches(session)
+
+        with get_session, bind as bind_statement:
+            response = get_cell_value(
+                "c1", "ks", "files", '{"id": "7", "part": "0"}', "body", _user=None
+            )
+            body = self._stream(response)
+
+        assert bind_statement.call_args.args[1:] == (
+            'SELECT "body" FROM "ks"."files" WHERE "id" = ? AND "part" = ?',
+            [7, 0],
+        )
+        assert response.media_type == "application/octet-stream"
+        assert body == value
+
+    def test_missing_row(self, session):
+        session.execute.return_value = MagicMock(**{"one.return_value": None})
+        get_session, _, bind = _patches(session)
+
+        with get_session, bind, pytest.raises(HTTPException) as exc:
+            get_cell_value("c1", "ks", "files", '{"id": 7, "part": 0}', "name", _user=None)
+
+        assert exc.value.status_code == 404
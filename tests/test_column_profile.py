@@ -0,0 +1,193 @@
+from collections import namedtuple
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+
+from cassanova.api.routes.api.cluster_routes import cancel_scan_job, get_scan_job
+from cassanova.api.routes.api.data_routes import start_table_profile
+from cassanova.config.scan_jobs_config import ScanJobsConfig
+from cassanova.consts.scan_jobs import ScanJobKinds, ScanJobStatuses
+from cassanova.core.column_profile import ColumnProfile, TableProfile, profile_table
+from cassanova.core.scan_jobs import ScanJob, ScanJobRegistry, range_statement
+
+Row = namedtuple("Row", ["id", "name", "score"])
+
+
+@pytest.fixture
+def users(make_table):
+    return make_table("users", [("id", "int")], regular=["name", ("score", "double")])
+
+
+def _job(**kwargs):
+    return ScanJob("c1", "alice", ScanJobKinds.PROFILE, "ks", "users", **kwargs)
+
+
+class TestColumnProfile:
+    def test_statistics(self):
+        profile = ColumnProfile("name", "text")
+        profile.update(["bob", None, "alice", "bob"])
+
+        result = profile.to_dict()
+
+        assert result["count"] == 4
+        assert result["null_ratio"] == 0.25
+        assert (result["min"], result["max"]) == ("alice", "bob")
+        assert result["distinct"] == 2
+        assert result["top"][0] == {"value": "bob", "count": 2, "error": 0}
+        assert result["histogram_of"] == "length"
+        assert sum(bucket["count"] for bucket in result["histogram"]) == 3
+
+    def test_merge(self):
+        left, right = ColumnProfile("score", "double"), ColumnProfile("score", "double")
+        left.update([1.5, float("nan")])
+        right.update([-3.0, None])
+
+        left.merge(right)
+        result = left.to_dict()
+
+        assert (result["min"], result["max"]) == (-3.0, 1.5)
+        assert result["nulls"] == 1
+        assert result["histogram_of"] == "value"
+
+    def test_unordered_values_have_no_bounds(self):
+        profile = ColumnProfile("tags", "map<text, int>")
+        profile.update([{"a": 1}, {"b": 2}])
+
+        assert profile.to_dict()["min"] is None
+
+    def test_long_values_are_truncated(self):
+        profile = ColumnProfile("name", "text")
+        profile.update(["x" * 100])
+
+        assert profile.to_dict(max_cell_bytes=10)["max"]["$truncated"] is True
+
+    def test_table_profile_transposes_pages(self, users):
+        profile = TableProfile(users, ["id", "score"])
+        profile.update_rows([Row(1, "a", 2.0), Row(2, "b", None)])
+
+        result = profile.to_dict()
+
+        assert result["rows"] == 2
+        assert [column["nulls"] for column in result["columns"]] == [0, 1]
+
+
+class TestProfileJob:
+    def _session(self, mock_session, pages):
+        mock_session.cluster.metadata.partitioner = "org.apache.cassandra.dht.Murmur3Partitioner"
+        mock_session.execute.side_effect = [
+            MagicMock(current_rows=page, has_more_pages=False) for page in pages
+        ]
+        return mock_session
+
+    def _config(self):
+        config = MagicMock()
+        config.scan_jobs = ScanJobsConfig(token_ranges=2, parallelism=1, max_finished_jobs=1)
+        config.browse.max_cell_bytes = 1024
+        return config
+
+    def test_full_scan_merges_ranges(self, mock_session, users):
+        session = self._session(
+            mock_session, [[Row(1, "a", 1.0), Row(2, None, 2.0)], [Row(3, "a", None)]]
+        )
+        registry = ScanJobRegistry()
+        job = _job()
+
+        with (
+            patch("cassanova.core.scan_jobs.get_clusters_config", return_value=self._config()),
+            patch("cassanova.core.column_profile.get_clusters_config", return_value=self._config()),
+            patch("cassanova.core.scan_jobs.bind_statement") as bind,
+        ):
+            registry._run(job, None, lambda job: profile_table(session, job, None, users))
+
+        assert job.status == ScanJobStatuses.COMPLETED
+        assert (job.ranges_total, job.ranges_done, job.rows_scanned) == (2, 2, 3)
+        assert job.result["rows"] == 3
+        name = job.result["columns"][1]
+        assert (name["column"], name["nulls"], name["distinct"]) == ("name", 1, 1)
+        assert bind.call_args_list[0].args[1] == (
+            'SELECT "id", "name", "score" FROM "ks"."users" WHERE token("id") <= ?'
+        )
+
+    def test_sampled_profile(self, mock_session, users):
+        rows = [{"id": 1, "name": "a", "score": 1.0}]
+        job = _job()
+
+        with (
+            patch("cassanova.core.column_profile.get_clusters_config", return_value=self._config()),
+            patch("cassanova.core.column_profile.sample_rows", return_value=rows) as sample,
+        ):
+            result = profile_table(mock_session, job, None, users, ["name"], sample_points=5)
+
+        assert sample.call_args.args[5:8] == (5, 5, ["name"])
+        assert result["sampled"] is True
+        assert [column["column"] for column in result["columns"]] == ["name"]
+        assert job.ranges_done == job.ranges_total == 1
+
+    def test_cancelled_before_start(self):
+        registry = ScanJobRegistry()
+        job = _job(cancelled=True)
+        work = MagicMock()
+
+        with patch("cassanova.core.scan_jobs.get_clusters_config", return_value=self._config()):
+            registry._run(job, None, work)
+
+        assert job.status == ScanJobStatuses.CANCELLED
+        work.assert_not_called()
+
+    def test_failure_is_reported(self):
+        registry = ScanJobRegistry()
+        job = _job()
+
+        with patch("cassanova.core.scan_jobs.get_clusters_config", return_value=self._config()):
+            registry._run(job, None, MagicMock(side_effect=RuntimeError("boom")))
+
+        assert job.status == ScanJobStatuses.FAILED
+        assert job.error == "boom"
+
+
+def test_range_statement_with_both_bounds(users):
+    query, values = range_statement("ks", users, (-5, 5), ["id"])
+
+    assert query == 'SELECT "id" FROM "ks"."users" WHERE token("id") > ? AND token("id") <= ?'
+    assert values == [-5, 5]
+
+
+class TestProfileRoutes:
+    def test_start_submits_a_job(self, mock_session, users):
+        keyspace = MagicMock()
+        keyspace.tables = {"users": users}
+        mock_session.cluster.metadata.keyspaces = {"ks": keyspace}
+
+        with (
+            patch("cassanova.api.routes.api.data_routes.get_session", return_value=mock_session),
+            patch("cassanova.api.routes.api.data_routes.scan_jobs") as registry,
+        ):
+            result = start_table_profile("c1", "ks", "users", columns="name", _user=None)
+
+        job = registry.submit.call_args.args[0]
+        assert result["job"]["status"] == ScanJobStatuses.QUEUED
+        assert job.parameters["columns"] == ["name"]
+
+    def test_invalid_sample(self, mock_session, users):
+        keyspace = MagicMock()
+        keyspace.tables = {"users": users}
+        mock_session.cluster.metadata.keyspaces = {"ks": keyspace}
+
+        with (
+            patch("cassanova.api.routes.api.data_routes.get_session", return_value=mock_session),
+            pytest.raises(HTTPException) as exc,
+        ):
+            start_table_profile("c1", "ks", "users", sample_points=0, _user=None)
+
+        assert exc.value.status_code == 400
+
+    def test_job_routes(self):
+        job = _job(result={"min": b"\x01"})
+
+        with patch("cassanova.api.routes.api.cluster_routes.scan_jobs") as registry:
+            registry.get.return_value = job
+            registry.cancel.return_value = None
+            assert get_scan_job("c1", job.job_id, _user=None)["job"]["result"] == {"min": "01"}
+            with pytest.raises(HTTPException):
+                cancel_scan_job("c1", "missing", _user=None)
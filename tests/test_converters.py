@@ -3,7 +3,7 @@ from uuid import UUID
 
 import pytest
 
-from cassanova.core.cql.converters import convert_value_for_cql
+from cassanova.core.cql.converters import TRUNCATED_MARKER, convert_value_for_cql, truncate_cell
 
 
 class TestNullAndEmpty:
@@ -254,3 +254,22 @@ class TestDefaultFallthrough:
 
     def test_varchar_returns_unchanged(self):
         assert convert_value_for_cql("test", "varchar") == "test"
+
+
+class TestTruncateCell:
+    def test_small_values_are_unchanged(self):
+        assert truncate_cell("short", 10) == "short"
+        assert truncate_cell(b"\x01\x02", 4) == b"\x01\x02"
+        assert truncate_cell(12345678901234, 4) == 12345678901234
+
+    def test_text_preview_is_cut_on_a_character_boundary(self):
+        result = truncate_cell("héllo wörld", 2)
+        assert result == {TRUNCATED_MARKER: True, "preview": "h", "size": 13}
+
+    def test_blob_preview_is_hex_within_the_cap(self):
+        result = truncate_cell(bytes(range(100)), 8)
+        assert result == {TRUNCATED_MARKER: True, "preview": "00010203", "size": 100}
+
+    @pytest.mark.parametrize("max_bytes", [None, 0])
+    def test_disabled(self, max_bytes):
+        assert truncate_cell("x" * 10_000, max_bytes) == "x" * 10_000
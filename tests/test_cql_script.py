@@ -0,0 +1,195 @@
+from threading import Barrier, Lock
+from time import sleep
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from cassanova.core.cql.script_runner import (
+    StatementResult,
+    _groups,
+    _statement_kind,
+    run_script,
+)
+from cassanova.core.cql.script_splitter import split_statements
+
+
+class TestSplitStatements:
+    def test_splits_on_semicolons(self):
+        assert split_statements("SELECT 1; SELECT 2;\nSELECT 3") == [
+            "SELECT 1",
+            "SELECT 2",
+            "SELECT 3",
+        ]
+
+    def test_ignores_semicolons_in_literals(self):
+        script = (
+            "INSERT INTO t (a, b) VALUES ('x;y', 'it''s;');"
+            'SELECT "odd;name" FROM t;'
+            "CREATE FUNCTION f() RETURNS int LANGUAGE java AS $$ return 1; $$"
+        )
+        assert split_statements(script) == [
+            "INSERT INTO t (a, b) VALUES ('x;y', 'it''s;')",
+            'SELECT "odd;name" FROM t',
+            "CREATE FUNCTION f() RETURNS int LANGUAGE java AS $$ return 1; $$",
+        ]
+
+    def test_drops_comments(self):
+        script = """
+            -- create things; carefully
+            CREATE TABLE ks.t (id int PRIMARY KEY); // trailing; comment
+            /* block; comment */ INSERT INTO ks.t (id) VALUES (1);
+        """
+        assert split_statements(script) == [
+            "CREATE TABLE ks.t (id int PRIMARY KEY)",
+            "INSERT INTO ks.t (id) VALUES (1)",
+        ]
+
+    def test_keeps_batch_together(self):
+        script = """
+            BEGIN UNLOGGED BATCH
+              INSERT INTO ks.t (id) VALUES (1);
+              INSERT INTO ks.t (id) VALUES (2);
+            APPLY BATCH;
+            SELECT * FROM ks.t;
+        """
+        statements = split_statements(script)
+
+        assert len(statements) == 2
+        assert statements[0].startswith("BEGIN UNLOGGED BATCH")
+        assert statements[0].endswith("APPLY BATCH")
+        assert statements[1] == "SELECT * FROM ks.t"
+
+    @pytest.mark.parametrize("script", ["SELECT 'oops", "SELECT 1 /* never closed", "$$ body"])
+    def test_unterminated_literals_raise(self, script):
+        with pytest.raises(ValueError):
+            split_statements(script)
+
+
+def _rows(columns=None):
+    rows = MagicMock()
+    rows.column_names = columns
+    rows.current_rows = []
+    rows.response_future.is_schema_agreed = True
+    return rows
+
+
+class TestRunScript:
+    def test_dml_runs_concurrently(self, mock_session):
+        barrier = Barrier(2, timeout=5)
+
+        def _execute(*_args, **_kwargs):
+            barrier.wait()
+            return _rows()
+
+        with patch("cassanova.core.cql.script_runner.execute_cql", side_effect=_execute):
+            result = run_script(
+                mock_session,
+                ["INSERT INTO ks.a (id) VALUES (1)", "UPDATE ks.b SET v = 1 WHERE id = 1"],
+                "c1",
+                None,
+                consistency_level=1,
+            )
+
+        assert [s.status for s in result.statements] == ["ok", "ok"]
+
+    def test_writes_to_the_same_table_keep_script_order(self, mock_session):
+        table: dict[int, str] = {}
+
+        def _execute(_session, statement, *_args, **_kwargs):
+            if statement.query_string.startswith("INSERT"):
+                # A slow insert would lose the race against the delete.
+                sleep(0.05)
+                table[1] = "a"
+            else:
+                table.pop(1, None)
+            return _rows()
+
+        script = [
+            "INSERT INTO ks.users (id, name) VALUES (1, 'a')",
+            "DELETE FROM KS.Users WHERE id = 1",
+        ]
+        with patch("cassanova.core.cql.script_runner.execute_cql", side_effect=_execute):
+            result = run_script(mock_session, script, "c1", None, consistency_level=1)
+
+        assert [s.status for s in result.statements] == ["ok", "ok"]
+        assert table == {}
+
+    def test_window_grouping(self):
+        statements = [
+            "INSERT INTO ks.a (id) VALUES (1)",
+            "INSERT INTO ks.b (id) VALUES (1)",
+            "SELECT * FROM ks.a",
+            "UPDATE ks.a SET v = 1 WHERE id = 1",
+            "BEGIN BATCH INSERT INTO ks.b (id) VALUES (2); DELETE FROM ks.c WHERE id = 1; "
+            "APPLY BATCH",
+            "DELETE v FROM ks.c WHERE id = 2",
+            "INSERT INTO ks.d (id) VALUES (1)",
+        ]
+        results = [
+            StatementResult(i, cql, _statement_kind(cql)) for i, cql in enumerate(statements)
+        ]
+
+        groups = [[r.index for r in group] for group in _groups(results)]
+
+        assert groups == [[0, 1], [2], [3, 4], [5, 6]]
+
+    def test_ddl_is_a_barrier(self, mock_session):
+        events: list[str] = []
+        lock = Lock()
+
+        def _execute(_session, statement, *_args, **_kwargs):
+            with lock:
+                events.append(statement.query_string)
+            return _rows()
+
+        script = ["INSERT a", "INSERT b", "CREATE TABLE ks.t (id int PRIMARY KEY)", "INSERT c"]
+        with patch("cassanova.core.cql.script_runner.execute_cql", side_effect=_execute):
+            result = run_script(mock_session, script, "c1", None, consistency_level=1)
+
+        assert set(events[:2]) == {"INSERT a", "INSERT b"}
+        assert events[2:] == script[2:]
+        assert result.statements[2].kind == "ddl"
+        assert result.statements[2].schema_agreed is True
+
+    def test_waits_for_schema_agreement_when_driver_did_not(self, mock_session):
+        rows = _rows()
+        rows.response_future.is_schema_agreed = False
+        mock_session.cluster.control_connection.wait_for_schema_agreement.return_value = False
+
+        with patch("cassanova.core.cql.script_runner.execute_cql", return_value=rows):
+            result = run_script(mock_session, ["DROP TABLE ks.t"], "c1", None, 1)
+
+        assert result.statements[0].schema_agreed is False
+        mock_session.cluster.control_connection.wait_for_schema_agreement.assert_called_once()
+
+    def test_stop_on_error_skips_later_statements(self, mock_session):
+        def _execute(_session, statement, *_args, **_kwargs):
+            if statement.query_string.startswith("CREATE"):
+                raise RuntimeError("already exists")
+            return _rows()
+
+        script = ["CREATE TABLE ks.t (id int PRIMARY KEY)", "INSERT a"]
+        with patch("cassanova.core.cql.script_runner.execute_cql", side_effect=_execute):
+            result = run_script(mock_session, script, "c1", None, 1)
+
+        assert [s.status for s in result.statements] == ["error", "skipped"]
+        assert result.to_dict()["failed"] == 1
+        assert result.to_dict()["skipped"] == 1
+
+    def test_continues_past_errors_when_asked(self, mock_session):
+        with patch(
+            "cassanova.core.cql.script_runner.execute_cql", return_value=_rows(["id"])
+        ) as execute:
+            result = run_script(
+                mock_session, ["USE ks", "SELECT id FROM t"], "c1", None, 1, stop_on_error=False
+            )
+
+        assert [s.status for s in result.statements] == ["error", "ok"]
+        assert result.statements[1].rows == []
+        execute.assert_called_once()
+
+    def test_rejects_oversized_scripts(self, mock_session):
+        with patch("cassanova.core.cql.script_runner.get_clusters_config") as config:
+            config.return_value.cqlsh.max_script_statements = 1
+            with pytest.raises(ValueError):
+                run_script(mock_session, ["SELECT 1", "SELECT 2"], "c1", None, 1)
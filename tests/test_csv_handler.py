@@ -181,7 +181,7 @@ class TestIterJsonRows:
 
     def test_rejects_non_array_root_when_starts_with_bracket(self):
         # Edge case: starts with '[' but not a valid array of objects
-        content = b'[1, 2, 3]'
+        content = b"[1, 2, 3]"
 
         with pytest.raises(ValueError, match="must be an object"):
             list(_iter_json_rows(content))
@@ -230,7 +230,8 @@ class TestGenerateCsvStream:
         session = MagicMock()
         result_set = MagicMock()
         result_set.column_names = ["id", "name"]
-        result_set.__iter__ = MagicMock(return_value=iter([]))
+        result_set.current_rows = []
+        result_set.has_more_pages = False
         session.execute.return_value = result_set
 
         rows = list(generate_csv_stream(session, "SELECT * FROM t"))
@@ -245,7 +246,8 @@ class TestGenerateCsvStream:
         headers = ["id", "name"]
         result_set.column_names = headers
         data_row = self._make_row(headers, [1, "alice"])
-        result_set.__iter__ = MagicMock(return_value=iter([data_row]))
+        result_set.current_rows = [data_row]
+        result_set.has_more_pages = False
         session.execute.return_value = result_set
 
         rows = list(generate_csv_stream(session, "SELECT * FROM t"))
@@ -261,7 +263,8 @@ class TestGenerateCsvStream:
         result_set.column_names = headers
         dt = datetime(2025, 6, 15, 12, 30, 0)
         data_row = self._make_row(headers, [1, dt])
-        result_set.__iter__ = MagicMock(return_value=iter([data_row]))
+        result_set.current_rows = [data_row]
+        result_set.has_more_pages = False
         session.execute.return_value = result_set
 
         rows = list(generate_csv_stream(session, "SELECT * FROM t"))
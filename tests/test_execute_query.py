@@ -1,26 +1,81 @@
+import asyncio
+import json
 from collections import namedtuple
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
+import pytest
 from cassandra import ConsistencyLevel, InvalidRequest
 from cassandra.cluster import NoHostAvailable
 from cassandra.protocol import SyntaxException
-
-from cassanova.core.cql.execute_query import execute_query_cql, get_trace_info
+from fastapi import FastAPI, HTTPException
+
+from cassanova.api.exception_handlers.cql_handler import add_cql_exception_handlers
+from cassanova.api.routes.api.tools_routes import export_cqlsh_query, run_cqlsh
+from cassanova.config.cassanova_config import get_clusters_config
+from cassanova.core.cql.execute_query import execute_query_cql
+from cassanova.core.cql.query_trace import format_trace
+from cassanova.exceptions.cql_exceptions import QueryCancelled
 from cassanova.models.cql_query import CQLQuery
 
 Row = namedtuple("Row", ["id", "name"])
 
 
-def _make_query(cql="SELECT * FROM ks.tbl", cl=ConsistencyLevel.QUORUM, tracing=False):
-    return CQLQuery(cql=cql, cl=cl, enable_tracing=tracing)
+def _make_query(cql="SELECT * FROM ks.tbl", cl=ConsistencyLevel.QUORUM, tracing=False, **kw):
+    return CQLQuery(cql=cql, cl=cl, enable_tracing=tracing, **kw)
+
+
+def _result_set(rows, paging_state=None):
+    result_set = MagicMock()
+    result_set.current_rows = rows
+    result_set.paging_state = paging_state
+    return result_set
 
 
 class TestExecuteQueryCql:
     def test_successful_query(self, mock_session):
-        mock_session.execute.return_value = [Row(id=1, name="alice")]
+        mock_session.execute.return_value = _result_set([Row(id=1, name="alice")])
         result = execute_query_cql(mock_session, _make_query())
         assert "result" in result
         assert result["result"][0]["id"] == 1
+        assert result["next_paging_state"] is None
+
+    def test_returns_first_page_and_paging_state(self, mock_session):
+        mock_session.execute.return_value = _result_set([Row(id=1, name="a")], b"\x01\x02")
+
+        result = execute_query_cql(mock_session, _make_query())
+
+        assert result["next_paging_state"] == "0102"
+        assert len(result["result"]) == 1
+        mock_session.execute.return_value.__iter__.assert_not_called()
+
+    def test_tracing_returns_trace_id_without_fetching_trace(self, mock_session):
+        result_set = _result_set([Row(id=1, name="a")])
+        result_set.response_future.get_query_trace_ids.return_value = ["1234"]
+        mock_session.execute.return_value = result_set
+
+        result = execute_query_cql(mock_session, _make_query(tracing=True))
+
+        assert result["result"]["trace_id"] == "1234"
+        assert result["result"]["result"] == [{"id": 1, "name": "a"}]
+        assert mock_session.execute.call_args.kwargs["trace"] is True
+        result_set.get_query_trace.assert_not_called()
+
+    def test_resumes_from_paging_state(self, mock_session):
+        mock_session.execute.return_value = _result_set([])
+
+        execute_query_cql(mock_session, _make_query(paging_state="0102", page_size=20))
+
+        statement = mock_session.execute.call_args.args[0]
+        assert statement.fetch_size == 20
+        assert mock_session.execute.call_args.kwargs["paging_state"] == b"\x01\x02"
+
+    def test_page_size_is_capped(self, mock_session):
+        mock_session.execute.return_value = _result_set([])
+
+        execute_query_cql(mock_session, _make_query(page_size=10**6))
+
+        statement = mock_session.execute.call_args.args[0]
+        assert statement.fetch_size == get_clusters_config().cqlsh.max_page_size
 
     def test_syntax_error_returns_string(self, mock_session):
         mock_session.execute.side_effect = SyntaxException(
@@ -44,7 +99,7 @@ class TestExecuteQueryCql:
         """When a table name has wrong case, it should retry with the correct case."""
         mock_session.execute.side_effect = [
             InvalidRequest("unconfigured table mytable"),
-            [Row(id=1, name="test")],
+            _result_set([Row(id=1, name="test")]),
         ]
 
         ks_meta = MagicMock()
@@ -71,11 +126,40 @@ class TestExecuteQueryCql:
         assert "unexpected" in result
 
 
-class TestGetTraceInfo:
+class TestRunCqlsh:
+    def test_cancelled_query_is_a_409(self, mock_session):
+        with (
+            patch("cassanova.api.routes.api.tools_routes.get_session", return_value=mock_session),
+            patch("cassanova.api.routes.api.tools_routes.check_query_cost"),
+            patch("cassanova.core.cql.execute_query.execute_cql", side_effect=QueryCancelled("q1")),
+            pytest.raises(QueryCancelled) as exc_info,
+        ):
+            run_cqlsh("c1", _make_query(), _user=None)
+
+        app = FastAPI()
+        add_cql_exception_handlers(app)
+        handler = app.exception_handlers[QueryCancelled]
+        response = asyncio.get_event_loop().run_until_complete(handler(None, exc_info.value))
+        assert response.status_code == 409
+        assert json.loads(response.body)["query_id"] == "q1"
+
+    def test_invalid_paging_state_is_a_400(self, mock_session):
+        with (
+            patch("cassanova.api.routes.api.tools_routes.get_session", return_value=mock_session),
+            pytest.raises(HTTPException) as exc_info,
+        ):
+            run_cqlsh("c1", _make_query(paging_state="not-hex"), _user=None)
+
+        assert exc_info.value.status_code == 400
+        mock_session.execute.assert_not_called()
+
+
+class TestFormatTrace:
     def test_extracts_trace_info(self):
         mock_event = MagicMock()
         mock_event.description = "Reading data"
         mock_event.source = "10.0.0.1"
+        mock_event.thread_name = "ReadStage-1"
         mock_event.source_elapsed.total_seconds.return_value = 0.005
 
         mock_trace = MagicMock()
@@ -85,10 +169,7 @@ class TestGetTraceInfo:
         mock_trace.parameters = {"query": "SELECT *"}
         mock_trace.events = [mock_event]
 
-        mock_result_set = MagicMock()
-        mock_result_set.get_query_trace.return_value = mock_trace
-
-        info = get_trace_info(mock_result_set)
+        info = format_trace(mock_trace)
 
         assert info["request_type"] == "Execute CQL3 query"
         assert info["duration_ms"] == 5.0
@@ -99,6 +180,7 @@ class TestGetTraceInfo:
         mock_event = MagicMock()
         mock_event.description = "test"
         mock_event.source = "10.0.0.1"
+        mock_event.thread_name = "ReadStage-1"
         mock_event.source_elapsed.total_seconds.return_value = 0.010
 
         mock_trace = MagicMock()
@@ -108,8 +190,58 @@ class TestGetTraceInfo:
         mock_trace.parameters = {}
         mock_trace.events = [mock_event]
 
-        mock_result_set = MagicMock()
-        mock_result_set.get_query_trace.return_value = mock_trace
-
-        info = get_trace_info(mock_result_set)
+        info = format_trace(mock_trace)
         assert info["duration_ms"] == 10.0
+
+
+async def _collect(body_iterator):
+    return [chunk async for chunk in body_iterator]
+
+
+class TestCqlshExport:
+    @pytest.fixture
+    def controller(self):
+        with patch("cassanova.api.routes.api.tools_routes.admission_controller") as controller:
+            yield controller
+
+    @staticmethod
+    def _export(session, cql, **kw):
+        user = MagicMock(username="admin", roles=["admin"])
+        with patch("cassanova.api.routes.api.tools_routes.get_session", return_value=session):
+            return export_cqlsh_query("c1", _make_query(cql), _user=user, **kw)
+
+    @pytest.mark.usefixtures("controller")
+    def test_rejects_non_select(self, mock_session):
+        with pytest.raises(HTTPException) as exc_info:
+            self._export(mock_session, "DELETE FROM ks.tbl WHERE id = 1")
+        assert exc_info.value.status_code == 400
+
+    @pytest.mark.usefixtures("controller")
+    def test_streams_every_page(self, mock_session):
+        rows = MagicMock()
+        mock_session.execute.return_value = rows
+        rows.column_names = ["id", "name"]
+        rows.current_rows = [Row(id=1, name="a")]
+        rows.has_more_pages = True
+
+        def _last_page():
+            rows.current_rows = [Row(id=2, name="b")]
+            rows.has_more_pages = False
+
+        rows.fetch_next_page.side_effect = _last_page
+
+        response = self._export(mock_session, "SELECT * FROM ks.tbl;", format="json")
+        lines = asyncio.get_event_loop().run_until_complete(_collect(response.body_iterator))
+
+        assert [json.loads(line)["id"] for line in lines] == [1, 2]
+        assert mock_session.execute.call_args.args[0].query_string == "SELECT * FROM ks.tbl"
+
+    def test_query_error_is_reported_and_releases_slot(self, mock_session, controller):
+        mock_session.execute.side_effect = InvalidRequest("unconfigured table tbl")
+
+        with pytest.raises(HTTPException) as exc_info:
+            self._export(mock_session, "SELECT * FROM ks.tbl")
+
+        assert exc_info.value.status_code == 400
+        assert "unconfigured table" in exc_info.value.detail
+        controller.acquire.return_value.release.assert_called_once()
@@ -0,0 +1,120 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from cassandra import ConsistencyLevel
+from cassandra.cluster import EXEC_PROFILE_DEFAULT, Cluster
+from cassandra.policies import (
+    DCAwareRoundRobinPolicy,
+    FallthroughRetryPolicy,
+    RoundRobinPolicy,
+    TokenAwarePolicy,
+)
+
+from cassanova.api.dependencies.csv_handler import generate_json_stream
+from cassanova.config.cluster_config import ClusterConnectionConfig, generate_cluster_connection
+from cassanova.config.execution_profiles_config import (
+    ExecutionProfilesConfig,
+    ExecutionProfileSettings,
+)
+from cassanova.config.timeouts_config import TimeoutConfig
+from cassanova.consts.execution_profiles import ExecutionProfiles
+from cassanova.core.speculative_execution import ConstantSpeculativeExecution
+
+
+def _profiles(config: ClusterConnectionConfig, timeouts: TimeoutConfig | None = None) -> dict:
+    with patch("cassanova.config.cluster_config.Cluster") as mock_cluster:
+        generate_cluster_connection(config, timeouts or TimeoutConfig())
+    return mock_cluster.call_args.kwargs
+
+
+class TestExecutionProfileSettings:
+    def test_consistency_level_is_normalised(self):
+        assert ExecutionProfileSettings(consistency_level="local_one").consistency_level == (
+            "LOCAL_ONE"
+        )
+
+    def test_rejects_unknown_consistency_level(self):
+        with pytest.raises(ValueError):
+            ExecutionProfileSettings(consistency_level="SOMETIMES")
+
+
+class TestGenerateExecutionProfiles:
+    def test_registers_named_profiles(self):
+        kwargs = _profiles(ClusterConnectionConfig(contact_points=["127.0.0.1"]))
+
+        assert set(kwargs["execution_profiles"]) == {
+            EXEC_PROFILE_DEFAULT,
+            ExecutionProfiles.INTERACTIVE,
+            ExecutionProfiles.BULK,
+            ExecutionProfiles.METADATA,
+        }
+        assert "load_balancing_policy" not in kwargs
+        assert "default_retry_policy" not in kwargs
+
+    def test_profile_timeouts_and_consistency(self):
+        timeouts = TimeoutConfig(interactive=3, batch=90, metadata=4)
+        profiles = _profiles(ClusterConnectionConfig(contact_points=["127.0.0.1"]), timeouts)[
+            "execution_profiles"
+        ]
+
+        interactive = profiles[ExecutionProfiles.INTERACTIVE]
+        assert interactive.request_timeout == 3
+        assert interactive.consistency_level == ConsistencyLevel.LOCAL_ONE
+        assert isinstance(interactive.speculative_execution_policy, ConstantSpeculativeExecution)
+        assert profiles[ExecutionProfiles.BULK].request_timeout == 90
+        assert profiles[ExecutionProfiles.METADATA].request_timeout == 4
+        assert profiles[ExecutionProfiles.METADATA].consistency_level == ConsistencyLevel.ONE
+
+    def test_settings_override_timeout(self):
+        config = ClusterConnectionConfig(
+            contact_points=["127.0.0.1"],
+            execution_profiles=ExecutionProfilesConfig(
+                bulk=ExecutionProfileSettings(request_timeout=600)
+            ),
+        )
+        profiles = _profiles(config)["execution_profiles"]
+
+        assert profiles[ExecutionProfiles.BULK].request_timeout == 600
+
+    def test_local_dc_builds_token_aware_policy_per_profile(self):
+        config = ClusterConnectionConfig(contact_points=["127.0.0.1"], local_dc="dc1")
+        profiles = _profiles(config)["execution_profiles"]
+
+        policies = [p.load_balancing_policy for p in profiles.values()]
+        assert all(isinstance(p, TokenAwarePolicy) for p in policies)
+        assert all(isinstance(p._child_policy, DCAwareRoundRobinPolicy) for p in policies)
+        assert len({id(p) for p in policies}) == len(policies)
+
+    def test_legacy_kwargs_are_folded_into_profiles(self):
+        lbp, retry = RoundRobinPolicy(), FallthroughRetryPolicy()
+        config = ClusterConnectionConfig(
+            contact_points=["127.0.0.1"],
+            additional_kwargs={"load_balancing_policy": lbp, "default_retry_policy": retry},
+        )
+        kwargs = _profiles(config)
+
+        assert "load_balancing_policy" not in kwargs
+        for profile in kwargs["execution_profiles"].values():
+            assert profile.load_balancing_policy is lbp
+            assert profile.retry_policy is retry
+
+    def test_cluster_accepts_generated_profiles(self):
+        config = ClusterConnectionConfig(contact_points=["127.0.0.1"], local_dc="dc1")
+        cluster = generate_cluster_connection(config, TimeoutConfig())
+
+        assert cluster.profile_manager.profiles[ExecutionProfiles.BULK].request_timeout == 120
+        assert isinstance(cluster, Cluster)
+
+
+class TestBulkExport:
+    def test_stream_uses_bulk_profile_and_fetch_size(self):
+        session = MagicMock()
+        session.execute.return_value.column_names = []
+        session.execute.return_value.current_rows = []
+        session.execute.return_value.has_more_pages = False
+
+        list(generate_json_stream(session, "SELECT * FROM t", fetch_size=5000))
+
+        statement = session.execute.call_args.args[0]
+        assert statement.fetch_size == 5000
+        assert session.execute.call_args.kwargs["execution_profile"] == ExecutionProfiles.BULK
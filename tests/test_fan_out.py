@@ -0,0 +1,119 @@
+from collections import namedtuple
+from threading import Event, Lock
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from cassanova.config.fan_out_config import FanOutConfig
+from cassanova.core.cql.fan_out import fan_out_query, select_clusters
+
+Row = namedtuple("Row", ["release_version"])
+
+
+@pytest.fixture
+def fan_out_config():
+    config = MagicMock()
+    config.clusters = {name: MagicMock() for name in ("prod-eu", "prod-us", "staging")}
+    config.fan_out = FanOutConfig(max_parallelism=4, cluster_deadline_seconds=5)
+    with (
+        patch("cassanova.core.cql.fan_out.get_clusters_config", return_value=config),
+        patch("cassanova.core.cql.fan_out.session_manager") as manager,
+    ):
+        manager.get_session.side_effect = lambda name, _config: name
+        yield config
+
+
+def _rows(version="5.0"):
+    rows = MagicMock()
+    rows.current_rows = [Row(version)]
+    rows.has_more_pages = False
+    return rows
+
+
+@pytest.mark.usefixtures("fan_out_config")
+class TestSelectClusters:
+    def test_glob_pattern(self):
+        assert select_clusters([], "prod-*") == ["prod-eu", "prod-us"]
+
+    def test_list_and_pattern_are_merged_without_duplicates(self):
+        assert select_clusters(["staging", "prod-us"], "prod-*") == [
+            "staging",
+            "prod-us",
+            "prod-eu",
+        ]
+
+
+@pytest.mark.usefixtures("fan_out_config")
+class TestFanOutQuery:
+    def test_results_are_tagged_per_cluster(self):
+        with patch("cassanova.core.cql.fan_out.execute_cql", return_value=_rows()) as execute:
+            results = list(
+                fan_out_query(["prod-eu", "prod-us"], "SELECT * FROM system.local", None, 1)
+            )
+
+        assert {r["cluster"] for r in results} == {"prod-eu", "prod-us"}
+        assert all(r["status"] == "ok" for r in results)
+        assert results[0]["rows"] == [{"release_version": "5.0"}]
+        assert execute.call_count == 2
+
+    def test_errors_are_isolated(self):
+        def _execute(session, *_args, **_kwargs):
+            if session == "prod-us":
+                raise RuntimeError("unavailable")
+            return _rows()
+
+        with patch("cassanova.core.cql.fan_out.execute_cql", side_effect=_execute):
+            results = {
+                r["cluster"]: r
+                for r in fan_out_query(["prod-eu", "prod-us", "missing"], "SELECT 1", None, 1)
+            }
+
+        assert results["prod-eu"]["status"] == "ok"
+        assert results["prod-us"]["status"] == "error"
+        assert results["prod-us"]["error"] == "unavailable"
+        assert results["missing"]["error"] == "Cluster not found"
+
+    def test_slow_cluster_times_out_without_blocking_others(self):
+        release = Event()
+
+        def _execute(session, *_args, **_kwargs):
+            if session == "staging":
+                release.wait(5)
+            return _rows()
+
+        with patch("cassanova.core.cql.fan_out.execute_cql", side_effect=_execute):
+            results = list(
+                fan_out_query(["staging", "prod-eu"], "SELECT 1", None, 1, deadline_seconds=0.3)
+            )
+        release.set()
+
+        assert [r["cluster"] for r in results] == ["prod-eu", "staging"]
+        assert results[1]["status"] == "timeout"
+
+    def test_deadline_is_capped_by_config(self):
+        with patch("cassanova.core.cql.fan_out.execute_cql", return_value=_rows()) as execute:
+            list(fan_out_query(["staging"], "SELECT 1", None, 1, deadline_seconds=3600))
+
+        assert execute.call_args.kwargs["timeout"] <= 5
+
+    def test_parallelism_is_bounded(self):
+        lock = Lock()
+        running = peak = 0
+
+        def _execute(*_args, **_kwargs):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            Event().wait(0.05)
+            with lock:
+                running -= 1
+            return _rows()
+
+        with patch("cassanova.core.cql.fan_out.execute_cql", side_effect=_execute):
+            results = list(
+                fan_out_query(["prod-eu", "prod-us", "staging"], "SELECT 1", None, 1, parallelism=1)
+            )
+
+        assert len(results) == 3
+        assert peak == 1
@@ -0,0 +1,164 @@
+from collections import namedtuple
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+
+from cassanova.api.routes.api.cluster_routes import get_node_view, get_settings_drift
+from cassanova.consts.node_views import NodeViews
+from cassanova.core.cql.node_queries import (
+    NodeQueryCache,
+    NodeResult,
+    NodeTable,
+    merge_node_rows,
+)
+from cassanova.core.node_views import node_view, settings_drift
+from cassanova.exceptions.system_views_unavailable import SystemViewsUnavailableException
+
+SettingRow = namedtuple("SettingRow", ["name", "value"])
+PoolRow = namedtuple("PoolRow", ["name", "active_tasks", "pending_tasks"])
+
+
+def _result(address, rows=(), error=None):
+    return NodeResult(MagicMock(address=address), list(rows), error)
+
+
+def _settings(**nodes):
+    return NodeTable(
+        rows=[
+            {"node": node, "name": name, "value": value}
+            for node, settings in nodes.items()
+            for name, value in settings.items()
+        ],
+        errors={},
+        nodes=list(nodes),
+    )
+
+
+class TestMergeNodeRows:
+    def test_tags_rows_with_their_node(self):
+        table = merge_node_rows(
+            [
+                _result("10.0.0.1", [PoolRow("ReadStage", 2, 0)]),
+                _result("10.0.0.2", [PoolRow("ReadStage", 0, 7)]),
+                _result("10.0.0.3", error="Node is down"),
+                _result("10.0.0.4"),
+            ]
+        )
+
+        assert table.rows == [
+            {"node": "10.0.0.1", "name": "ReadStage", "active_tasks": 2, "pending_tasks": 0},
+            {"node": "10.0.0.2", "name": "ReadStage", "active_tasks": 0, "pending_tasks": 7},
+        ]
+        assert table.errors == {"10.0.0.3": "Node is down"}
+        # A node that answered without rows is still one of the nodes.
+        assert table.nodes == ["10.0.0.1", "10.0.0.2", "10.0.0.4"]
+
+
+class TestNodeQueryCache:
+    def test_cached_per_query_until_refreshed(self, mock_session):
+        cache = NodeQueryCache()
+        with patch(
+            "cassanova.core.cql.node_queries.query_nodes", return_value=[_result("a")]
+        ) as query:
+            first = cache.get(mock_session, "c1", "SELECT * FROM system_views.caches")
+            assert cache.get(mock_session, "c1", "SELECT * FROM system_views.caches") is first
+            assert query.call_count == 1
+
+            cache.get(mock_session, "c1", "SELECT * FROM system_views.clients")
+            assert query.call_count == 2
+
+            cache.get(mock_session, "c1", "SELECT * FROM system_views.caches", refresh=True)
+            assert query.call_count == 3
+
+    def test_invalidate(self, mock_session):
+        cache = NodeQueryCache()
+        with patch(
+            "cassanova.core.cql.node_queries.query_nodes", return_value=[_result("a")]
+        ) as query:
+            cache.get(mock_session, "c1", "SELECT * FROM system_views.caches")
+            cache.invalidate("c1")
+            cache.get(mock_session, "c1", "SELECT * FROM system_views.caches")
+
+        assert query.call_count == 2
+
+
+class TestNodeView:
+    def test_reads_the_view_from_every_node(self, mock_session):
+        with patch("cassanova.core.node_views.node_query_cache") as cache:
+            cache.get.return_value = NodeTable([], {})
+            node_view(mock_session, "c1", NodeViews.THREAD_POOLS, refresh=True)
+
+        cache.get.assert_called_once_with(
+            mock_session, "c1", "SELECT * FROM system_views.thread_pools", refresh=True
+        )
+
+    def test_unknown_view(self, mock_session):
+        with pytest.raises(ValueError):
+            node_view(mock_session, "c1", "local; DROP TABLE x")
+
+    def test_no_system_views_keyspace(self, mock_session):
+        missing = "Keyspace system_views does not exist"
+        with patch("cassanova.core.node_views.node_query_cache") as cache:
+            cache.get.return_value = NodeTable([], {"a": missing, "b": missing})
+            with pytest.raises(SystemViewsUnavailableException):
+                node_view(mock_session, "c1", NodeViews.SETTINGS)
+
+    def test_failed_nodes_are_reported_not_raised(self, mock_session):
+        table = NodeTable([{"node": "a", "name": "x", "value": "1"}], {"b": "timed out"})
+        with patch("cassanova.core.node_views.node_query_cache") as cache:
+            cache.get.return_value = table
+            assert node_view(mock_session, "c1", NodeViews.SETTINGS) is table
+
+
+class TestSettingsDrift:
+    def test_only_differing_settings(self):
+        table = _settings(
+            a={"concurrent_reads": "32", "cluster_name": "prod"},
+            b={"concurrent_reads": "64", "cluster_name": "prod"},
+        )
+
+        assert settings_drift(table) == {"concurrent_reads": {"a": "32", "b": "64"}}
+
+    def test_setting_missing_on_a_node(self):
+        table = _settings(a={"cdc_enabled": "false", "x": "1"}, b={"x": "1"})
+
+        assert settings_drift(table) == {"cdc_enabled": {"a": "false", "b": None}}
+
+    def test_node_reporting_no_settings(self):
+        table = _settings(a={"x": "1"}, b={})
+
+        assert settings_drift(table) == {"x": {"a": "1", "b": None}}
+
+
+class TestNodeViewRoutes:
+    @pytest.fixture
+    def session(self, mock_session):
+        with patch(
+            "cassanova.api.routes.api.cluster_routes.get_session", return_value=mock_session
+        ):
+            yield mock_session
+
+    def test_settings_drift(self, session):
+        table = _settings(a={"x": "1", "y": "2"}, b={"x": "1", "y": "3"})
+        with patch("cassanova.api.routes.api.cluster_routes.node_view", return_value=table) as view:
+            response = get_settings_drift("c1")
+
+        view.assert_called_once_with(session, "c1", NodeViews.SETTINGS, False)
+        assert response["nodes"] == ["a", "b"]
+        assert response["drift"] == {"y": {"a": "2", "b": "3"}}
+
+    def test_node_view(self, session):
+        table = NodeTable([{"node": "a", "name": "ReadStage", "pending_tasks": 3}], {})
+        with patch("cassanova.api.routes.api.cluster_routes.node_view", return_value=table):
+            response = get_node_view("c1", NodeViews.THREAD_POOLS, refresh=True)
+
+        assert response["view"] == NodeViews.THREAD_POOLS
+        assert response["rows"] == table.rows
+        assert response["errors"] == {}
+
+    def test_unknown_node_view(self, session):
+        with pytest.raises(HTTPException) as exc:
+            get_node_view("c1", "sstable_tasks")
+
+        assert exc.value.status_code == 404
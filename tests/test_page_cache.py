@@ -0,0 +1,195 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from cassanova.api.routes.api.data_routes import get_table_data
+from cassanova.config.page_cache_config import PageCacheConfig
+from cassanova.consts.workloads import Priorities, Workloads
+from cassanova.core.page_cache import PageCache, PageCursor, cursor_key
+
+_KEY = cursor_key("c1", "alice", "ks", "users", "SELECT * FROM ks.users", [], 2)
+
+
+class _Table:
+    """Pages of a fake table, addressed by paging states b"1", b"2", ..."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.calls = []
+
+    def __call__(self, state, priority):
+        self.calls.append((state, priority))
+        number = int(state) if state else 0
+        next_state = str(number + 1).encode() if number + 1 < len(self.pages) else None
+        return self.pages[number], next_state
+
+
+def _config(**kwargs):
+    config = MagicMock()
+    config.page_cache = PageCacheConfig(**kwargs)
+    return patch("cassanova.core.page_cache.get_clusters_config", return_value=config)
+
+
+@pytest.fixture
+def table():
+    return _Table([[{"id": 1}, {"id": 2}], [{"id": 3}, {"id": 4}], [{"id": 5}], [{"id": 6}]])
+
+
+class TestPageCursor:
+    def test_visited_pages_are_served_from_the_cache(self, table):
+        cursor = PageCursor("c", _KEY)
+
+        cursor.read(0, table, cached_pages=10)
+        cursor.read(1, table, cached_pages=10)
+        page = cursor.read(0, table, cached_pages=10)
+
+        assert page.rows == [{"id": 1}, {"id": 2}]
+        assert page.has_more is True
+        assert page.next_paging_state == b"1"
+        assert len(table.calls) == 2
+
+    def test_jump_pages_forward_from_the_nearest_state(self, table):
+        cursor = PageCursor("c", _KEY)
+        cursor.read(1, table, cached_pages=0)
+        table.calls.clear()
+
+        page = cursor.read(3, table, cached_pages=0)
+
+        assert page.rows == [{"id": 6}]
+        assert page.has_more is False
+        assert [state for state, _ in table.calls] == [b"2", b"3"]
+
+    def test_previous_page_resumes_from_its_state_without_cached_rows(self, table):
+        cursor = PageCursor("c", _KEY)
+        cursor.read(2, table, cached_pages=0)
+        table.calls.clear()
+
+        assert cursor.read(1, table, cached_pages=0).rows == [{"id": 3}, {"id": 4}]
+        assert table.calls == [(b"1", Priorities.INTERACTIVE)]
+
+    def test_past_the_end(self, table):
+        cursor = PageCursor("c", _KEY)
+
+        page = cursor.read(10, table, cached_pages=10)
+
+        assert page.rows == []
+        assert page.has_more is False
+        assert len(table.calls) == 4
+        assert cursor.read(5, table, cached_pages=10).rows == []
+        assert len(table.calls) == 4
+
+    def test_rows_cache_is_bounded(self, table):
+        cursor = PageCursor("c", _KEY)
+        for number in range(3):
+            cursor.read(number, table, cached_pages=2)
+        table.calls.clear()
+
+        cursor.read(0, table, cached_pages=2)
+
+        assert table.calls == [(None, Priorities.INTERACTIVE)]
+
+    def test_prefetch_loads_the_next_known_page_in_the_background(self, table):
+        cursor = PageCursor("c", _KEY)
+        cursor.read(0, table, cached_pages=10)
+
+        cursor.prefetch(1, table, cached_pages=10)
+        cursor.prefetch(1, table, cached_pages=10)
+        cursor.prefetch(5, table, cached_pages=10)
+
+        assert table.calls[1:] == [(b"1", Priorities.BACKGROUND)]
+        assert cursor.read(1, table, cached_pages=10).rows == [{"id": 3}, {"id": 4}]
+        assert len(table.calls) == 2
+
+
+class TestPageCache:
+    def test_cursor_is_reused_only_for_the_same_query(self):
+        cache = PageCache()
+        other = cursor_key("c1", "bob", "ks", "users", "SELECT * FROM ks.users", [], 2)
+
+        with _config():
+            cursor = cache.cursor(None, _KEY)
+            assert cache.cursor(cursor.id, _KEY) is cursor
+            assert cache.cursor(cursor.id, other) is not cursor
+
+    def test_eviction(self):
+        cache = PageCache()
+
+        with _config(max_cursors=1):
+            first = cache.cursor(None, _KEY)
+            cache.cursor(None, _KEY)
+            assert cache.cursor(first.id, _KEY) is not first
+
+        with _config(ttl_seconds=0.001):
+            cursor = cache.cursor(None, _KEY)
+            cursor.touched -= 1
+            assert cache.cursor(cursor.id, _KEY) is not cursor
+
+    def test_invalidate_table(self):
+        cache = PageCache()
+        other = cursor_key("c1", "alice", "ks", "orders", "SELECT * FROM ks.orders", [], 2)
+
+        with _config():
+            users, orders = cache.cursor(None, _KEY), cache.cursor(None, other)
+            cache.invalidate("c1", "ks", "users")
+
+            assert cache.cursor(users.id, _KEY) is not users
+            assert cache.cursor(orders.id, other) is orders
+
+    def test_read_prefetches_the_next_page(self, table):
+        cache = PageCache()
+
+        with _config(), patch.object(cache, "_prefetch") as prefetch:
+            cursor = cache.cursor(None, _KEY)
+            cache.read(cursor, 0, table)
+            cache.read(cursor, 3, table)
+
+        prefetch.assert_called_once_with(cursor, 1, table, 10)
+
+
+class TestTableDataPaging:
+    def test_pages_are_read_through_a_cursor(self, mock_session):
+        table_meta = MagicMock()
+        table_meta.name = "users"
+        keyspace = MagicMock()
+        keyspace.tables = {"users": table_meta}
+        mock_session.cluster.metadata.keyspaces = {"ks": keyspace}
+        row = MagicMock()
+        row._asdict.return_value = {"id": 1}
+        mock_session.execute.return_value = MagicMock(current_rows=[row], paging_state=b"\x01")
+
+        with (
+            patch("cassanova.api.routes.api.data_routes.get_session", return_value=mock_session),
+            patch("cassanova.api.routes.api.data_routes.check_query_cost"),
+            patch("cassanova.api.routes.api.data_routes.bind_statement"),
+            patch("cassanova.core.page_cache.page_cache._prefetch"),
+        ):
+            first = get_table_data("c1", "ks", "users", _user=None)
+            again = get_table_data("c1", "ks", "users", page=0, cursor=first["cursor"], _user=None)
+
+        assert first["rows"] == [{"id": 1}]
+        assert first["has_more"] is True
+        assert first["next_paging_state"] == "01"
+        assert again["cursor"] == first["cursor"]
+        mock_session.execute.assert_called_once()
+
+    def test_prefetch_is_admitted_as_background_work(self, mock_session):
+        table_meta = MagicMock()
+        table_meta.name = "users"
+        keyspace = MagicMock()
+        keyspace.tables = {"users": table_meta}
+        mock_session.cluster.metadata.keyspaces = {"ks": keyspace}
+        mock_session.execute.return_value = MagicMock(current_rows=[], paging_state=b"\x01")
+
+        with (
+            patch("cassanova.api.routes.api.data_routes.get_session", return_value=mock_session),
+            patch("cassanova.api.routes.api.data_routes.check_query_cost"),
+            patch("cassanova.api.routes.api.data_routes.bind_statement"),
+            patch("cassanova.api.routes.api.data_routes.admission_controller") as admission,
+            patch("cassanova.core.page_cache.page_cache._prefetch") as prefetch,
+        ):
+            get_table_data("c1", "ks", "users", _user=None)
+            fetch = prefetch.call_args.args[2]
+            fetch(b"\x01", Priorities.BACKGROUND)
+
+        workloads = [call.args[2] for call in admission.acquire.call_args_list]
+        assert workloads == [Workloads.INTERACTIVE, Workloads.EXPORTS]
@@ -0,0 +1,140 @@
+from collections import namedtuple
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+
+from cassanova.api.routes.api.data_routes import get_table_partitions
+from cassanova.core.cql.partition_listing import list_partitions, listing_statement
+from cassanova.core.cql.token_ranges import split_ring
+
+_MURMUR3 = "org.apache.cassandra.dht.Murmur3Partitioner"
+
+Key = namedtuple("Key", ["sensor", "system_token_sensor"])
+Row = namedtuple("Row", ["sensor", "seq", "system_token_sensor"])
+
+
+@pytest.fixture
+def readings(make_table):
+    return make_table("readings", partition_key=["sensor"], clustering_key=["seq"])
+
+
+class TestSplitRing:
+    def test_whole_ring(self):
+        assert split_ring(_MURMUR3, None, 2) == [(None, -1), (-1, None)]
+
+    def test_rest_of_the_ring_after_a_token(self):
+        assert split_ring(_MURMUR3, 2**63 - 5, 2) == [(2**63 - 5, 2**63 - 3), (2**63 - 3, None)]
+
+    def test_unsupported_partitioner(self):
+        with pytest.raises(ValueError, match="not supported"):
+            split_ring("org.apache.cassandra.dht.ByteOrderedPartitioner", None, 2)
+
+
+class TestListingStatement:
+    def test_distinct_keys(self, readings):
+        query, values = listing_statement("ks", readings, (5, None), 10)
+
+        assert query == (
+            'SELECT DISTINCT "sensor", token("sensor") FROM "ks"."readings"'
+            ' WHERE token("sensor") > ? LIMIT ?'
+        )
+        assert values == [5, 10]
+
+    def test_preview(self, readings):
+        query, values = listing_statement("ks", readings, (None, 7), 10, preview=3)
+
+        assert query == (
+            'SELECT "sensor", "seq", token("sensor") FROM "ks"."readings"'
+            ' WHERE token("sensor") <= ? PER PARTITION LIMIT ? LIMIT ?'
+        )
+        assert values == [7, 3, 30]
+
+
+class TestListPartitions:
+    @pytest.fixture(autouse=True)
+    def _readings(self, readings):
+        self.readings = readings
+
+    def _list(self, session, outcomes, **kwargs):
+        session.cluster.metadata.partitioner = _MURMUR3
+        results = [(True, MagicMock(current_rows=rows)) for rows in outcomes]
+        with (
+            patch("cassanova.core.cql.partition_listing.bind_statement"),
+            patch(
+                "cassanova.core.cql.partition_listing.execute_concurrent_tracked",
+                return_value=results,
+            ) as execute,
+        ):
+            page = list_partitions(session, "c1", None, "ks", self.readings, **kwargs)
+        return page, execute
+
+    def test_last_page(self, mock_session):
+        page, _ = self._list(mock_session, [[Key("a", 1), Key("b", 2)]], limit=3)
+
+        assert [p.key for p in page.partitions] == [{"sensor": "a"}, {"sensor": "b"}]
+        assert page.next_after is None
+
+    def test_full_page_continues_after_the_last_token(self, mock_session):
+        page, _ = self._list(mock_session, [[Key("a", 1), Key("b", 2)]], limit=2)
+
+        assert page.next_after == 2
+
+    def test_segments_merge_up_to_the_first_unfinished_range(self, mock_session):
+        page, execute = self._list(
+            mock_session,
+            [[Key("a", -9)], [Key("b", 3), Key("c", 4)], [Key("d", 2**62)]],
+            limit=2,
+            segments=3,
+        )
+
+        assert len(execute.call_args.args[1]) == 3
+        assert [p.token for p in page.partitions] == [-9, 3]
+        assert page.next_after == 3
+
+    def test_preview_drops_a_partition_cut_by_the_limit(self, mock_session):
+        rows = [Row("a", 1, 1), Row("a", 2, 1), Row("b", 1, 2), Row("c", 1, 3)]
+
+        page, _ = self._list(mock_session, [rows], limit=2, preview=2)
+        partition = page.partitions[0]
+
+        assert [p.key["sensor"] for p in page.partitions] == ["a", "b"]
+        assert partition.rows == [{"sensor": "a", "seq": 1}, {"sensor": "a", "seq": 2}]
+        assert partition.to_dict()["token"] == "1"
+        assert page.next_after == 2
+
+    def test_too_many_segments(self, mock_session):
+        with pytest.raises(ValueError, match="segments"):
+            self._list(mock_session, [], segments=1000)
+
+
+class TestGetTablePartitions:
+    def test_tokens_are_strings(self, mock_session, readings):
+        keyspace = MagicMock()
+        keyspace.tables = {"readings": readings}
+        mock_session.cluster.metadata.keyspaces = {"ks": keyspace}
+        page = MagicMock(partitions=[], next_after=2**63 - 1)
+
+        with (
+            patch("cassanova.api.routes.api.data_routes.get_session", return_value=mock_session),
+            patch(
+                "cassanova.api.routes.api.data_routes.list_partitions", return_value=page
+            ) as listing,
+        ):
+            result = get_table_partitions("c1", "ks", "readings", after="-42", _user=None)
+
+        assert listing.call_args.args[5] == -42
+        assert result == {"partitions": [], "next_after": str(2**63 - 1)}
+
+    def test_invalid_token(self, mock_session, readings):
+        keyspace = MagicMock()
+        keyspace.tables = {"readings": readings}
+        mock_session.cluster.metadata.keyspaces = {"ks": keyspace}
+
+        with (
+            patch("cassanova.api.routes.api.data_routes.get_session", return_value=mock_session),
+            pytest.raises(HTTPException) as exc,
+        ):
+            get_table_partitions("c1", "ks", "readings", after="abc", _user=None)
+
+        assert exc.value.status_code == 400
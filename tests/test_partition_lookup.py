@@ -0,0 +1,89 @@
+import re
+from unittest.mock import MagicMock, patch
+
+import pytest
+from cassandra.concurrent import ExecutionResult
+
+from cassanova.core.cql.partition_lookup import lookup_partitions, lookup_statement
+
+
+@pytest.fixture
+def table(make_table):
+    return make_table(
+        "events",
+        partition_key=["tenant", ("bucket", "int")],
+        clustering_key=[("day", "date"), ("seq", "int")],
+    )
+
+
+class TestLookupStatement:
+    def test_partition_key_values_are_typed_and_bound(self, table):
+        query, values = lookup_statement("ks", table, {"bucket": "3", "tenant": "a"})
+
+        assert query == ('SELECT * FROM "ks"."events" WHERE "tenant" = ? AND "bucket" = ? LIMIT ?')
+        # The limit is bound too, so every limit shares one prepared statement.
+        assert values == ["a", 3, 100]
+
+    def test_clustering_prefix_and_projection(self, table):
+        query, values = lookup_statement(
+            "ks",
+            table,
+            {"tenant": "a", "bucket": 3, "day": "2024-01-02"},
+            columns=["tenant", "seq"],
+            limit=5,
+        )
+
+        assert query == (
+            'SELECT "tenant", "seq" FROM "ks"."events" '
+            'WHERE "tenant" = ? AND "bucket" = ? AND "day" = ? LIMIT ?'
+        )
+        assert str(values[2]) == "2024-01-02"
+        assert values[3] == 5
+
+    @pytest.mark.parametrize(
+        ("key", "message"),
+        [
+            ({"tenant": "a"}, "Missing partition key column(s): bucket"),
+            ({"tenant": "a", "bucket": 1, "seq": 2}, "seq are not part of the partition key"),
+        ],
+    )
+    def test_invalid_keys(self, table, key, message):
+        with pytest.raises(ValueError, match=re.escape(message)):
+            lookup_statement("ks", table, key)
+
+
+class TestLookupPartitions:
+    def test_keys_run_concurrently_and_fail_independently(self, mock_session, table):
+        row = MagicMock()
+        row._asdict.return_value = {"tenant": "a", "bucket": 1}
+        keys = [{"tenant": "a", "bucket": 1}, {"tenant": "b"}, {"tenant": "c", "bucket": 2}]
+
+        with (
+            patch("cassanova.core.cql.partition_lookup.bind_statement") as bind,
+            patch("cassanova.core.cql.partition_lookup.execute_concurrent_tracked") as concurrent,
+        ):
+            concurrent.return_value = [
+                ExecutionResult(True, MagicMock(current_rows=[row])),
+                ExecutionResult(False, RuntimeError("timed out")),
+            ]
+            results = lookup_partitions(mock_session, "c1", None, "ks", table, keys)
+
+        assert [r.to_dict() for r in results] == [
+            {"key": keys[0], "rows": [{"tenant": "a", "bucket": 1}], "error": None},
+            {"key": keys[1], "rows": [], "error": "Missing partition key column(s): bucket"},
+            {"key": keys[2], "rows": [], "error": "timed out"},
+        ]
+        assert bind.call_count == 2
+        assert bind.call_args.kwargs == {"fetch_size": 100}
+        assert concurrent.call_args.kwargs["concurrency"] == 32
+        assert concurrent.call_args.kwargs["raise_on_first_error"] is False
+
+    def test_too_many_keys(self, mock_session, table):
+        config = MagicMock()
+        config.browse.max_lookup_keys = 1
+
+        with (
+            patch("cassanova.core.cql.partition_lookup.get_clusters_config", return_value=config),
+            pytest.raises(ValueError, match="At most 1 keys"),
+        ):
+            lookup_partitions(mock_session, "c1", None, "ks", table, [{}, {}])
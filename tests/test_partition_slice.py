@@ -0,0 +1,131 @@
+import json
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+
+from cassanova.api.routes.api.data_routes import get_partition_slice
+from cassanova.core.cql.partition_slice import next_after, slice_statement
+
+_READINGS = {
+    "partition_key": ["sensor"],
+    "clustering_key": [("day", "date"), ("seq", "int")],
+    "regular": [("v", "double")],
+}
+
+
+@pytest.fixture
+def readings(make_table):
+    return make_table("readings", **_READINGS)
+
+
+_BASE = 'SELECT * FROM "ks"."readings" WHERE "sensor" = ?'
+
+
+class TestSliceStatement:
+    def test_whole_partition(self, readings):
+        query, values = slice_statement("ks", readings, {"sensor": "s1"})
+
+        assert query == f'{_BASE} ORDER BY "day" ASC, "seq" ASC LIMIT ?'
+        assert values == ["s1", 100]
+
+    def test_range_with_prefix_bounds(self, readings):
+        query, values = slice_statement(
+            "ks",
+            readings,
+            {"sensor": "s1"},
+            start={"day": "2024-01-01", "seq": "5"},
+            end={"day": "2024-02-01"},
+            limit=10,
+        )
+
+        assert query == (
+            f'{_BASE} AND ("day", "seq") >= (?, ?) AND ("day") < (?)'
+            ' ORDER BY "day" ASC, "seq" ASC LIMIT ?'
+        )
+        assert values == ["s1", date(2024, 1, 1), 5, date(2024, 2, 1), 10]
+
+    @pytest.mark.parametrize(
+        ("order", "expected"),
+        [
+            ("asc", '("day", "seq") > (?, ?) AND ("day") < (?) ORDER BY "day" ASC, "seq" ASC'),
+            ("desc", '("day") >= (?) AND ("day", "seq") < (?, ?) ORDER BY "day" DESC, "seq" DESC'),
+        ],
+    )
+    def test_after_replaces_the_bound_the_slice_moves_from(self, readings, order, expected):
+        query, _ = slice_statement(
+            "ks",
+            readings,
+            {"sensor": "s1"},
+            start={"day": "2024-01-01"},
+            end={"day": "2024-02-01"},
+            after={"day": "2024-01-15", "seq": 3},
+            order=order,
+        )
+
+        assert query == f"{_BASE} AND {expected} LIMIT ?"
+
+    @pytest.mark.parametrize(
+        ("kwargs", "message"),
+        [
+            ({"key": {}}, "Missing partition key"),
+            ({"start": {"seq": 1}}, "clustering prefix"),
+            ({"after": {"day": "2024-01-01"}}, "every clustering column"),
+        ],
+    )
+    def test_invalid(self, readings, kwargs, message):
+        args = {"table": readings, "key": {"sensor": "s1"}} | kwargs
+
+        with pytest.raises(ValueError, match=message):
+            slice_statement("ks", **args)
+
+    def test_mixed_clustering_orders(self, make_table):
+        table = make_table("readings", **_READINGS, descending=["seq"])
+
+        with pytest.raises(ValueError, match="mixed clustering orders"):
+            slice_statement("ks", table, {"sensor": "s1"})
+
+    def test_next_after(self, readings):
+        rows = [{"day": date(2024, 1, 1), "seq": 1}, {"day": date(2024, 1, 2), "seq": 7}]
+
+        assert next_after(readings, rows, 2) == {"day": date(2024, 1, 2), "seq": 7}
+        assert next_after(readings, rows, 3) is None
+
+
+class TestGetPartitionSlice:
+    @pytest.fixture
+    def session(self, mock_session, readings):
+        keyspace = MagicMock()
+        keyspace.tables = {"readings": readings}
+        mock_session.cluster.metadata.keyspaces = {"ks": keyspace}
+        return mock_session
+
+    def _patches(self, session):
+        return (
+            patch("cassanova.api.routes.api.data_routes.get_session", return_value=session),
+            patch("cassanova.api.routes.api.data_routes.bind_statement"),
+        )
+
+    def test_returns_the_next_bound(self, session):
+        row = MagicMock()
+        row._asdict.return_value = {"sensor": "s1", "day": date(2024, 1, 2), "seq": 7, "v": 1.5}
+        session.execute.return_value = MagicMock(current_rows=[row], paging_state=None)
+        get_session, bind = self._patches(session)
+
+        with get_session, bind as bind_statement:
+            result = get_partition_slice(
+                "c1", "ks", "readings", json.dumps({"sensor": "s1"}), limit=1, _user=None
+            )
+
+        assert bind_statement.call_args.args[2] == ["s1", 1]
+        assert bind_statement.call_args.kwargs == {"fetch_size": 1}
+        assert result["next_after"] == {"day": "2024-01-02", "seq": 7}
+
+    def test_invalid_slice(self, session):
+        get_session, bind = self._patches(session)
+
+        with get_session, bind, pytest.raises(HTTPException) as exc:
+            get_partition_slice("c1", "ks", "readings", "{}", _user=None)
+
+        assert exc.value.status_code == 400
@@ -0,0 +1,48 @@
+from unittest.mock import MagicMock, patch
+
+from cassanova.api.dependencies.csv_handler import generate_json_stream
+from cassanova.core.cql.prepared_statements import PreparedStatementCache
+
+
+class TestPreparedStatementCache:
+    def test_prepares_once_per_session(self, mock_session):
+        cache = PreparedStatementCache()
+
+        first = cache.get(mock_session, "SELECT * FROM ks.t WHERE k = ?")
+        second = cache.get(mock_session, "SELECT * FROM ks.t WHERE k = ?")
+
+        assert first is second
+        mock_session.prepare.assert_called_once_with("SELECT * FROM ks.t WHERE k = ?")
+
+    def test_least_recently_used_is_evicted(self, mock_session):
+        cache = PreparedStatementCache(max_size=2)
+        for query in ("a", "b", "a", "c", "a", "b"):
+            cache.get(mock_session, query)
+
+        assert [c.args[0] for c in mock_session.prepare.call_args_list] == ["a", "b", "c", "b"]
+
+    def test_invalidate(self, mock_session):
+        cache = PreparedStatementCache()
+        cache.get(mock_session, "a")
+        cache.invalidate(mock_session)
+        cache.get(mock_session, "a")
+
+        assert mock_session.prepare.call_count == 2
+
+
+def test_bulk_read_binds_parameters(mock_session):
+    rows = MagicMock()
+    rows.column_names = ["k"]
+    rows.current_rows = []
+    rows.has_more_pages = False
+    mock_session.execute = MagicMock(return_value=rows)
+
+    with patch(
+        "cassanova.api.dependencies.csv_handler.bind_statement", return_value="bound"
+    ) as bind:
+        list(generate_json_stream(mock_session, "SELECT * FROM t WHERE k = ?", 50, parameters=[1]))
+
+    bind.assert_called_once_with(
+        mock_session, "SELECT * FROM t WHERE k = ?", [1], fetch_size=50, consistency_level=None
+    )
+    assert mock_session.execute.call_args.args[0] == "bound"
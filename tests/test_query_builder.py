@@ -1,12 +1,15 @@
 import json
+from uuid import UUID
 
 import pytest
 
 from cassanova.core.cql.query_builder import (
+    _element_type,
     _escape_cql_string,
     _format_cql_value,
     _validate_operator,
     build_insert_query,
+    build_where,
     build_where_clause,
 )
 
@@ -60,6 +63,88 @@ class TestBuildWhereClause:
         assert "30" in result
 
 
+class TestBuildWhere:
+    @pytest.fixture(autouse=True)
+    def _table(self, make_table):
+        self.table = make_table(
+            partition_key=[("id", "uuid")],
+            regular=[
+                ("age", "int"),
+                ("active", "boolean"),
+                "name",
+                ("tags", "frozen<set<text>>"),
+                ("scores", "map<text, frozen<list<int>>>"),
+            ],
+        )
+
+    def test_no_filters(self):
+        where = build_where(None, self.table)
+        assert where.clause == ""
+        assert where.values == []
+
+    def test_values_are_bound_with_column_types(self):
+        filters = json.dumps(
+            [
+                {"col": "age", "op": ">", "val": "25"},
+                {"col": "active", "op": "=", "val": "true"},
+                {"col": "id", "op": "=", "val": "123e4567-e89b-12d3-a456-426614174000"},
+            ]
+        )
+        where = build_where(filters, self.table)
+
+        assert where.clause == ' WHERE "age" > ? AND "active" = ? AND "id" = ?'
+        assert where.values == [25, True, UUID("123e4567-e89b-12d3-a456-426614174000")]
+
+    def test_text_that_looks_numeric_stays_text(self):
+        where = build_where(json.dumps([{"col": "name", "op": "=", "val": "007"}]), self.table)
+        assert where.values == ["007"]
+
+    def test_same_shape_for_different_values(self):
+        first = build_where(json.dumps([{"col": "name", "op": "=", "val": "a"}]), self.table)
+        second = build_where(json.dumps([{"col": "name", "op": "=", "val": "x'; --"}]), self.table)
+
+        assert first.clause == second.clause
+        assert second.values == ["x'; --"]
+
+    def test_in_gets_one_marker_per_item(self):
+        where = build_where(json.dumps([{"col": "age", "op": "IN", "val": "1, 2,3"}]), self.table)
+
+        assert where.clause == ' WHERE "age" IN (?, ?, ?)'
+        assert where.values == [1, 2, 3]
+
+    def test_like_and_contains(self):
+        filters = json.dumps(
+            [
+                {"col": "name", "op": "LIKE", "val": "ali"},
+                {"col": "tags", "op": "CONTAINS", "val": "x"},
+                {"col": "scores", "op": "CONTAINS KEY", "val": "math"},
+            ]
+        )
+        where = build_where(filters, self.table)
+
+        assert where.values == ["%ali%", "x", "math"]
+
+    def test_unknown_column_rejected(self):
+        with pytest.raises(ValueError, match="Unknown column"):
+            build_where(json.dumps([{"col": "nope", "op": "=", "val": "1"}]), self.table)
+
+    def test_bad_value_rejected(self):
+        with pytest.raises(ValueError):
+            build_where(json.dumps([{"col": "age", "op": "=", "val": "abc"}]), self.table)
+
+    @pytest.mark.parametrize(
+        ("cql_type", "key", "expected"),
+        [
+            ("list<int>", False, "int"),
+            ("frozen<set<text>>", False, "text"),
+            ("map<text, frozen<list<int>>>", False, "frozen<list<int>>"),
+            ("map<text, frozen<list<int>>>", True, "text"),
+        ],
+    )
+    def test_element_type(self, cql_type, key, expected):
+        assert _element_type(cql_type, key) == expected
+
+
 class TestOperatorWhitelist:
     @pytest.mark.parametrize(
         "op",
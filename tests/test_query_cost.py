@@ -0,0 +1,237 @@
+from collections import namedtuple
+from unittest.mock import MagicMock, patch
+
+import pytest
+from cassandra.metadata import IndexMetadata
+
+from cassanova.api.routes.api.data_routes import get_table_data
+from cassanova.api.routes.api.tools_routes import run_cqlsh_script, run_fan_out_query
+from cassanova.config.fan_out_config import FanOutConfig
+from cassanova.config.query_cost_config import CostThresholds, QueryCostConfig
+from cassanova.consts.query_kinds import CostDecisions, QueryKinds
+from cassanova.core.cql.query_cost import (
+    QueryCost,
+    _estimate,
+    analyze_query,
+    check_query_cost,
+    decide,
+)
+from cassanova.core.size_estimates import TableSizeEstimate, load_size_estimate
+from cassanova.exceptions.cql_exceptions import QueryCostExceeded
+from cassanova.models.auth_models import WebUser
+from cassanova.models.cql_query import CQLScript, FanOutQuery
+
+SizeRow = namedtuple(
+    "SizeRow", ["range_start", "range_end", "partitions_count", "mean_partition_size"]
+)
+
+
+@pytest.fixture
+def session(mock_session, make_table):
+    keyspace = MagicMock()
+    keyspace.tables = {
+        "users": make_table(
+            "users",
+            ["tenant", "user_id"],
+            indexes=[
+                IndexMetadata("ks", "users", "users_email", "COMPOSITES", {"target": "email"}),
+                IndexMetadata(
+                    "ks",
+                    "users",
+                    "users_age",
+                    "CUSTOM",
+                    {"target": "age", "class_name": "StorageAttachedIndex"},
+                ),
+            ],
+        )
+    }
+    keyspace.views = {}
+    mock_session.cluster.metadata.keyspaces = {"ks": keyspace}
+    return mock_session
+
+
+@pytest.fixture(autouse=True)
+def size_estimate():
+    estimate = TableSizeEstimate(partitions=1_000_000, mean_partition_size=2048)
+    with patch("cassanova.core.cql.query_cost.size_estimate_cache") as cache:
+        cache.get.return_value = estimate
+        yield cache
+
+
+def _config(**kwargs):
+    config = MagicMock()
+    config.query_cost = QueryCostConfig(**kwargs)
+    return patch("cassanova.core.cql.query_cost.get_clusters_config", return_value=config)
+
+
+class TestAnalyzeQuery:
+    def test_single_partition(self, session):
+        cost = analyze_query(
+            session, "c1", "SELECT * FROM ks.users WHERE tenant = 'a AND b' AND user_id = 7"
+        )
+
+        assert cost.kind == QueryKinds.SINGLE_PARTITION
+        assert cost.estimated_partitions == 1
+        assert cost.estimated_bytes == 2048
+
+    def test_multi_partition_in(self, session):
+        cql = "SELECT * FROM ks.users WHERE tenant IN ('a', 'b') AND user_id IN (1,2,3)"
+        cost = analyze_query(session, "c1", cql)
+
+        assert cost.kind == QueryKinds.MULTI_PARTITION
+        assert cost.estimated_partitions == 6
+
+    def test_no_estimate_without_a_table(self, session, size_estimate):
+        cost = QueryCost(QueryKinds.FULL_SCAN)
+        _estimate(cost, session, "c1", None)
+
+        size_estimate.get.assert_not_called()
+        assert cost.estimated_partitions is None
+        assert cost.reasons == ["No size estimates available for this table"]
+
+    @pytest.mark.parametrize(
+        ("where", "index"),
+        [("email = 'x@y'", "users_email"), ("age > 30 ALLOW FILTERING", "users_age")],
+    )
+    def test_index_scan(self, session, where, index):
+        cost = analyze_query(session, "c1", f"SELECT * FROM ks.users WHERE {where}")
+
+        assert cost.kind == QueryKinds.INDEX_SCAN
+        assert cost.index == index
+        assert cost.estimated_partitions is None
+
+    def test_range_on_legacy_index_is_a_full_scan(self, session):
+        cost = analyze_query(
+            session, "c1", "SELECT * FROM ks.users WHERE email > 'a' ALLOW FILTERING"
+        )
+
+        assert cost.kind == QueryKinds.FULL_SCAN
+        assert cost.filtering is True
+        assert cost.estimated_partitions == 1_000_000
+
+    def test_unfiltered_scan_is_capped_by_limit_and_page(self, session):
+        cost = analyze_query(session, "c1", "SELECT * FROM ks.users LIMIT 500", page_size=100)
+
+        assert cost.kind == QueryKinds.FULL_SCAN
+        assert cost.estimated_partitions == 100
+        assert cost.estimated_bytes == 100 * 2048
+
+    def test_partial_partition_key_with_filtering(self, session):
+        cost = analyze_query(
+            session, "c1", 'SELECT * FROM "ks"."users" WHERE tenant = \'a\' ALLOW FILTERING'
+        )
+
+        assert cost.kind == QueryKinds.FULL_SCAN
+        assert "user_id" in cost.reasons[0]
+
+    @pytest.mark.parametrize(
+        "cql", ["INSERT INTO ks.users (tenant) VALUES ('a')", "SELECT * FROM ks.missing"]
+    )
+    def test_unknown(self, session, cql):
+        assert analyze_query(session, "c1", cql).kind == QueryKinds.UNKNOWN
+
+
+class TestDecide:
+    def _cost(self, kind=QueryKinds.FULL_SCAN, partitions=10, size=10_000):
+        return QueryCost(kind, estimated_partitions=partitions, estimated_bytes=size)
+
+    def test_default_thresholds(self):
+        with _config():
+            assert decide(self._cost(), None) == CostDecisions.ALLOW
+            assert decide(self._cost(size=2 * 1024**3), None) == CostDecisions.CONFIRM
+
+    def test_most_lenient_role_wins(self):
+        thresholds = {
+            "viewer": CostThresholds(block_kinds=[QueryKinds.FULL_SCAN]),
+            "analyst": CostThresholds(confirm_partitions=5),
+        }
+        viewer = WebUser(username="v", password="x", roles=["viewer"])
+        both = WebUser(username="b", password="x", roles=["viewer", "analyst"])
+
+        with _config(role_thresholds=thresholds):
+            assert decide(self._cost(), viewer) == CostDecisions.BLOCK
+            assert decide(self._cost(), both) == CostDecisions.CONFIRM
+
+    def test_check_requires_confirmation(self, session):
+        cql = "SELECT * FROM ks.users ALLOW FILTERING"
+        with _config(default_thresholds=CostThresholds(confirm_kinds=[QueryKinds.FULL_SCAN])):
+            with pytest.raises(QueryCostExceeded) as exc:
+                check_query_cost(session, "c1", cql, None)
+            assert check_query_cost(session, "c1", cql, None, confirmed=True).kind == "full_scan"
+
+        assert exc.value.decision == CostDecisions.CONFIRM
+        assert exc.value.cost["estimated_partitions"] == 1_000_000
+
+    def test_disabled(self, session):
+        with _config(enabled=False):
+            assert check_query_cost(session, "c1", "SELECT * FROM ks.users", None) is None
+
+    def test_table_browser_is_checked_before_running(self, session):
+        with (
+            _config(default_thresholds=CostThresholds(block_kinds=[QueryKinds.FULL_SCAN])),
+            patch("cassanova.api.routes.api.data_routes.get_session", return_value=session),
+            pytest.raises(QueryCostExceeded),
+        ):
+            get_table_data("c1", "ks", "users", allow_filtering=True, _user=None)
+
+        session.execute.assert_not_called()
+
+    def test_scripts_check_every_select_before_running(self, session):
+        script = CQLScript(
+            script="INSERT INTO ks.users (tenant) VALUES ('a'); SELECT * FROM ks.users"
+        )
+        with (
+            _config(default_thresholds=CostThresholds(confirm_kinds=[QueryKinds.FULL_SCAN])),
+            patch("cassanova.api.routes.api.tools_routes.get_session", return_value=session),
+            patch("cassanova.api.routes.api.tools_routes.run_script") as run_script,
+        ):
+            with pytest.raises(QueryCostExceeded) as exc:
+                run_cqlsh_script("c1", script, _user=None)
+            assert exc.value.decision == CostDecisions.CONFIRM
+            run_script.assert_not_called()
+
+            script.confirm_cost = True
+            run_cqlsh_script("c1", script, _user=None)
+            run_script.assert_called_once()
+
+    def test_fan_out_is_checked_on_every_cluster(self, session):
+        config = MagicMock()
+        config.clusters = {"prod": MagicMock(), "staging": MagicMock()}
+        config.fan_out = FanOutConfig()
+        query = FanOutQuery(cql="SELECT * FROM ks.users", clusters=["prod", "staging", "gone"])
+        with (
+            _config(default_thresholds=CostThresholds(block_kinds=[QueryKinds.FULL_SCAN])),
+            patch("cassanova.core.cql.fan_out.get_clusters_config", return_value=config),
+            patch("cassanova.core.cql.fan_out.session_manager") as manager,
+            patch("cassanova.api.routes.api.tools_routes.fan_out_query") as fan_out,
+            pytest.raises(QueryCostExceeded) as exc,
+        ):
+            manager.get_session.return_value = session
+            run_fan_out_query(query, _user=None)
+
+        assert exc.value.cluster_name == "prod"
+        assert [call.args[0] for call in manager.get_session.call_args_list] == [
+            "prod",
+            "staging",
+        ]
+        fan_out.assert_not_called()
+
+
+class TestSizeEstimates:
+    def test_scales_local_ranges_to_the_whole_ring(self, mock_session):
+        quarter = 2**62
+        mock_session.execute.return_value = [
+            SizeRow(str(-(2**63)), str(-(2**63) + quarter), 100, 1000),
+            SizeRow("0", str(quarter), 300, 3000),
+        ]
+
+        estimate = load_size_estimate(mock_session, "ks", "users")
+
+        assert estimate.partitions == 800
+        assert estimate.mean_partition_size == 2500
+        assert estimate.total_bytes == 2_000_000
+
+    def test_missing_estimates(self, mock_session):
+        mock_session.execute.return_value = []
+
+        assert load_size_estimate(mock_session, "ks", "users") is None
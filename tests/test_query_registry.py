@@ -0,0 +1,184 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from cassanova.api.dependencies.csv_handler import generate_json_stream
+from cassanova.core.query_registry import (
+    QueryRegistry,
+    _on_request,
+    execute_concurrent_tracked,
+    query_registry,
+)
+from cassanova.exceptions.cql_exceptions import QueryCancelled
+from cassanova.models.auth_models import WebUser
+
+ALICE = WebUser(username="alice", password="x", roles=["viewer"])
+BOB = WebUser(username="bob", password="x", roles=["viewer"])
+ADMIN = WebUser(username="root", password="x", roles=["admin"])
+
+
+@pytest.fixture(autouse=True)
+def _permissions():
+    with patch(
+        "cassanova.core.query_registry.check_permission",
+        side_effect=lambda user, _perm: user is ADMIN,
+    ):
+        yield
+
+
+class TestQueryRegistry:
+    def test_query_is_listed_only_while_running(self):
+        registry = QueryRegistry()
+
+        with registry.track("c1", ALICE, "SELECT * FROM ks.t") as query:
+            listed = registry.list_queries(ALICE)
+            assert [q["query_id"] for q in listed] == [query.query_id]
+            assert listed[0]["query"] == "SELECT * FROM ks.t"
+
+        assert registry.list_queries(ALICE) == []
+
+    def test_users_only_see_their_own_queries(self):
+        registry = QueryRegistry()
+
+        with registry.track("c1", ALICE, "q1"), registry.track("c2", BOB, "q2"):
+            assert [q["user"] for q in registry.list_queries(BOB)] == ["bob"]
+            assert len(registry.list_queries(ADMIN)) == 2
+            assert registry.list_queries(ADMIN, only_own=True) == []
+            assert [q["cluster"] for q in registry.list_queries(ADMIN, "c1")] == ["c1"]
+
+    def test_only_owner_or_admin_can_cancel(self):
+        registry = QueryRegistry()
+
+        with registry.track("c1", ALICE, "q") as query:
+            assert registry.cancel(query.query_id, BOB) is None
+            assert registry.cancel(query.query_id, ADMIN, "other") is None
+            assert not query.cancelled
+
+            assert registry.cancel(query.query_id, ALICE) is query
+            assert query.cancelled
+
+    def test_cancel_fails_attached_future(self):
+        registry = QueryRegistry()
+        future = MagicMock()
+
+        with registry.track("c1", ALICE, "q") as query:
+            with query.bound():
+                _on_request(future)
+            registry.cancel(query.query_id, ALICE)
+
+        exc = future._set_final_exception.call_args.args[0]
+        assert isinstance(exc, QueryCancelled)
+        assert exc.query_id == query.query_id
+
+    def test_request_sent_after_cancel_is_failed_immediately(self):
+        registry = QueryRegistry()
+        future = MagicMock()
+
+        with registry.track("c1", ALICE, "q") as query:
+            query.cancel()
+            with query.bound():
+                _on_request(future)
+
+        future._set_final_exception.assert_called_once()
+
+    def test_unbound_requests_are_ignored(self):
+        future = MagicMock()
+        _on_request(future)
+        future._set_final_exception.assert_not_called()
+
+
+class _FakeFuture:
+    """A ResponseFuture that completes when told to."""
+
+    def __init__(self):
+        self.callbacks = []
+        self.outcome = None
+
+    def add_callbacks(self, callback, errback):
+        self.callbacks.append((callback, errback))
+        if self.outcome is not None:
+            (errback if isinstance(self.outcome, Exception) else callback)(self.outcome)
+
+    def complete(self, rows):
+        self.outcome = rows
+        for callback, _ in self.callbacks:
+            callback(rows)
+
+    def _set_final_exception(self, exc):
+        self.outcome = exc
+        for _, errback in self.callbacks:
+            errback(exc)
+
+    def result(self):
+        if isinstance(self.outcome, Exception):
+            raise self.outcome
+        return self.outcome
+
+
+class TestExecuteConcurrentTracked:
+    def _session(self, on_send):
+        session = MagicMock()
+        futures = []
+
+        def _execute_async(statement, **_kwargs):
+            future = _FakeFuture()
+            futures.append(future)
+            # The driver runs request-init listeners on the sending thread.
+            _on_request(future)
+            on_send(statement, future)
+            return future
+
+        session.execute_async.side_effect = _execute_async
+        return session, futures
+
+    def test_every_request_is_attached(self):
+        session, futures = self._session(lambda statement, future: future.complete([statement]))
+
+        with query_registry.track("c1", ALICE, "q") as query:
+            outcomes = execute_concurrent_tracked(session, ["a", "b", "c"], query, concurrency=2)
+
+        assert outcomes == [(True, ["a"]), (True, ["b"]), (True, ["c"])]
+        assert query.futures == futures
+
+    def test_cancel_stops_the_whole_batch(self):
+        registry = QueryRegistry()
+
+        def _on_send(statement, future):
+            if statement == "a":
+                future.complete(["a"])
+            else:
+                registry.cancel(query.query_id, ALICE)
+
+        session, futures = self._session(_on_send)
+        with registry.track("c1", ALICE, "q") as query:
+            outcomes = execute_concurrent_tracked(
+                session, ["a", "b", "c", "d"], query, concurrency=1, raise_on_first_error=False
+            )
+
+        # Both sent requests were failed and the rest were never sent.
+        assert session.execute_async.call_count == 2
+        assert all(isinstance(future.outcome, QueryCancelled) for future in futures)
+        assert [success for success, _ in outcomes] == [False] * 4
+        assert all(isinstance(outcome, QueryCancelled) for _, outcome in outcomes)
+
+
+class TestExportCancellation:
+    def test_export_stops_paging_once_cancelled(self):
+        session = MagicMock()
+        rows = session.execute.return_value
+        rows.column_names = ["id"]
+        rows.current_rows = [MagicMock(id=1), MagicMock(id=2)]
+        rows.has_more_pages = True
+
+        stream = generate_json_stream(session, "SELECT * FROM ks.t", user=ALICE, cluster_name="c1")
+        next(stream)
+        (running,) = query_registry.list_queries(ALICE)
+        assert running["rows_fetched"] == 2
+
+        query_registry.cancel(running["query_id"], ALICE)
+        next(stream)
+        with pytest.raises(QueryCancelled):
+            next(stream)
+
+        rows.fetch_next_page.assert_not_called()
+        assert query_registry.list_queries(ALICE) == []
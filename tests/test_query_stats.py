@@ -0,0 +1,209 @@
+import gc
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from cassandra.query import BatchStatement, SimpleStatement
+
+from cassanova.api.routes.api.admin_routes import get_query_metrics, get_slow_queries
+from cassanova.config.query_metrics_config import QueryMetricsConfig
+from cassanova.core.metrics.histogram import LatencyHistogram
+from cassanova.core.metrics.query_stats import QueryStatsCollector, normalize_query
+from cassanova.core.query_registry import InFlightQuery
+
+
+class TestLatencyHistogram:
+    def test_percentiles_are_within_bucket_precision(self):
+        histogram = LatencyHistogram()
+        for ms in range(1, 1001):
+            histogram.record(ms / 1000)
+
+        for percentile, expected in ((50, 500), (90, 900), (99, 990)):
+            assert histogram.percentile(percentile) == pytest.approx(expected, rel=0.07)
+        assert histogram.percentile(100) == 1000
+
+    def test_snapshot(self):
+        histogram = LatencyHistogram()
+        assert histogram.snapshot()["p99_ms"] is None
+
+        histogram.record(0.002)
+        histogram.record(0.004)
+        snapshot = histogram.snapshot()
+
+        assert snapshot["count"] == 2
+        assert snapshot["min_ms"] == 2
+        assert snapshot["max_ms"] == 4
+        assert snapshot["mean_ms"] == 3
+        assert "p99.9_ms" in snapshot
+
+    def test_huge_values_are_clamped_to_last_bucket(self):
+        histogram = LatencyHistogram()
+        histogram.record(10**9)
+
+        assert histogram.percentile(50) == 10**12
+
+
+class TestNormalizeQuery:
+    def test_replaces_literals(self):
+        query = (
+            "SELECT * FROM ks.t WHERE id = 42 AND name = 'it''s' "
+            "AND u = 123e4567-e89b-12d3-a456-426614174000 AND b = 0xCAFE AND f = -1.5e3;"
+        )
+        assert normalize_query(query) == (
+            "SELECT * FROM ks.t WHERE id = ? AND name = ? AND u = ? AND b = ? AND f = ?"
+        )
+
+    def test_keeps_identifiers_and_collapses_in_lists(self):
+        query = 'SELECT "Col1"  FROM ks.t2\nWHERE id IN (1, 2,3) LIMIT 10'
+        assert normalize_query(query) == 'SELECT "Col1" FROM ks.t2 WHERE id IN (?) LIMIT ?'
+
+    def test_same_shape_for_different_values(self):
+        assert normalize_query("SELECT * FROM t WHERE k = 1") == normalize_query(
+            "SELECT * FROM t WHERE k = 22;"
+        )
+
+
+class _FakeFuture:
+    """Just enough of ResponseFuture to drive the collector's callbacks."""
+
+    def __init__(self, query):
+        self.query = query
+        self.has_more_pages = False
+        self.coordinator_host = "10.0.0.1:9042"
+        self.attempted_hosts = [self.coordinator_host]
+        self._callback = None
+        self._errback = None
+
+    def add_callbacks(self, callback, errback):
+        self._callback = callback
+        self._errback = errback
+
+    def page(self, rows, more=False):
+        self.has_more_pages = more
+        self._callback(rows)
+
+    def fail(self, exc):
+        self._errback(exc)
+
+
+@pytest.fixture
+def collector():
+    return QueryStatsCollector("c1", QueryMetricsConfig(slow_query_threshold_ms=100))
+
+
+@pytest.fixture
+def clock():
+    with patch("cassanova.core.metrics.query_stats.monotonic") as monotonic:
+        monotonic.return_value = 0.0
+        yield monotonic
+
+
+class TestQueryStatsCollector:
+    def test_records_first_page_latency_per_shape(self, collector, clock):
+        for key in (1, 2):
+            future = _FakeFuture(SimpleStatement(f"SELECT * FROM ks.t WHERE k = {key}"))
+            collector._on_request(future)
+            clock.return_value += 0.01
+            future.page([1, 2])
+
+        [shape] = collector.shapes()
+        assert shape["shape"] == "SELECT * FROM ks.t WHERE k = ?"
+        assert shape["count"] == 2
+        assert shape["rows"] == 4
+        assert collector.slow_queries() == []
+
+    def test_slow_paged_query_is_logged_on_last_page(self, collector, clock):
+        future = _FakeFuture(SimpleStatement("SELECT * FROM ks.t"))
+        with InFlightQuery("c1", "alice", "SELECT * FROM ks.t").bound():
+            collector._on_request(future)
+        clock.return_value = 0.2
+        future.page([1, 2], more=True)
+        assert collector.slow_queries() == []
+
+        clock.return_value = 0.5
+        with patch("cassanova.core.metrics.query_stats._slow_query_logger") as slow_log:
+            future.page([3])
+
+        [entry] = collector.slow_queries()
+        assert entry["user"] == "alice"
+        assert entry["latency_ms"] == 200
+        assert entry["total_ms"] == 500
+        assert entry["rows"] == 3
+        assert entry["pages"] == 2
+        assert entry["coordinator"] == "10.0.0.1:9042"
+        assert json.loads(slow_log.info.call_args.args[0]) == entry
+
+    def test_abandoned_paging_is_finished_when_future_is_dropped(self, collector, clock):
+        future = _FakeFuture(SimpleStatement("SELECT * FROM ks.t"))
+        collector._on_request(future)
+        clock.return_value = 0.3
+        future.page([1], more=True)
+        assert collector.slow_queries() == []
+
+        del future
+        gc.collect()
+
+        assert collector.slow_queries()[0]["pages"] == 1
+
+    def test_errors_are_counted(self, collector, clock):
+        future = _FakeFuture(SimpleStatement("SELECT * FROM ks.t"))
+        collector._on_request(future)
+        clock.return_value = 0.01
+        future.fail(RuntimeError("timeout"))
+
+        [shape] = collector.shapes()
+        assert shape["errors"] == 1
+        assert shape["count"] == 0
+
+    def test_statement_kinds(self, collector, clock):
+        prepared = MagicMock(prepared_statement=MagicMock(query_string="SELECT * FROM t WHERE k=?"))
+        for statement in (prepared, BatchStatement()):
+            future = _FakeFuture(statement)
+            collector._on_request(future)
+            future.page([])
+
+        assert {s["shape"] for s in collector.shapes()} == {
+            "SELECT * FROM t WHERE k=?",
+            "<BatchStatement>",
+        }
+
+    def test_shape_count_is_bounded(self, clock):
+        collector = QueryStatsCollector("c1", QueryMetricsConfig(max_shapes_per_cluster=2))
+        for table in ("a", "b", "c", "d"):
+            future = _FakeFuture(SimpleStatement(f"SELECT * FROM {table}"))
+            collector._on_request(future)
+            future.page([])
+
+        shapes = {s["shape"]: s["count"] for s in collector.shapes()}
+        assert shapes == {"SELECT * FROM a": 1, "SELECT * FROM b": 1, "<other>": 2}
+
+
+class TestQueryMetricsRoutes:
+    def _collectors(self, clock):
+        collectors = []
+        for name, delay in (("c1", 0.2), ("c2", 0.3)):
+            collector = QueryStatsCollector(name, QueryMetricsConfig(slow_query_threshold_ms=100))
+            future = _FakeFuture(SimpleStatement("SELECT * FROM ks.t"))
+            clock.return_value = 0.0
+            collector._on_request(future)
+            clock.return_value = delay
+            future.page([])
+            collectors.append(collector)
+        return collectors
+
+    def test_query_metrics_per_cluster(self, clock):
+        _, c2 = self._collectors(clock)
+        with patch("cassanova.api.routes.api.admin_routes.session_manager") as manager:
+            manager.get_query_stats.return_value = c2
+            result = get_query_metrics(cluster="c2", sort_by="p99_ms", limit=10)
+
+        assert [c["cluster"] for c in result["clusters"]] == ["c2"]
+        assert result["clusters"][0]["shapes"][0]["p99_ms"] == 300
+
+    def test_slow_queries_across_clusters(self, clock):
+        collectors = self._collectors(clock)
+        with patch("cassanova.api.routes.api.admin_routes.session_manager") as manager:
+            manager.all_query_stats.return_value = collectors
+            result = get_slow_queries(cluster=None, limit=1)
+
+        assert len(result) == 1
@@ -0,0 +1,135 @@
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from cassandra.query import TraceUnavailable
+
+from cassanova.api.routes.api.tools_routes import get_cqlsh_trace
+from cassanova.core.cql.query_trace import fetch_trace, format_trace, trace_cache
+
+
+def _event(source, thread, elapsed_ms, description="step"):
+    event = MagicMock()
+    event.source = source
+    event.thread_name = thread
+    event.description = description
+    event.source_elapsed = timedelta(milliseconds=elapsed_ms)
+    return event
+
+
+def _trace(events, duration_us=5000):
+    trace = MagicMock()
+    trace.trace_id = uuid4()
+    trace.request_type = "Execute CQL3 query"
+    trace.duration = duration_us
+    trace.coordinator = "10.0.0.1"
+    trace.parameters = {}
+    trace.started_at = None
+    trace.events = events
+    return trace
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    trace_cache.clear()
+    yield
+    trace_cache.clear()
+
+
+class TestFormatTrace:
+    def test_groups_events_into_replica_stage_timelines(self):
+        trace = _trace(
+            [
+                _event("10.0.0.1", "Native-Transport-Requests-1", 0.1),
+                _event("10.0.0.1", "Native-Transport-Requests-1", 0.3),
+                _event("10.0.0.2", "ReadStage-2", 0.2),
+                _event("10.0.0.1", "ReadStage-4", 0.5),
+                _event("10.0.0.2", "ReadStage-3", 1.2),
+                _event("10.0.0.1", "RequestResponseStage-1", 2.0),
+            ]
+        )
+
+        replicas = {r["source"]: r for r in format_trace(trace)["replicas"]}
+
+        coordinator = replicas["10.0.0.1"]
+        assert coordinator["events"] == 4
+        assert [s["stage"] for s in coordinator["stages"]] == [
+            "Native-Transport-Requests",
+            "ReadStage",
+            "RequestResponseStage",
+        ]
+        assert coordinator["stages"][0]["events"] == 2
+        assert coordinator["stages"][0]["duration_ms"] == pytest.approx(0.4)
+        assert coordinator["span_ms"] == pytest.approx(1.9)
+
+        replica = replicas["10.0.0.2"]
+        assert replica["stages"] == [
+            {"stage": "ReadStage", "start_ms": 0.2, "end_ms": 1.2, "events": 2, "duration_ms": 1.0}
+        ]
+
+    def test_missing_thread_name(self):
+        trace = _trace([_event("10.0.0.1", None, 1.0)])
+
+        assert format_trace(trace)["events"][0]["stage"] == "unknown"
+
+
+class TestFetchTrace:
+    def test_pending_trace_returns_none_and_is_not_cached(self, mock_session):
+        trace_id = uuid4()
+        with patch("cassanova.core.cql.query_trace.QueryTrace") as query_trace:
+            query_trace.return_value.populate.side_effect = TraceUnavailable("not yet")
+            assert fetch_trace(mock_session, "c1", trace_id) is None
+            assert fetch_trace(mock_session, "c1", trace_id) is None
+
+        assert query_trace.return_value.populate.call_count == 2
+
+    def test_complete_trace_is_cached(self, mock_session):
+        trace_id = uuid4()
+        with patch("cassanova.core.cql.query_trace.QueryTrace") as query_trace:
+            query_trace.return_value = _trace([_event("10.0.0.1", "ReadStage-1", 1.0)])
+            first = fetch_trace(mock_session, "c1", trace_id)
+            second = fetch_trace(mock_session, "c1", trace_id)
+
+        assert first is second
+        assert first["duration_ms"] == 5.0
+        query_trace.assert_called_once_with(trace_id, mock_session)
+
+    def test_cache_evicts_least_recently_used(self, mock_session):
+        ids = [uuid4() for _ in range(3)]
+        with (
+            patch("cassanova.core.cql.query_trace.get_clusters_config") as config,
+            patch("cassanova.core.cql.query_trace.QueryTrace") as query_trace,
+        ):
+            config.return_value.cqlsh.trace_cache_size = 2
+            config.return_value.cqlsh.trace_fetch_wait = 1.0
+            query_trace.side_effect = lambda *_: _trace([])
+            for trace_id in ids:
+                fetch_trace(mock_session, "c1", trace_id)
+
+        assert trace_cache.get("c1", ids[0]) is None
+        assert trace_cache.get("c1", ids[2]) is not None
+
+
+class TestTraceRoute:
+    def test_pending_trace_answers_accepted(self, mock_session):
+        trace_id = uuid4()
+        with (
+            patch("cassanova.api.routes.api.tools_routes.get_session", return_value=mock_session),
+            patch("cassanova.api.routes.api.tools_routes.fetch_trace", return_value=None),
+        ):
+            response = get_cqlsh_trace("c1", trace_id, MagicMock())
+
+        assert response.status_code == 202
+
+    def test_complete_trace_is_returned(self, mock_session):
+        with (
+            patch("cassanova.api.routes.api.tools_routes.get_session", return_value=mock_session),
+            patch(
+                "cassanova.api.routes.api.tools_routes.fetch_trace",
+                return_value={"duration_ms": 1.0, "events": []},
+            ),
+        ):
+            result = get_cqlsh_trace("c1", uuid4(), MagicMock())
+
+        assert result == {"duration_ms": 1.0, "events": []}
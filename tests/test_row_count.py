@@ -0,0 +1,170 @@
+import asyncio
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from cassandra import OperationTimedOut
+from cassandra.metadata import Murmur3Token
+
+from cassanova.api.routes.api.cluster_routes import stream_scan_job
+from cassanova.api.routes.api.data_routes import start_table_count
+from cassanova.config.scan_jobs_config import ScanJobsConfig
+from cassanova.consts.scan_jobs import ScanJobKinds, ScanJobStatuses
+from cassanova.core.cql.token_ranges import replica_ranges, split_range
+from cassanova.core.row_count import count_rows, count_statement, estimate_rows
+from cassanova.core.scan_jobs import ScanJob
+from cassanova.core.size_estimates import TableSizeEstimate
+
+_MURMUR3 = "org.apache.cassandra.dht.Murmur3Partitioner"
+
+
+@pytest.fixture
+def users(make_table):
+    return make_table("users")
+
+
+def _host(name, is_up=True):
+    host = MagicMock(is_up=is_up)
+    host.name = name
+    return host
+
+
+def _session(mock_session):
+    a, b = _host("a"), _host("b", is_up=False)
+    token_map = MagicMock(ring=[Murmur3Token(100), Murmur3Token(-100)], token_class=Murmur3Token)
+    token_map.get_replicas.side_effect = lambda ks, token: [a, b] if token.value == -100 else [b]
+    mock_session.cluster.metadata.partitioner = _MURMUR3
+    mock_session.cluster.metadata.token_map = token_map
+    return mock_session, a
+
+
+def _patch_config(module, **kwargs):
+    return patch(f"cassanova.core.{module}.get_clusters_config", return_value=_config(**kwargs))
+
+
+def _config(**kwargs):
+    config = MagicMock()
+    config.scan_jobs = ScanJobsConfig(parallelism=1, **kwargs)
+    return config
+
+
+class TestTokenRanges:
+    def test_split_range_keeps_open_ends(self):
+        assert split_range(_MURMUR3, (None, 0), 2) == [(None, -(2**62)), (-(2**62), 0)]
+        assert split_range(_MURMUR3, (4, 5), 2) == [(4, 5)]
+
+    def test_replica_ranges_are_cut_at_node_tokens(self, mock_session):
+        session, a = _session(mock_session)
+
+        ranges = replica_ranges(session, "ks", 3)
+
+        bounds = [token_range for token_range, _ in ranges]
+        assert bounds == [(None, -100), (-100, 100), (100, None)]
+        # The range past the last token wraps around to the owners of the first.
+        assert ranges[0][1] == ranges[2][1] == [a, ranges[0][1][1]]
+
+    def test_without_token_metadata(self, mock_session):
+        mock_session.cluster.metadata.partitioner = _MURMUR3
+        mock_session.cluster.metadata.token_map = None
+
+        assert replica_ranges(mock_session, "ks", 2) == [((None, -1), []), ((-1, None), [])]
+
+
+class TestCountRows:
+    def test_counts_every_range_on_a_live_replica(self, mock_session, users):
+        session, a = _session(mock_session)
+        session.execute.return_value = MagicMock(**{"one.return_value": (5,)})
+        job = ScanJob("c1", "alice", ScanJobKinds.COUNT, "ks", "users")
+
+        with (
+            _patch_config("row_count", token_ranges=3),
+            _patch_config("scan_jobs"),
+            patch("cassanova.core.row_count.bind_statement"),
+        ):
+            result = count_rows(session, job, None, users, {"rows": 12})
+
+        assert result == {"count": 15, "retries": 0, "estimate": {"rows": 12}}
+        assert (job.ranges_done, job.ranges_total, job.rows_scanned) == (3, 3, 15)
+        hosts = [call.kwargs["host"] for call in session.execute.call_args_list]
+        assert hosts == [a, None, a]
+
+    def test_failed_range_is_split_and_retried(self, mock_session, users):
+        session, _ = _session(mock_session)
+        session.cluster.metadata.token_map = None
+        ok = MagicMock(**{"one.return_value": (1,)})
+        session.execute.side_effect = [OperationTimedOut(), ok, ok]
+        job = ScanJob("c1", "alice", ScanJobKinds.COUNT, "ks", "users")
+
+        with (
+            _patch_config("row_count", token_ranges=1),
+            _patch_config("scan_jobs"),
+            patch("cassanova.core.row_count.bind_statement") as bind,
+        ):
+            result = count_rows(session, job, None, users)
+
+        assert result["count"] == 2
+        assert result["retries"] == 1
+        assert [call.args[2] for call in bind.call_args_list] == [[], [-1], [-1]]
+
+
+def test_count_statement(users):
+    query, values = count_statement("ks", users, (1, 2))
+
+    assert query == 'SELECT COUNT(*) FROM "ks"."users" WHERE token("id") > ? AND token("id") <= ?'
+    assert values == [1, 2]
+
+
+def test_estimate_rows_only_without_clustering_columns(mock_session, make_table):
+    estimate = TableSizeEstimate(partitions=10, mean_partition_size=100)
+
+    with patch("cassanova.core.row_count.size_estimate_cache") as cache:
+        cache.get.return_value = estimate
+        flat = estimate_rows(mock_session, "c1", "ks", make_table("users"))
+        wide = estimate_rows(mock_session, "c1", "ks", make_table("users", clustering_key=["seq"]))
+
+    assert flat == {"partitions": 10, "rows": 10, "bytes": 1000}
+    assert wide["rows"] is None
+
+
+def test_start_count_returns_the_estimate(mock_session, users):
+    keyspace = MagicMock()
+    keyspace.tables = {"users": users}
+    mock_session.cluster.metadata.keyspaces = {"ks": keyspace}
+
+    with (
+        patch("cassanova.api.routes.api.data_routes.get_session", return_value=mock_session),
+        patch("cassanova.api.routes.api.data_routes.estimate_rows", return_value={"rows": 3}),
+        patch("cassanova.api.routes.api.data_routes.scan_jobs") as registry,
+    ):
+        result = start_table_count("c1", "ks", "users", _user=None)
+
+    assert result["estimate"] == {"rows": 3}
+    assert registry.submit.call_args.args[0].kind == ScanJobKinds.COUNT
+
+
+def test_events_stream_until_the_job_finishes():
+    job = ScanJob("c1", "alice", ScanJobKinds.COUNT, "ks", "users")
+    statuses = iter([ScanJobStatuses.COMPLETED])
+
+    def _sleep(_):
+        job.status = next(statuses)
+        job.result = {"count": 7}
+
+    with (
+        patch("cassanova.api.routes.api.cluster_routes.scan_jobs") as registry,
+        patch("cassanova.api.routes.api.cluster_routes.sleep", side_effect=_sleep) as sleep,
+    ):
+        registry.get.return_value = job
+        response = stream_scan_job("c1", job.job_id, _user=None)
+
+        async def collect():
+            return [line async for line in response.body_iterator]
+
+        lines = asyncio.get_event_loop().run_until_complete(collect())
+
+    # Waits on the event loop, not in a threadpool worker.
+    sleep.assert_awaited_once_with(1.0)
+
+    events = [json.loads(line) for line in lines]
+    assert [event["status"] for event in events] == [ScanJobStatuses.QUEUED, "completed"]
+    assert events[-1]["result"] == {"count": 7}
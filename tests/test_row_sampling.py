@@ -0,0 +1,83 @@
+from collections import namedtuple
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+
+from cassanova.api.routes.api.data_routes import get_table_sample
+from cassanova.core.cql.row_sampling import sample_rows, sample_statement
+
+Row = namedtuple("Row", ["sensor", "seq", "system_token_sensor"])
+
+
+@pytest.fixture
+def readings(make_table):
+    return make_table("readings", partition_key=["sensor"], clustering_key=["seq"])
+
+
+def test_sample_statement(readings):
+    query, values = sample_statement("ks", readings, -5, 3)
+
+    assert query == (
+        'SELECT "sensor", "seq", token("sensor") FROM "ks"."readings"'
+        ' WHERE token("sensor") > ? LIMIT ?'
+    )
+    assert values == [-5, 3]
+
+
+class TestSampleRows:
+    @pytest.fixture(autouse=True)
+    def _readings(self, readings):
+        self.readings = readings
+
+    def _sample(self, session, outcomes, **kwargs):
+        session.cluster.metadata.partitioner = "org.apache.cassandra.dht.Murmur3Partitioner"
+        results = [(True, MagicMock(current_rows=rows)) for rows in outcomes]
+        with (
+            patch("cassanova.core.cql.row_sampling.bind_statement") as bind,
+            patch(
+                "cassanova.core.cql.row_sampling.execute_concurrent_tracked", return_value=results
+            ),
+        ):
+            rows = sample_rows(session, "c1", None, "ks", self.readings, **kwargs)
+        return rows, [call.args[2][0] for call in bind.call_args_list]
+
+    def test_starts_are_random_tokens_of_the_ring(self, mock_session):
+        _, starts = self._sample(mock_session, [], points=50, seed=1)
+        _, again = self._sample(mock_session, [], points=50, seed=1)
+
+        assert starts == again == sorted(starts)
+        assert len(starts) == 50
+        assert min(starts) < 0 < max(starts)
+        assert all(-(2**63) <= start < 2**63 for start in starts)
+
+    def test_overlapping_reads_are_merged_in_token_order(self, mock_session):
+        rows, _ = self._sample(
+            mock_session,
+            [[Row("b", 1, 9), Row("c", 1, 12)], [Row("a", 1, 3), Row("b", 1, 9)]],
+            points=2,
+        )
+
+        assert rows == [
+            {"sensor": "a", "seq": 1},
+            {"sensor": "b", "seq": 1},
+            {"sensor": "c", "seq": 1},
+        ]
+
+    def test_too_many_points(self, mock_session):
+        with pytest.raises(ValueError, match="sample points"):
+            self._sample(mock_session, [], points=10_000)
+
+
+def test_invalid_sample_size(mock_session, readings):
+    keyspace = MagicMock()
+    keyspace.tables = {"readings": readings}
+    mock_session.cluster.metadata.keyspaces = {"ks": keyspace}
+
+    with (
+        patch("cassanova.api.routes.api.data_routes.get_session", return_value=mock_session),
+        pytest.raises(HTTPException) as exc,
+    ):
+        get_table_sample("c1", "ks", "readings", points=0, _user=None)
+
+    assert exc.value.status_code == 400
@@ -0,0 +1,186 @@
+from threading import Thread
+from time import monotonic, sleep
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from cassanova.api.dependencies.csv_handler import generate_json_stream
+from cassanova.config.scheduler_config import SchedulerConfig
+from cassanova.consts.workloads import Priorities
+from cassanova.core.scheduler import (
+    WorkScheduler,
+    default_priority,
+    get_scheduler,
+    install_scheduler,
+    scheduled,
+)
+from cassanova.exceptions.cql_exceptions import AdmissionRejected
+from cassanova.models.auth_models import WebUser
+
+
+def _user(name: str) -> WebUser:
+    return WebUser(username=name, password="x")
+
+
+def _queued(scheduler: WorkScheduler) -> int:
+    return sum(c["queue_depth"] for c in scheduler.stats()["classes"].values())
+
+
+def _wait_for_queue(scheduler: WorkScheduler, depth: int) -> None:
+    deadline = monotonic() + 5
+    while _queued(scheduler) < depth:
+        assert monotonic() < deadline, "requests never queued"
+        sleep(0.005)
+
+
+def _queue_requests(
+    scheduler: WorkScheduler, requests: list[tuple[str, str]], order: list[str]
+) -> list[Thread]:
+    """Queue ``(username, priority)`` requests one by one behind a held slot."""
+
+    def _run(username: str, priority: str) -> None:
+        with scheduler.turn(_user(username), priority):
+            order.append(f"{username}:{priority}")
+
+    threads = []
+    for i, (username, priority) in enumerate(requests, start=1):
+        thread = Thread(target=_run, args=(username, priority))
+        thread.start()
+        _wait_for_queue(scheduler, i)
+        threads.append(thread)
+    return threads
+
+
+def _scheduler(**overrides) -> WorkScheduler:
+    config = SchedulerConfig(max_concurrent_requests=1, queue_timeout_seconds=5, **overrides)
+    return WorkScheduler("c1", config)
+
+
+class TestWorkScheduler:
+    def test_runs_immediately_with_free_capacity(self):
+        scheduler = _scheduler()
+
+        with scheduler.turn(None, Priorities.BACKGROUND):
+            stats = scheduler.stats()
+
+        assert stats["active"] == 1
+        assert stats["classes"][Priorities.BACKGROUND]["dispatched"] == 1
+        assert scheduler.stats()["active"] == 0
+
+    def test_interactive_overtakes_queued_background_work(self):
+        scheduler = _scheduler()
+        order: list[str] = []
+        scheduler.acquire(_user("export"), Priorities.BACKGROUND)
+
+        threads = _queue_requests(
+            scheduler,
+            [
+                ("export", Priorities.BACKGROUND),
+                ("export", Priorities.BACKGROUND),
+                ("alice", Priorities.INTERACTIVE),
+            ],
+            order,
+        )
+        scheduler.release(Priorities.BACKGROUND)
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert order[0] == "alice:interactive"
+
+    def test_users_in_same_class_are_interleaved(self):
+        scheduler = _scheduler()
+        order: list[str] = []
+        scheduler.acquire(None, Priorities.BACKGROUND)
+
+        threads = _queue_requests(
+            scheduler,
+            [
+                ("a", Priorities.BACKGROUND),
+                ("a", Priorities.BACKGROUND),
+                ("a", Priorities.BACKGROUND),
+                ("b", Priorities.BACKGROUND),
+            ],
+            order,
+        )
+        scheduler.release(Priorities.BACKGROUND)
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert order.index("b:background") < 2
+
+    def test_queue_timeout_rejects_and_is_counted(self):
+        scheduler = _scheduler()
+        scheduler.queue_timeout = 0
+        scheduler.acquire(None, Priorities.BACKGROUND)
+
+        with pytest.raises(AdmissionRejected):
+            scheduler.acquire(_user("alice"), Priorities.INTERACTIVE)
+
+        interactive = scheduler.stats()["classes"][Priorities.INTERACTIVE]
+        assert interactive["rejected"] == 1
+        assert interactive["queue_depth"] == 0
+
+        scheduler.release(Priorities.BACKGROUND)
+        assert scheduler.stats()["active"] == 0
+
+    def test_wait_time_is_recorded_per_class(self):
+        scheduler = _scheduler()
+        scheduler.acquire(None, Priorities.BACKGROUND)
+        threads = _queue_requests(scheduler, [("alice", Priorities.MUTATION)], [])
+
+        sleep(0.02)
+        scheduler.release(Priorities.BACKGROUND)
+        threads[0].join(timeout=5)
+
+        mutation = scheduler.stats()["classes"][Priorities.MUTATION]
+        assert mutation["dispatched"] == 1
+        assert mutation["max_wait_ms"] >= 10
+
+
+@pytest.fixture
+def scheduler_config():
+    config = MagicMock()
+    config.scheduler = SchedulerConfig()
+    with patch("cassanova.core.scheduler.get_clusters_config", return_value=config):
+        yield config
+
+
+class TestScheduledHelpers:
+    def test_unscheduled_session_runs_directly(self):
+        with scheduled(MagicMock()):
+            pass
+
+    def test_install_respects_enabled_flag(self, scheduler_config):
+        scheduler_config.scheduler = SchedulerConfig(enabled=False)
+        session = MagicMock()
+
+        assert install_scheduler(session, "c1") is None
+        assert get_scheduler(session) is None
+
+    def test_default_priority_applies_to_unprioritized_requests(self, scheduler_config):
+        session = MagicMock()
+        scheduler = install_scheduler(session, "c1")
+
+        with default_priority(Priorities.BACKGROUND), scheduled(session):
+            pass
+
+        assert scheduler.stats()["classes"][Priorities.BACKGROUND]["dispatched"] == 1
+
+    def test_export_takes_a_turn_per_page(self, scheduler_config):
+        session = MagicMock()
+        scheduler = install_scheduler(session, "c1")
+        rows = session.execute.return_value
+        rows.column_names = ["id"]
+        rows.current_rows = [MagicMock(id=1)]
+        rows.has_more_pages = True
+
+        def _last_page():
+            rows.current_rows = [MagicMock(id=2)]
+            rows.has_more_pages = False
+
+        rows.fetch_next_page.side_effect = _last_page
+
+        lines = list(generate_json_stream(session, "SELECT * FROM t"))
+
+        assert len(lines) == 2
+        assert scheduler.stats()["classes"][Priorities.BACKGROUND]["dispatched"] == 2
@@ -0,0 +1,197 @@
+from collections import namedtuple
+from unittest.mock import MagicMock, patch
+
+import pytest
+from cassandra import InvalidRequest
+
+from cassanova.api.routes.api.cluster_routes import get_cluster_schema_map, get_keyspaces
+from cassanova.config.cluster_config import ClusterConnectionConfig, generate_cluster_connection
+from cassanova.core.schema_loader import (
+    LazyKeyspaceMetadata,
+    get_lazy_schema,
+    install_lazy_schema,
+    keyspace_listing,
+)
+
+KeyspaceRow = namedtuple("KeyspaceRow", ["keyspace_name", "durable_writes", "replication"])
+TableRow = namedtuple("TableRow", ["keyspace_name", "table_name", "flags"])
+ColumnRow = namedtuple(
+    "ColumnRow",
+    ["keyspace_name", "table_name", "column_name", "clustering_order", "kind", "position", "type"],
+)
+NameRow = namedtuple("NameRow", ["keyspace_name"])
+
+
+class _ResultSet(list):
+    def __init__(self, column_names, rows):
+        super().__init__(rows)
+        self.column_names = list(column_names)
+
+
+def _schema_rows(keyspace: str) -> dict[str, list]:
+    return {
+        "system_schema.keyspaces": [
+            KeyspaceRow(
+                keyspace,
+                True,
+                {"class": "org.apache.cassandra.locator.SimpleStrategy", "replication_factor": "1"},
+            )
+        ],
+        "system_schema.tables": [TableRow(keyspace, "users", {"compound"})],
+        "system_schema.columns": [
+            ColumnRow(keyspace, "users", "id", "none", "partition_key", 0, "int"),
+            ColumnRow(keyspace, "users", "name", "none", "regular", -1, "text"),
+        ],
+    }
+
+
+def _make_session(keyspaces: dict[str, dict[str, list]]) -> MagicMock:
+    session = MagicMock()
+    host = MagicMock(release_version="4.1.3", dse_version=None)
+    session.cluster.metadata.all_hosts.return_value = [host]
+
+    def _execute_async(statement, params, **_kwargs):
+        assert statement.query_string.endswith(" WHERE keyspace_name = %s")
+        table = statement.query_string.split()[3]
+        future = MagicMock()
+        if table.startswith("system_virtual_schema"):
+            future.result.side_effect = InvalidRequest("no virtual tables")
+        else:
+            rows = keyspaces.get(params[0], {}).get(table, [])
+            future.result.return_value = _ResultSet(rows[0]._fields if rows else [], rows)
+        return future
+
+    def _execute(statement, **_kwargs):
+        if "system_virtual_schema" in statement.query_string:
+            raise InvalidRequest("no virtual tables")
+        return [NameRow(name) for name in keyspaces]
+
+    session.execute_async.side_effect = _execute_async
+    session.execute.side_effect = _execute
+    return session
+
+
+class TestLazyKeyspaceMetadata:
+    def test_loads_single_keyspace_on_lookup(self):
+        session = _make_session({"app": _schema_rows("app"), "other": _schema_rows("other")})
+        keyspaces = LazyKeyspaceMetadata(session, timeout=5)
+
+        ks_meta = keyspaces.get("app")
+
+        assert ks_meta is not None
+        assert ks_meta.name == "app"
+        assert list(ks_meta.tables) == ["users"]
+        assert [c.name for c in ks_meta.tables["users"].partition_key] == ["id"]
+        assert keyspaces.loaded_keyspaces() == ["app"]
+        queried = {call.args[1][0] for call in session.execute_async.call_args_list}
+        assert queried == {"app"}
+
+    def test_caches_loaded_keyspace(self):
+        session = _make_session({"app": _schema_rows("app")})
+        keyspaces = LazyKeyspaceMetadata(session, timeout=5)
+
+        first = keyspaces["app"]
+        calls = session.execute_async.call_count
+        second = keyspaces["app"]
+
+        assert first is second
+        assert session.execute_async.call_count == calls
+
+    def test_missing_keyspace(self):
+        session = _make_session({})
+        keyspaces = LazyKeyspaceMetadata(session, timeout=5)
+
+        assert keyspaces.get("nope") is None
+        with pytest.raises(KeyError):
+            keyspaces["nope"]
+
+    def test_iteration_uses_name_listing(self):
+        session = _make_session({"b": _schema_rows("b"), "a": _schema_rows("a")})
+        keyspaces = LazyKeyspaceMetadata(session, timeout=5)
+
+        assert list(keyspaces) == ["a", "b"]
+        assert "a" in keyspaces
+        assert len(keyspaces) == 2
+        session.execute_async.assert_not_called()
+
+    def test_invalidate_single_keyspace(self):
+        session = _make_session({"a": _schema_rows("a"), "b": _schema_rows("b")})
+        keyspaces = LazyKeyspaceMetadata(session, timeout=5)
+        keyspaces.get("a")
+        keyspaces.get("b")
+
+        keyspaces.invalidate("a")
+
+        assert keyspaces.loaded_keyspaces() == ["b"]
+
+    def test_invalidate_all(self):
+        session = _make_session({"a": _schema_rows("a")})
+        keyspaces = LazyKeyspaceMetadata(session, timeout=5)
+        keyspaces.get("a")
+
+        keyspaces.invalidate()
+
+        assert keyspaces.loaded_keyspaces() == []
+
+
+class TestKeyspaceListing:
+    def test_lists_names_without_loading(self):
+        session = _make_session({"a": _schema_rows("a"), "b": _schema_rows("b")})
+        keyspaces = install_lazy_schema(session, timeout=5)
+        keyspaces.get("b")
+        loads = session.execute_async.call_count
+
+        listing = keyspace_listing(session)
+
+        assert [name for name, _ in listing] == ["a", "b"]
+        assert listing[0][1] is None
+        assert listing[1][1].name == "b"
+        assert session.execute_async.call_count == loads
+
+    def test_eager_schema(self):
+        session = MagicMock()
+        session.cluster.metadata.keyspaces = {"a": "meta"}
+
+        assert keyspace_listing(session) == [("a", "meta")]
+
+    def test_routes_do_not_load_keyspaces(self):
+        session = _make_session({"a": _schema_rows("a"), "b": _schema_rows("b")})
+        install_lazy_schema(session, timeout=5)
+        with patch("cassanova.api.routes.api.cluster_routes.get_session", return_value=session):
+            keyspaces = get_keyspaces("lazy-c1")
+            schema_map = get_cluster_schema_map("lazy-c1")
+
+        assert [(k["name"], k["loaded"], k["table_count"]) for k in keyspaces] == [
+            ("a", False, None),
+            ("b", False, None),
+        ]
+        assert schema_map == {"a": {}, "b": {}}
+        session.execute_async.assert_not_called()
+
+
+class TestInstallLazySchema:
+    def test_replaces_driver_keyspaces(self):
+        session = MagicMock()
+        installed = install_lazy_schema(session, timeout=5)
+
+        assert session.cluster.metadata.keyspaces is installed
+        assert get_lazy_schema(session) is installed
+
+    def test_eager_session_is_not_lazy(self):
+        session = MagicMock()
+        session.cluster.metadata.keyspaces = {}
+
+        assert get_lazy_schema(session) is None
+
+    @patch("cassanova.config.cluster_config.Cluster")
+    def test_lazy_config_disables_driver_schema(self, mock_cluster):
+        config = ClusterConnectionConfig(contact_points=["127.0.0.1"], lazy_schema=True)
+        generate_cluster_connection(config)
+
+        assert mock_cluster.call_args.kwargs["schema_metadata_enabled"] is False
+
+    @patch("cassanova.config.cluster_config.Cluster")
+    def test_default_config_keeps_driver_schema(self, mock_cluster):
+        generate_cluster_connection(ClusterConnectionConfig(contact_points=["127.0.0.1"]))
+
+        assert "schema_metadata_enabled" not in mock_cluster.call_args.kwargs
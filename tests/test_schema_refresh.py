@@ -0,0 +1,135 @@
+from threading import Event
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from cassanova.config.schema_refresh_config import SchemaRefreshConfig
+from cassanova.core.schema_refresh import SchemaRefreshScheduler, SchemaTarget, parse_ddl_target
+
+
+class TestParseDdlTarget:
+    @pytest.mark.parametrize(
+        "cql,expected",
+        [
+            ("CREATE TABLE ks.users (id int PRIMARY KEY)", SchemaTarget("table", "ks", "users")),
+            (
+                "create table if not exists KS.Users (id int primary key)",
+                SchemaTarget("table", "ks", "users"),
+            ),
+            ('ALTER TABLE "Ks"."Users" ADD x int', SchemaTarget("table", "Ks", "Users")),
+            ("DROP TABLE IF EXISTS ks.t", SchemaTarget("table", "ks", "t")),
+            ("CREATE KEYSPACE app WITH replication = {}", SchemaTarget("keyspace", "app")),
+            ("DROP KEYSPACE IF EXISTS app", SchemaTarget("keyspace", "app")),
+            ("CREATE TYPE ks.address (street text)", SchemaTarget("type", "ks", "address")),
+            (
+                "CREATE MATERIALIZED VIEW ks.by_name AS SELECT * FROM ks.t",
+                SchemaTarget("view", "ks", "by_name"),
+            ),
+            ("CREATE INDEX idx ON ks.users (name)", SchemaTarget("table", "ks", "users")),
+            (
+                "CREATE CUSTOM INDEX IF NOT EXISTS ON ks.users (name) USING 'StorageAttachedIndex'",
+                SchemaTarget("table", "ks", "users"),
+            ),
+        ],
+    )
+    def test_parses_target(self, cql, expected):
+        assert parse_ddl_target(cql) == expected
+
+    @pytest.mark.parametrize(
+        "cql",
+        [
+            "CREATE TABLE users (id int PRIMARY KEY)",
+            "DROP INDEX ks.idx",
+            "CREATE FUNCTION ks.f (x int) RETURNS NULL ON NULL INPUT RETURNS int",
+            "SELECT * FROM ks.t",
+        ],
+    )
+    def test_ambiguous_statements_return_none(self, cql):
+        assert parse_ddl_target(cql) is None
+
+
+@pytest.fixture
+def _refresh_config():
+    config = MagicMock()
+    config.schema_refresh = SchemaRefreshConfig(debounce_seconds=60, max_targets=2)
+    with patch("cassanova.core.schema_refresh.get_clusters_config", return_value=config):
+        yield config
+
+
+@pytest.mark.usefixtures("_refresh_config")
+class TestSchemaRefreshScheduler:
+    def test_coalesces_targets_into_one_pass(self):
+        scheduler = SchemaRefreshScheduler()
+        session = MagicMock()
+
+        for _ in range(5):
+            scheduler.schedule("c1", session, SchemaTarget("table", "ks", "t"))
+        scheduler.flush("c1")
+
+        session.cluster.refresh_table_metadata.assert_called_once_with("ks", "t")
+        session.cluster.refresh_schema_metadata.assert_not_called()
+
+    def test_refresh_runs_in_background_after_debounce(self, _refresh_config):
+        _refresh_config.schema_refresh = SchemaRefreshConfig(debounce_seconds=0)
+        scheduler = SchemaRefreshScheduler()
+        session = MagicMock()
+        refreshed = Event()
+        scheduler.add_listener(lambda name: refreshed.set())
+
+        scheduler.schedule("c1", session, SchemaTarget("keyspace", "ks"))
+
+        assert refreshed.wait(timeout=5)
+        session.cluster.refresh_keyspace_metadata.assert_called_once_with("ks")
+
+    def test_unknown_target_forces_full_refresh(self):
+        scheduler = SchemaRefreshScheduler()
+        session = MagicMock()
+
+        scheduler.schedule("c1", session, SchemaTarget("table", "ks", "t"))
+        scheduler.schedule("c1", session, None)
+        scheduler.flush("c1")
+
+        session.cluster.refresh_schema_metadata.assert_called_once()
+        session.cluster.refresh_table_metadata.assert_not_called()
+
+    def test_too_many_targets_forces_full_refresh(self):
+        scheduler = SchemaRefreshScheduler()
+        session = MagicMock()
+
+        for name in ("a", "b", "c"):
+            scheduler.schedule("c1", session, SchemaTarget("table", "ks", name))
+        scheduler.flush("c1")
+
+        session.cluster.refresh_schema_metadata.assert_called_once()
+
+    def test_failed_targeted_refresh_falls_back_to_full(self):
+        scheduler = SchemaRefreshScheduler()
+        session = MagicMock()
+        session.cluster.refresh_table_metadata.side_effect = Exception("boom")
+
+        scheduler.schedule("c1", session, SchemaTarget("table", "ks", "t"))
+        scheduler.flush("c1")
+
+        session.cluster.refresh_schema_metadata.assert_called_once()
+
+    def test_clusters_are_refreshed_independently(self):
+        scheduler = SchemaRefreshScheduler()
+        session_a, session_b = MagicMock(), MagicMock()
+
+        scheduler.schedule("a", session_a, SchemaTarget("table", "ks", "t"))
+        scheduler.schedule("b", session_b, SchemaTarget("table", "ks", "u"))
+        scheduler.flush("a")
+
+        session_a.cluster.refresh_table_metadata.assert_called_once_with("ks", "t")
+        session_b.cluster.refresh_table_metadata.assert_not_called()
+        scheduler.cancel("b")
+
+    def test_cancel_drops_pending_refresh(self):
+        scheduler = SchemaRefreshScheduler()
+        session = MagicMock()
+
+        scheduler.schedule("c1", session, None)
+        scheduler.cancel("c1")
+        scheduler.flush("c1")
+
+        session.cluster.refresh_schema_metadata.assert_not_called()
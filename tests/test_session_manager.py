@@ -1,9 +1,11 @@
 from concurrent.futures import ThreadPoolExecutor
-from unittest.mock import MagicMock, patch
+from threading import Barrier
+from unittest.mock import ANY, MagicMock, patch
 
 import pytest
 
 from cassanova.config.cluster_config import ClusterConnectionConfig
+from cassanova.config.query_metrics_config import QueryMetricsConfig
 from cassanova.config.timeouts_config import TimeoutConfig
 from cassanova.core.session_manager import SessionManager
 
@@ -13,9 +15,13 @@ def _clean_session_manager():
     """Reset SessionManager state before each test."""
     SessionManager._sessions.clear()
     SessionManager._instances.clear()
+    SessionManager._latency_trackers.clear()
+    SessionManager._query_stats.clear()
     yield
     SessionManager._sessions.clear()
     SessionManager._instances.clear()
+    SessionManager._latency_trackers.clear()
+    SessionManager._query_stats.clear()
 
 
 @pytest.fixture(autouse=True)
@@ -23,9 +29,8 @@ def _stub_clusters_config():
     """Stub get_clusters_config so SessionManager can read timeouts without a real config file."""
     fake_config = MagicMock()
     fake_config.timeouts = TimeoutConfig()
-    with patch(
-        "cassanova.core.session_manager.get_clusters_config", return_value=fake_config
-    ):
+    fake_config.query_metrics = QueryMetricsConfig()
+    with patch("cassanova.core.session_manager.get_clusters_config", return_value=fake_config):
         yield fake_config
 
 
@@ -46,17 +51,6 @@ class TestSessionManager:
         assert session is mock_session
         mock_cluster.connect.assert_called_once()
 
-    @patch("cassanova.core.session_manager.generate_cluster_connection")
-    def test_sets_default_timeout_on_session(self, mock_gen, _stub_clusters_config):
-        mock_cluster = MagicMock()
-        mock_session = MagicMock()
-        mock_cluster.connect.return_value = mock_session
-        mock_gen.return_value = mock_cluster
-
-        SessionManager.get_session("timeout_cluster", _make_config())
-
-        assert mock_session.default_timeout == _stub_clusters_config.timeouts.default_query
-
     @patch("cassanova.core.session_manager.generate_cluster_connection")
     def test_passes_timeouts_to_cluster_factory(self, mock_gen, _stub_clusters_config):
         mock_cluster = MagicMock()
@@ -66,7 +60,74 @@ class TestSessionManager:
         config = _make_config()
         SessionManager.get_session("factory_cluster", config)
 
-        mock_gen.assert_called_once_with(config, _stub_clusters_config.timeouts)
+        mock_gen.assert_called_once_with(config, _stub_clusters_config.timeouts, ANY)
+
+    @patch("cassanova.core.session_manager.generate_cluster_connection")
+    def test_installs_latency_tracker(self, mock_gen):
+        mock_session = MagicMock()
+        mock_gen.return_value.connect.return_value = mock_session
+
+        SessionManager.get_session("latency_cluster", _make_config())
+
+        tracker = SessionManager.get_latency_tracker("latency_cluster")
+        assert tracker is mock_gen.call_args.args[2]
+        # The tracker is fed by the query stats listener rather than its own.
+        stats = SessionManager.get_query_stats("latency_cluster")
+        assert stats._latency_tracker is tracker
+        timers = [
+            call.args[0]
+            for call in mock_session.add_request_init_listener.call_args_list
+            if call.args[0] == stats._on_request
+        ]
+        assert len(timers) == 1
+
+        SessionManager.shutdown("latency_cluster")
+        assert SessionManager.get_latency_tracker("latency_cluster") is None
+
+    @patch("cassanova.core.session_manager.generate_cluster_connection")
+    def test_installs_query_stats(self, mock_gen):
+        mock_session = MagicMock()
+        mock_gen.return_value.connect.return_value = mock_session
+
+        SessionManager.get_session("stats_cluster", _make_config())
+
+        stats = SessionManager.get_query_stats("stats_cluster")
+        assert stats.cluster_name == "stats_cluster"
+        mock_session.add_request_init_listener.assert_any_call(stats._on_request)
+
+        SessionManager.shutdown("stats_cluster")
+        assert SessionManager.get_query_stats("stats_cluster") is None
+
+    @patch("cassanova.core.session_manager.generate_cluster_connection")
+    def test_query_stats_can_be_disabled(self, mock_gen, _stub_clusters_config):
+        _stub_clusters_config.query_metrics = QueryMetricsConfig(enabled=False)
+
+        SessionManager.get_session("quiet_cluster", _make_config())
+
+        assert SessionManager.get_query_stats("quiet_cluster") is None
+
+    @patch("cassanova.core.session_manager.generate_cluster_connection")
+    def test_clusters_connect_concurrently(self, mock_gen):
+        # Each connect waits for the other; connecting under one global lock would deadlock.
+        both_connecting = Barrier(2, timeout=5)
+
+        def _connect():
+            both_connecting.wait()
+            return MagicMock()
+
+        def _cluster(config, *_args):
+            cluster = MagicMock()
+            cluster.connect.side_effect = _connect
+            return cluster
+
+        mock_gen.side_effect = _cluster
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            sessions = list(
+                pool.map(lambda name: SessionManager.get_session(name, _make_config()), "ab")
+            )
+
+        assert len(sessions) == 2
+        assert set(SessionManager._sessions) == {"a", "b"}
 
     @patch("cassanova.core.session_manager.generate_cluster_connection")
     def test_caches_session(self, mock_gen):
@@ -96,6 +157,16 @@ class TestSessionManager:
         mock_session.shutdown.assert_called_once()
         mock_cluster.shutdown.assert_called_once()
 
+    @patch("cassanova.core.session_manager.generate_cluster_connection")
+    def test_shutdown_drops_cached_node_queries(self, mock_gen):
+        mock_gen.return_value = MagicMock()
+
+        SessionManager.get_session("cluster1", _make_config())
+        with patch("cassanova.core.session_manager.node_query_cache") as cache:
+            SessionManager.shutdown("cluster1")
+
+        cache.invalidate.assert_called_once_with("cluster1")
+
     @patch("cassanova.core.session_manager.generate_cluster_connection")
     def test_shutdown_logs_errors_without_raising(self, mock_gen):
         mock_cluster = MagicMock()
@@ -0,0 +1,73 @@
+import math
+
+from cassanova.core.sketches import HyperLogLog, LogHistogram, SpaceSaving
+
+
+class TestHyperLogLog:
+    def test_small_cardinalities_are_exact_enough(self):
+        sketch = HyperLogLog()
+        sketch.add_many([1, 2, 3, 2, 1])
+
+        assert sketch.estimate() == 3
+
+    def test_large_cardinality_within_error(self):
+        sketch = HyperLogLog()
+        sketch.add_many(f"user-{i}" for i in range(50_000))
+
+        assert math.isclose(sketch.estimate(), 50_000, rel_tol=0.05)
+
+    def test_merge_equals_union(self):
+        left, right = HyperLogLog(), HyperLogLog()
+        left.add_many(range(0, 20_000))
+        right.add_many(range(10_000, 30_000))
+
+        left.merge(right)
+
+        assert math.isclose(left.estimate(), 30_000, rel_tol=0.05)
+
+
+class TestSpaceSaving:
+    def test_exact_below_capacity(self):
+        sketch = SpaceSaving(capacity=3)
+        sketch.add_many(["a", "b", "a", "c", "a", "b"])
+
+        assert sketch.top() == [
+            {"value": "a", "count": 3, "error": 0},
+            {"value": "b", "count": 2, "error": 0},
+            {"value": "c", "count": 1, "error": 0},
+        ]
+
+    def test_heavy_hitters_survive_eviction(self):
+        sketch = SpaceSaving(capacity=5)
+        for batch in range(20):
+            sketch.add_many(["hot"] * 10 + [f"cold-{batch}-{i}" for i in range(10)])
+
+        top = sketch.top()[0]
+
+        assert top["value"] == "hot"
+        assert top["count"] - top["error"] <= 200 <= top["count"]
+
+    def test_merge_and_unhashable_values(self):
+        left, right = SpaceSaving(capacity=2), SpaceSaving(capacity=2)
+        left.add_many([[1], [1], [2]])
+        right.add_many([[1], [3]])
+
+        left.merge(right)
+
+        assert left.top()[0] == {"value": [1], "count": 3, "error": 0}
+
+
+def test_log_histogram():
+    histogram = LogHistogram()
+    histogram.add_many([0, 1, 3, 3, -2, 0.25, float("nan")])
+    other = LogHistogram()
+    other.add_many([2])
+    histogram.merge(other)
+
+    assert histogram.to_list() == [
+        {"lower": -4.0, "upper": -2.0, "count": 1},
+        {"lower": 0.0, "upper": 0.0, "count": 1},
+        {"lower": 0.25, "upper": 0.5, "count": 1},
+        {"lower": 1.0, "upper": 2.0, "count": 1},
+        {"lower": 2.0, "upper": 4.0, "count": 3},
+    ]
@@ -0,0 +1,178 @@
+from unittest.mock import MagicMock
+
+from cassandra.query import SimpleStatement
+
+from cassanova.config.cluster_config import ClusterConnectionConfig, generate_cluster_connection
+from cassanova.config.execution_profiles_config import (
+    ExecutionProfilesConfig,
+    ExecutionProfileSettings,
+    SpeculativeExecutionConfig,
+)
+from cassanova.config.query_metrics_config import QueryMetricsConfig
+from cassanova.consts.execution_profiles import ExecutionProfiles
+from cassanova.core.cql.statements import execute_metadata_query, idempotent_statement
+from cassanova.core.metrics.latency import LatencyTracker, get_latency_metrics
+from cassanova.core.metrics.query_stats import QueryStatsCollector
+from cassanova.core.speculative_execution import (
+    ConstantSpeculativeExecution,
+    PercentileSpeculativeExecution,
+    ProfileSpeculativeExecutionPolicy,
+    planned_profile,
+)
+
+
+def _percentile_config(**overrides) -> ClusterConnectionConfig:
+    speculative = SpeculativeExecutionConfig(policy="percentile", **overrides)
+    return ClusterConnectionConfig(
+        contact_points=["127.0.0.1"],
+        execution_profiles=ExecutionProfilesConfig(
+            interactive=ExecutionProfileSettings(speculative_execution=speculative)
+        ),
+    )
+
+
+class TestSpeculativePlans:
+    def test_disabled_policy_never_speculates(self):
+        statement = SimpleStatement("SELECT * FROM t")
+        plan = ProfileSpeculativeExecutionPolicy("bulk").new_plan("ks", statement)
+
+        assert plan.next_execution(None) == -1
+        assert planned_profile(statement) == "bulk"
+
+    def test_planned_profile_only_matches_the_planned_statement(self):
+        planned, other = SimpleStatement("SELECT 1"), SimpleStatement("SELECT 2")
+        ProfileSpeculativeExecutionPolicy("bulk").new_plan("ks", planned)
+
+        assert planned_profile(other) is None
+        # Consumed by the first lookup, so a later unplanned statement is not tagged.
+        assert planned_profile(planned) is None
+
+    def test_constant_policy_limits_attempts(self):
+        plan = ConstantSpeculativeExecution("interactive", 0.1, 2).new_plan("ks", None)
+
+        assert [plan.next_execution(None) for _ in range(3)] == [0.1, 0.1, -1]
+
+    def test_percentile_policy_uses_fallback_until_enough_samples(self):
+        tracker = LatencyTracker()
+        policy = PercentileSpeculativeExecution(
+            "interactive", tracker, 99, fallback_delay=0.2, max_attempts=1, min_samples=10
+        )
+        for _ in range(5):
+            tracker.record("interactive", 0.05)
+
+        assert policy.current_delay() == 0.2
+
+    def test_percentile_policy_follows_observed_latency(self):
+        tracker = LatencyTracker()
+        for i in range(1, 101):
+            tracker.record("interactive", i / 1000)
+        policy = PercentileSpeculativeExecution(
+            "interactive", tracker, 99, fallback_delay=0.2, max_attempts=1, min_samples=10
+        )
+
+        assert policy.new_plan("ks", None).next_execution(None) == 0.099
+
+    def test_config_builds_percentile_policy(self):
+        cluster = generate_cluster_connection(_percentile_config(), None, LatencyTracker())
+        policy = cluster.profile_manager.profiles[
+            ExecutionProfiles.INTERACTIVE
+        ].speculative_execution_policy
+
+        assert isinstance(policy, PercentileSpeculativeExecution)
+        assert policy.tracker is not None
+
+
+class TestLatencyTracker:
+    def _request(self, collector, profile="interactive", attempted_hosts=1):
+        statement = SimpleStatement("SELECT * FROM t")
+        if profile is not None:
+            ProfileSpeculativeExecutionPolicy(profile).new_plan("ks", statement)
+        future = MagicMock(query=statement, has_more_pages=True)
+        future.attempted_hosts = ["h"] * attempted_hosts
+        collector._on_request(future)
+        callback, _errback = future.add_callbacks.call_args.args
+        return future, callback
+
+    def test_records_first_page_only(self):
+        tracker = LatencyTracker()
+        collector = QueryStatsCollector("c1", QueryMetricsConfig(), tracker)
+        future, callback = self._request(collector, attempted_hosts=2)
+
+        callback(["page 1"])
+        future.has_more_pages = False
+        callback(["page 2"])
+
+        assert tracker.sample_count("interactive") == 1
+        assert tracker.summary()["interactive"]["multi_attempt_count"] == 1
+
+    def test_ignores_unplanned_requests(self):
+        tracker = LatencyTracker()
+        collector = QueryStatsCollector("c1", QueryMetricsConfig(), tracker)
+        future, callback = self._request(collector, profile=None)
+
+        future.has_more_pages = False
+        callback([])
+
+        assert tracker.summary() == {}
+
+    def test_recorded_with_query_metrics_disabled(self):
+        tracker = LatencyTracker()
+        collector = QueryStatsCollector("c1", QueryMetricsConfig(enabled=False), tracker)
+        future, callback = self._request(collector)
+
+        future.has_more_pages = False
+        callback([])
+
+        assert tracker.sample_count("interactive") == 1
+        assert collector.shapes() == []
+
+    def test_summary_compares_first_and_multi_attempt_p99(self):
+        tracker = LatencyTracker()
+        for _ in range(99):
+            tracker.record("interactive", 0.01)
+        tracker.record("interactive", 0.5, multi_attempt=True)
+
+        summary = tracker.summary()["interactive"]
+
+        assert summary["count"] == 100
+        assert summary["first_attempt_p99_ms"] == 10.0
+        assert summary["multi_attempt_p99_ms"] == 500.0
+
+    def test_window_is_bounded(self):
+        tracker = LatencyTracker(window_size=3)
+        for i in range(10):
+            tracker.record("bulk", i)
+
+        assert tracker.sample_count("bulk") == 3
+        assert tracker.percentile("bulk", 50) == 8
+
+    def test_metrics_include_speculative_delay(self):
+        cluster = generate_cluster_connection(
+            ClusterConnectionConfig(contact_points=["127.0.0.1"]), None
+        )
+        session = MagicMock(cluster=cluster)
+
+        metrics = get_latency_metrics(session, LatencyTracker())
+
+        assert metrics[ExecutionProfiles.INTERACTIVE]["speculative_delay_ms"] == 200.0
+        assert metrics[ExecutionProfiles.BULK]["speculative_delay_ms"] is None
+
+
+class TestIdempotentReads:
+    def test_idempotent_statement(self):
+        statement = idempotent_statement("SELECT * FROM t", fetch_size=10)
+
+        assert statement.is_idempotent
+        assert statement.fetch_size == 10
+
+    def test_metadata_query_uses_profile(self):
+        session = MagicMock()
+
+        execute_metadata_query(session, "SELECT * FROM system.local", timeout=3)
+
+        statement, _params = session.execute.call_args.args
+        assert statement.is_idempotent
+        assert session.execute.call_args.kwargs == {
+            "execution_profile": ExecutionProfiles.METADATA,
+            "timeout": 3,
+        }
@@ -0,0 +1,156 @@
+from collections import namedtuple
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+
+from cassanova.api.routes.api.cluster_routes import get_keyspace_sizes
+from cassanova.core.cql.node_queries import NodeResult, query_nodes
+from cassanova.core.size_estimates import SizeEstimateCache, TableSizes, load_keyspace_sizes
+
+EstimateRow = namedtuple(
+    "EstimateRow",
+    ["table_name", "range_start", "range_end", "partitions_count", "mean_partition_size"],
+)
+DiskRow = namedtuple("DiskRow", ["table_name", "mebibytes"])
+MaxPartitionRow = namedtuple("MaxPartitionRow", ["table_name", "mebibytes"])
+
+_QUARTER = 2**62
+_MIB = 1024 * 1024
+
+
+def _host(address, is_up=True):
+    return MagicMock(address=address, is_up=is_up)
+
+
+def _future(rows=None, error=None):
+    future = MagicMock()
+    if error is not None:
+        future.result.side_effect = error
+    else:
+        future.result.return_value = rows
+    return future
+
+
+def _node(address, rows):
+    return NodeResult(_host(address), rows)
+
+
+class TestQueryNodes:
+    def test_queries_every_live_host_directly(self, mock_session):
+        b, a, down = _host("10.0.0.2"), _host("10.0.0.1"), _host("10.0.0.3", is_up=False)
+        mock_session.cluster.metadata.all_hosts.return_value = [b, a, down]
+        futures = {a: _future(["a-row"]), b: _future(error=RuntimeError("timed out"))}
+        mock_session.execute_async.side_effect = lambda *args, host, **kwargs: futures[host]
+
+        results = query_nodes(mock_session, "SELECT * FROM system_views.settings")
+
+        assert [result.address for result in results] == ["10.0.0.1", "10.0.0.2", "10.0.0.3"]
+        assert results[0].rows == ["a-row"] and results[0].error is None
+        assert results[1].rows == [] and results[1].error == "timed out"
+        assert results[2].error == "Node is down"
+        targeted = [call.kwargs["host"] for call in mock_session.execute_async.call_args_list]
+        assert targeted == [a, b]
+
+
+class TestLoadKeyspaceSizes:
+    def _patch_nodes(self, estimates, disk, max_partition):
+        results = iter([estimates, disk, max_partition])
+        return patch(
+            "cassanova.core.size_estimates.query_nodes",
+            side_effect=lambda *args: next(results),
+        )
+
+    def test_aggregates_all_nodes(self, mock_session):
+        first = str(-(2**63))
+        estimates = [
+            _node("a", [EstimateRow("users", first, str(int(first) + _QUARTER), 100, 1000)]),
+            _node(
+                "b",
+                [
+                    # Also reported by node a; must not be counted twice.
+                    EstimateRow("users", first, str(int(first) + _QUARTER), 100, 1000),
+                    EstimateRow("users", "0", str(_QUARTER), 300, 3000),
+                ],
+            ),
+        ]
+        disk = [
+            _node("a", [DiskRow("users", 10), DiskRow("events", 1)]),
+            _node("b", [DiskRow("users", 12)]),
+        ]
+        max_partition = [
+            _node("a", [MaxPartitionRow("users", 2)]),
+            _node("b", [MaxPartitionRow("users", 5)]),
+        ]
+
+        with self._patch_nodes(estimates, disk, max_partition) as query:
+            sizes = load_keyspace_sizes(mock_session, "ks")
+
+        # Both virtual tables report their size in a "mebibytes" column.
+        virtual_queries = [call.args[1] for call in query.call_args_list[1:]]
+        assert all(q.startswith("SELECT table_name, mebibytes FROM") for q in virtual_queries)
+
+        assert sizes["users"] == TableSizes(
+            partitions=800,
+            mean_partition_size=2500,
+            disk_bytes=22 * _MIB,
+            max_partition_size=5 * _MIB,
+        )
+        assert sizes["events"] == TableSizes(disk_bytes=_MIB)
+
+    def test_missing_virtual_tables(self, mock_session):
+        estimates = [_node("a", [EstimateRow("users", "0", str(_QUARTER), 10, 100)])]
+        unavailable = [NodeResult(_host("a"), error="unconfigured table disk_usage")]
+
+        with self._patch_nodes(estimates, unavailable, unavailable):
+            sizes = load_keyspace_sizes(mock_session, "ks")
+
+        assert sizes["users"].partitions == 40
+        assert sizes["users"].disk_bytes is None
+        assert sizes["users"].max_partition_size is None
+
+
+class TestKeyspaceSizeCache:
+    def test_cached_until_invalidated(self, mock_session):
+        cache = SizeEstimateCache()
+        loaded = {"users": TableSizes(partitions=1)}
+        with patch(
+            "cassanova.core.size_estimates.load_keyspace_sizes", return_value=loaded
+        ) as load:
+            assert cache.keyspace_sizes(mock_session, "c1", "ks") is loaded
+            assert cache.keyspace_sizes(mock_session, "c1", "ks") is loaded
+            assert load.call_count == 1
+
+            cache.invalidate("c1")
+            cache.keyspace_sizes(mock_session, "c1", "ks")
+            assert load.call_count == 2
+
+
+class TestKeyspaceSizesRoute:
+    @pytest.fixture
+    def session(self, mock_session):
+        mock_session.cluster.metadata.keyspaces = {"ks": MagicMock()}
+        with patch(
+            "cassanova.api.routes.api.cluster_routes.get_session", return_value=mock_session
+        ):
+            yield mock_session
+
+    def test_sizes_and_total(self, session):
+        sizes = {
+            "users": TableSizes(partitions=10, disk_bytes=300),
+            "events": TableSizes(disk_bytes=200),
+            "audit": TableSizes(partitions=1),
+        }
+        with patch("cassanova.api.routes.api.cluster_routes.size_estimate_cache") as cache:
+            cache.keyspace_sizes.return_value = sizes
+            response = get_keyspace_sizes("c1", "ks")
+
+        assert list(response["tables"]) == ["audit", "events", "users"]
+        assert response["tables"]["users"]["partitions"] == 10
+        assert response["disk_bytes"] == 500
+
+    def test_unknown_keyspace(self, session):
+        with pytest.raises(HTTPException) as exc:
+            get_keyspace_sizes("c1", "missing")
+
+        assert exc.value.status_code == 404
@@ -1,6 +1,7 @@
 from unittest.mock import patch
 
 import pytest
+from cassandra.cluster import EXEC_PROFILE_DEFAULT
 
 from cassanova.config.cluster_config import ClusterConnectionConfig, generate_cluster_connection
 from cassanova.config.timeouts_config import TimeoutConfig
@@ -55,3 +56,10 @@ class TestGenerateClusterConnectionTimeouts:
 
         kwargs = mock_cluster.call_args.kwargs
         assert kwargs["connect_timeout"] == 99
+
+    @patch("cassanova.config.cluster_config.Cluster")
+    def test_default_profile_uses_default_query_timeout(self, mock_cluster):
+        generate_cluster_connection(self._make_config(), TimeoutConfig(default_query=12))
+
+        profiles = mock_cluster.call_args.kwargs["execution_profiles"]
+        assert profiles[EXEC_PROFILE_DEFAULT].request_timeout == 12